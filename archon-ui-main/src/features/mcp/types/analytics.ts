@@ -12,6 +12,8 @@ export interface KnowledgeBaseAnalyticsResponse {
   success: boolean;
   data: KnowledgeBaseUsageItem[];
   total_queries: number;
+  // unique_queries counts distinct queries per hour bucket, summed over the period
+  unique_queries_scope: "per_hour";
   period: {
     hours: number;
     start_time: string;
@@ -69,6 +69,11 @@ CREATE TABLE IF NOT EXISTS archon_crawled_pages (
     metadata TEXT DEFAULT '{}',
     source_id TEXT NOT NULL,
     page_id TEXT,
+    -- ref chunks are content_length characters of their page body from content_offset
+    -- (see 011_compressed_page_content.sql)
+    content_encoding TEXT NOT NULL DEFAULT 'text',
+    content_offset INTEGER,
+    content_length INTEGER,
     -- Model tracking
     llm_chat_model TEXT,
     embedding_model TEXT,
@@ -83,6 +88,7 @@ CREATE TABLE IF NOT EXISTS archon_crawled_pages (
 CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_source_id ON archon_crawled_pages(source_id);
 CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_page_id ON archon_crawled_pages(page_id);
 CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_url ON archon_crawled_pages(url);
+CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_source_url_chunk ON archon_crawled_pages(source_id, url, chunk_number);
 
 -- Code examples table
 CREATE TABLE IF NOT EXISTS archon_code_examples (
@@ -107,12 +113,35 @@ CREATE TABLE IF NOT EXISTS archon_code_examples (
 CREATE INDEX IF NOT EXISTS idx_archon_code_examples_source_id ON archon_code_examples(source_id);
 CREATE INDEX IF NOT EXISTS idx_archon_code_examples_url ON archon_code_examples(url);
 
+-- Per-source corpus statistics maintained by the repository (see 012_source_stats.sql)
+CREATE TABLE IF NOT EXISTS archon_source_stats (
+    source_id TEXT PRIMARY KEY REFERENCES archon_sources(source_id) ON DELETE CASCADE,
+    page_count INTEGER NOT NULL DEFAULT 0,
+    chunk_count INTEGER NOT NULL DEFAULT 0,
+    code_example_count INTEGER NOT NULL DEFAULT 0,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    content_bytes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Per-source zlib preset dictionaries for compressed page bodies
+CREATE TABLE IF NOT EXISTS archon_source_dictionaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_id TEXT NOT NULL UNIQUE REFERENCES archon_sources(source_id) ON DELETE CASCADE,
+    dictionary BLOB NOT NULL,
+    sample_pages INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Page metadata table
 CREATE TABLE IF NOT EXISTS archon_page_metadata (
     id TEXT PRIMARY KEY,
     source_id TEXT NOT NULL,
     url TEXT NOT NULL UNIQUE,
     full_content TEXT NOT NULL,
+    -- Encoding of full_content: text or zlib / zlib-dict (see 011_compressed_page_content.sql)
+    content_encoding TEXT NOT NULL DEFAULT 'text',
+    dictionary_id INTEGER,
     -- Section metadata
     section_title TEXT,
     section_order INTEGER DEFAULT 0,
@@ -132,6 +161,7 @@ CREATE TABLE IF NOT EXISTS archon_page_metadata (
 -- Indexes for page metadata
 CREATE INDEX IF NOT EXISTS idx_archon_page_metadata_source_id ON archon_page_metadata(source_id);
 CREATE INDEX IF NOT EXISTS idx_archon_page_metadata_url ON archon_page_metadata(url);
+CREATE INDEX IF NOT EXISTS idx_archon_page_metadata_source_url ON archon_page_metadata(source_id, url);
 CREATE INDEX IF NOT EXISTS idx_archon_page_metadata_section ON archon_page_metadata(source_id, section_title, section_order);
 
 -- =====================================================
@@ -182,6 +212,7 @@ CREATE INDEX IF NOT EXISTS idx_archon_tasks_project_id ON archon_tasks(project_i
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_status ON archon_tasks(status);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_assignee ON archon_tasks(assignee);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_order ON archon_tasks(task_order);
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_project_status_order ON archon_tasks(project_id, status, task_order);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_priority ON archon_tasks(priority);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_archived ON archon_tasks(archived);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_parent ON archon_tasks(parent_task_id);
@@ -212,6 +243,8 @@ CREATE TABLE IF NOT EXISTS archon_document_versions (
     change_summary TEXT,
     change_type TEXT DEFAULT 'update',
     document_id TEXT,
+    -- 'snapshot' (keyframe, full content) or 'delta' (JSON Patch against the previous version)
+    storage_format TEXT NOT NULL DEFAULT 'snapshot',
     created_by TEXT DEFAULT 'system',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     -- Ensure we have either project_id OR task_id, not both
@@ -226,6 +259,8 @@ CREATE TABLE IF NOT EXISTS archon_document_versions (
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_project_id ON archon_document_versions(project_id);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_task_id ON archon_document_versions(task_id);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_field_name ON archon_document_versions(field_name);
+CREATE INDEX IF NOT EXISTS idx_archon_document_versions_project_field_version
+    ON archon_document_versions(project_id, field_name, version_number);
 
 -- =====================================================
 -- SECTION 5: PROMPTS TABLE
@@ -41,7 +41,9 @@ CREATE TABLE IF NOT EXISTS archon_mcp_usage_hourly (
     call_count INTEGER NOT NULL DEFAULT 0,
     error_count INTEGER NOT NULL DEFAULT 0,
     avg_response_time_ms INTEGER NOT NULL DEFAULT 0,
+    total_response_time_ms INTEGER NOT NULL DEFAULT 0,
     unique_sessions INTEGER NOT NULL DEFAULT 0,
+    latency_histogram TEXT,
     last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(hour_bucket, tool_name)
 );
@@ -61,7 +63,9 @@ CREATE TABLE IF NOT EXISTS archon_mcp_usage_daily (
     call_count INTEGER NOT NULL DEFAULT 0,
     error_count INTEGER NOT NULL DEFAULT 0,
     avg_response_time_ms INTEGER NOT NULL DEFAULT 0,
+    total_response_time_ms INTEGER NOT NULL DEFAULT 0,
     unique_sessions INTEGER NOT NULL DEFAULT 0,
+    latency_histogram TEXT,
     last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(date_bucket, tool_name)
 );
@@ -71,89 +75,25 @@ CREATE INDEX IF NOT EXISTS idx_mcp_daily_bucket ON archon_mcp_usage_daily(date_b
 CREATE INDEX IF NOT EXISTS idx_mcp_daily_category ON archon_mcp_usage_daily(tool_category);
 
 -- ============================================
--- Triggers for Automatic Aggregation
+-- Per-Source Hourly Rollups
 -- ============================================
-
--- Trigger to update hourly aggregation when new event is inserted
-CREATE TRIGGER IF NOT EXISTS trg_mcp_events_hourly_insert
-AFTER INSERT ON archon_mcp_usage_events
-BEGIN
-    INSERT INTO archon_mcp_usage_hourly (
-        hour_bucket,
-        tool_name,
-        tool_category,
-        call_count,
-        error_count,
-        avg_response_time_ms,
-        unique_sessions,
-        last_updated
-    )
-    VALUES (
-        datetime(strftime('%Y-%m-%d %H:00:00', NEW.timestamp)),
-        NEW.tool_name,
-        NEW.tool_category,
-        1,
-        CASE WHEN NEW.success = 0 THEN 1 ELSE 0 END,
-        NEW.response_time_ms,
-        1,
-        CURRENT_TIMESTAMP
-    )
-    ON CONFLICT(hour_bucket, tool_name) DO UPDATE SET
-        call_count = call_count + 1,
-        error_count = error_count + CASE WHEN NEW.success = 0 THEN 1 ELSE 0 END,
-        avg_response_time_ms = (
-            (COALESCE(avg_response_time_ms, 0) * call_count + NEW.response_time_ms) / (call_count + 1)
-        ),
-        last_updated = CURRENT_TIMESTAMP;
-END;
-
--- Trigger to update daily aggregation when new event is inserted
-CREATE TRIGGER IF NOT EXISTS trg_mcp_events_daily_insert
-AFTER INSERT ON archon_mcp_usage_events
-BEGIN
-    INSERT INTO archon_mcp_usage_daily (
-        date_bucket,
-        tool_name,
-        tool_category,
-        call_count,
-        error_count,
-        avg_response_time_ms,
-        unique_sessions,
-        last_updated
-    )
-    VALUES (
-        date(NEW.timestamp),
-        NEW.tool_name,
-        NEW.tool_category,
-        1,
-        CASE WHEN NEW.success = 0 THEN 1 ELSE 0 END,
-        NEW.response_time_ms,
-        1,
-        CURRENT_TIMESTAMP
-    )
-    ON CONFLICT(date_bucket, tool_name) DO UPDATE SET
-        call_count = call_count + 1,
-        error_count = error_count + CASE WHEN NEW.success = 0 THEN 1 ELSE 0 END,
-        avg_response_time_ms = (
-            (COALESCE(avg_response_time_ms, 0) * call_count + NEW.response_time_ms) / (call_count + 1)
-        ),
-        last_updated = CURRENT_TIMESTAMP;
-END;
+CREATE TABLE IF NOT EXISTS archon_mcp_usage_source_hourly (
+    hour_bucket DATETIME NOT NULL,
+    source_id TEXT NOT NULL,
+    query_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    total_response_time_ms INTEGER NOT NULL DEFAULT 0,
+    unique_queries INTEGER NOT NULL DEFAULT 0,
+    latency_histogram TEXT,
+    last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (hour_bucket, source_id)
+);
 
 -- ============================================
--- Cleanup Policy
+-- Aggregation
 -- ============================================
 
--- Create trigger to automatically clean up old events (180 days retention)
-CREATE TRIGGER IF NOT EXISTS trg_mcp_events_cleanup
-AFTER INSERT ON archon_mcp_usage_events
-BEGIN
-    DELETE FROM archon_mcp_usage_events
-    WHERE timestamp < datetime('now', '-180 days');
-
-    DELETE FROM archon_mcp_usage_hourly
-    WHERE hour_bucket < datetime('now', '-180 days');
-
-    DELETE FROM archon_mcp_usage_daily
-    WHERE date_bucket < date('now', '-180 days');
-END;
+-- The hourly, daily and per-source tables are rollups maintained by the MCP
+-- usage tracker: it aggregates events in memory and merges them into these
+-- tables when it flushes, together with the raw event batch. It also enforces
+-- the 180-day retention. There are no per-row triggers on the events table.
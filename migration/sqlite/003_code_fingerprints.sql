@@ -0,0 +1,36 @@
+-- Migration: Code Example Fingerprints
+-- Description: Global dedup index for code examples across sources and crawls
+-- Created: 2026-10-18
+
+-- ============================================
+-- Fingerprint Table
+-- ============================================
+-- One row per normalized code snippet. Known snippets reuse their summary
+-- (and embedding, when the embedding model matches) instead of calling the
+-- LLM and embedding providers again.
+CREATE TABLE IF NOT EXISTS archon_code_fingerprints (
+    code_hash TEXT PRIMARY KEY,          -- sha256 of the normalized code
+    minhash BLOB NOT NULL,               -- MinHash signature (uint32 array)
+    language TEXT DEFAULT '',
+    summary TEXT,
+    example_name TEXT,
+    llm_chat_model TEXT,
+    embedding_model TEXT,
+    embedding_dimension INTEGER,
+    embedding BLOB,                      -- float32 array, NULL if not reusable
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ============================================
+-- LSH Band Table
+-- ============================================
+-- Near-duplicate lookup: snippets sharing any band key are candidates.
+CREATE TABLE IF NOT EXISTS archon_code_fingerprint_bands (
+    band_key TEXT NOT NULL,
+    code_hash TEXT NOT NULL REFERENCES archon_code_fingerprints(code_hash) ON DELETE CASCADE,
+    PRIMARY KEY (band_key, code_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_archon_code_fingerprint_bands_hash ON archon_code_fingerprint_bands(code_hash);
@@ -0,0 +1,11 @@
+-- Migration: Page Metadata Source/URL Index
+-- Description: Index for per-source first-URL lookups and url-ordered page listings
+-- Created: 2026-10-18
+
+-- Knowledge item listings read each source's first page URL with MIN(url),
+-- which this index answers with a single probe. Page and code example counts
+-- come from archon_source_stats (012_source_stats.sql).
+--
+-- Upgrades existing databases only: fresh installs get the index from
+-- 001_initial_schema.sql, so this file is skipped.
+CREATE INDEX IF NOT EXISTS idx_archon_page_metadata_source_url ON archon_page_metadata(source_id, url);
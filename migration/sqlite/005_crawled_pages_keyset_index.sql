@@ -0,0 +1,8 @@
+-- Migration: Crawled Pages Keyset Index
+-- Description: Composite index for keyset pagination of chunks per source
+-- Created: 2026-10-18
+
+-- Chunk listings seek on (url, chunk_number) within a source instead of
+-- scanning past OFFSET rows. Fresh installs get this index from 001.
+CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_source_url_chunk
+    ON archon_crawled_pages(source_id, url, chunk_number);
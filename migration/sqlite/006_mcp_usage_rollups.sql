@@ -0,0 +1,55 @@
+-- Migration: MCP Usage Rollups
+-- Description: Replace per-row aggregation triggers with tracker-maintained rollups
+-- Created: 2026-10-18
+
+-- The MCP usage tracker now aggregates events in memory and merges hourly,
+-- daily and per-source rollups when it flushes an event batch, so the
+-- triggers that upserted the aggregation tables (and ran the retention
+-- DELETEs) on every inserted event are dropped.
+--
+-- Upgrades existing databases only: fresh installs get the final schema from
+-- 002_mcp_usage_tracking.sql, including the sentinel table, so this file is
+-- skipped.
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_mcp_events_hourly_insert;
+DROP TRIGGER IF EXISTS trg_mcp_events_daily_insert;
+DROP TRIGGER IF EXISTS trg_mcp_events_cleanup;
+
+-- Totals make averages mergeable; histograms back latency percentiles
+ALTER TABLE archon_mcp_usage_hourly ADD COLUMN total_response_time_ms INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE archon_mcp_usage_hourly ADD COLUMN latency_histogram TEXT;
+ALTER TABLE archon_mcp_usage_daily ADD COLUMN total_response_time_ms INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE archon_mcp_usage_daily ADD COLUMN latency_histogram TEXT;
+
+UPDATE archon_mcp_usage_hourly SET total_response_time_ms = avg_response_time_ms * call_count;
+UPDATE archon_mcp_usage_daily SET total_response_time_ms = avg_response_time_ms * call_count;
+
+CREATE TABLE IF NOT EXISTS archon_mcp_usage_source_hourly (
+    hour_bucket DATETIME NOT NULL,
+    source_id TEXT NOT NULL,
+    query_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    total_response_time_ms INTEGER NOT NULL DEFAULT 0,
+    unique_queries INTEGER NOT NULL DEFAULT 0,
+    latency_histogram TEXT,
+    last_updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (hour_bucket, source_id)
+);
+
+-- Backfill per-source rollups from the retained raw events
+INSERT OR REPLACE INTO archon_mcp_usage_source_hourly (
+    hour_bucket, source_id, query_count, error_count, total_response_time_ms, unique_queries
+)
+SELECT
+    datetime(strftime('%Y-%m-%d %H:00:00', timestamp)),
+    source_id,
+    COUNT(*),
+    SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END),
+    SUM(response_time_ms),
+    COUNT(DISTINCT query_text)
+FROM archon_mcp_usage_events
+WHERE source_id IS NOT NULL
+GROUP BY datetime(strftime('%Y-%m-%d %H:00:00', timestamp)), source_id;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Migration: Project Search Index
+-- Description: Full-text index over project titles and descriptions
+-- Created: 2026-10-18
+
+-- find_projects searches and pages projects in SQL instead of loading every
+-- project with its docs/features/data JSON. The index is maintained by the
+-- repository's project create/update/delete methods.
+CREATE VIRTUAL TABLE IF NOT EXISTS archon_projects_fts USING fts5(
+    project_id UNINDEXED,
+    title,
+    description,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+INSERT INTO archon_projects_fts (project_id, title, description)
+SELECT id, title, COALESCE(description, '')
+FROM archon_projects
+WHERE id NOT IN (SELECT project_id FROM archon_projects_fts);
+
+-- Keyset pagination over (created_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_archon_projects_created_at_id ON archon_projects(created_at, id);
@@ -0,0 +1,19 @@
+-- Migration: Delta-Encoded Document Versions
+-- Description: Keyframe/delta storage format and a version lookup index
+-- Created: 2026-10-18
+
+-- Document versions are stored as periodic full snapshots (keyframes) with
+-- JSON Patch deltas in between. Existing rows are full snapshots, which the
+-- column default already records.
+--
+-- Upgrades existing databases only: fresh installs get the column and the
+-- sentinel index from 001_initial_schema.sql, so this file is skipped.
+BEGIN;
+
+ALTER TABLE archon_document_versions ADD COLUMN storage_format TEXT NOT NULL DEFAULT 'snapshot';
+
+-- Latest version number and keyframe lookups per project field
+CREATE INDEX IF NOT EXISTS idx_archon_document_versions_project_field_version
+    ON archon_document_versions(project_id, field_name, version_number);
+
+COMMIT;
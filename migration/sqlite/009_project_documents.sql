@@ -0,0 +1,65 @@
+-- Migration: Project Documents
+-- Description: One row per project document instead of the archon_projects.docs JSON array
+-- Created: 2026-10-18
+
+-- Adding, editing or deleting a document writes only that document's row.
+-- `revision` is bumped on every write so callers can detect concurrent edits
+-- (optimistic concurrency); `version` stays the user-facing document version.
+-- New content is stored zlib-compressed (content_encoding 'zlib'); rows moved
+-- over from the JSON array keep plain JSON ('json') until their next edit.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS archon_project_documents (
+    id TEXT NOT NULL,
+    project_id TEXT NOT NULL REFERENCES archon_projects(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL DEFAULT 0,
+    document_type TEXT,
+    title TEXT,
+    status TEXT DEFAULT 'draft',
+    version TEXT DEFAULT '1.0',
+    tags TEXT DEFAULT '[]',
+    author TEXT,
+    metadata TEXT DEFAULT '{}',          -- any other document keys
+    content BLOB,
+    content_encoding TEXT NOT NULL DEFAULT 'zlib',
+    content_size INTEGER NOT NULL DEFAULT 0,  -- bytes of uncompressed JSON content
+    revision INTEGER NOT NULL DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Document ids are only unique within their project (copied docs keep theirs)
+    PRIMARY KEY (project_id, id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_archon_project_documents_project_position
+    ON archon_project_documents(project_id, position);
+
+-- Move existing documents out of the JSON array
+INSERT OR IGNORE INTO archon_project_documents (
+    id, project_id, position, document_type, title, status, version, tags, author,
+    metadata, content, content_encoding, content_size, created_at, updated_at
+)
+SELECT
+    COALESCE(json_extract(d.value, '$.id'), lower(hex(randomblob(16)))),
+    p.id,
+    CAST(d.key AS INTEGER),
+    json_extract(d.value, '$.document_type'),
+    json_extract(d.value, '$.title'),
+    COALESCE(json_extract(d.value, '$.status'), 'draft'),
+    COALESCE(json_extract(d.value, '$.version'), '1.0'),
+    COALESCE(json_extract(d.value, '$.tags'), '[]'),
+    json_extract(d.value, '$.author'),
+    json_remove(
+        d.value, '$.id', '$.document_type', '$.title', '$.status', '$.version', '$.tags',
+        '$.author', '$.content', '$.created_at', '$.updated_at', '$.revision'
+    ),
+    json_quote(json_extract(d.value, '$.content')),
+    'json',
+    length(CAST(json_quote(json_extract(d.value, '$.content')) AS BLOB)),
+    COALESCE(json_extract(d.value, '$.created_at'), p.created_at),
+    COALESCE(json_extract(d.value, '$.updated_at'), p.updated_at)
+FROM archon_projects p, json_each(CASE WHEN json_valid(p.docs) THEN p.docs ELSE '[]' END) d
+WHERE json_type(d.value) = 'object';
+
+UPDATE archon_projects SET docs = '[]' WHERE docs IS NOT NULL AND docs != '[]';
+
+COMMIT;
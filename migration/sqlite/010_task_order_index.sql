@@ -0,0 +1,8 @@
+-- Migration: Task Order Index
+-- Description: Composite index for sparse task ordering within a board column
+-- Created: 2026-10-18
+
+-- Inserting a task at a position only looks at the tasks of its project and
+-- status from that task_order upwards. Fresh installs get this index from 001.
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_project_status_order
+    ON archon_tasks(project_id, status, task_order);
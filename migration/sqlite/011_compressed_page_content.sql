@@ -0,0 +1,28 @@
+-- Migration: Compressed Page Content
+-- Description: Compress page bodies with per-source zlib dictionaries; chunks may reference them
+-- Created: 2026-10-19
+
+-- New page bodies are stored zlib-compressed in full_content ('zlib'), or with
+-- the preset dictionary trained from their source's pages ('zlib-dict',
+-- dictionary_id). Chunks found verbatim in their page body may be stored as a
+-- character range of it ('ref': content_offset, content_length) instead of a
+-- copy of the text. Existing rows keep plain text ('text').
+-- Fresh installs get these columns and the table from 001.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS archon_source_dictionaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_id TEXT NOT NULL UNIQUE REFERENCES archon_sources(source_id) ON DELETE CASCADE,
+    dictionary BLOB NOT NULL,
+    sample_pages INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE archon_page_metadata ADD COLUMN content_encoding TEXT NOT NULL DEFAULT 'text';
+ALTER TABLE archon_page_metadata ADD COLUMN dictionary_id INTEGER;
+
+ALTER TABLE archon_crawled_pages ADD COLUMN content_encoding TEXT NOT NULL DEFAULT 'text';
+ALTER TABLE archon_crawled_pages ADD COLUMN content_offset INTEGER;
+ALTER TABLE archon_crawled_pages ADD COLUMN content_length INTEGER;
+
+COMMIT;
@@ -0,0 +1,43 @@
+-- Migration: Source Stats
+-- Description: Per-source corpus statistics maintained on the write path
+-- Created: 2026-10-19
+
+-- The repository adjusts a source's row in the same transaction as every
+-- insert or delete of its pages, chunks and code examples, so database
+-- metrics are read from here instead of being counted per source.
+-- content_bytes is the stored size of page bodies (after compression),
+-- chunk text and code examples (content and summary).
+--
+-- Upgrades existing databases only: fresh installs get the table from
+-- 001_initial_schema.sql, so this file is skipped.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS archon_source_stats (
+    source_id TEXT PRIMARY KEY REFERENCES archon_sources(source_id) ON DELETE CASCADE,
+    page_count INTEGER NOT NULL DEFAULT 0,
+    chunk_count INTEGER NOT NULL DEFAULT 0,
+    code_example_count INTEGER NOT NULL DEFAULT 0,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    content_bytes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Backfill existing sources
+INSERT OR REPLACE INTO archon_source_stats (
+    source_id, page_count, chunk_count, code_example_count, word_count, content_bytes
+)
+SELECT
+    s.source_id,
+    (SELECT COUNT(*) FROM archon_page_metadata p WHERE p.source_id = s.source_id),
+    (SELECT COUNT(*) FROM archon_crawled_pages c WHERE c.source_id = s.source_id),
+    (SELECT COUNT(*) FROM archon_code_examples e WHERE e.source_id = s.source_id),
+    (SELECT COALESCE(SUM(word_count), 0) FROM archon_page_metadata p WHERE p.source_id = s.source_id),
+    (SELECT COALESCE(SUM(LENGTH(CAST(full_content AS BLOB))), 0)
+        FROM archon_page_metadata p WHERE p.source_id = s.source_id)
+    + (SELECT COALESCE(SUM(LENGTH(CAST(content AS BLOB))), 0)
+        FROM archon_crawled_pages c WHERE c.source_id = s.source_id)
+    + (SELECT COALESCE(SUM(LENGTH(CAST(content AS BLOB)) + LENGTH(CAST(summary AS BLOB))), 0)
+        FROM archon_code_examples e WHERE e.source_id = s.source_id)
+FROM archon_sources s;
+
+COMMIT;
@@ -14,6 +14,7 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.middleware import usage_tracker
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
+from src.mcp_server.utils.http_client import get_http_client
 from src.mcp_server.utils.timeout_config import get_default_timeout
 from src.server.config.service_discovery import get_api_url
 
@@ -73,7 +74,7 @@ def register_document_tools(mcp: FastMCP):
 
             # Single document get mode
             if document_id:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+                async with get_http_client(timeout) as client:
                     response = await client.get(
                         urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}")
                     )
@@ -93,7 +94,7 @@ def register_document_tools(mcp: FastMCP):
                         return MCPErrorFormatter.from_http_error(response, "get document")
 
             # List mode
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 response = await client.get(
                     urljoin(api_url, f"/api/projects/{project_id}/docs")
                 )
@@ -152,6 +153,7 @@ def register_document_tools(mcp: FastMCP):
         content: dict[str, Any] | None = None,
         tags: list[str] | None = None,
         author: str | None = None,
+        revision: int | None = None,
     ) -> str:
         """
         Manage documents (consolidated: create/update/delete).
@@ -165,6 +167,8 @@ def register_document_tools(mcp: FastMCP):
             content: Structured JSON content
             tags: List of tags (e.g. ["backend", "auth"])
             author: Document author name
+            revision: Document revision last read (update only); the update is
+                rejected if someone else edited the document since
         
         Examples:
             manage_document("create", project_id="p-1", title="API Spec", document_type="spec")
@@ -177,7 +181,7 @@ def register_document_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 if action == "create":
                     if not title or not document_type:
                         return MCPErrorFormatter.format_error(
@@ -232,6 +236,8 @@ def register_document_tools(mcp: FastMCP):
                             "validation_error",
                             "No fields to update"
                         )
+                    if revision is not None:
+                        update_data["revision"] = revision
 
                     response = await client.put(
                         urljoin(api_url, f"/api/projects/{project_id}/docs/{document_id}"),
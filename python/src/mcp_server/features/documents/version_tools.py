@@ -14,6 +14,7 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.middleware import usage_tracker
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
+from src.mcp_server.utils.http_client import get_http_client
 from src.mcp_server.utils.timeout_config import get_default_timeout
 from src.server.config.service_discovery import get_api_url
 
@@ -51,7 +52,8 @@ def register_version_tools(mcp: FastMCP):
         
         Args:
             project_id: Project UUID (required)
-            field_name: Filter by field (docs/features/data/prd)
+            field_name: Filter by field (docs/features/data/prd, or docs:<document_id>
+                for the edit history of a single document)
             version_number: Get specific version (requires field_name)
             page: Page number for pagination
             per_page: Items per page (default: 10)
@@ -70,7 +72,7 @@ def register_version_tools(mcp: FastMCP):
 
             # Single version get mode
             if field_name and version_number is not None:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+                async with get_http_client(timeout) as client:
                     response = await client.get(
                         urljoin(api_url, f"/api/projects/{project_id}/versions/{field_name}/{version_number}")
                     )
@@ -94,7 +96,7 @@ def register_version_tools(mcp: FastMCP):
             if field_name:
                 params["field_name"] = field_name
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 response = await client.get(
                     urljoin(api_url, f"/api/projects/{project_id}/versions"),
                     params=params
@@ -148,7 +150,7 @@ def register_version_tools(mcp: FastMCP):
         Args:
             action: "create" | "restore"
             project_id: Project UUID (required)
-            field_name: docs/features/data/prd
+            field_name: docs/features/data/prd, or docs:<document_id> for a single document
             version_number: Version to restore (for restore action)
             content: Content to snapshot (for create action)
             change_summary: What changed (for create)
@@ -167,7 +169,7 @@ def register_version_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 if action == "create":
                     if not content:
                         return MCPErrorFormatter.format_error(
@@ -13,6 +13,7 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.middleware import usage_tracker
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
+from src.mcp_server.utils.http_client import get_http_client
 from src.mcp_server.utils.timeout_config import get_default_timeout
 from src.server.config.service_discovery import get_api_url
 
@@ -76,7 +77,7 @@ def register_feature_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 response = await client.get(
                     urljoin(api_url, f"/api/projects/{project_id}/features")
                 )
@@ -14,6 +14,7 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.middleware import usage_tracker
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
+from src.mcp_server.utils.http_client import get_http_client
 from src.mcp_server.utils.timeout_config import (
     get_default_timeout,
     get_max_polling_attempts,
@@ -60,7 +61,7 @@ def register_project_tools(mcp: FastMCP):
         ctx: Context,
         project_id: str | None = None,  # For getting single project
         query: str | None = None,  # Search capability
-        page: int = 1,
+        cursor: str | None = None,
         per_page: int = DEFAULT_PAGE_SIZE,
     ) -> str:
         """
@@ -69,7 +70,7 @@ def register_project_tools(mcp: FastMCP):
         Args:
             project_id: Get specific project by ID (returns full details)
             query: Keyword search in title/description
-            page: Page number for pagination  
+            cursor: next_cursor from a previous call to get the next page
             per_page: Items per page (default: 10)
         
         Returns:
@@ -78,6 +79,7 @@ def register_project_tools(mcp: FastMCP):
         Examples:
             list_projects()  # All projects
             list_projects(query="auth")  # Search projects
+            list_projects(cursor="eyJ...")  # Next page
             list_projects(project_id="proj-123")  # Get specific project
         """
         try:
@@ -86,7 +88,7 @@ def register_project_tools(mcp: FastMCP):
 
             # Single project get mode
             if project_id:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+                async with get_http_client(timeout) as client:
                     response = await client.get(urljoin(api_url, f"/api/projects/{project_id}"))
 
                     if response.status_code == 200:
@@ -103,37 +105,26 @@ def register_project_tools(mcp: FastMCP):
                     else:
                         return MCPErrorFormatter.from_http_error(response, "get project")
 
-            # List mode
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(urljoin(api_url, "/api/projects"))
+            # List mode - search and pagination run in the API, which returns lightweight projections
+            params = {"limit": max(1, min(per_page, 100))}
+            if query:
+                params["query"] = query
+            if cursor:
+                params["cursor"] = cursor
+
+            async with get_http_client(timeout) as client:
+                response = await client.get(urljoin(api_url, "/api/projects"), params=params)
 
                 if response.status_code == 200:
                     data = response.json()
-                    projects = data.get("projects", [])
-
-                    # Apply search filter if provided
-                    if query:
-                        query_lower = query.lower()
-                        projects = [
-                            p for p in projects
-                            if query_lower in p.get("title", "").lower()
-                            or query_lower in p.get("description", "").lower()
-                        ]
-
-                    # Apply pagination
-                    start_idx = (page - 1) * per_page
-                    end_idx = start_idx + per_page
-                    paginated = projects[start_idx:end_idx]
-
-                    # Optimize project responses
-                    optimized = [optimize_project_response(p) for p in paginated]
+                    projects = [optimize_project_response(p) for p in data.get("projects", [])]
 
                     return json.dumps({
                         "success": True,
-                        "projects": optimized,
-                        "count": len(optimized),
-                        "total": len(projects),
-                        "page": page,
+                        "projects": projects,
+                        "count": len(projects),
+                        "next_cursor": data.get("next_cursor"),
+                        "has_more": data.get("has_more", False),
                         "per_page": per_page,
                         "query": query
                     })
@@ -177,7 +168,7 @@ def register_project_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = get_default_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 if action == "create":
                     if not title:
                         return MCPErrorFormatter.format_error(
@@ -208,7 +199,7 @@ def register_project_tools(mcp: FastMCP):
                                     sleep_interval = get_polling_interval(attempt)
                                     await asyncio.sleep(sleep_interval)
 
-                                    async with httpx.AsyncClient(timeout=polling_timeout) as poll_client:
+                                    async with get_http_client(polling_timeout) as poll_client:
                                         poll_response = await poll_client.get(
                                             urljoin(api_url, f"/api/progress/{result['progress_id']}")
                                         )
@@ -21,6 +21,7 @@ from mcp.server.fastmcp import Context, FastMCP
 # Import service discovery for HTTP communication
 from src.server.config.service_discovery import get_api_url
 from src.mcp_server.middleware import usage_tracker
+from src.mcp_server.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,7 @@ def register_rag_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = httpx.Timeout(30.0, connect=5.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 response = await client.get(urljoin(api_url, "/api/rag/sources"))
 
                 if response.status_code == 200:
@@ -116,7 +117,7 @@ def register_rag_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = httpx.Timeout(30.0, connect=5.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 request_data = {
                     "query": query,
                     "match_count": match_count,
@@ -182,7 +183,7 @@ def register_rag_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = httpx.Timeout(30.0, connect=5.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 request_data = {"query": query, "match_count": match_count}
                 if source_id:
                     request_data["source"] = source_id
@@ -221,7 +222,11 @@ def register_rag_tools(mcp: FastMCP):
     @mcp.tool()
     @usage_tracker.track_tool('rag_list_pages_for_source', 'rag')
     async def rag_list_pages_for_source(
-        ctx: Context, source_id: str, section: str | None = None
+        ctx: Context,
+        source_id: str,
+        section: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> str:
         """
         List all pages for a given knowledge source.
@@ -232,6 +237,8 @@ def register_rag_tools(mcp: FastMCP):
         Args:
             source_id: Source ID from rag_get_available_sources() (e.g., "src_1234abcd")
             section: Optional filter for llms-full.txt section title (e.g., "# Core Concepts")
+            limit: Optional page size (1-500) for large sources; enables cursor pagination
+            cursor: next_cursor from a previous call to fetch the following page
 
         Returns:
             JSON string with structure:
@@ -239,6 +246,7 @@ def register_rag_tools(mcp: FastMCP):
             - pages: list[dict] - Array of page objects with id, url, section_title, word_count
             - total: int - Total number of pages
             - source_id: str - The source ID that was queried
+            - next_cursor: str|null - Pass as cursor to get the next page (null on the last page)
             - error: str|null - Error description if success=false
 
         Example workflow:
@@ -250,10 +258,14 @@ def register_rag_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = httpx.Timeout(30.0, connect=5.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 params = {"source_id": source_id}
                 if section:
                     params["section"] = section
+                if limit is not None:
+                    params["limit"] = limit
+                if cursor:
+                    params["cursor"] = cursor
 
                 response = await client.get(
                     urljoin(api_url, "/api/pages"),
@@ -268,6 +280,7 @@ def register_rag_tools(mcp: FastMCP):
                             "pages": result.get("pages", []),
                             "total": result.get("total", 0),
                             "source_id": result.get("source_id", source_id),
+                            "next_cursor": result.get("next_cursor"),
                             "error": None,
                         },
                         indent=2,
@@ -329,7 +342,7 @@ def register_rag_tools(mcp: FastMCP):
             api_url = get_api_url()
             timeout = httpx.Timeout(30.0, connect=5.0)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 if page_id:
                     response = await client.get(urljoin(api_url, f"/api/pages/{page_id}"))
                 else:
@@ -14,6 +14,7 @@ import httpx
 from mcp.server.fastmcp import Context, FastMCP
 from src.mcp_server.middleware import usage_tracker
 from src.mcp_server.utils.error_handling import MCPErrorFormatter
+from src.mcp_server.utils.http_client import get_http_client
 from src.mcp_server.utils.timeout_config import get_default_timeout
 from src.server.config.service_discovery import get_api_url
 
@@ -49,6 +50,99 @@ def optimize_task_response(task: dict) -> dict:
     return task
 
 
+async def _manage_tasks_batch(
+    client: httpx.AsyncClient,
+    api_url: str,
+    action: str,
+    tasks: list[dict[str, Any]],
+    project_id: str | None,
+) -> str:
+    """Send a manage_task batch to the matching batch endpoint in one request."""
+    if not tasks:
+        return MCPErrorFormatter.format_error(
+            "validation_error",
+            "tasks must contain at least one task",
+            suggestion="Provide a non-empty list of task dicts"
+        )
+
+    if action == "create":
+        payload = []
+        for task in tasks:
+            task_project_id = task.get("project_id") or project_id
+            if not task_project_id or not task.get("title"):
+                return MCPErrorFormatter.format_error(
+                    "validation_error",
+                    "project_id and title required for every task in a create batch",
+                    suggestion="Pass project_id once or in each task, and a title in each task"
+                )
+            payload.append({
+                "project_id": task_project_id,
+                "title": task["title"],
+                "description": task.get("description") or "",
+                "assignee": task.get("assignee") or "User",
+                "task_order": task.get("task_order") or 0,
+                "feature": task.get("feature"),
+            })
+        response = await client.post(urljoin(api_url, "/api/tasks/batch"), json={"tasks": payload})
+
+    elif action == "update":
+        payload = []
+        for task in tasks:
+            task_id = task.get("task_id") or task.get("id")
+            update_fields = {
+                field: task[field]
+                for field in ("title", "description", "status", "assignee", "task_order", "feature")
+                if task.get(field) is not None
+            }
+            if not task_id or not update_fields:
+                return MCPErrorFormatter.format_error(
+                    "validation_error",
+                    "Every task in an update batch needs task_id and at least one field",
+                    suggestion="Provide task_id plus the fields to change in each task"
+                )
+            payload.append({"id": task_id, **update_fields})
+        response = await client.put(urljoin(api_url, "/api/tasks/batch"), json={"tasks": payload})
+
+    elif action == "delete":
+        task_ids = [task.get("task_id") or task.get("id") for task in tasks]
+        if not all(task_ids):
+            return MCPErrorFormatter.format_error(
+                "validation_error",
+                "Every task in a delete batch needs task_id",
+                suggestion="Provide task_id in each task"
+            )
+        response = await client.post(
+            urljoin(api_url, "/api/tasks/batch/archive"), json={"task_ids": task_ids}
+        )
+
+    else:
+        return MCPErrorFormatter.format_error(
+            "invalid_action",
+            f"Unknown action: {action}",
+            suggestion="Use 'create', 'update', or 'delete'"
+        )
+
+    if response.status_code != 200:
+        return MCPErrorFormatter.from_http_error(response, f"{action} tasks")
+
+    result = response.json()
+    if action == "delete":
+        return json.dumps({
+            "success": True,
+            "task_ids": result.get("task_ids", []),
+            "count": result.get("count", 0),
+            "message": result.get("message", "Tasks deleted successfully"),
+        })
+
+    optimized_tasks = [optimize_task_response(task) for task in result.get("tasks", [])]
+    return json.dumps({
+        "success": True,
+        "tasks": optimized_tasks,
+        "count": len(optimized_tasks),
+        "message": result.get("message", f"Tasks {action}d successfully"),
+    })
+
+
 def register_task_tools(mcp: FastMCP):
     """Register consolidated task management tools with the MCP server."""
 
@@ -93,7 +187,7 @@ def register_task_tools(mcp: FastMCP):
 
             # Single task get mode
             if task_id:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+                async with get_http_client(timeout) as client:
                     response = await client.get(urljoin(api_url, f"/api/tasks/{task_id}"))
 
                     if response.status_code == 200:
@@ -149,7 +243,7 @@ def register_task_tools(mcp: FastMCP):
                 url = urljoin(api_url, "/api/tasks")
                 params["include_closed"] = include_closed
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
 
@@ -210,10 +304,11 @@ def register_task_tools(mcp: FastMCP):
         status: str | None = None,
         assignee: str | None = None,
         task_order: int | None = None,
-        feature: str | None = None
+        feature: str | None = None,
+        tasks: list[dict[str, Any]] | None = None,
     ) -> str:
         """
-        Manage tasks (consolidated: create/update/delete).
+        Manage tasks (consolidated: create/update/delete), one at a time or in batches.
 
         TASK GRANULARITY GUIDANCE:
         - For feature-specific projects: Create detailed implementation tasks (setup, implement, test, document)
@@ -235,20 +330,30 @@ def register_task_tools(mcp: FastMCP):
                      Default: "User"
             task_order: Priority 0-100 (higher = more priority)
             feature: Feature label for grouping
+            tasks: Batch mode - list of task dicts handled in one request and one
+                   transaction (all or nothing). For create each dict takes the
+                   create fields (project_id defaults to the project_id argument);
+                   for update each needs "task_id" plus the fields to change; for
+                   delete each needs "task_id".
 
         Examples:
           manage_task("create", project_id="p-1", title="Research existing patterns", description="Study codebase for similar implementations")
           manage_task("create", project_id="p-1", title="Write unit tests", description="Cover all edge cases with 80% coverage")
           manage_task("update", task_id="t-1", status="doing", assignee="User")
           manage_task("delete", task_id="t-1")
+          manage_task("create", project_id="p-1", tasks=[{"title": "Setup"}, {"title": "Implement"}])
+          manage_task("update", tasks=[{"task_id": "t-1", "status": "done"}, {"task_id": "t-2", "status": "doing"}])
 
-        Returns: {success: bool, task?: object, message: string}
+        Returns: {success: bool, task?: object, tasks?: array, message: string}
         """
         try:
             api_url = get_api_url()
             timeout = get_default_timeout()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+            async with get_http_client(timeout) as client:
+                if tasks is not None:
+                    return await _manage_tasks_batch(client, api_url, action, tasks, project_id)
+
                 if action == "create":
                     if not project_id or not title:
                         return MCPErrorFormatter.format_error(
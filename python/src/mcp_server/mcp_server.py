@@ -59,6 +59,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Import usage tracking (buffered writer is flushed on shutdown)
+from src.mcp_server.middleware import usage_tracker
+
+# Shared keep-alive HTTP client for tool calls to the API
+from src.mcp_server.utils.http_client import SharedHTTPClient, get_shared_http_client, set_shared_http_client
+
 # Import Logfire configuration
 from src.server.config.logfire_config import mcp_logger, setup_logfire
 
@@ -94,6 +100,7 @@ class ArchonContext:
     """
 
     service_client: Any
+    http_client: SharedHTTPClient | None = None
     health_status: dict = None
     startup_time: float = None
 
@@ -169,8 +176,13 @@ async def lifespan(server: FastMCP) -> AsyncIterator[ArchonContext]:
             service_client = get_mcp_service_client()
             logger.info("✓ Service client initialized")
 
+            # One pooled keep-alive client for all tool calls to the API
+            http_client = SharedHTTPClient()
+            set_shared_http_client(http_client)
+            logger.info(f"✓ Shared HTTP client initialized (http2={http_client.http2})")
+
             # Create context
-            context = ArchonContext(service_client=service_client)
+            context = ArchonContext(service_client=service_client, http_client=http_client)
 
             # Perform initial health check
             await perform_health_checks(context)
@@ -190,6 +202,16 @@ async def lifespan(server: FastMCP) -> AsyncIterator[ArchonContext]:
         finally:
             # Clean up resources
             logger.info("🧹 Cleaning up MCP server...")
+            shared_http_client = get_shared_http_client()
+            if shared_http_client is not None:
+                set_shared_http_client(None)
+                await shared_http_client.aclose()
+                logger.info(f"✓ Shared HTTP client closed | stats={shared_http_client.get_stats()}")
+            try:
+                await usage_tracker.shutdown()
+                logger.info(f"✓ Usage events flushed | stats={usage_tracker.get_stats()}")
+            except Exception as e:
+                logger.error(f"Failed to flush usage events: {e}")
             logger.info("✅ MCP server shutdown complete")
 
 
@@ -256,7 +278,7 @@ IMPORTANT: Always use source_id (not URLs or domain names) for filtering!
 ## 🏗️ Project Management
 
 ### Project Tools
-- `list_projects(project_id=None, query=None, page=1, per_page=10)`
+- `list_projects(project_id=None, query=None, cursor=None, per_page=10)`
   - List all projects, search by query, or get specific project by ID
 - `manage_project(action, project_id=None, title=None, description=None, github_repo=None)`
   - Actions: "create", "update", "delete"
@@ -368,6 +390,7 @@ async def health_check(ctx: Context) -> str:
                 "success": True,
                 "health": context.health_status,
                 "uptime_seconds": time.time() - context.startup_time,
+                "http_client": context.http_client.get_stats() if context.http_client else None,
                 "timestamp": datetime.now().isoformat(),
             })
         else:
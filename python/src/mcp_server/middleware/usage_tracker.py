@@ -2,7 +2,10 @@
 MCP Usage Tracking Middleware
 
 Captures all MCP tool invocations and stores usage metrics in SQLite time-series database.
-This middleware provides automatic tracking with minimal overhead (< 10ms per request).
+Events are buffered in memory and written by a background flusher in batched
+transactions, so tool calls never wait on a database connection or fsync.
+Hourly, daily and per-source rollups are aggregated in memory as events are
+recorded and merged into their tables in the same transactions.
 
 Usage:
     from src.mcp_server.middleware import usage_tracker
@@ -13,21 +16,33 @@ Usage:
         ...
 """
 
+import asyncio
 import json
-import logging
 import os
 import time
 import uuid
-from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any
 
 import aiosqlite
 
 from src.server.config.logfire_config import get_logger, safe_span
+from src.server.services.mcp_usage_rollups import UsageRollupAggregator, apply_retention
 
 logger = get_logger(__name__)
 
+_INSERT_EVENT_SQL = """
+    INSERT INTO archon_mcp_usage_events (
+        id, tool_name, tool_category, session_id, client_type,
+        request_metadata, source_id, query_text, match_count,
+        response_time_ms, success, error_type, timestamp
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class MCPUsageTracker:
     """
@@ -39,11 +54,25 @@ class MCPUsageTracker:
     """
 
     def __init__(self):
-        """Initialize the usage tracker with SQLite database path."""
+        """Initialize the usage tracker with SQLite database path and write buffer."""
         self.db_path = os.getenv("SQLITE_PATH") or os.getenv("ARCHON_SQLITE_PATH") or "/data/archon.db"
-        self._session_id: Optional[str] = None
+        self._session_id: str | None = None
         self._client_type: str = "unknown"
         self._enabled: bool = True  # Can be disabled for testing
+
+        # Ring buffer of pending events; the oldest event is dropped when full
+        self.buffer_size = int(os.getenv("MCP_USAGE_BUFFER_SIZE", "10000"))
+        self.flush_interval_ms = int(os.getenv("MCP_USAGE_FLUSH_INTERVAL_MS", "1000"))
+        self.flush_batch_size = int(os.getenv("MCP_USAGE_FLUSH_BATCH_SIZE", "100"))
+        self._buffer: deque[tuple] = deque()
+        self._flush_event: asyncio.Event | None = None
+        self._flusher_task: asyncio.Task | None = None
+        self._stopping = False
+        self._stats = {"recorded": 0, "written": 0, "dropped": 0, "failed": 0, "flushes": 0}
+        self._rollups = UsageRollupAggregator()
+        # Retention runs at most once per interval, from the flusher
+        self.retention_interval_seconds = 3600
+        self._last_retention = 0.0
         logger.debug(f"Initialized MCPUsageTracker with database: {self.db_path}")
 
     def set_session_context(self, session_id: str, client_type: str = "unknown"):
@@ -73,16 +102,19 @@ class MCPUsageTracker:
         tool_name: str,
         tool_category: str,
         request_data: dict[str, Any],
-        response_data: Optional[Any] = None,
+        response_data: Any | None = None,
         response_time_ms: int = 0,
         success: bool = True,
-        error_type: Optional[str] = None,
+        error_type: str | None = None,
     ):
         """
-        Record a tool usage event in the SQLite database.
+        Record a tool usage event.
 
-        This method is fire-and-forget to avoid blocking tool execution.
-        Any errors during tracking are logged but don't affect the tool.
+        The event is appended to the in-memory buffer and folded into the
+        rollup aggregates; both are written to SQLite by the background flusher,
+        so this never waits on the database. Use flush() to write pending events
+        immediately. Any errors during tracking are logged but don't affect the
+        tool.
 
         Args:
             tool_name: Name of the MCP tool (e.g., 'rag_search_knowledge_base')
@@ -106,34 +138,29 @@ class MCPUsageTracker:
                 query_text = query_text[:500]
 
             match_count = request_data.get("match_count")
+            timestamp = datetime.now(UTC)
 
-            # Insert into SQLite database
-            async with aiosqlite.connect(self.db_path) as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO archon_mcp_usage_events (
-                        id, tool_name, tool_category, session_id, client_type,
-                        request_metadata, source_id, query_text, match_count,
-                        response_time_ms, success, error_type
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        str(uuid.uuid4()),
-                        tool_name,
-                        tool_category,
-                        self._session_id,
-                        self._client_type,
-                        json.dumps(request_data),
-                        source_id,
-                        query_text if query_text else None,
-                        match_count,
-                        response_time_ms,
-                        1 if success else 0,  # SQLite uses INTEGER for boolean
-                        error_type,
-                    ),
-                )
-                await conn.commit()
+            # Rollups count every event, even one later dropped from a full buffer
+            self._rollups.add(
+                tool_name, tool_category, self._session_id, source_id,
+                query_text or None, response_time_ms, success, timestamp,
+            )
+            self._enqueue((
+                str(uuid.uuid4()),
+                tool_name,
+                tool_category,
+                self._session_id,
+                self._client_type,
+                json.dumps(request_data, default=str),
+                source_id,
+                query_text if query_text else None,
+                match_count,
+                response_time_ms,
+                1 if success else 0,  # SQLite uses INTEGER for boolean
+                error_type,
+                # Same format as CURRENT_TIMESTAMP, captured at call time rather than flush time
+                timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            ))
 
             logger.debug(
                 f"Tracked MCP tool usage: {tool_name} "
@@ -145,6 +172,112 @@ class MCPUsageTracker:
             # Just log the error and continue
             logger.error(f"Failed to track MCP usage: {e}", exc_info=True)
 
+    def _enqueue(self, event: tuple) -> None:
+        """Buffer an event and wake the flusher once a full batch is pending."""
+        if len(self._buffer) >= self.buffer_size:
+            self._buffer.popleft()
+            self._stats["dropped"] += 1
+        self._buffer.append(event)
+        self._stats["recorded"] += 1
+
+        self._ensure_flusher()
+        if len(self._buffer) >= self.flush_batch_size and self._flush_event is not None:
+            self._flush_event.set()
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher on the running loop if it is not running there."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = self._flusher_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._flush_event = asyncio.Event()
+        self._flusher_task = loop.create_task(self._flush_loop(self._flush_event))
+
+    async def _flush_loop(self, flush_event: asyncio.Event) -> None:
+        """Flush every flush_interval_ms, or earlier when a full batch is pending, until shutdown."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(flush_event.wait(), self.flush_interval_ms / 1000)
+            except TimeoutError:
+                pass
+            flush_event.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered events and pending rollups in batched transactions.
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        while self._buffer or self._rollups.pending:
+            # Take the batch and rollup deltas synchronously so concurrent flushes never overlap
+            batch = [self._buffer.popleft() for _ in range(min(self.flush_batch_size, len(self._buffer)))]
+            deltas = self._rollups.drain()
+            run_retention = time.monotonic() - self._last_retention >= self.retention_interval_seconds
+            committed = False
+            try:
+                async with aiosqlite.connect(self.db_path) as conn:
+                    if batch:
+                        await conn.executemany(_INSERT_EVENT_SQL, batch)
+                    await self._rollups.write(conn, deltas)
+                    if run_retention:
+                        await apply_retention(conn)
+                    await conn.commit()
+                    committed = True
+                if run_retention:
+                    self._last_retention = time.monotonic()
+                written += len(batch)
+                self._stats["written"] += len(batch)
+                self._stats["flushes"] += 1
+            except Exception as e:
+                # Retry the batch together with its rollup deltas on the next flush
+                self._requeue(batch)
+                self._rollups.restore(deltas)
+                self._stats["failed"] += len(batch)
+                logger.error(f"Failed to flush {len(batch)} MCP usage events: {e}", exc_info=True)
+                break
+            except BaseException:
+                # Cancelled mid-write: keep the batch unless its transaction already committed
+                if not committed:
+                    self._requeue(batch)
+                    self._rollups.restore(deltas)
+                raise
+        return written
+
+    def _requeue(self, batch: list[tuple]) -> None:
+        """Put a failed batch back at the front of the buffer, dropping the oldest on overflow."""
+        self._buffer.extendleft(reversed(batch))
+        while len(self._buffer) > self.buffer_size:
+            self._buffer.popleft()
+            self._stats["dropped"] += 1
+
+    async def shutdown(self) -> None:
+        """Stop the background flusher and write any remaining events."""
+        task = self._flusher_task
+        self._flusher_task = None
+        # A flusher started on another (finished) loop can't be awaited from here
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            # Let an in-flight flush finish instead of cancelling it mid-transaction
+            self._stopping = True
+            if self._flush_event is not None:
+                self._flush_event.set()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._stopping = False
+        await self.flush()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get buffer counters (recorded, written, dropped, failed, flushes, pending)."""
+        return {**self._stats, "pending": len(self._buffer)}
+
     def track_tool(self, tool_name: str, tool_category: str):
         """
         Decorator to automatically track tool usage.
@@ -1,30 +1,158 @@
 """
 HTTP client utilities for MCP Server.
 
-Provides consistent HTTP client configuration.
+Provides consistent HTTP client configuration. The MCP server keeps one pooled,
+keep-alive client for its whole lifespan (see SharedHTTPClient); tools borrow it
+through get_http_client() with their own per-call timeout, so a tool call only
+pays for the API work instead of a TCP connect and pool setup.
 """
 
+import importlib.util
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
 import httpx
 
 from .timeout_config import get_default_timeout, get_polling_timeout
 
+# Lifespan-scoped client registered by the MCP server (None outside the server lifespan)
+_shared_client: "SharedHTTPClient | None" = None
+
+
+def get_connection_limits() -> httpx.Limits:
+    """
+    Get connection pool limits from environment or defaults.
+
+    Environment variables:
+    - MCP_HTTP_MAX_CONNECTIONS: Maximum open connections (default: 50)
+    - MCP_HTTP_MAX_KEEPALIVE: Maximum idle keep-alive connections (default: 20)
+    - MCP_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default: 60)
+
+    Returns:
+        Configured httpx.Limits object
+    """
+    return httpx.Limits(
+        max_connections=int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "50")),
+        max_keepalive_connections=int(os.getenv("MCP_HTTP_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("MCP_HTTP_KEEPALIVE_EXPIRY", "60.0")),
+    )
+
+
+def http2_enabled() -> bool:
+    """
+    Whether the shared client should offer HTTP/2 (MCP_HTTP2, default: true).
+
+    HTTP/2 needs the optional h2 package (httpx[http2]) and is negotiated via
+    ALPN, so it only applies when the API is reached over TLS.
+    """
+    if os.getenv("MCP_HTTP2", "true").lower() not in ("true", "1", "yes"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+class SharedHTTPClient:
+    """
+    Lifespan-scoped pooled HTTP client with connection reuse metrics.
+
+    Wraps a single httpx.AsyncClient and counts requests and newly opened
+    connections (via the httpcore trace extension); every other request reused
+    a pooled keep-alive connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self._stats = {"requests": 0, "connections_opened": 0, "errors": 0}
+        self.http2 = http2_enabled()
+        self.client = httpx.AsyncClient(
+            timeout=get_default_timeout(),
+            limits=get_connection_limits(),
+            http2=self.http2,
+            transport=transport,
+            event_hooks={"request": [self._on_request]},
+        )
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self._stats["requests"] += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._stats["connections_opened"] += 1
+        elif event_name.endswith(".failed"):
+            self._stats["errors"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get reuse counters (requests, connections_opened, reused, errors, reuse_ratio, http2)."""
+        requests = self._stats["requests"]
+        reused = max(requests - self._stats["connections_opened"], 0)
+        return {
+            **self._stats,
+            "reused": reused,
+            "reuse_ratio": round(reused / requests, 3) if requests else 0.0,
+            "http2": self.http2,
+        }
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+
+class _TimeoutBoundClient:
+    """View of the shared client that applies a per-call timeout to every request."""
+
+    def __init__(self, client: httpx.AsyncClient, timeout: httpx.Timeout):
+        self._client = client
+        self._timeout = timeout
+
+    async def request(self, method: str, url: Any, **kwargs: Any) -> httpx.Response:
+        kwargs.setdefault("timeout", self._timeout)
+        return await self._client.request(method, url, **kwargs)
+
+    async def get(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: Any, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+def set_shared_http_client(client: SharedHTTPClient | None) -> None:
+    """Register (or clear, with None) the lifespan-scoped client used by get_http_client()."""
+    global _shared_client
+    _shared_client = client
+
+
+def get_shared_http_client() -> SharedHTTPClient | None:
+    """Get the lifespan-scoped client, if the MCP server registered one."""
+    return _shared_client
+
 
 @asynccontextmanager
 async def get_http_client(
     timeout: httpx.Timeout | None = None, for_polling: bool = False
 ) -> AsyncIterator[httpx.AsyncClient]:
     """
-    Create an HTTP client with consistent configuration.
+    Get an HTTP client with consistent configuration.
+
+    Inside the MCP server lifespan this borrows the shared keep-alive client,
+    applying the timeout to each request; otherwise (scripts, tests) a
+    short-lived client is created.
 
     Args:
         timeout: Optional custom timeout. If not provided, uses defaults.
         for_polling: If True, uses polling-specific timeout configuration.
 
     Yields:
-        Configured httpx.AsyncClient
+        Configured httpx.AsyncClient (or a per-call-timeout view of the shared one)
 
     Example:
         async with get_http_client() as client:
@@ -33,6 +161,10 @@ async def get_http_client(
     if timeout is None:
         timeout = get_polling_timeout() if for_polling else get_default_timeout()
 
-    # Future: Could add retry logic, custom headers, etc. here
+    shared = _shared_client
+    if shared is not None and not shared.client.is_closed:
+        yield _TimeoutBoundClient(shared.client, timeout)
+        return
+
     async with httpx.AsyncClient(timeout=timeout) as client:
         yield client
@@ -9,20 +9,24 @@ This package organizes the API into logical modules:
 - projects_api: Project and task management with streaming
 """
 
-from .agent_chat_api import router as agent_chat_router
-from .internal_api import router as internal_router
-from .knowledge_api import router as knowledge_router
-from .mcp_api import router as mcp_router
-from .projects_api import router as projects_router
-from .providers_api import router as providers_router
-from .settings_api import router as settings_router
+import importlib
 
-__all__ = [
-    "settings_router",
-    "mcp_router",
-    "knowledge_router",
-    "projects_router",
-    "agent_chat_router",
-    "internal_router",
-    "providers_router",
-]
+# Routers are resolved on first access so importing one API module doesn't
+# import all of them (and their crawling/embedding dependencies)
+_ROUTER_MODULES = {
+    "settings_router": "settings_api",
+    "mcp_router": "mcp_api",
+    "knowledge_router": "knowledge_api",
+    "projects_router": "projects_api",
+    "agent_chat_router": "agent_chat_api",
+    "internal_router": "internal_api",
+    "providers_router": "providers_api",
+}
+
+__all__ = list(_ROUTER_MODULES)
+
+
+def __getattr__(name: str):
+    if name in _ROUTER_MODULES:
+        return importlib.import_module(f".{_ROUTER_MODULES[name]}", __name__).router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,8 @@ This module handles all knowledge base operations including:
 
 import asyncio
 import json
+import os
+import tempfile
 import uuid
 from datetime import datetime
 from urllib.parse import urlparse
@@ -23,14 +25,14 @@ from pydantic import BaseModel
 # Import unified logging
 from ..config.logfire_config import get_logger, safe_logfire_error, safe_logfire_info
 from ..repositories.repository_factory import get_repository
-from ..services.crawler_manager import get_crawler
+from ..services.crawler_manager import acquire_crawler
 from ..services.crawling import CrawlingService
 from ..services.credential_service import credential_service
 from ..services.embeddings.provider_error_adapters import ProviderErrorFactory
 from ..services.knowledge import DatabaseMetricsService, KnowledgeItemService, KnowledgeSummaryService
 from ..services.search.rag_service import RAGService
 from ..services.storage import DocumentStorageService
-from ..utils.document_processing import extract_text_from_document
+from ..utils.document_processing import stream_document_text
 
 # Get logger for this module
 logger = get_logger(__name__)
@@ -38,6 +40,9 @@ logger = get_logger(__name__)
 # Create router
 router = APIRouter(prefix="/api", tags=["knowledge"])
 
+# Uploads are copied to disk in pieces of this size instead of read into memory
+UPLOAD_SPOOL_CHUNK_SIZE = 1024 * 1024
+
 # Create a semaphore to limit concurrent crawl OPERATIONS (not pages within a crawl)
 # This prevents the server from becoming unresponsive during heavy crawling
 #
@@ -366,7 +371,9 @@ async def get_knowledge_item_chunks(
     source_id: str,
     domain_filter: str | None = None,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str | None = None,
+    include_content: bool = True
 ):
     """
     Get document chunks for a specific knowledge item with pagination.
@@ -376,6 +383,8 @@ async def get_knowledge_item_chunks(
         domain_filter: Optional domain filter for URLs
         limit: Maximum number of chunks to return (default 20, max 100)
         offset: Number of chunks to skip (for pagination)
+        cursor: Keyset cursor from a previous response's next_cursor (takes precedence over offset)
+        include_content: Whether to return chunk content (False returns metadata only)
 
     Returns:
         Paginated chunks with metadata
@@ -395,12 +404,17 @@ async def get_knowledge_item_chunks(
         repository = get_repository()
         service = KnowledgeItemService(repository=repository)
 
-        result = await service.get_chunks_for_source(
-            source_id=source_id,
-            domain_filter=domain_filter,
-            limit=limit,
-            offset=offset
-        )
+        try:
+            result = await service.get_chunks_for_source(
+                source_id=source_id,
+                domain_filter=domain_filter,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                include_content=include_content
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail={"error": str(e)}) from e
 
         chunks = result.get("chunks", [])
 
@@ -482,6 +496,7 @@ async def get_knowledge_item_chunks(
             "limit": limit,
             "offset": offset,
             "has_more": result.get("has_more", False),
+            "next_cursor": result.get("next_cursor"),
         }
 
     except HTTPException:
@@ -656,11 +671,9 @@ async def refresh_knowledge_item(source_id: str):
             logger.warning(f"Failed to set initial crawl_status to pending: {e}")
             safe_logfire_error(f"Failed to set crawl_status | error={e} | source_id={source_id}")
 
-        # Get crawler from CrawlerManager - same pattern as _perform_crawl_with_progress
+        # Lease a pooled crawler from CrawlerManager - same pattern as _perform_crawl_with_progress
         try:
-            crawler = await get_crawler()
-            if crawler is None:
-                raise Exception("Crawler not available - initialization may have failed")
+            crawler_lease = await acquire_crawler()
         except Exception as e:
             safe_logfire_error(f"Failed to get crawler | error={str(e)}")
             raise HTTPException(
@@ -670,7 +683,7 @@ async def refresh_knowledge_item(source_id: str):
         # Use the same crawl orchestration as regular crawl
         repository = get_repository()
         crawl_service = CrawlingService(
-            crawler=crawler, repository=repository
+            crawler=crawler_lease.crawler, repository=repository
         )
         crawl_service.set_progress_id(progress_id)
 
@@ -697,9 +710,16 @@ async def refresh_knowledge_item(source_id: str):
                     crawl_task = result.get("task")
                     if crawl_task:
                         active_crawl_tasks[progress_id] = crawl_task
+                        # The browser stays leased until the background crawl finishes
+                        crawl_task.add_done_callback(lambda _: crawler_lease.release())
                         safe_logfire_info(
                             f"Stored actual refresh crawl task | progress_id={progress_id} | task_name={crawl_task.get_name()}"
                         )
+                    else:
+                        crawler_lease.release()
+            except BaseException:
+                crawler_lease.release()
+                raise
             finally:
                 # Clean up task from registry when done (success or failure)
                 if progress_id in active_crawl_tasks:
@@ -812,23 +832,23 @@ async def _perform_crawl_with_progress(
         safe_logfire_info(
             f"Acquired crawl semaphore | progress_id={progress_id} | url={str(request.url)}"
         )
+        crawler_lease = None
+        crawl_task = None
         try:
             safe_logfire_info(
                 f"Starting crawl with progress tracking | progress_id={progress_id} | url={str(request.url)}"
             )
 
-            # Get crawler from CrawlerManager
+            # Lease a pooled crawler from CrawlerManager
             try:
-                crawler = await get_crawler()
-                if crawler is None:
-                    raise Exception("Crawler not available - initialization may have failed")
+                crawler_lease = await acquire_crawler()
             except Exception as e:
                 safe_logfire_error(f"Failed to get crawler | error={str(e)}")
                 await tracker.error(f"Failed to initialize crawler: {str(e)}")
                 return
 
             repository = get_repository()
-            orchestration_service = CrawlingService(crawler, repository=repository)
+            orchestration_service = CrawlingService(crawler_lease.crawler, repository=repository)
             orchestration_service.set_progress_id(progress_id)
 
             # Convert request to dict for service
@@ -848,6 +868,8 @@ async def _perform_crawl_with_progress(
             crawl_task = result.get("task")
             if crawl_task:
                 active_crawl_tasks[progress_id] = crawl_task
+                # The browser stays leased until the background crawl finishes
+                crawl_task.add_done_callback(lambda _: crawler_lease.release())
                 safe_logfire_info(
                     f"Stored actual crawl task in active_crawl_tasks | progress_id={progress_id} | task_name={crawl_task.get_name()}"
                 )
@@ -882,6 +904,8 @@ async def _perform_crawl_with_progress(
             except Exception:
                 pass
         finally:
+            if crawler_lease is not None and crawl_task is None:
+                crawler_lease.release()
             # Clean up task from registry when done (success or failure)
             if progress_id in active_crawl_tasks:
                 del active_crawl_tasks[progress_id]
@@ -933,12 +957,12 @@ async def upload_document(
         except json.JSONDecodeError as ex:
             raise HTTPException(status_code=422, detail={"error": f"Invalid tags JSON: {str(ex)}"})
 
-        # Read file content immediately to avoid closed file issues
-        file_content = await file.read()
+        # Spool the upload to disk immediately to avoid closed file issues
+        file_path, file_size = await _spool_upload(file)
         file_metadata = {
             "filename": file.filename,
             "content_type": file.content_type,
-            "size": len(file_content),
+            "size": file_size,
         }
 
         # Initialize progress tracker IMMEDIATELY so it's available for polling
@@ -950,11 +974,11 @@ async def upload_document(
             "progress": 0,
             "log": f"Starting upload for {file.filename}"
         })
-        # Start background task for processing with file content and metadata
+        # Start background task for processing with the spooled file and metadata
         # Upload tasks can be tracked directly since they don't spawn sub-tasks
         upload_task = asyncio.create_task(
             _perform_upload_with_progress(
-                progress_id, file_content, file_metadata, tag_list, knowledge_type, extract_code_examples, tracker
+                progress_id, file_path, file_metadata, tag_list, knowledge_type, extract_code_examples, tracker
             )
         )
         # Track the task for cancellation support
@@ -975,9 +999,24 @@ async def upload_document(
         )
         raise HTTPException(status_code=500, detail={"error": str(e)})
 
+async def _spool_upload(file: UploadFile) -> tuple[str, int]:
+    """Copy an upload to a temporary file, returning (path, size in bytes)."""
+    suffix = os.path.splitext(file.filename or "")[1]
+    fd, path = tempfile.mkstemp(prefix="archon_upload_", suffix=suffix)
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            while chunk := await file.read(UPLOAD_SPOOL_CHUNK_SIZE):
+                await asyncio.to_thread(spool.write, chunk)
+                size += len(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path, size
+
 async def _perform_upload_with_progress(
     progress_id: str,
-    file_content: bytes,
+    file_path: str,
     file_metadata: dict,
     tag_list: list[str],
     knowledge_type: str,
@@ -1005,18 +1044,34 @@ async def _perform_upload_with_progress(
             f"Starting document upload with progress tracking | progress_id={progress_id} | filename={filename} | content_type={content_type}"
         )
 
-        # Extract text from document with progress - use mapper for consistent progress
-        mapped_progress = progress_mapper.map_progress("processing", 50)
+        # Extract text page by page with progress - use mapper for consistent progress
+        mapped_progress = progress_mapper.map_progress("text_extraction", 0)
         await tracker.update(
             status="processing",
             progress=mapped_progress,
             log=f"Extracting text from {filename}"
         )
 
+        async def page_progress_callback(pages_done: int, total_pages: int):
+            await tracker.update(
+                status="processing",
+                progress=progress_mapper.map_progress("text_extraction", pages_done / total_pages * 100),
+                log=f"Extracted page {pages_done}/{total_pages} of {filename}",
+                current_page=pages_done,
+                total_pages=total_pages,
+            )
+
+        # Use DocumentStorageService to handle the upload
+        repository = get_repository()
+        doc_storage_service = DocumentStorageService(repository=repository)
+
         try:
-            extracted_text = extract_text_from_document(file_content, filename, content_type)
+            # Pages are parsed in a process pool and chunked as they arrive
+            extracted_text, chunks = await doc_storage_service.chunk_document_stream(
+                stream_document_text(file_path, filename, content_type, page_progress_callback)
+            )
             safe_logfire_info(
-                f"Document text extracted | filename={filename} | extracted_length={len(extracted_text)} | content_type={content_type}"
+                f"Document text extracted | filename={filename} | extracted_length={len(extracted_text)} | chunks={len(chunks)} | content_type={content_type}"
             )
         except ValueError as ex:
             # ValueError indicates unsupported format or empty file - user error
@@ -1029,10 +1084,6 @@ async def _perform_upload_with_progress(
             await tracker.error(f"Failed to extract text from document: {str(ex)}")
             return
 
-        # Use DocumentStorageService to handle the upload
-        repository = get_repository()
-        doc_storage_service = DocumentStorageService(repository=repository)
-
         # Generate source_id from filename with UUID to prevent collisions
         source_id = f"file_{filename.replace(' ', '_').replace('.', '_')}_{uuid.uuid4().hex[:8]}"
 
@@ -1063,6 +1114,7 @@ async def _perform_upload_with_progress(
             extract_code_examples=extract_code_examples,
             progress_callback=document_progress_callback,
             cancellation_check=check_upload_cancellation,
+            chunks=chunks,
         )
 
         if success:
@@ -1088,6 +1140,10 @@ async def _perform_upload_with_progress(
             f"Document upload failed | progress_id={progress_id} | filename={file_metadata.get('filename', 'unknown')} | error={str(e)}"
         )
     finally:
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
         # Clean up task from registry when done (success or failure)
         if progress_id in active_crawl_tasks:
             del active_crawl_tasks[progress_id]
@@ -4,7 +4,10 @@ MCP Analytics API endpoints for Archon
 Handles:
 - Hourly analytics from aggregation tables
 - Daily analytics from aggregation tables
-- 24-hour summary from raw events
+- 24-hour summary and knowledge base usage from hourly rollups
+
+The rollup tables are maintained by the MCP usage tracker, so every endpoint
+reads O(buckets) rows instead of scanning raw events.
 """
 
 import os
@@ -15,12 +18,16 @@ from fastapi import APIRouter, Header, HTTPException, Query, Response
 from fastapi import status as http_status
 
 from ..config.logfire_config import get_logger
+from ..services.mcp_usage_rollups import HOUR_BUCKET_FORMAT, decode_histogram, histogram_percentile
 from ..utils.etag_utils import check_etag, generate_etag
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/mcp/analytics", tags=["mcp-analytics"])
 
+# Per-source unique query counts are distinct per hour bucket and summed over the window
+UNIQUE_QUERIES_SCOPE = "per_hour"
+
 def get_db_path() -> str:
     """Get the SQLite database path from environment or default."""
     # Check for SQLITE_PATH or ARCHON_SQLITE_PATH environment variables
@@ -29,6 +36,29 @@ def get_db_path() -> str:
     return db_path
 
 
+def get_db_revision(db_path: str) -> str | None:
+    """
+    Get a cheap revision marker for the SQLite database file.
+
+    Usage events are written by the MCP server process, so in-process revision
+    counters never see them. Every committed write changes the size or mtime of
+    the database file or its WAL, which a stat() picks up without a query.
+
+    Returns:
+        Revision string, or None if the database file cannot be stat'ed
+    """
+    parts = []
+    for path in (db_path, f"{db_path}-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if path == db_path:
+                return None
+            continue
+        parts.append(f"{stat.st_mtime_ns}-{stat.st_size}")
+    return ":".join(parts)
+
+
 @router.get("/hourly")
 async def get_hourly_analytics(
     response: Response,
@@ -50,8 +80,24 @@ async def get_hourly_analytics(
         # Calculate start time
         start_time = datetime.now(UTC) - timedelta(hours=hours)
 
-        # Query SQLite database
+        # Compare against the database file revision before querying. The current
+        # hour is part of the key because buckets leave the window on hour boundaries.
         db_path = get_db_path()
+        db_revision = get_db_revision(db_path)
+        if db_revision is not None:
+            current_etag = generate_etag({
+                "revision": db_revision,
+                "hour": start_time.strftime("%Y-%m-%dT%H"),
+                "hours": hours,
+            })
+            if check_etag(if_none_match, current_etag):
+                response.status_code = http_status.HTTP_304_NOT_MODIFIED
+                response.headers["ETag"] = current_etag
+                response.headers["Cache-Control"] = "no-cache, must-revalidate"
+                logger.debug(f"Hourly analytics unchanged, returning 304 | etag={current_etag}")
+                return None
+
+        # Query SQLite database
         async with aiosqlite.connect(db_path) as conn:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
@@ -66,21 +112,22 @@ async def get_hourly_analytics(
             rows = await cursor.fetchall()
             analytics_data = [dict(row) for row in rows]
 
-        # Generate ETag from stable data
-        etag_data = {
-            "analytics": analytics_data,
-            "count": len(analytics_data),
-            "hours": hours,
-        }
-        current_etag = generate_etag(etag_data)
+        if db_revision is None:
+            # No file to stat: fall back to hashing the result
+            etag_data = {
+                "analytics": analytics_data,
+                "count": len(analytics_data),
+                "hours": hours,
+            }
+            current_etag = generate_etag(etag_data)
 
-        # Check if client's ETag matches
-        if check_etag(if_none_match, current_etag):
-            response.status_code = http_status.HTTP_304_NOT_MODIFIED
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            logger.debug(f"Hourly analytics unchanged, returning 304 | etag={current_etag}")
-            return None
+            # Check if client's ETag matches
+            if check_etag(if_none_match, current_etag):
+                response.status_code = http_status.HTTP_304_NOT_MODIFIED
+                response.headers["ETag"] = current_etag
+                response.headers["Cache-Control"] = "no-cache, must-revalidate"
+                logger.debug(f"Hourly analytics unchanged, returning 304 | etag={current_etag}")
+                return None
 
         # Set headers for successful response
         response.headers["ETag"] = current_etag
@@ -197,13 +244,17 @@ async def get_24h_summary(
     if_none_match: str | None = Header(None),
 ):
     """
-    Get 24-hour summary from raw MCP usage events.
+    Get 24-hour summary from the hourly usage rollups.
+
+    The window is aligned to hour buckets: it starts at the beginning of the
+    hour 24 hours ago.
 
     Returns:
         Summary statistics for the last 24 hours including:
         - Total events
         - Unique tools used
         - Success/error counts
+        - p50/p95/p99 response times (upper bounds of histogram buckets)
         - Tool usage breakdown
     """
     try:
@@ -218,34 +269,37 @@ async def get_24h_summary(
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
-                SELECT *
-                FROM archon_mcp_usage_events
-                WHERE timestamp >= ?
-                ORDER BY timestamp DESC
+                SELECT tool_name, call_count, error_count, latency_histogram
+                FROM archon_mcp_usage_hourly
+                WHERE hour_bucket >= ?
                 """,
-                (start_time.isoformat(),)
+                (start_time.strftime(HOUR_BUCKET_FORMAT),)
             )
             rows = await cursor.fetchall()
-            events = [dict(row) for row in rows]
+            rollups = [dict(row) for row in rows]
 
         # Calculate summary statistics
-        total_events = len(events)
-        unique_tools = len({event.get("tool_name") for event in events if event.get("tool_name")})
-        success_count = sum(1 for event in events if event.get("success") == 1)
-        error_count = sum(1 for event in events if event.get("success") == 0)
-
-        # Tool usage breakdown
+        total_events = 0
+        error_count = 0
+        histogram = decode_histogram(None)
         tool_usage = {}
-        for event in events:
-            tool_name = event.get("tool_name")
+        for rollup in rollups:
+            calls = rollup.get("call_count") or 0
+            errors = rollup.get("error_count") or 0
+            total_events += calls
+            error_count += errors
+            for index, count in enumerate(decode_histogram(rollup.get("latency_histogram"))):
+                histogram[index] += count
+
+            tool_name = rollup.get("tool_name")
             if tool_name:
                 if tool_name not in tool_usage:
                     tool_usage[tool_name] = {"count": 0, "success": 0, "error": 0}
-                tool_usage[tool_name]["count"] += 1
-                if event.get("success") == 1:
-                    tool_usage[tool_name]["success"] += 1
-                elif event.get("success") == 0:
-                    tool_usage[tool_name]["error"] += 1
+                tool_usage[tool_name]["count"] += calls
+                tool_usage[tool_name]["success"] += calls - errors
+                tool_usage[tool_name]["error"] += errors
+        success_count = total_events - error_count
+        unique_tools = len(tool_usage)
 
         # Sort tools by usage count
         sorted_tools = sorted(
@@ -260,6 +314,9 @@ async def get_24h_summary(
             "success_count": success_count,
             "error_count": error_count,
             "success_rate": round(success_count / total_events * 100, 2) if total_events > 0 else 0,
+            "p50_response_time_ms": histogram_percentile(histogram, 50),
+            "p95_response_time_ms": histogram_percentile(histogram, 95),
+            "p99_response_time_ms": histogram_percentile(histogram, 99),
             "tool_usage": sorted_tools,
         }
 
@@ -312,7 +369,7 @@ async def get_knowledge_base_analytics(
     if_none_match: str | None = Header(None),
 ):
     """
-    Get knowledge base usage statistics by joining MCP events with sources.
+    Get knowledge base usage statistics by joining per-source hourly rollups with sources.
 
     Returns top 10 knowledge bases by query count, including:
     - source_id, source_name
@@ -320,6 +377,11 @@ async def get_knowledge_base_analytics(
     - avg_response_time_ms, success_rate
     - percentage_of_total
 
+    unique_queries is the sum of distinct queries per hour bucket: a query
+    repeated in several hours is counted once per hour, so it can exceed the
+    number of distinct queries in the whole window. The response reports this
+    as unique_queries_scope="per_hour".
+
     Args:
         hours: Number of hours to look back (1-168, default 24)
 
@@ -341,21 +403,21 @@ async def get_knowledge_base_analytics(
             cursor = await conn.execute(
                 """
                 SELECT
-                    e.source_id,
-                    COALESCE(s.source_display_name, s.title, s.source_url, e.source_id) as source_name,
-                    COUNT(*) as query_count,
-                    COUNT(DISTINCT e.query_text) as unique_queries,
-                    CAST(AVG(e.response_time_ms) AS INTEGER) as avg_response_time_ms,
-                    ROUND(AVG(CASE WHEN e.success = 1 THEN 100.0 ELSE 0.0 END), 1) as success_rate
-                FROM archon_mcp_usage_events e
-                LEFT JOIN archon_sources s ON e.source_id = s.source_id
-                WHERE e.timestamp >= ?
-                  AND e.source_id IS NOT NULL
-                GROUP BY e.source_id, source_name
+                    r.source_id,
+                    COALESCE(s.source_display_name, s.title, s.source_url, r.source_id) as source_name,
+                    SUM(r.query_count) as query_count,
+                    SUM(r.unique_queries) as unique_queries,
+                    CAST(SUM(r.total_response_time_ms) / SUM(r.query_count) AS INTEGER) as avg_response_time_ms,
+                    ROUND(100.0 * (SUM(r.query_count) - SUM(r.error_count)) / SUM(r.query_count), 1) as success_rate
+                FROM archon_mcp_usage_source_hourly r
+                LEFT JOIN archon_sources s ON r.source_id = s.source_id
+                WHERE r.hour_bucket >= ?
+                  AND r.query_count > 0
+                GROUP BY r.source_id, source_name
                 ORDER BY query_count DESC
                 LIMIT 10
                 """,
-                (start_time.isoformat(),),
+                (start_time.strftime(HOUR_BUCKET_FORMAT),),
             )
             rows = await cursor.fetchall()
             kb_data = [dict(row) for row in rows]
@@ -376,6 +438,7 @@ async def get_knowledge_base_analytics(
                 "success": True,
                 "data": [],
                 "total_queries": 0,
+                "unique_queries_scope": UNIQUE_QUERIES_SCOPE,
                 "period": {
                     "hours": hours,
                     "start_time": start_time.isoformat(),
@@ -430,6 +493,7 @@ async def get_knowledge_base_analytics(
             "success": True,
             "data": kb_data,
             "total_queries": total_queries,
+            "unique_queries_scope": UNIQUE_QUERIES_SCOPE,
             "period": {
                 "hours": hours,
                 "start_time": start_time.isoformat(),
@@ -448,17 +512,17 @@ async def get_knowledge_base_analytics(
 @router.post("/refresh-views")
 async def refresh_aggregation_tables():
     """
-    Refresh aggregation tables (no-op for SQLite with automatic triggers).
+    Refresh aggregation tables (no-op for SQLite).
 
-    SQLite version uses triggers to automatically update hourly and daily
-    aggregation tables, so manual refresh is not needed. This endpoint
-    exists for API compatibility.
+    The MCP usage tracker merges its in-memory rollups into the hourly, daily
+    and per-source tables whenever it flushes events, so manual refresh is not
+    needed. This endpoint exists for API compatibility.
 
     Returns:
         Success status
     """
     return {
         "success": True,
-        "message": "Aggregation tables are automatically updated via triggers (no manual refresh needed)",
+        "message": "Aggregation tables are automatically updated by the MCP usage tracker (no manual refresh needed)",
         "refreshed_at": datetime.now(UTC).isoformat(),
     }
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from ..config.logfire_config import get_logger, safe_logfire_error
 from ..repositories.repository_factory import get_repository
+from ..utils.pagination_utils import decode_cursor, encode_cursor
 
 # Get logger for this module
 logger = get_logger(__name__)
@@ -22,6 +23,10 @@ router = APIRouter(prefix="/api", tags=["pages"])
 # Maximum character count for returning full page content
 MAX_PAGE_CHARS = 20_000
 
+# Page sizes for cursor-paginated page listings
+DEFAULT_PAGE_LIST_LIMIT = 100
+MAX_PAGE_LIST_LIMIT = 500
+
 class PageSummary(BaseModel):
     """Summary model for page listings (no content)"""
 
@@ -55,6 +60,7 @@ class PageListResponse(BaseModel):
     pages: list[PageSummary]
     total: int
     source_id: str
+    next_cursor: str | None = None
 
 def _handle_large_page_content(page_data: dict) -> dict:
     """
@@ -88,13 +94,21 @@ def _handle_large_page_content(page_data: dict) -> dict:
 async def list_pages(
     source_id: str = Query(..., description="Source ID to filter pages"),
     section: str | None = Query(None, description="Filter by section title (for llms-full.txt)"),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_LIST_LIMIT, description="Page size; enables cursor pagination"),
+    cursor: str | None = Query(None, description="Cursor from a previous response's next_cursor"),
 ):
     """
     List all pages for a given source.
 
+    Without limit/cursor all pages are returned in section order. With them, pages
+    are returned in URL order using keyset pagination, and next_cursor points to
+    the following page (None on the last page).
+
     Args:
         source_id: The source ID to filter pages
         section: Optional H1 section title for llms-full.txt sources
+        limit: Optional page size
+        cursor: Optional cursor returned by a previous call
 
     Returns:
         PageListResponse with list of pages and metadata
@@ -102,15 +116,42 @@ async def list_pages(
     try:
         repository = get_repository()
 
-        page_data = await repository.list_page_metadata_by_source(
-            source_id=source_id,
-            section_title=section
+        if limit is None and cursor is None:
+            page_data = await repository.list_page_metadata_by_source(
+                source_id=source_id,
+                section_title=section
+            )
+
+            pages = [PageSummary(**page) for page in page_data]
+
+            return PageListResponse(pages=pages, total=len(pages), source_id=source_id)
+
+        page_size = limit or DEFAULT_PAGE_LIST_LIMIT
+        try:
+            after_url = decode_cursor(cursor, expected_length=1)[0] if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+        # Fetch one extra row to know whether another page exists
+        page_data = await repository.list_pages_by_source(
+            source_id,
+            limit=page_size + 1,
+            after_url=after_url,
+            include_content=False,
+            section_title=section,
         )
+        has_more = len(page_data) > page_size
+        page_data = page_data[:page_size]
+
+        total = await repository.get_page_count_by_source(source_id, section_title=section)
 
         pages = [PageSummary(**page) for page in page_data]
+        next_cursor = encode_cursor(page_data[-1]["url"]) if has_more else None
 
-        return PageListResponse(pages=pages, total=len(pages), source_id=source_id)
+        return PageListResponse(pages=pages, total=total, source_id=source_id, next_cursor=next_cursor)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing pages for source {source_id}: {e}", exc_info=True)
         safe_logfire_error(f"Failed to list pages | source_id={source_id} | error={str(e)}")
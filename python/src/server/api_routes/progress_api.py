@@ -1,15 +1,18 @@
-"""Progress API endpoints for polling operation status."""
+"""Progress API endpoints for polling and streaming operation status."""
 
+import json
 from datetime import datetime
 from email.utils import formatdate
+from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi import APIRouter, Header, HTTPException, Request, Response
 from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
 
 from ..config.logfire_config import get_logger, logfire
 from ..models.progress_models import create_progress_response
 from ..utils.etag_utils import check_etag, generate_etag
-from ..utils.progress import ProgressTracker
+from ..utils.progress import ProgressTracker, progress_broadcaster
 
 logger = get_logger(__name__)
 
@@ -18,6 +21,9 @@ router = APIRouter(prefix="/api/progress", tags=["progress"])
 # Terminal states that don't require further polling
 TERMINAL_STATES = {"completed", "failed", "error", "cancelled"}
 
+# Seconds between SSE keep-alive comments while an operation is idle
+STREAM_HEARTBEAT_SECONDS = 15.0
+
 @router.get("/{operation_id}")
 async def get_progress(
     operation_id: str,
@@ -93,6 +99,87 @@ async def get_progress(
         logfire.error(f"Failed to get progress | error={e!s} | operation_id={operation_id}", exc_info=True)
         raise HTTPException(status_code=500, detail={"error": str(e)}) from e
 
+def _format_stream_event(operation_id: str, event: dict[str, Any]) -> str:
+    """Render a broadcaster event as an SSE message in the polling response shape."""
+    operation_with_id = {**event["state"], "logs": event["logs"], "progress_id": operation_id}
+    progress_response = create_progress_response(event["state"].get("type", "crawl"), operation_with_id)
+    response_data = progress_response.model_dump(by_alias=True, exclude_none=True)
+    event_name = "snapshot" if event["snapshot"] else "progress"
+    return f"id: {event['id']}\nevent: {event_name}\ndata: {json.dumps(response_data)}\n\n"
+
+
+@router.get("/{operation_id}/stream")
+async def stream_progress(
+    operation_id: str,
+    request: Request,
+    last_event_id: int | None = None,
+    last_event_id_header: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream progress for an operation as Server-Sent Events.
+
+    The first event is a "snapshot" with the full state and logs. Each following
+    "progress" event carries the current state but only the log entries added
+    since the previous event. Clients reconnecting with Last-Event-ID (header or
+    query parameter) receive a single coalesced delta of what they missed while
+    it is still retained, otherwise a fresh snapshot. The stream ends after a
+    terminal status.
+    """
+    operation = ProgressTracker.get_progress(operation_id)
+    if not operation:
+        logfire.warning(f"Operation not found for stream | operation_id={operation_id}")
+        raise HTTPException(
+            status_code=404,
+            detail={"error": f"Operation {operation_id} not found"}
+        )
+
+    if last_event_id_header is not None:
+        try:
+            last_event_id = int(last_event_id_header)
+        except ValueError:
+            last_event_id = None
+
+    subscription = progress_broadcaster.subscribe(operation_id, operation, last_event_id)
+    logfire.info(
+        f"Progress stream opened | operation_id={operation_id} | last_event_id={last_event_id}"
+    )
+
+    async def generate():
+        try:
+            if operation.get("status") in TERMINAL_STATES:
+                # Finished before the client subscribed: send the catch-up event, if any
+                event = await subscription.get(timeout=0)
+                if event is not None:
+                    yield _format_stream_event(operation_id, event)
+                return
+
+            while True:
+                event = await subscription.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                if event is None:
+                    if subscription.closed or await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield _format_stream_event(operation_id, event)
+                if event["state"].get("status") in TERMINAL_STATES:
+                    return
+        finally:
+            progress_broadcaster.unsubscribe(subscription)
+            logfire.info(
+                f"Progress stream closed | operation_id={operation_id} | coalesced={subscription.coalesced_count}"
+            )
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable Nginx buffering
+        },
+    )
+
+
 @router.get("/")
 async def list_active_operations():
     """
@@ -36,11 +36,16 @@ from ..services.projects.versioning_service import VersioningService
 
 # Repository imports
 from ..repositories import get_repository
+from ..repositories.revision_counters import PROJECTS, SOURCES, TASKS, revision_counters
 
 # Using HTTP polling for real-time updates
 
 router = APIRouter(prefix="/api", tags=["projects"])
 
+# Page sizes for searched/paginated project listings
+DEFAULT_PROJECT_PAGE_SIZE = 10
+MAX_PROJECT_PAGE_SIZE = 100
+
 class CreateProjectRequest(BaseModel):
     title: str
     description: str | None = None
@@ -77,21 +82,70 @@ class CreateTaskRequest(BaseModel):
 async def list_projects(
     response: Response,
     include_content: bool = True,
+    query: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
     if_none_match: str | None = Header(None)
 ):
     """
     List all projects.
+
+    With query, limit or cursor, projects are searched and paginated in the
+    database and returned as lightweight projections (no docs/features/data,
+    with stats), newest first; next_cursor points to the following page.
     
     Args:
         include_content: If True (default), returns full project content.
                         If False, returns lightweight metadata with statistics.
+        query: Optional keyword search (prefix match on every term)
+        limit: Optional page size (clamped to MAX_PROJECT_PAGE_SIZE)
+        cursor: Optional cursor returned by a previous call
     """
     try:
         logfire.debug(f"Listing all projects | include_content={include_content}")
 
-        # Use ProjectService to get projects with include_content parameter
+        # ETag comes from the revision counters, so unchanged polls skip the query.
+        # Read it before querying: a concurrent write then only costs one extra response.
+        search = query is not None or limit is not None or cursor is not None
+        current_etag = generate_etag({
+            "revision": revision_counters.version((PROJECTS, None), (SOURCES, None)),
+            "include_content": include_content,
+            "search": [query, limit, cursor] if search else None,
+        })
+
+        # Check if client's ETag matches
+        if check_etag(if_none_match, current_etag):
+            response.status_code = http_status.HTTP_304_NOT_MODIFIED
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            return None
+
         repository = get_repository()
         project_service = ProjectService(repository=repository)
+
+        if search:
+            try:
+                success, result = await project_service.search_projects(
+                    query=query,
+                    limit=max(1, min(limit or DEFAULT_PROJECT_PAGE_SIZE, MAX_PROJECT_PAGE_SIZE)),
+                    cursor=cursor,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+            if not success:
+                raise HTTPException(status_code=500, detail=result)
+
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            return {
+                "projects": result["projects"],
+                "timestamp": datetime.utcnow().isoformat(),
+                "count": len(result["projects"]),
+                "next_cursor": result["next_cursor"],
+                "has_more": result["has_more"],
+            }
+
+        # Use ProjectService to get projects with include_content parameter
         success, result = await project_service.list_projects(include_content=include_content)
 
         if not success:
@@ -123,13 +177,6 @@ async def list_projects(
                 f"include_content={include_content} | project_count={len(formatted_projects)}"
             )
 
-        # Generate ETag from stable data (excluding timestamp)
-        etag_data = {
-            "projects": formatted_projects,
-            "count": len(formatted_projects)
-        }
-        current_etag = generate_etag(etag_data)
-
         # Generate response with timestamp for polling
         response_data = {
             "projects": formatted_projects,
@@ -137,13 +184,6 @@ async def list_projects(
             "count": len(formatted_projects)
         }
 
-        # Check if client's ETag matches
-        if check_etag(if_none_match, current_etag):
-            response.status_code = http_status.HTTP_304_NOT_MODIFIED
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            return None
-
         # Set headers
         response.headers["ETag"] = current_etag
         response.headers["Last-Modified"] = datetime.utcnow().isoformat()
@@ -297,21 +337,8 @@ async def get_all_task_counts(
 
         logfire.debug(f"Getting task counts for all projects | etag={if_none_match}")
 
-        # Get repository instance from factory (uses configured backend)
-        repository = get_repository()
-        task_service = TaskService(repository=repository)
-        success, result = await task_service.get_all_project_task_counts()
-
-        if not success:
-            logfire.error(f"Failed to get task counts | error={result.get('error')}")
-            raise HTTPException(status_code=500, detail=result)
-
-        # Generate ETag from counts data
-        etag_data = {
-            "counts": result,
-            "count": len(result)
-        }
-        current_etag = generate_etag(etag_data)
+        # Any task write bumps the collection-wide tasks revision
+        current_etag = generate_etag({"revision": revision_counters.version((TASKS, None))})
 
         # Check if client's ETag matches (304 Not Modified)
         if check_etag(if_none_match, current_etag):
@@ -321,6 +348,15 @@ async def get_all_task_counts(
             logfire.debug(f"Task counts unchanged, returning 304 | etag={current_etag}")
             return None
 
+        # Get repository instance from factory (uses configured backend)
+        repository = get_repository()
+        task_service = TaskService(repository=repository)
+        success, result = await task_service.get_all_project_task_counts()
+
+        if not success:
+            logfire.error(f"Failed to get task counts | error={result.get('error')}")
+            raise HTTPException(status_code=500, detail=result)
+
         # Set ETag headers for successful response
         response.headers["ETag"] = current_etag
         response.headers["Cache-Control"] = "no-cache, must-revalidate"
@@ -570,6 +606,22 @@ async def list_project_tasks(
             f"Listing project tasks | project_id={project_id} | include_archived={include_archived} | exclude_large_fields={exclude_large_fields} | etag={if_none_match}"
         )
 
+        # ETag comes from the project's task revision, read before querying
+        current_etag = generate_etag({
+            "revision": revision_counters.version((TASKS, project_id)),
+            "project_id": project_id,
+            "include_archived": include_archived,
+            "exclude_large_fields": exclude_large_fields,
+        })
+
+        # Check if client's ETag matches (304 Not Modified)
+        if check_etag(if_none_match, current_etag):
+            response.status_code = 304
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            logfire.debug(f"Tasks unchanged, returning 304 | project_id={project_id} | etag={current_etag}")
+            return None
+
         # Use TaskService to list tasks
         repository = get_repository()
         task_service = TaskService(repository=repository)
@@ -585,10 +637,8 @@ async def list_project_tasks(
 
         tasks = result.get("tasks", [])
 
-        # Generate ETag from task data (includes description and updated_at to drive polling invalidation)
-        etag_tasks: list[dict[str, object]] = []
+        # Last-Modified is the newest task update
         last_modified_dt: datetime | None = None
-
         for task in tasks:
             raw_updated = task.get("updated_at")
             parsed_updated: datetime | None = None
@@ -605,38 +655,6 @@ async def list_project_tasks(
                 if last_modified_dt is None or parsed_updated > last_modified_dt:
                     last_modified_dt = parsed_updated
 
-            etag_tasks.append(
-                {
-                    "id": task.get("id") or "",
-                    "title": task.get("title") or "",
-                    "status": task.get("status") or "",
-                    "task_order": task.get("task_order") or 0,
-                    "assignee": task.get("assignee") or "",
-                    "priority": task.get("priority") or "",
-                    "feature": task.get("feature") or "",
-                    "description": task.get("description") or "",
-                    "updated_at": (
-                        parsed_updated.isoformat()
-                        if parsed_updated is not None
-                        else (str(raw_updated) if raw_updated else "")
-                    ),
-                }
-            )
-
-        etag_data = {"tasks": etag_tasks, "project_id": project_id, "count": len(tasks)}
-        current_etag = generate_etag(etag_data)
-
-        # Check if client's ETag matches (304 Not Modified)
-        if check_etag(if_none_match, current_etag):
-            response.status_code = 304
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            response.headers["Last-Modified"] = format_datetime(
-                last_modified_dt or datetime.now(timezone.utc)
-            )
-            logfire.debug(f"Tasks unchanged, returning 304 | project_id={project_id} | etag={current_etag}")
-            return None
-
         # Set ETag headers for successful response
         response.headers["ETag"] = current_etag
         response.headers["Cache-Control"] = "no-cache, must-revalidate"
@@ -694,6 +712,7 @@ async def create_task(request: CreateTaskRequest):
 
 @router.get("/tasks")
 async def list_tasks(
+    response: Response,
     status: str | None = None,
     project_id: str | None = None,
     include_closed: bool = True,
@@ -701,6 +720,7 @@ async def list_tasks(
     per_page: int = 10,
     exclude_large_fields: bool = False,
     q: str | None = None,  # Search query parameter
+    if_none_match: str | None = Header(None),
 ):
     """List tasks with optional filters including status, project, and keyword search."""
     try:
@@ -708,6 +728,19 @@ async def list_tasks(
             f"Listing tasks | status={status} | project_id={project_id} | include_closed={include_closed} | page={page} | per_page={per_page} | q={q}"
         )
 
+        # ETag comes from the task revisions, read before querying
+        current_etag = generate_etag({
+            "revision": revision_counters.version((TASKS, project_id)),
+            "params": [status, project_id, include_closed, page, per_page, exclude_large_fields, q],
+        })
+
+        # Check if client's ETag matches (304 Not Modified)
+        if check_etag(if_none_match, current_etag):
+            response.status_code = 304
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            return None
+
         # Use TaskService to list tasks
         repository = get_repository()
         task_service = TaskService(repository=repository)
@@ -738,7 +771,7 @@ async def list_tasks(
         paginated_tasks = tasks[start_idx:end_idx]
 
         # Prepare response
-        response = {
+        response_data = {
             "tasks": paginated_tasks,
             "pagination": {
                 "total": len(tasks),
@@ -749,7 +782,7 @@ async def list_tasks(
         }
 
         # Monitor response size for optimization validation
-        response_json = json.dumps(response)
+        response_json = json.dumps(response_data)
         response_size = len(response_json)
 
         # Log response metrics
@@ -765,7 +798,10 @@ async def list_tasks(
                 f"exclude_large_fields={exclude_large_fields} | task_count={len(paginated_tasks)}"
             )
 
-        return response
+        response.headers["ETag"] = current_etag
+        response.headers["Cache-Control"] = "no-cache, must-revalidate"
+
+        return response_data
 
     except HTTPException:
         raise
@@ -823,6 +859,8 @@ class UpdateDocumentRequest(BaseModel):
     content: dict[str, Any] | None = None
     tags: list[str] | None = None
     author: str | None = None
+    # Revision the client last read; a concurrent edit turns the update into a 409
+    revision: int | None = None
 
 class CreateVersionRequest(BaseModel):
     field_name: str
@@ -835,6 +873,96 @@ class CreateVersionRequest(BaseModel):
 class RestoreVersionRequest(BaseModel):
     restored_by: str | None = "system"
 
+class BatchCreateTasksRequest(BaseModel):
+    tasks: list[CreateTaskRequest]
+
+class BatchTaskUpdate(UpdateTaskRequest):
+    id: str
+
+class BatchUpdateTasksRequest(BaseModel):
+    tasks: list[BatchTaskUpdate]
+
+class BatchArchiveTasksRequest(BaseModel):
+    task_ids: list[str]
+
+# Batch routes are registered before /tasks/{task_id} so "batch" is not taken as an ID
+
+@router.post("/tasks/batch")
+async def create_tasks_batch(request: BatchCreateTasksRequest):
+    """Create several tasks in one transaction."""
+    try:
+        repository = get_repository()
+        task_service = TaskService(repository=repository)
+        success, result = await task_service.create_tasks(
+            [task.model_dump() for task in request.tasks]
+        )
+
+        if not success:
+            raise HTTPException(status_code=400, detail=result)
+
+        logfire.info(f"Tasks created in batch | count={result['count']}")
+
+        return {"message": f"{result['count']} tasks created successfully", **result}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logfire.error(f"Failed to create tasks in batch | error={str(e)}")
+        raise HTTPException(status_code=500, detail={"error": str(e)}) from e
+
+@router.put("/tasks/batch")
+async def update_tasks_batch(request: BatchUpdateTasksRequest):
+    """Update several tasks in one transaction."""
+    try:
+        updates = [
+            (task.id, task.model_dump(exclude={"id"}, exclude_none=True))
+            for task in request.tasks
+        ]
+
+        repository = get_repository()
+        task_service = TaskService(repository=repository)
+        success, result = await task_service.update_tasks(updates)
+
+        if not success:
+            if "not found" in result.get("error", "").lower():
+                raise HTTPException(status_code=404, detail=result.get("error"))
+            else:
+                raise HTTPException(status_code=400, detail=result)
+
+        logfire.info(f"Tasks updated in batch | count={result['count']}")
+
+        return {"message": f"{result['count']} tasks updated successfully", **result}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logfire.error(f"Failed to update tasks in batch | error={str(e)}")
+        raise HTTPException(status_code=500, detail={"error": str(e)}) from e
+
+@router.post("/tasks/batch/archive")
+async def archive_tasks_batch(request: BatchArchiveTasksRequest):
+    """Archive several tasks (soft delete) in one transaction."""
+    try:
+        repository = get_repository()
+        task_service = TaskService(repository=repository)
+        success, result = await task_service.archive_tasks(request.task_ids, archived_by="api")
+
+        if not success:
+            if "not found" in result.get("error", "").lower():
+                raise HTTPException(status_code=404, detail=result.get("error"))
+            else:
+                raise HTTPException(status_code=400, detail=result)
+
+        logfire.info(f"Tasks archived in batch | count={result['count']}")
+
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logfire.error(f"Failed to archive tasks in batch | error={str(e)}")
+        raise HTTPException(status_code=500, detail={"error": str(e)}) from e
+
 @router.put("/tasks/{task_id}")
 async def update_task(task_id: str, request: UpdateTaskRequest):
     """Update a task."""
@@ -968,7 +1096,7 @@ async def list_project_documents(project_id: str, include_content: bool = False)
         # Use DocumentService to list documents
         repository = get_repository()
         document_service = DocumentService(repository=repository)
-        success, result = document_service.list_documents(project_id, include_content=include_content)
+        success, result = await document_service.list_documents(project_id, include_content=include_content)
 
         if not success:
             if "not found" in result.get("error", "").lower():
@@ -999,7 +1127,7 @@ async def create_project_document(project_id: str, request: CreateDocumentReques
         # Use DocumentService to create document
         repository = get_repository()
         document_service = DocumentService(repository=repository)
-        success, result = document_service.add_document(
+        success, result = await document_service.add_document(
             project_id=project_id,
             document_type=request.document_type,
             title=request.title,
@@ -1035,7 +1163,7 @@ async def get_project_document(project_id: str, doc_id: str):
         # Use DocumentService to get document
         repository = get_repository()
         document_service = DocumentService(repository=repository)
-        success, result = document_service.get_document(project_id, doc_id)
+        success, result = await document_service.get_document(project_id, doc_id)
 
         if not success:
             if "not found" in result.get("error", "").lower():
@@ -1075,11 +1203,15 @@ async def update_project_document(project_id: str, doc_id: str, request: UpdateD
         # Use DocumentService to update document
         repository = get_repository()
         document_service = DocumentService(repository=repository)
-        success, result = document_service.update_document(project_id, doc_id, update_fields)
+        success, result = await document_service.update_document(
+            project_id, doc_id, update_fields, expected_revision=request.revision
+        )
 
         if not success:
             if "not found" in result.get("error", "").lower():
                 raise HTTPException(status_code=404, detail=result.get("error"))
+            elif "revision conflict" in result.get("error", "").lower():
+                raise HTTPException(status_code=409, detail=result)
             else:
                 raise HTTPException(status_code=500, detail=result)
 
@@ -1104,7 +1236,7 @@ async def delete_project_document(project_id: str, doc_id: str):
         # Use DocumentService to delete document
         repository = get_repository()
         document_service = DocumentService(repository=repository)
-        success, result = document_service.delete_document(project_id, doc_id)
+        success, result = await document_service.delete_document(project_id, doc_id)
 
         if not success:
             if "not found" in result.get("error", "").lower():
@@ -1137,7 +1269,7 @@ async def list_project_versions(project_id: str, field_name: str = None):
         # Use VersioningService to list versions
         repository = get_repository()
         versioning_service = VersioningService(repository=repository)
-        success, result = versioning_service.list_versions(project_id, field_name)
+        success, result = await versioning_service.list_versions(project_id, field_name)
 
         if not success:
             if "not found" in result.get("error", "").lower():
@@ -1168,7 +1300,7 @@ async def create_project_version(project_id: str, request: CreateVersionRequest)
         # Use VersioningService to create version
         repository = get_repository()
         versioning_service = VersioningService(repository=repository)
-        success, result = versioning_service.create_version(
+        success, result = await versioning_service.create_version(
             project_id=project_id,
             field_name=request.field_name,
             content=request.content,
@@ -1207,7 +1339,7 @@ async def get_project_version(project_id: str, field_name: str, version_number:
         # Use VersioningService to get version content
         repository = get_repository()
         versioning_service = VersioningService(repository=repository)
-        success, result = versioning_service.get_version_content(
+        success, result = await versioning_service.get_version_content(
             project_id, field_name, version_number
         )
 
@@ -1244,7 +1376,7 @@ async def restore_project_version(
         # Use VersioningService to restore version
         repository = get_repository()
         versioning_service = VersioningService(repository=repository)
-        success, result = versioning_service.restore_version(
+        success, result = await versioning_service.restore_version(
             project_id=project_id,
             field_name=field_name,
             version_number=version_number,
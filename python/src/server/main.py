@@ -11,44 +11,42 @@ Modules:
 - projects_api: Project and task management with streaming
 """
 
+import asyncio
+import importlib
 import logging
 import os
+import threading
+import time
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from .api_routes.agent_chat_api import router as agent_chat_router
-from .api_routes.bug_report_api import router as bug_report_router
-from .api_routes.internal_api import router as internal_router
-from .api_routes.knowledge_api import router as knowledge_router
-from .api_routes.mcp_analytics_api import router as mcp_analytics_router
-from .api_routes.mcp_api import router as mcp_router
-from .api_routes.migration_api import router as migration_router
-from .api_routes.ollama_api import router as ollama_router
-from .api_routes.pages_api import router as pages_router
-from .api_routes.progress_api import router as progress_router
-from .api_routes.projects_api import router as projects_router
-from .api_routes.providers_api import router as providers_router
-
-# Import modular API routers
-from .api_routes.settings_api import router as settings_router
-from .api_routes.version_api import router as version_router
-
 # Import Logfire configuration
 from .config.logfire_config import api_logger, setup_logfire
-from .services.crawler_manager import cleanup_crawler, initialize_crawler
-
-# Import utilities and core classes
-from .services.credential_service import initialize_credentials
 
-# Import missing dependencies that the modular APIs need
-try:
-    from crawl4ai import AsyncWebCrawler, BrowserConfig
-except ImportError:
-    # These are optional dependencies for full functionality
-    AsyncWebCrawler = None
-    BrowserConfig = None
+_module_import_started = time.perf_counter()
+
+# API routers in registration order. They pull in crawl4ai, openai, document
+# parsers and the search strategies, so they are imported off the event loop
+# during startup (or on the first request when the lifespan did not run).
+API_ROUTER_MODULES = [
+    "settings_api",
+    "mcp_api",
+    "mcp_analytics_api",
+    "knowledge_api",
+    "pages_api",
+    "ollama_api",
+    "projects_api",
+    "progress_api",
+    "agent_chat_api",
+    "internal_api",
+    "bug_report_api",
+    "providers_api",
+    "version_api",
+    "migration_api",
+]
 
 # Logger will be initialized after credentials are loaded
 logger = logging.getLogger(__name__)
@@ -64,18 +62,93 @@ uvicorn_logger.setLevel(logging.WARNING)  # Only log warnings and errors, not ev
 # Global flag to track if initialization is complete
 _initialization_complete = False
 
+# Startup timings served by /api/startup-profile
+_startup_profile: dict[str, Any] = {"router_imports": {}, "phases": {}}
+
+_router_import_lock = threading.Lock()
+_imported_routers: list | None = None
+_routers_included = False
+_router_import_task: asyncio.Task | None = None
+_crawler_warmup_task: asyncio.Task | None = None
+
+
+def _import_routers() -> list:
+    """Import the API router modules (blocking), recording each module's import time."""
+    global _imported_routers
+    with _router_import_lock:
+        if _imported_routers is None:
+            routers = []
+            for name in API_ROUTER_MODULES:
+                started = time.perf_counter()
+                module = importlib.import_module(f".api_routes.{name}", __package__)
+                _startup_profile["router_imports"][name] = round(time.perf_counter() - started, 3)
+                routers.append(module.router)
+            _imported_routers = routers
+        return _imported_routers
+
+
+async def _ensure_routers(app: FastAPI) -> None:
+    """Import (off the event loop) and register the API routers once."""
+    global _routers_included
+    if _routers_included:
+        return
+    if _router_import_task is not None and _router_import_task.get_loop() is asyncio.get_running_loop():
+        routers = await _router_import_task
+    else:
+        routers = await asyncio.to_thread(_import_routers)
+    if not _routers_included:
+        for router in routers:
+            app.include_router(router)
+        _routers_included = True
+
+
+async def _timed(phase: str, awaitable):
+    """Await a startup step and record how long it took."""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        _startup_profile["phases"][phase] = round(time.perf_counter() - started, 3)
+
+
+async def _warm_crawler() -> None:
+    """Launch the first pooled browser in the background; crawls start it on demand otherwise."""
+    from .services.crawler_manager import initialize_crawler
+
+    try:
+        await _timed("crawler_warmup", initialize_crawler())
+        api_logger.info("✅ Crawler warmed up")
+    except Exception as e:
+        api_logger.warning(f"Could not fully initialize crawling context: {str(e)}")
+
+
+async def _load_prompts(prompt_service) -> None:
+    try:
+        await prompt_service.load_prompts()
+        api_logger.info("✅ Prompt service initialized")
+    except Exception as e:
+        api_logger.warning(f"Could not initialize prompt service: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown tasks."""
-    global _initialization_complete
+    global _initialization_complete, _router_import_task, _crawler_warmup_task
     _initialization_complete = False
 
     # Startup
     logger.info("🚀 Starting Archon backend...")
+    startup_started = time.perf_counter()
 
     try:
         # Validate configuration FIRST - check for anon vs service key
         from .config.config import get_config
+        from .services.credential_service import initialize_credentials
+        from .services.prompt_service import prompt_service
+
+        # Import the API routers in a worker thread while the database and
+        # credentials initialize
+        _router_import_task = asyncio.ensure_future(_timed("router_import", asyncio.to_thread(_import_routers)))
 
         get_config()  # This will raise ConfigurationError if anon key detected
         
@@ -95,14 +168,18 @@ async def lifespan(app: FastAPI):
                 db_path = os.getenv("ARCHON_SQLITE_PATH", "archon.db")
                 logger.info(f"Initializing SQLite database: {db_path}")
                 
-                if await ensure_sqlite_database(db_path):
+                if await _timed("database", ensure_sqlite_database(db_path)):
                     logger.info("✅ SQLite database initialized successfully")
                 else:
                     logger.error("❌ Failed to initialize SQLite database")
                     raise RuntimeError("SQLite database initialization failed")
 
-        # Initialize credentials from database FIRST - this is the foundation for everything else
-        await initialize_credentials()
+        # Initialize credentials from database FIRST - this is the foundation for everything else.
+        # Prompts only need the database, so they load at the same time.
+        await asyncio.gather(
+            _timed("credentials", initialize_credentials()),
+            _timed("prompts", _load_prompts(prompt_service)),
+        )
         
         # Check for pending database migrations (Supabase)
         if db_backend != "sqlite":
@@ -163,38 +240,28 @@ async def lifespan(app: FastAPI):
 
         # Now that credentials are loaded, we can properly initialize logging
         # This must happen AFTER credentials so LOGFIRE_ENABLED is set from database
+        started = time.perf_counter()
         setup_logfire(service_name="archon-backend")
+        _startup_profile["phases"]["logfire"] = round(time.perf_counter() - started, 3)
 
         # Now we can safely use the logger
         logger.info("✅ Credentials initialized")
         api_logger.info("🔥 Logfire initialized for backend")
 
-        # Initialize crawling context
-        try:
-            await initialize_crawler()
-        except Exception as e:
-            api_logger.warning(f"Could not fully initialize crawling context: {str(e)}")
-
-        # Make crawling context available to modules
-        # Crawler is now managed by CrawlerManager
+        # Warm up the crawler in the background - it doesn't block readiness
+        _crawler_warmup_task = asyncio.create_task(_warm_crawler())
 
         api_logger.info("✅ Using polling for real-time updates")
 
-        # Initialize prompt service
-        try:
-            from .services.prompt_service import prompt_service
-
-            await prompt_service.load_prompts()
-            api_logger.info("✅ Prompt service initialized")
-        except Exception as e:
-            api_logger.warning(f"Could not initialize prompt service: {e}")
+        await _ensure_routers(app)
 
         # MCP Client functionality removed from architecture
         # Agents now use MCP tools directly
 
         # Mark initialization as complete
         _initialization_complete = True
-        api_logger.info("🎉 Archon backend started successfully!")
+        _startup_profile["startup_seconds"] = round(time.perf_counter() - startup_started, 3)
+        api_logger.info(f"🎉 Archon backend started successfully in {_startup_profile['startup_seconds']}s!")
 
     except Exception:
         api_logger.error("❌ Failed to start backend", exc_info=True)
@@ -211,10 +278,27 @@ async def lifespan(app: FastAPI):
 
         # Cleanup crawling context
         try:
+            from .services.crawler_manager import cleanup_crawler
+
+            if _crawler_warmup_task is not None and not _crawler_warmup_task.done():
+                _crawler_warmup_task.cancel()
             await cleanup_crawler()
         except Exception as e:
             api_logger.warning("Could not cleanup crawling context: %s", e, exc_info=True)
 
+        # Close pooled fast-path HTTP connections
+        try:
+            from .services.crawling.helpers.http_fetcher import close_http_fetcher
+
+            await close_http_fetcher()
+        except Exception as e:
+            api_logger.warning("Could not close crawl HTTP client: %s", e, exc_info=True)
+
+        # Stop document parsing workers
+        from .utils.document_processing import shutdown_pdf_process_pool
+
+        shutdown_pdf_process_pool()
+
         api_logger.info("✅ Cleanup completed")
 
     except Exception:
@@ -253,22 +337,16 @@ async def skip_health_check_logs(request, call_next):
         return response
     return await call_next(request)
 
-# Include API routers
-app.include_router(settings_router)
-app.include_router(mcp_router)
-app.include_router(mcp_analytics_router)
-# app.include_router(mcp_client_router)  # Removed - not part of new architecture
-app.include_router(knowledge_router)
-app.include_router(pages_router)
-app.include_router(ollama_router)
-app.include_router(projects_router)
-app.include_router(progress_router)
-app.include_router(agent_chat_router)
-app.include_router(internal_router)
-app.include_router(bug_report_router)
-app.include_router(providers_router)
-app.include_router(version_router)
-app.include_router(migration_router)
+# Include API routers (imported lazily, see API_ROUTER_MODULES)
+@app.middleware("http")
+async def ensure_routers_loaded(request, call_next):
+    # Requests that arrive before the lifespan registered the routers (or
+    # without a lifespan, e.g. in tests) wait for the import instead of a 404
+    if not _routers_included and request.url.path not in _ROUTERLESS_PATHS:
+        await _ensure_routers(app)
+    return await call_next(request)
+
+_ROUTERLESS_PATHS = {"/", "/health", "/api/health", "/api/startup-profile"}
 
 # Root endpoint
 @app.get("/")
@@ -327,6 +405,9 @@ async def health_check(response: Response):
         
         return migration_response
 
+    from .services.crawler_manager import get_crawler_pool_stats
+    from .services.crawling.helpers.http_fetcher import get_http_fetcher
+
     return {
         "status": "healthy",
         "service": "archon-backend",
@@ -334,6 +415,8 @@ async def health_check(response: Response):
         "ready": True,
         "credentials_loaded": True,
         "schema_valid": True,
+        "crawl_fast_path": get_http_fetcher().get_stats(),
+        "crawler_pool": get_crawler_pool_stats(),
     }
 
 # API health check endpoint (alias for /health at /api/health)
@@ -342,6 +425,21 @@ async def api_health_check(response: Response):
     """API health check endpoint - alias for /health."""
     return await health_check(response)
 
+# Startup profile endpoint
+@app.get("/api/startup-profile")
+async def startup_profile():
+    """Report import and startup timings (router imports, lifespan phases, crawler warmup)."""
+    crawler_warming = _crawler_warmup_task is not None and not _crawler_warmup_task.done()
+    return {
+        "ready": _initialization_complete,
+        "main_import_seconds": _startup_profile.get("main_import_seconds"),
+        "startup_seconds": _startup_profile.get("startup_seconds"),
+        "phases": _startup_profile["phases"],
+        "router_imports": _startup_profile["router_imports"],
+        "routers_loaded": _routers_included,
+        "crawler_warming": crawler_warming,
+    }
+
 # Cache schema check result to avoid repeated database queries
 _schema_check_cache = {"valid": None, "checked_at": 0}
 
@@ -424,6 +522,8 @@ async def _check_database_schema():
         # Don't cache inconclusive results - allow retry
         return result
 
+_startup_profile["main_import_seconds"] = round(time.perf_counter() - _module_import_started, 3)
+
 # Export the app directly for uvicorn to use
 
 def main():
@@ -67,15 +67,21 @@ class DatabaseRepository(ABC):
         self,
         source_id: str,
         limit: int | None = None,
-        offset: int | None = None
+        offset: int | None = None,
+        after_url: str | None = None,
+        include_content: bool = True,
+        section_title: str | None = None
     ) -> list[dict[str, Any]]:
         """
-        List all pages for a given source.
+        List all pages for a given source, ordered by URL.
 
         Args:
             source_id: The source identifier
             limit: Maximum number of results to return
-            offset: Number of results to skip
+            offset: Number of results to skip (prefer after_url for deep pages)
+            after_url: Keyset cursor; only pages with a URL after this one are returned
+            include_content: Whether to load full_content (False returns metadata only)
+            section_title: Optional section title filter (llms-full.txt sources)
 
         Returns:
             List of page metadata dictionaries
@@ -83,12 +89,13 @@ class DatabaseRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_page_count_by_source(self, source_id: str) -> int:
+    async def get_page_count_by_source(self, source_id: str, section_title: str | None = None) -> int:
         """
         Get the count of pages for a source.
 
         Args:
             source_id: The source identifier
+            section_title: Optional section title to count only that section's pages
 
         Returns:
             Number of pages for the source
@@ -359,6 +366,49 @@ class DatabaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_code_fingerprints(self, code_hashes: list[str]) -> list[dict[str, Any]]:
+        """
+        Get global code fingerprints by normalized-code hash.
+
+        Args:
+            code_hashes: Normalized-code hashes to look up
+
+        Returns:
+            List of fingerprint dicts (code_hash, minhash, language, summary,
+            example_name, llm_chat_model, embedding_model, embedding_dimension,
+            embedding as list[float] or None, hit_count)
+        """
+        pass
+
+    @abstractmethod
+    async def find_code_fingerprints_by_band_keys(self, band_keys: list[str]) -> list[dict[str, Any]]:
+        """
+        Get fingerprints sharing at least one LSH band key (near-duplicate candidates).
+
+        Args:
+            band_keys: LSH band keys of the snippets being looked up
+
+        Returns:
+            List of candidate fingerprint dicts (without embeddings)
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_code_fingerprints(self, fingerprints: list[dict[str, Any]]) -> int:
+        """
+        Insert or update code fingerprints and their LSH band keys.
+
+        Existing fingerprints keep their row and get their hit_count incremented.
+
+        Args:
+            fingerprints: Fingerprint dicts; each may carry a "band_keys" list
+
+        Returns:
+            Number of fingerprints written
+        """
+        pass
+
     # ========================================================================
     # 4. SETTINGS OPERATIONS
     # ========================================================================
@@ -488,6 +538,27 @@ class DatabaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def search_projects(
+        self,
+        query: str | None = None,
+        limit: int | None = None,
+        cursor: tuple[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search projects and return lightweight projections, newest first.
+
+        Args:
+            query: Optional free-text search over title and description
+            limit: Maximum number of projects to return (None for all)
+            cursor: (created_at, id) of the last project on the previous page
+
+        Returns:
+            Project dictionaries without docs/features/data; a "stats" dict holds
+            docs_count, features_count and has_data instead
+        """
+        pass
+
     @abstractmethod
     async def get_project_by_id(self, project_id: str) -> dict[str, Any] | None:
         """
@@ -558,6 +629,94 @@ class DatabaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_project_documents(
+        self,
+        project_id: str,
+        include_content: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        List the documents of a project in document order.
+
+        Args:
+            project_id: The project identifier
+            include_content: If False, omit content and report content_size instead
+
+        Returns:
+            List of document dictionaries (each with its revision)
+        """
+        pass
+
+    @abstractmethod
+    async def get_project_document(self, project_id: str, doc_id: str) -> dict[str, Any] | None:
+        """
+        Get a single project document with its content.
+
+        Args:
+            project_id: The project identifier
+            doc_id: The document identifier
+
+        Returns:
+            Document dict if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def create_project_document(
+        self,
+        project_id: str,
+        document_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Append a document to a project without touching its other documents.
+
+        Args:
+            project_id: The project identifier
+            document_data: Document fields (id, document_type, title, content, ...)
+
+        Returns:
+            The created document with revision 1
+        """
+        pass
+
+    @abstractmethod
+    async def update_project_document(
+        self,
+        project_id: str,
+        doc_id: str,
+        update_data: dict[str, Any],
+        expected_revision: int | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Update a single project document and bump its revision.
+
+        Args:
+            project_id: The project identifier
+            doc_id: The document identifier
+            update_data: Fields to update
+            expected_revision: If given, only update while the stored revision
+                still matches (optimistic concurrency)
+
+        Returns:
+            The updated document, or None if it was not found or the revision
+            no longer matches
+        """
+        pass
+
+    @abstractmethod
+    async def delete_project_document(self, project_id: str, doc_id: str) -> bool:
+        """
+        Delete a single project document.
+
+        Args:
+            project_id: The project identifier
+            doc_id: The document identifier
+
+        Returns:
+            True if deleted, False if not found
+        """
+        pass
+
     # ========================================================================
     # 6. TASK OPERATIONS
     # ========================================================================
@@ -685,6 +844,92 @@ class DatabaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def make_room_for_task_order(self, project_id: str, status: str, task_order: int) -> int:
+        """
+        Free a task_order slot for an inserted task.
+
+        Task orders are sparse, so usually nothing moves. If the slot is taken,
+        only the run of consecutive orders starting at task_order shifts up by
+        one (the first gap absorbs it), in a single write.
+
+        Args:
+            project_id: The project identifier
+            status: The task status (board column)
+            task_order: The slot the new task will take
+
+        Returns:
+            Number of tasks shifted
+        """
+        pass
+
+    @abstractmethod
+    async def rebalance_task_orders(self, project_id: str, status: str, gap: int) -> int:
+        """
+        Respace the task orders of a board column, keeping their order.
+
+        Args:
+            project_id: The project identifier
+            status: The task status (board column)
+            gap: Distance between consecutive task orders
+
+        Returns:
+            Number of tasks renumbered
+        """
+        pass
+
+    @abstractmethod
+    async def create_tasks_batch(self, tasks_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Create several tasks in a single transaction.
+
+        Each task with a task_order > 0 takes its slot the same way as
+        make_room_for_task_order, in list order.
+
+        Args:
+            tasks_data: List of task field dictionaries
+
+        Returns:
+            The created tasks with IDs, in input order
+        """
+        pass
+
+    @abstractmethod
+    async def update_tasks_batch(
+        self,
+        updates: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]] | None:
+        """
+        Update several tasks in a single transaction.
+
+        Args:
+            updates: List of (task_id, update_data) pairs
+
+        Returns:
+            Updated task dicts in input order, or None if any task does not
+            exist (nothing is written)
+        """
+        pass
+
+    @abstractmethod
+    async def archive_tasks_batch(
+        self,
+        task_ids: list[str],
+        archived_by: str = "system"
+    ) -> list[dict[str, Any]] | None:
+        """
+        Archive several tasks in a single transaction.
+
+        Args:
+            task_ids: The task identifiers
+            archived_by: Who archived the tasks
+
+        Returns:
+            Archived task dicts in input order, or None if any task does not
+            exist (nothing is written)
+        """
+        pass
+
     @abstractmethod
     async def get_task_counts_by_project(self, project_id: str) -> dict[str, int]:
         """
@@ -813,6 +1058,36 @@ class DatabaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_source_stats_by_sources(
+        self,
+        source_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get page count, code example count and first page URL for many sources.
+
+        Args:
+            source_ids: List of source identifiers
+
+        Returns:
+            Dictionary mapping source_id to a dict with page_count,
+            code_example_count and first_page_url (None if the source has no pages).
+            The counts are the same per-source stats that get_corpus_stats totals.
+        """
+        pass
+
+    @abstractmethod
+    async def get_corpus_stats(self) -> dict[str, int]:
+        """
+        Get totals across all sources.
+
+        Returns:
+            Dictionary with sources_count, page_count, chunk_count,
+            code_example_count, word_count and content_bytes (stored size
+            of page bodies, chunks and code examples)
+        """
+        pass
+
     # ========================================================================
     # 8. CRAWLED PAGES OPERATIONS
     # ========================================================================
@@ -885,15 +1160,19 @@ class DatabaseRepository(ABC):
         self,
         source_id: str,
         limit: int | None = None,
-        offset: int | None = None
+        offset: int | None = None,
+        after: tuple[str, int] | None = None,
+        include_content: bool = True
     ) -> list[dict[str, Any]]:
         """
-        List crawled pages for a source.
+        List crawled pages (chunks) for a source, ordered by URL and chunk number.
 
         Args:
             source_id: The source identifier
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (prefer after for deep pages)
+            after: Keyset cursor (url, chunk_number) of the last chunk already returned
+            include_content: Whether to load chunk content (False returns metadata only)
 
         Returns:
             List of crawled page dictionaries
@@ -969,7 +1248,8 @@ class DatabaseRepository(ABC):
     async def list_document_versions(
         self,
         project_id: str,
-        limit: int | None = None
+        limit: int | None = None,
+        field_name: str | None = None
     ) -> list[dict[str, Any]]:
         """
         List document versions for a project.
@@ -977,12 +1257,55 @@ class DatabaseRepository(ABC):
         Args:
             project_id: The project identifier
             limit: Maximum number of versions to return
+            field_name: Optional field filter (docs, features, data, ...)
 
         Returns:
             List of version dictionaries ordered by created_at desc
         """
         pass
 
+    @abstractmethod
+    async def get_latest_document_version_number(
+        self,
+        project_id: str,
+        field_name: str
+    ) -> int:
+        """
+        Get the highest version number of a project field.
+
+        Args:
+            project_id: The project identifier
+            field_name: The versioned field (docs, features, data, ...)
+
+        Returns:
+            The latest version number, or 0 if the field has no versions
+        """
+        pass
+
+    @abstractmethod
+    async def get_document_version_chain(
+        self,
+        project_id: str,
+        field_name: str,
+        version_number: int
+    ) -> list[dict[str, Any]]:
+        """
+        Get the versions needed to reconstruct one version of a project field.
+
+        Versions are stored as full snapshots (storage_format 'snapshot') or
+        JSON Patch deltas against the previous version ('delta').
+
+        Args:
+            project_id: The project identifier
+            field_name: The versioned field
+            version_number: The version to reconstruct
+
+        Returns:
+            Versions from the nearest snapshot at or below version_number up to
+            version_number, ordered by version_number asc (empty if not found)
+        """
+        pass
+
     @abstractmethod
     async def get_document_version_by_id(
         self,
@@ -6,12 +6,16 @@ Uses dictionaries to store data and generates UUIDs for IDs.
 Thread-safe and maintains referential integrity.
 """
 
+import copy
+import json
+import re
 import threading
 import uuid
 from datetime import datetime
 from typing import Any
 
 from .database_repository import DatabaseRepository
+from .revision_counters import PROJECTS, SOURCES, TASKS, revision_counters
 
 class FakeDatabaseRepository(DatabaseRepository):
     """
@@ -29,6 +33,8 @@ class FakeDatabaseRepository(DatabaseRepository):
         self.page_metadata: dict[str, dict[str, Any]] = {}
         self.documents: dict[str, dict[str, Any]] = {}
         self.code_examples: dict[str, dict[str, Any]] = {}
+        self.code_fingerprints: dict[str, dict[str, Any]] = {}
+        self.code_fingerprint_bands: dict[str, set[str]] = {}
         self.settings: dict[str, Any] = {}
         self.projects: dict[str, dict[str, Any]] = {}
         self.tasks: dict[str, dict[str, Any]] = {}
@@ -62,15 +68,25 @@ class FakeDatabaseRepository(DatabaseRepository):
         self,
         source_id: str,
         limit: int | None = None,
-        offset: int | None = None
+        offset: int | None = None,
+        after_url: str | None = None,
+        include_content: bool = True,
+        section_title: str | None = None
     ) -> list[dict[str, Any]]:
-        """List all pages for a given source."""
+        """List all pages for a given source, ordered by URL."""
         with self.lock:
             pages = [
                 page for page in self.crawled_pages.values()
                 if page.get("source_id") == source_id
+                and (section_title is None or page.get("section_title") == section_title)
+                and (after_url is None or page.get("url", "") > after_url)
             ]
-            pages.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+            pages.sort(key=lambda x: x.get("url", ""))
+            if not include_content:
+                pages = [
+                    {k: v for k, v in page.items() if k not in ("full_content", "content")}
+                    for page in pages
+                ]
 
             if offset:
                 pages = pages[offset:]
@@ -79,9 +95,14 @@ class FakeDatabaseRepository(DatabaseRepository):
 
             return pages
 
-    async def get_page_count_by_source(self, source_id: str) -> int:
-        """Get the count of pages for a source."""
+    async def get_page_count_by_source(self, source_id: str, section_title: str | None = None) -> int:
+        """Get the count of pages for a source, optionally within one section."""
         with self.lock:
+            if section_title:
+                return sum(
+                    1 for page in self.page_metadata.values()
+                    if page.get("source_id") == source_id and page.get("section_title") == section_title
+                )
             return sum(
                 1 for page in self.crawled_pages.values()
                 if page.get("source_id") == source_id
@@ -310,6 +331,46 @@ class FakeDatabaseRepository(DatabaseRepository):
                 del self.code_examples[ex_id]
             return len(to_delete)
 
+    async def get_code_fingerprints(self, code_hashes: list[str]) -> list[dict[str, Any]]:
+        """Get global code fingerprints by normalized-code hash."""
+        with self.lock:
+            return [
+                self.code_fingerprints[code_hash].copy()
+                for code_hash in dict.fromkeys(code_hashes)
+                if code_hash in self.code_fingerprints
+            ]
+
+    async def find_code_fingerprints_by_band_keys(self, band_keys: list[str]) -> list[dict[str, Any]]:
+        """Get fingerprints sharing at least one LSH band key."""
+        with self.lock:
+            candidate_hashes = set()
+            for band_key in band_keys:
+                candidate_hashes.update(self.code_fingerprint_bands.get(band_key, ()))
+            return [
+                {k: v for k, v in self.code_fingerprints[code_hash].items() if k != "embedding"}
+                for code_hash in candidate_hashes
+            ]
+
+    async def upsert_code_fingerprints(self, fingerprints: list[dict[str, Any]]) -> int:
+        """Insert or update code fingerprints and their LSH band keys."""
+        with self.lock:
+            for fingerprint in fingerprints:
+                code_hash = fingerprint["code_hash"]
+                record = {k: v for k, v in fingerprint.items() if k != "band_keys"}
+                existing = self.code_fingerprints.get(code_hash)
+                if existing:
+                    for key, value in record.items():
+                        if value is not None:
+                            existing[key] = value
+                    existing["hit_count"] = existing.get("hit_count", 0) + 1
+                else:
+                    record["hit_count"] = 0
+                    self.code_fingerprints[code_hash] = record
+
+                for band_key in fingerprint.get("band_keys") or []:
+                    self.code_fingerprint_bands.setdefault(band_key, set()).add(code_hash)
+            return len(fingerprints)
+
     # ========================================================================
     # 4. SETTINGS OPERATIONS
     # ========================================================================
@@ -378,6 +439,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 project_data["updated_at"] = datetime.now().isoformat()
 
             self.projects[project_id] = project_data.copy()
+            revision_counters.bump(PROJECTS)
             return self.projects[project_id]
 
     async def list_projects(
@@ -392,6 +454,40 @@ class FakeDatabaseRepository(DatabaseRepository):
             projects.sort(key=lambda x: x.get(order_by, ""), reverse=desc)
             return projects
 
+    async def search_projects(
+        self,
+        query: str | None = None,
+        limit: int | None = None,
+        cursor: tuple[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search projects by title/description, returning lightweight projections."""
+        terms = re.findall(r"\w+", (query or "").lower())
+        with self.lock:
+            projects = sorted(
+                self.projects.values(), key=lambda p: (p.get("created_at", ""), p["id"]), reverse=True
+            )
+            results = []
+            for project in projects:
+                text = f"{project.get('title', '')} {project.get('description') or ''}".lower()
+                words = re.findall(r"\w+", text)
+                if not all(any(word.startswith(term) for word in words) for term in terms):
+                    continue
+                if cursor and (project.get("created_at", ""), project["id"]) >= tuple(cursor):
+                    continue
+                results.append({
+                    **{key: project.get(key) for key in ("id", "title", "description", "github_repo",
+                                                         "created_at", "updated_at")},
+                    "pinned": bool(project.get("pinned")),
+                    "stats": {
+                        "docs_count": len(project.get("docs") or []),
+                        "features_count": len(project.get("features") or []),
+                        "has_data": bool(project.get("data")),
+                    },
+                })
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
     async def get_project_by_id(self, project_id: str) -> dict[str, Any] | None:
         """Get a specific project by ID."""
         with self.lock:
@@ -409,6 +505,7 @@ class FakeDatabaseRepository(DatabaseRepository):
 
             update_data["updated_at"] = datetime.now().isoformat()
             self.projects[project_id].update(update_data)
+            revision_counters.bump(PROJECTS)
             return self.projects[project_id]
 
     async def delete_project(self, project_id: str) -> bool:
@@ -423,6 +520,8 @@ class FakeDatabaseRepository(DatabaseRepository):
                 ]
                 for task_id in to_delete:
                     del self.tasks[task_id]
+                revision_counters.bump(PROJECTS)
+                revision_counters.bump(TASKS, project_id)
                 return True
             return False
 
@@ -434,6 +533,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 if pid != project_id and project.get("pinned"):
                     project["pinned"] = False
                     count += 1
+            revision_counters.bump(PROJECTS)
             return count
 
     async def get_project_features(self, project_id: str) -> list[dict[str, Any]] | None:
@@ -448,6 +548,89 @@ class FakeDatabaseRepository(DatabaseRepository):
                 return None
             return project.get("features", [])
 
+    async def list_project_documents(
+        self,
+        project_id: str,
+        include_content: bool = False
+    ) -> list[dict[str, Any]]:
+        """List the documents of a project in document order."""
+        with self.lock:
+            project = self.projects.get(project_id) or {}
+            documents = []
+            for doc in project.get("docs") or []:
+                document = {"revision": 1, **copy.deepcopy(doc)}
+                if not include_content:
+                    content = document.pop("content", {})
+                    document["content_size"] = len(json.dumps(content))
+                documents.append(document)
+            return documents
+
+    async def get_project_document(self, project_id: str, doc_id: str) -> dict[str, Any] | None:
+        """Get a single project document with its content."""
+        with self.lock:
+            project = self.projects.get(project_id) or {}
+            for doc in project.get("docs") or []:
+                if doc.get("id") == doc_id:
+                    return {"revision": 1, **copy.deepcopy(doc)}
+            return None
+
+    async def create_project_document(
+        self,
+        project_id: str,
+        document_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Append a document to a project."""
+        with self.lock:
+            now = datetime.now().isoformat()
+            document = {
+                **copy.deepcopy(document_data),
+                "id": document_data.get("id") or self._generate_id(),
+                "revision": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            project = self.projects[project_id]
+            project["docs"] = [*(project.get("docs") or []), document]
+            project["updated_at"] = now
+            revision_counters.bump(PROJECTS)
+            return copy.deepcopy(document)
+
+    async def update_project_document(
+        self,
+        project_id: str,
+        doc_id: str,
+        update_data: dict[str, Any],
+        expected_revision: int | None = None
+    ) -> dict[str, Any] | None:
+        """Update a single project document and bump its revision."""
+        with self.lock:
+            project = self.projects.get(project_id) or {}
+            for doc in project.get("docs") or []:
+                if doc.get("id") != doc_id:
+                    continue
+                revision = doc.get("revision", 1)
+                if expected_revision is not None and expected_revision != revision:
+                    return None
+                doc.update(copy.deepcopy(update_data))
+                doc["revision"] = revision + 1
+                doc["updated_at"] = project["updated_at"] = datetime.now().isoformat()
+                revision_counters.bump(PROJECTS)
+                return copy.deepcopy(doc)
+            return None
+
+    async def delete_project_document(self, project_id: str, doc_id: str) -> bool:
+        """Delete a single project document."""
+        with self.lock:
+            project = self.projects.get(project_id) or {}
+            docs = project.get("docs") or []
+            remaining = [doc for doc in docs if doc.get("id") != doc_id]
+            if len(remaining) == len(docs):
+                return False
+            project["docs"] = remaining
+            project["updated_at"] = datetime.now().isoformat()
+            revision_counters.bump(PROJECTS)
+            return True
+
     # ========================================================================
     # 6. TASK OPERATIONS
     # ========================================================================
@@ -475,6 +658,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 task_data["archived"] = False
 
             self.tasks[task_id] = task_data.copy()
+            revision_counters.bump(TASKS, task_data.get("project_id"))
             return self.tasks[task_id]
 
     async def list_tasks(
@@ -529,15 +713,18 @@ class FakeDatabaseRepository(DatabaseRepository):
             if task_id not in self.tasks:
                 return None
 
+            previous_project_id = self.tasks[task_id].get("project_id")
             update_data["updated_at"] = datetime.now().isoformat()
             self.tasks[task_id].update(update_data)
+            revision_counters.bump(TASKS, previous_project_id, self.tasks[task_id].get("project_id"))
             return self.tasks[task_id]
 
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task (hard delete)."""
         with self.lock:
             if task_id in self.tasks:
-                del self.tasks[task_id]
+                task = self.tasks.pop(task_id)
+                revision_counters.bump(TASKS, task.get("project_id"))
                 return True
             return False
 
@@ -557,6 +744,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 "archived_by": archived_by,
                 "updated_at": datetime.now().isoformat(),
             })
+            revision_counters.bump(TASKS, self.tasks[task_id].get("project_id"))
             return self.tasks[task_id]
 
     async def get_tasks_by_project_and_status(
@@ -575,6 +763,80 @@ class FakeDatabaseRepository(DatabaseRepository):
                 tasks = [t for t in tasks if t.get("task_order", 0) >= task_order_gte]
             return tasks
 
+    async def make_room_for_task_order(self, project_id: str, status: str, task_order: int) -> int:
+        """Shift the consecutive run of tasks occupying task_order up by one."""
+        with self.lock:
+            column = sorted(
+                (
+                    t for t in self.tasks.values()
+                    if t.get("project_id") == project_id and t.get("status") == status
+                    and not t.get("archived") and t.get("task_order", 0) >= task_order
+                ),
+                key=lambda t: t.get("task_order", 0),
+            )
+            run_end = task_order - 1
+            for task in column:
+                if task.get("task_order", 0) > run_end + 1:
+                    break
+                run_end = task.get("task_order", 0)
+
+            shifted = [t for t in column if t.get("task_order", 0) <= run_end]
+            for task in shifted:
+                task["task_order"] = task.get("task_order", 0) + 1
+            if shifted:
+                revision_counters.bump(TASKS, project_id)
+            return len(shifted)
+
+    async def rebalance_task_orders(self, project_id: str, status: str, gap: int) -> int:
+        """Respace a column's task orders to gap, 2 * gap, ..."""
+        with self.lock:
+            column = sorted(
+                (
+                    t for t in self.tasks.values()
+                    if t.get("project_id") == project_id and t.get("status") == status
+                    and not t.get("archived")
+                ),
+                key=lambda t: (t.get("task_order", 0), t.get("created_at", ""), t["id"]),
+            )
+            for position, task in enumerate(column, start=1):
+                task["task_order"] = position * gap
+            revision_counters.bump(TASKS, project_id)
+            return len(column)
+
+    async def create_tasks_batch(self, tasks_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several tasks under one lock acquisition."""
+        with self.lock:
+            created = []
+            for task_data in tasks_data:
+                task_order = task_data.get("task_order")
+                if task_order and task_order > 0:
+                    await self.make_room_for_task_order(
+                        task_data["project_id"], task_data.get("status", "todo"), task_order
+                    )
+                created.append(await self.create_task(task_data))
+            return created
+
+    async def update_tasks_batch(
+        self,
+        updates: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]] | None:
+        """Update several tasks; nothing is written if any task is missing."""
+        with self.lock:
+            if any(task_id not in self.tasks for task_id, _ in updates):
+                return None
+            return [await self.update_task(task_id, update_data) for task_id, update_data in updates]
+
+    async def archive_tasks_batch(
+        self,
+        task_ids: list[str],
+        archived_by: str = "system"
+    ) -> list[dict[str, Any]] | None:
+        """Archive several tasks; nothing is written if any task is missing."""
+        with self.lock:
+            if any(task_id not in self.tasks for task_id in task_ids):
+                return None
+            return [await self.archive_task(task_id, archived_by) for task_id in task_ids]
+
     async def get_task_counts_by_project(self, project_id: str) -> dict[str, int]:
         """Get task counts grouped by status for a project."""
         with self.lock:
@@ -708,6 +970,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 # INSERT: new source
                 self.sources[source_id] = source_data.copy()
 
+            revision_counters.bump(SOURCES)
             return self.sources[source_id]
 
     async def update_source_metadata(
@@ -723,6 +986,7 @@ class FakeDatabaseRepository(DatabaseRepository):
             current_metadata = self.sources[source_id].get("metadata", {})
             merged_metadata = {**current_metadata, **metadata}
             self.sources[source_id]["metadata"] = merged_metadata
+            revision_counters.bump(SOURCES)
             return self.sources[source_id]
 
     async def delete_source(self, source_id: str) -> bool:
@@ -758,8 +1022,63 @@ class FakeDatabaseRepository(DatabaseRepository):
             for page_id in page_ids:
                 del self.crawled_pages[page_id]
 
+            revision_counters.bump(SOURCES)
             return True
 
+    async def get_source_stats_by_sources(
+        self,
+        source_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Get page count, code example count and first page URL for many sources."""
+        with self.lock:
+            wanted = set(source_ids)
+            stats = {
+                source_id: {"page_count": 0, "code_example_count": 0, "first_page_url": None}
+                for source_id in wanted
+                if source_id in self.sources
+            }
+
+            # Mirror list_pages_by_source ordering (by URL) for the first URL
+            pages = sorted(self.crawled_pages.values(), key=lambda x: x.get("url", ""))
+            for page in pages:
+                entry = stats.get(page.get("source_id"))
+                if entry is not None:
+                    entry["page_count"] += 1
+                    if entry["first_page_url"] is None:
+                        entry["first_page_url"] = page.get("url")
+
+            for ex in self.code_examples.values():
+                entry = stats.get(ex.get("source_id"))
+                if entry is not None:
+                    entry["code_example_count"] += 1
+
+            return stats
+
+    async def get_corpus_stats(self) -> dict[str, int]:
+        """Get totals across all sources."""
+        with self.lock:
+            pages = list(self.page_metadata.values())
+            # Chunks are the archon_crawled_pages rows, as counted by SQLite
+            chunks = list(self.crawled_pages.values())
+            examples = list(self.code_examples.values())
+            return {
+                "sources_count": len(self.sources),
+                "page_count": len(pages),
+                "chunk_count": len(chunks),
+                "code_example_count": len(examples),
+                "word_count": sum(
+                    page.get("word_count") or len(page.get("full_content", "").split()) for page in pages
+                ),
+                "content_bytes": sum(
+                    len(text.encode("utf-8"))
+                    for text in (
+                        [page.get("full_content") or "" for page in pages]
+                        + [chunk.get("content") or "" for chunk in chunks]
+                        + [ex.get(field) or "" for ex in examples for field in ("content", "summary")]
+                    )
+                ),
+            }
+
     # ========================================================================
     # 8. CRAWLED PAGES OPERATIONS
     # ========================================================================
@@ -828,15 +1147,23 @@ class FakeDatabaseRepository(DatabaseRepository):
         self,
         source_id: str,
         limit: int | None = None,
-        offset: int | None = None
+        offset: int | None = None,
+        after: tuple[str, int] | None = None,
+        include_content: bool = True
     ) -> list[dict[str, Any]]:
-        """List crawled pages for a source."""
+        """List crawled pages for a source, ordered by URL and chunk number."""
         with self.lock:
+            def sort_key(page: dict[str, Any]) -> tuple[str, int]:
+                return (page.get("url", ""), page.get("chunk_number", 0))
+
             pages = [
                 page for page in self.crawled_pages.values()
                 if page.get("source_id") == source_id
+                and (after is None or sort_key(page) > tuple(after))
             ]
-            pages.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+            pages.sort(key=sort_key)
+            if not include_content:
+                pages = [{k: v for k, v in page.items() if k != "content"} for page in pages]
 
             if offset:
                 pages = pages[offset:]
@@ -919,19 +1246,21 @@ class FakeDatabaseRepository(DatabaseRepository):
             if "created_at" not in version_data:
                 version_data["created_at"] = datetime.now().isoformat()
 
-            self.document_versions[version_id] = version_data.copy()
+            self.document_versions[version_id] = copy.deepcopy(version_data)
             return self.document_versions[version_id]
 
     async def list_document_versions(
         self,
         project_id: str,
-        limit: int | None = None
+        limit: int | None = None,
+        field_name: str | None = None
     ) -> list[dict[str, Any]]:
         """List document versions for a project."""
         with self.lock:
             versions = [
                 v for v in self.document_versions.values()
                 if v.get("project_id") == project_id
+                and (field_name is None or v.get("field_name") == field_name)
             ]
             versions.sort(key=lambda x: x.get("created_at", ""), reverse=True)
 
@@ -940,6 +1269,46 @@ class FakeDatabaseRepository(DatabaseRepository):
 
             return versions
 
+    async def get_latest_document_version_number(
+        self,
+        project_id: str,
+        field_name: str
+    ) -> int:
+        """Get the highest version number of a project field."""
+        with self.lock:
+            return max(
+                (
+                    v.get("version_number", 0) for v in self.document_versions.values()
+                    if v.get("project_id") == project_id and v.get("field_name") == field_name
+                ),
+                default=0,
+            )
+
+    async def get_document_version_chain(
+        self,
+        project_id: str,
+        field_name: str,
+        version_number: int
+    ) -> list[dict[str, Any]]:
+        """Get versions from the nearest snapshot up to version_number."""
+        with self.lock:
+            versions = sorted(
+                (
+                    v for v in self.document_versions.values()
+                    if v.get("project_id") == project_id
+                    and v.get("field_name") == field_name
+                    and v.get("version_number", 0) <= version_number
+                ),
+                key=lambda v: v.get("version_number", 0),
+            )
+            keyframes = [
+                i for i, v in enumerate(versions)
+                if v.get("storage_format", "snapshot") == "snapshot"
+            ]
+            if not keyframes:
+                return []
+            return [copy.deepcopy(v) for v in versions[keyframes[-1]:]]
+
     async def get_document_version_by_id(
         self,
         version_id: str
@@ -974,6 +1343,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 "notes": notes,
             }
             self.project_sources.append(link)
+            revision_counters.bump(PROJECTS)
             return link
 
     async def unlink_project_source(
@@ -988,6 +1358,7 @@ class FakeDatabaseRepository(DatabaseRepository):
                 link for link in self.project_sources
                 if not (link["project_id"] == project_id and link["source_id"] == source_id)
             ]
+            revision_counters.bump(PROJECTS)
             return len(self.project_sources) < initial_len
 
     async def list_project_sources(
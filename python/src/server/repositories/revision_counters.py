@@ -0,0 +1,64 @@
+"""
+Revision Counters
+
+In-process, monotonically increasing revision numbers per resource collection
+(projects, tasks, sources), bumped by repository writes after they commit.
+
+Polling endpoints build their ETag from these revisions instead of from the
+response body, so an unchanged poll is answered with a dictionary lookup
+before any query runs. Handlers must read the revision *before* querying: a
+write that lands in between then only causes one extra full response, never a
+stale body cached under a newer ETag.
+
+Revisions start from zero on every process start; the random epoch in
+version() keeps ETags issued by a previous process from matching.
+"""
+
+import threading
+from uuid import uuid4
+
+PROJECTS = "projects"
+TASKS = "tasks"
+SOURCES = "sources"
+
+
+class RevisionCounters:
+    """Thread-safe revision counters keyed by (collection, key)."""
+
+    def __init__(self):
+        self.epoch = uuid4().hex[:12]
+        self._revisions: dict[tuple[str, str | None], int] = {}
+        self._lock = threading.Lock()
+
+    def bump(self, collection: str, *keys: str | None) -> None:
+        """
+        Record a write to a collection.
+
+        Args:
+            collection: Collection name (PROJECTS, TASKS, SOURCES)
+            *keys: Sub-collections touched by the write (e.g. project ids for tasks).
+                The collection-wide revision is always bumped as well.
+        """
+        with self._lock:
+            for key in {None, *keys}:
+                self._revisions[(collection, key)] = self._revisions.get((collection, key), 0) + 1
+
+    def get(self, collection: str, key: str | None = None) -> int:
+        """Get the current revision of a collection or sub-collection."""
+        return self._revisions.get((collection, key), 0)
+
+    def version(self, *scopes: tuple[str, str | None]) -> str:
+        """
+        Combine the current revisions of several scopes into one version string.
+
+        Args:
+            *scopes: (collection, key) pairs the response depends on
+
+        Returns:
+            Version string suitable as ETag input
+        """
+        return ":".join([self.epoch, *(str(self.get(collection, key)) for collection, key in scopes)])
+
+
+# Global counters shared by all repository instances in this process
+revision_counters = RevisionCounters()
@@ -6,9 +6,15 @@ with all 71 methods fully implemented using actual SQLite queries.
 """
 
 import json
+import os
+import re
 import sqlite3
+import zlib
+from array import array
+from collections import Counter
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import uuid4
 
@@ -16,6 +22,76 @@ import aiosqlite
 import logfire
 
 from .database_repository import DatabaseRepository
+from .revision_counters import PROJECTS, SOURCES, TASKS, revision_counters
+
+# zlib only looks back 32 KB, so a larger preset dictionary would not help
+PAGE_DICTIONARY_SIZE = 32 * 1024
+# A source's dictionary is trained from its first batch with at least this many pages
+PAGE_DICTIONARY_MIN_PAGES = 8
+
+
+def train_page_dictionary(pages: list[str]) -> bytes | None:
+    """
+    Build a zlib preset dictionary from the lines shared by a source's pages.
+
+    Navigation, footers and other boilerplate repeat on every page of a docs
+    site. Lines are ranked by the bytes they would save and the best ones go
+    last, where zlib reaches them at the shortest distance.
+    """
+    page_counts: Counter[str] = Counter()
+    for text in pages:
+        page_counts.update({line for line in text.splitlines() if len(line.strip()) >= 8})
+
+    shared = sorted(
+        ((count * len(line), line) for line, count in page_counts.items() if count > 1),
+        reverse=True,
+    )
+    chosen: list[bytes] = []
+    size = 0
+    for _, line in shared:
+        encoded = line.encode('utf-8') + b'\n'
+        if size + len(encoded) <= PAGE_DICTIONARY_SIZE:
+            chosen.append(encoded)
+            size += len(encoded)
+    return b''.join(reversed(chosen)) or None
+
+
+def decode_page_content(body: Any, encoding: str, dictionary: bytes | None = None) -> str:
+    """Return the text of a stored page body ('text', 'zlib' or 'zlib-dict')."""
+    if encoding in ('zlib', 'zlib-dict'):
+        return _inflate_page(body, dictionary if encoding == 'zlib-dict' else None)
+    return body
+
+
+@lru_cache(maxsize=16)
+def _inflate_page(body: bytes, dictionary: bytes | None) -> str:
+    # Cached so the chunks referencing one page decompress it once per query
+    inflater = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+    return (inflater.decompress(body) + inflater.flush()).decode('utf-8')
+
+
+def _sql_page_text(body: Any, encoding: str, dictionary: bytes | None) -> str | None:
+    """SQL function archon_page_text(full_content, content_encoding, dictionary)."""
+    if body is None:
+        return None
+    return decode_page_content(body, encoding, dictionary)
+
+
+def _sql_chunk_text(
+    content: str,
+    encoding: str,
+    offset: int | None,
+    length: int | None,
+    page_body: Any,
+    page_encoding: str | None,
+    dictionary: bytes | None,
+) -> str:
+    """SQL function archon_chunk_text(...) resolving 'ref' chunks against their page body."""
+    if encoding != 'ref':
+        return content
+    if page_body is None:
+        return ''
+    return decode_page_content(page_body, page_encoding, dictionary)[offset:offset + length]
 
 
 class SQLiteDatabaseRepository(DatabaseRepository):
@@ -35,6 +111,10 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """
         self.db_path = db_path
         self._initialized = False
+        # Page bodies are stored compressed unless ARCHON_SQLITE_COMPRESS_PAGES=false;
+        # ARCHON_SQLITE_CHUNK_REFS=true stores chunks as ranges of their page body
+        self.compress_pages = os.getenv("ARCHON_SQLITE_COMPRESS_PAGES", "true").lower() == "true"
+        self.chunk_refs = os.getenv("ARCHON_SQLITE_CHUNK_REFS", "false").lower() == "true"
         logfire.info(f"Initialized SQLite repository with database: {db_path}")
     
     async def __aenter__(self):
@@ -64,6 +144,9 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             await conn.execute("PRAGMA foreign_keys = ON")
             # Use row factory for dict-like access
             conn.row_factory = aiosqlite.Row
+            # Decoders for compressed page bodies and chunk references (_PAGE_ROWS, _CHUNK_ROWS)
+            await conn.create_function("archon_page_text", 3, _sql_page_text, deterministic=True)
+            await conn.create_function("archon_chunk_text", 7, _sql_chunk_text, deterministic=True)
             yield conn
     
     async def _ensure_schema(self):
@@ -114,31 +197,57 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             if not await cursor.fetchone():
                 logfire.info("MCP usage tracking tables not found. Applying migration...")
 
-                # Apply the MCP usage tracking migration
-                mcp_migration_path = os.path.join(
-                    os.path.dirname(os.path.abspath(__file__)),
-                    "../../../../migration/sqlite/002_mcp_usage_tracking.sql"
-                )
+                await self._apply_migration_file(conn, "002_mcp_usage_tracking.sql")
 
-                if os.path.exists(mcp_migration_path):
-                    logfire.info(f"Applying MCP migration from {mcp_migration_path}")
-                    with open(mcp_migration_path, 'r') as f:
-                        mcp_sql = f.read()
+            # Apply incremental migrations whose sentinel table/index is missing
+            for migration_file, sentinel_name in self._INCREMENTAL_MIGRATIONS:
+                cursor = await conn.execute("""
+                    SELECT name FROM sqlite_master
+                    WHERE type IN ('table', 'index') AND name=?
+                """, (sentinel_name,))
+                if not await cursor.fetchone():
+                    await self._apply_migration_file(conn, migration_file)
 
-                    # Execute the MCP migration SQL
-                    statements = [s.strip() for s in mcp_sql.split(';') if s.strip() and not s.strip().startswith('--')]
-                    for statement in statements:
-                        try:
-                            await conn.execute(statement)
-                            await conn.commit()
-                        except Exception as e:
-                            logfire.error(f"Error executing MCP migration statement: {e}")
-                            raise
+    # Incremental migrations applied on startup: (file name, sentinel table or index)
+    _INCREMENTAL_MIGRATIONS: List[Tuple[str, str]] = [
+        ("003_code_fingerprints.sql", "archon_code_fingerprints"),
+        ("004_page_metadata_source_url_index.sql", "idx_archon_page_metadata_source_url"),
+        ("005_crawled_pages_keyset_index.sql", "idx_archon_crawled_pages_source_url_chunk"),
+        ("006_mcp_usage_rollups.sql", "archon_mcp_usage_source_hourly"),
+        ("007_projects_fts.sql", "archon_projects_fts"),
+        ("008_document_version_deltas.sql", "idx_archon_document_versions_project_field_version"),
+        ("009_project_documents.sql", "archon_project_documents"),
+        ("010_task_order_index.sql", "idx_archon_tasks_project_status_order"),
+        ("011_compressed_page_content.sql", "archon_source_dictionaries"),
+        ("012_source_stats.sql", "archon_source_stats"),
+    ]
+
+    async def _apply_migration_file(self, conn: aiosqlite.Connection, migration_file: str) -> None:
+        """Apply a migration script from migration/sqlite as a single script."""
+        import os
+
+        migration_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "../../../../migration/sqlite",
+            migration_file,
+        )
+        if not os.path.exists(migration_path):
+            logfire.warning(f"Migration file not found at {migration_path} - skipping")
+            return
+
+        logfire.info(f"Applying migration from {migration_path}")
+        with open(migration_path, 'r') as f:
+            migration_sql = f.read()
+
+        try:
+            await conn.executescript(migration_sql)
+            await conn.commit()
+        except Exception as e:
+            logfire.error(f"Error applying migration {migration_file}: {e}")
+            raise
+
+        logfire.info(f"Migration {migration_file} applied successfully")
 
-                    logfire.info("MCP usage tracking migration applied successfully")
-                else:
-                    logfire.warning(f"MCP migration file not found at {mcp_migration_path} - skipping MCP analytics setup")
-    
     def _row_to_dict(self, row: aiosqlite.Row) -> dict:
         """Convert a database row to a dictionary."""
         if row is None:
@@ -148,7 +257,250 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     def _rows_to_list(self, rows: List[aiosqlite.Row]) -> List[dict]:
         """Convert database rows to a list of dictionaries."""
         return [dict(row) for row in rows]
-    
+
+    # archon_source_stats columns, and how the rows of each table contribute to them
+    _SOURCE_STATS_FIELDS = ('page_count', 'chunk_count', 'code_example_count', 'word_count', 'content_bytes')
+    _SOURCE_STATS_MEASURES = {
+        'archon_page_metadata': (
+            "COUNT(*), 0, 0, COALESCE(SUM(word_count), 0), "
+            "COALESCE(SUM(LENGTH(CAST(full_content AS BLOB))), 0)"
+        ),
+        'archon_crawled_pages': "0, COUNT(*), 0, 0, COALESCE(SUM(LENGTH(CAST(content AS BLOB))), 0)",
+        'archon_code_examples': (
+            "0, 0, COUNT(*), 0, "
+            "COALESCE(SUM(LENGTH(CAST(content AS BLOB)) + LENGTH(CAST(summary AS BLOB))), 0)"
+        ),
+    }
+
+    @staticmethod
+    def _stored_bytes(value: Any) -> int:
+        """Size of a stored TEXT or BLOB value, as LENGTH(CAST(value AS BLOB)) reports it."""
+        if isinstance(value, bytes):
+            return len(value)
+        return len((value or '').encode('utf-8'))
+
+    @staticmethod
+    def _accumulate_source_stats(deltas: dict[str, list[int]], source_id: str, values: tuple[int, ...]) -> None:
+        """Add one row's (page, chunk, code example, word, byte) contribution to `deltas`."""
+        totals = deltas.setdefault(source_id, [0] * len(values))
+        for index, value in enumerate(values):
+            totals[index] += value
+
+    async def _measure_source_stats(
+        self, conn: aiosqlite.Connection, table: str, where: str, params: list[Any]
+    ) -> dict[str, list[int]]:
+        """Measure the stats contribution of the rows of `table` matching `where`, by source."""
+        cursor = await conn.execute(f"""
+            SELECT source_id, {self._SOURCE_STATS_MEASURES[table]}
+            FROM {table} WHERE {where}
+            GROUP BY source_id
+        """, params)
+        return {row[0]: list(row[1:]) for row in await cursor.fetchall()}
+
+    async def _add_source_stats(
+        self, conn: aiosqlite.Connection, deltas: dict[str, list[int]], sign: int = 1
+    ) -> None:
+        """Add (or with sign=-1 subtract) per-source deltas to archon_source_stats."""
+        rows = [
+            (source_id, *(sign * value for value in values))
+            for source_id, values in deltas.items()
+            if source_id and any(values)
+        ]
+        if not rows:
+            return
+        await conn.executemany("""
+            INSERT INTO archon_source_stats (
+                source_id, page_count, chunk_count, code_example_count, word_count, content_bytes
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_id) DO UPDATE SET
+                page_count = page_count + excluded.page_count,
+                chunk_count = chunk_count + excluded.chunk_count,
+                code_example_count = code_example_count + excluded.code_example_count,
+                word_count = word_count + excluded.word_count,
+                content_bytes = content_bytes + excluded.content_bytes,
+                updated_at = CURRENT_TIMESTAMP
+        """, rows)
+
+    async def _delete_with_source_stats(
+        self, conn: aiosqlite.Connection, table: str, where: str, params: list[Any]
+    ) -> int:
+        """Delete the rows of `table` matching `where` and take them out of the source stats."""
+        removed = await self._measure_source_stats(conn, table, where, params)
+        cursor = await conn.execute(f"DELETE FROM {table} WHERE {where}", params)
+        await self._add_source_stats(conn, removed, sign=-1)
+        return cursor.rowcount
+
+    # Page and chunk reads select from these instead of the tables, so page bodies
+    # are only decompressed (and chunk references resolved) when content is returned.
+    # Chunks stored as text are read directly; only 'ref' chunks look up their page.
+    _PAGE_ROWS = """(
+        SELECT p.id, p.source_id, p.url,
+               archon_page_text(p.full_content, p.content_encoding, d.dictionary) AS full_content,
+               p.section_title, p.section_order, p.word_count, p.char_count, p.chunk_count,
+               p.created_at, p.updated_at, p.metadata
+        FROM archon_page_metadata p
+        LEFT JOIN archon_source_dictionaries d ON d.id = p.dictionary_id
+    )"""
+    _CHUNK_ROWS = """(
+        SELECT c.id, c.url, c.chunk_number,
+               CASE WHEN c.content_encoding = 'ref' THEN COALESCE((
+                   SELECT archon_chunk_text(
+                       c.content, c.content_encoding, c.content_offset, c.content_length,
+                       p.full_content, p.content_encoding, d.dictionary
+                   )
+                   FROM archon_page_metadata p
+                   LEFT JOIN archon_source_dictionaries d ON d.id = p.dictionary_id
+                   WHERE p.id = c.page_id
+               ), '') ELSE c.content END AS content,
+               c.metadata, c.source_id, c.page_id, c.llm_chat_model, c.embedding_model,
+               c.embedding_dimension, c.created_at
+        FROM archon_crawled_pages c
+    )"""
+
+    async def _get_page_dictionary(
+        self, conn: aiosqlite.Connection, source_id: str, samples: list[str]
+    ) -> tuple[int, bytes] | None:
+        """Get a source's page dictionary, training it from `samples` if there is none yet."""
+        cursor = await conn.execute("""
+            SELECT id, dictionary FROM archon_source_dictionaries WHERE source_id = ?
+        """, (source_id,))
+        row = await cursor.fetchone()
+        if row:
+            return row['id'], row['dictionary']
+        if len(samples) < PAGE_DICTIONARY_MIN_PAGES:
+            return None
+
+        dictionary = train_page_dictionary(samples)
+        if not dictionary:
+            return None
+        cursor = await conn.execute("""
+            INSERT INTO archon_source_dictionaries (source_id, dictionary, sample_pages)
+            VALUES (?, ?, ?)
+        """, (source_id, dictionary, len(samples)))
+        return cursor.lastrowid, dictionary
+
+    def _encode_page_content(
+        self, text: str, dictionary: tuple[int, bytes] | None
+    ) -> tuple[Any, str, int | None]:
+        """Encode a page body, returning (full_content, content_encoding, dictionary_id)."""
+        if not self.compress_pages:
+            return text, 'text', None
+        raw = text.encode('utf-8')
+        if dictionary:
+            dictionary_id, zdict = dictionary
+            compressor = zlib.compressobj(zdict=zdict)
+            return compressor.compress(raw) + compressor.flush(), 'zlib-dict', dictionary_id
+        return zlib.compress(raw), 'zlib', None
+
+    async def _inline_chunk_refs(self, conn: aiosqlite.Connection, page_ids: list[str]) -> None:
+        """Copy the referenced text into chunks of the pages about to be replaced."""
+        added_bytes: dict[str, list[int]] = {}
+        for start in range(0, len(page_ids), self._IN_CLAUSE_CHUNK_SIZE):
+            chunk = page_ids[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = await conn.execute(f"""
+                UPDATE archon_crawled_pages SET
+                    content = COALESCE((
+                        SELECT archon_chunk_text(
+                            archon_crawled_pages.content, archon_crawled_pages.content_encoding,
+                            archon_crawled_pages.content_offset, archon_crawled_pages.content_length,
+                            p.full_content, p.content_encoding, d.dictionary
+                        )
+                        FROM archon_page_metadata p
+                        LEFT JOIN archon_source_dictionaries d ON d.id = p.dictionary_id
+                        WHERE p.id = archon_crawled_pages.page_id
+                    ), ''),
+                    content_encoding = 'text', content_offset = NULL, content_length = NULL
+                WHERE content_encoding = 'ref' AND page_id IN ({placeholders})
+                RETURNING source_id, LENGTH(CAST(content AS BLOB))
+            """, chunk)
+            # The references were stored as empty content
+            for source_id, size in await cursor.fetchall():
+                self._accumulate_source_stats(added_bytes, source_id, (0, 0, 0, 0, size))
+        await self._add_source_stats(conn, added_bytes)
+
+    async def _chunk_rows(
+        self, conn: aiosqlite.Connection, chunks: list[dict[str, Any]], keep_created_at: bool = False
+    ) -> list[tuple]:
+        """
+        Build archon_crawled_pages rows for chunks.
+
+        With chunk references enabled, a chunk found verbatim in its page body is
+        stored as a character range of it instead of a copy of the text.
+        """
+        page_bodies: dict[str, str] = {}
+        if self.chunk_refs:
+            page_ids = list({chunk.get('page_id') for chunk in chunks if chunk.get('page_id')})
+            for start in range(0, len(page_ids), self._IN_CLAUSE_CHUNK_SIZE):
+                batch = page_ids[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                cursor = await conn.execute(f"""
+                    SELECT id, full_content FROM {self._PAGE_ROWS} WHERE id IN ({placeholders})
+                """, batch)
+                page_bodies.update((row['id'], row['full_content']) for row in await cursor.fetchall())
+
+        # Chunks come in page order, so each search starts where the previous chunk ended
+        search_from: dict[str, int] = {}
+        rows = []
+        for chunk in chunks:
+            content = chunk.get('content')
+            encoding, offset, length = 'text', None, None
+            page_id = chunk.get('page_id')
+            body = page_bodies.get(page_id)
+            if body and content:
+                position = body.find(content, search_from.get(page_id, 0))
+                if position < 0:
+                    position = body.find(content)
+                if position >= 0:
+                    search_from[page_id] = position + len(content)
+                    content, encoding, offset, length = '', 'ref', position, len(content)
+
+            created_at = datetime.now().isoformat()
+            if keep_created_at:
+                created_at = chunk.get('created_at', created_at)
+            rows.append((
+                chunk.get('url'),
+                chunk.get('chunk_number', 0),
+                content,
+                json.dumps(chunk.get('metadata', {})),
+                chunk.get('source_id'),
+                page_id,
+                chunk.get('llm_chat_model'),
+                chunk.get('embedding_model'),
+                chunk.get('embedding_dimension'),
+                created_at,
+                encoding,
+                offset,
+                length,
+            ))
+        return rows
+
+    async def _insert_chunks(
+        self, conn: aiosqlite.Connection, chunks: list[dict[str, Any]], replace: bool = False
+    ) -> None:
+        """Insert chunk rows into archon_crawled_pages (INSERT OR REPLACE when `replace`)."""
+        rows = await self._chunk_rows(conn, chunks, keep_created_at=replace)
+
+        added: dict[str, list[int]] = {}
+        for row in rows:
+            self._accumulate_source_stats(added, row[4], (0, 1, 0, 0, self._stored_bytes(row[2])))
+        if replace:
+            for chunk in chunks:
+                replaced = await self._measure_source_stats(
+                    conn, 'archon_crawled_pages', "url = ? AND chunk_number = ?",
+                    [chunk.get('url'), chunk.get('chunk_number', 0)],
+                )
+                await self._add_source_stats(conn, replaced, sign=-1)
+
+        await conn.executemany(f"""
+            {"INSERT OR REPLACE" if replace else "INSERT"} INTO archon_crawled_pages (
+                url, chunk_number, content, metadata, source_id, page_id,
+                llm_chat_model, embedding_model, embedding_dimension, created_at,
+                content_encoding, content_offset, content_length
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        await self._add_source_stats(conn, added)
+
     # ============================================
     # 1. Page Metadata Operations (3 methods)
     # ============================================
@@ -156,8 +508,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     async def get_page_metadata_by_id(self, page_id: str) -> dict[str, Any] | None:
         """Retrieve page metadata by page ID."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT * FROM archon_page_metadata 
+            cursor = await conn.execute(f"""
+                SELECT * FROM {self._PAGE_ROWS}
                 WHERE id = ?
             """, (page_id,))
             row = await cursor.fetchone()
@@ -166,8 +518,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     async def get_page_metadata_by_url(self, url: str) -> dict[str, Any] | None:
         """Retrieve page metadata by URL."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT * FROM archon_page_metadata 
+            cursor = await conn.execute(f"""
+                SELECT * FROM {self._PAGE_ROWS}
                 WHERE url = ?
             """, (url,))
             row = await cursor.fetchone()
@@ -179,6 +531,40 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             return []
 
         async with self._get_connection() as conn:
+            # INSERT OR REPLACE on the unique url may move a page between sources
+            urls = [page.get('url') for page in pages if page.get('url')]
+            replaced_ids = {page['id'] for page in pages if page.get('id')}
+            for start in range(0, len(urls), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = urls[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await conn.execute(f"""
+                    SELECT id FROM archon_page_metadata
+                    WHERE url IN ({placeholders})
+                """, chunk)
+                for row in await cursor.fetchall():
+                    replaced_ids.add(row['id'])
+
+            # Replaced rows leave the source stats; the rows written below are added back
+            replaced_ids = list(replaced_ids)
+            for start in range(0, len(replaced_ids), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = replaced_ids[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                replaced = await self._measure_source_stats(
+                    conn, 'archon_page_metadata', f"id IN ({','.join('?' * len(chunk))})", chunk
+                )
+                await self._add_source_stats(conn, replaced, sign=-1)
+
+            # Chunks referencing a replaced page body keep their own copy of the text
+            await self._inline_chunk_refs(conn, replaced_ids)
+
+            dictionaries = {}
+            if self.compress_pages:
+                for source_id in {page.get('source_id') for page in pages if page.get('source_id')}:
+                    samples = [
+                        page.get('full_content') or '' for page in pages if page.get('source_id') == source_id
+                    ]
+                    dictionaries[source_id] = await self._get_page_dictionary(conn, source_id, samples)
+
+            written: dict[str, tuple[str, tuple[int, ...]]] = {}
             results = []
             for page in pages:
                 # Generate ID if not provided
@@ -209,16 +595,23 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 if char_count == 0:
                     char_count = len(full_content)
 
+                stored_content, content_encoding, dictionary_id = self._encode_page_content(
+                    full_content, dictionaries.get(source_id)
+                )
+
                 await conn.execute("""
                     INSERT OR REPLACE INTO archon_page_metadata (
-                        id, source_id, url, full_content, section_title, section_order,
-                        word_count, char_count, chunk_count, metadata, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        id, source_id, url, full_content, content_encoding, dictionary_id,
+                        section_title, section_order, word_count, char_count, chunk_count,
+                        metadata, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     page_id,
                     source_id,
                     url,
-                    full_content,
+                    stored_content,
+                    content_encoding,
+                    dictionary_id,
                     page.get('section_title'),
                     page.get('section_order', 0),
                     word_count,
@@ -231,7 +624,13 @@ class SQLiteDatabaseRepository(DatabaseRepository):
 
                 page['id'] = page_id
                 results.append(page)
+                # Keyed by url: a url repeated within the batch replaces its earlier row
+                written[url] = (source_id, (1, 0, 0, word_count, self._stored_bytes(stored_content)))
 
+            added: dict[str, list[int]] = {}
+            for source_id, values in written.values():
+                self._accumulate_source_stats(added, source_id, values)
+            await self._add_source_stats(conn, added)
             await conn.commit()
             return results
     
@@ -247,8 +646,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             await conn.commit()
 
             # Return the updated record
-            cursor = await conn.execute("""
-                SELECT * FROM archon_page_metadata WHERE id = ?
+            cursor = await conn.execute(f"""
+                SELECT * FROM {self._PAGE_ROWS} WHERE id = ?
             """, (page_id,))
             row = await cursor.fetchone()
             if row:
@@ -288,8 +687,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         Retrieve complete page metadata by URL including full_content.
         """
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT * FROM archon_page_metadata
+            cursor = await conn.execute(f"""
+                SELECT * FROM {self._PAGE_ROWS}
                 WHERE url = ?
             """, (url,))
             row = await cursor.fetchone()
@@ -300,8 +699,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         Retrieve complete page metadata by ID including full_content.
         """
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT * FROM archon_page_metadata
+            cursor = await conn.execute(f"""
+                SELECT * FROM {self._PAGE_ROWS}
                 WHERE id = ?
             """, (page_id,))
             row = await cursor.fetchone()
@@ -324,9 +723,9 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         # For SQLite, we'll do a simple text search since vectors aren't supported
         # In production, consider using SQLite-VSS extension
         async with self._get_connection() as conn:
-            query = """
+            query = f"""
                 SELECT id, url, chunk_number, content, metadata, source_id
-                FROM archon_crawled_pages
+                FROM {self._CHUNK_ROWS}
                 WHERE 1=1
             """
             params = []
@@ -353,10 +752,10 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """Perform hybrid search combining vector and full-text search."""
         # For SQLite, we use full-text search
         async with self._get_connection() as conn:
-            sql_query = """
+            sql_query = f"""
                 SELECT id, url, chunk_number, content, metadata, source_id,
                        LENGTH(content) - LENGTH(REPLACE(LOWER(content), LOWER(?), '')) as relevance
-                FROM archon_crawled_pages
+                FROM {self._CHUNK_ROWS}
                 WHERE content LIKE ?
             """
             params = [query, f'%{query}%']
@@ -384,8 +783,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     ) -> list[dict[str, Any]]:
         """Get all document chunks for a source."""
         async with self._get_connection() as conn:
-            query = """
-                SELECT * FROM archon_crawled_pages 
+            query = f"""
+                SELECT * FROM {self._CHUNK_ROWS}
                 WHERE source_id = ?
                 ORDER BY url, chunk_number
             """
@@ -402,8 +801,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     async def get_document_by_id(self, document_id: str) -> dict[str, Any] | None:
         """Get a specific document by ID."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT * FROM archon_crawled_pages 
+            cursor = await conn.execute(f"""
+                SELECT * FROM {self._CHUNK_ROWS}
                 WHERE id = ?
             """, (document_id,))
             row = await cursor.fetchone()
@@ -413,25 +812,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """Insert a new document chunk."""
         async with self._get_connection() as conn:
             # Use auto-increment ID for SQLite
-            metadata = json.dumps(document_data.get('metadata', {}))
-
-            await conn.execute("""
-                INSERT INTO archon_crawled_pages (
-                    url, chunk_number, content, metadata, source_id, page_id,
-                    llm_chat_model, embedding_model, embedding_dimension, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                document_data.get('url'),
-                document_data.get('chunk_number', 0),
-                document_data.get('content'),
-                metadata,
-                document_data.get('source_id'),
-                document_data.get('page_id'),
-                document_data.get('llm_chat_model'),
-                document_data.get('embedding_model'),
-                document_data.get('embedding_dimension'),
-                datetime.now().isoformat()
-            ))
+            await self._insert_chunks(conn, [document_data])
 
             await conn.commit()
             # Note: Embeddings are not stored in SQLite (no vector support)
@@ -443,27 +824,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             return []
 
         async with self._get_connection() as conn:
-            for doc in documents:
-                # Use auto-increment ID for SQLite
-                metadata = json.dumps(doc.get('metadata', {}))
-
-                await conn.execute("""
-                    INSERT INTO archon_crawled_pages (
-                        url, chunk_number, content, metadata, source_id, page_id,
-                        llm_chat_model, embedding_model, embedding_dimension, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    doc.get('url'),
-                    doc.get('chunk_number', 0),
-                    doc.get('content'),
-                    metadata,
-                    doc.get('source_id'),
-                    doc.get('page_id'),
-                    doc.get('llm_chat_model'),
-                    doc.get('embedding_model'),
-                    doc.get('embedding_dimension'),
-                    datetime.now().isoformat()
-                ))
+            # Use auto-increment ID for SQLite
+            await self._insert_chunks(conn, documents)
 
             await conn.commit()
             # Note: Embeddings (embedding_768, etc.) are not stored in SQLite
@@ -472,12 +834,11 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     async def delete_documents_by_source(self, source_id: str) -> int:
         """Delete all documents for a source."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                DELETE FROM archon_crawled_pages 
-                WHERE source_id = ?
-            """, (source_id,))
+            deleted = await self._delete_with_source_stats(
+                conn, 'archon_crawled_pages', "source_id = ?", [source_id]
+            )
             await conn.commit()
-            return cursor.rowcount
+            return deleted
     
     # ============================================
     # 4. Code Example Operations (7 methods)
@@ -576,6 +937,11 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 datetime.now().isoformat()
             ))
 
+            content_bytes = (
+                self._stored_bytes(code_example_data.get('content') or code_example_data.get('code', ''))
+                + self._stored_bytes(code_example_data.get('summary', ''))
+            )
+            await self._add_source_stats(conn, {code_example_data.get('source_id'): [0, 0, 1, 0, content_bytes]})
             await conn.commit()
             # Get the auto-generated id
             code_example_data['id'] = cursor.lastrowid
@@ -587,6 +953,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             return []
 
         async with self._get_connection() as conn:
+            added: dict[str, list[int]] = {}
             for example in code_examples:
                 # Prepare metadata - include language if provided
                 metadata_dict = example.get('metadata', {})
@@ -616,30 +983,143 @@ class SQLiteDatabaseRepository(DatabaseRepository):
 
                 # Get the auto-generated id
                 example['id'] = cursor.lastrowid
+                content_bytes = (
+                    self._stored_bytes(example.get('content') or example.get('code', ''))
+                    + self._stored_bytes(example.get('summary', ''))
+                )
+                self._accumulate_source_stats(added, example.get('source_id'), (0, 0, 1, 0, content_bytes))
 
+            await self._add_source_stats(conn, added)
             await conn.commit()
             return code_examples
     
     async def delete_code_examples_by_source(self, source_id: str) -> int:
         """Delete all code examples for a source."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                DELETE FROM archon_code_examples 
-                WHERE source_id = ?
-            """, (source_id,))
+            deleted = await self._delete_with_source_stats(
+                conn, 'archon_code_examples', "source_id = ?", [source_id]
+            )
             await conn.commit()
-            return cursor.rowcount
+            return deleted
     
     async def delete_code_examples_by_url(self, url: str) -> int:
         """Delete all code examples for a specific URL."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                DELETE FROM archon_code_examples 
-                WHERE url = ?
-            """, (url,))
+            deleted = await self._delete_with_source_stats(conn, 'archon_code_examples', "url = ?", [url])
             await conn.commit()
-            return cursor.rowcount
+            return deleted
     
+    # SQLite's default limit on bound parameters is 999; keep IN lists below it
+    _IN_CLAUSE_CHUNK_SIZE = 500
+
+    def _fingerprint_row_to_dict(self, row: aiosqlite.Row) -> dict[str, Any]:
+        """Convert a fingerprint row, decoding the float32 embedding blob."""
+        fingerprint = dict(row)
+        embedding = fingerprint.get('embedding')
+        if embedding is not None:
+            fingerprint['embedding'] = array('f', embedding).tolist()
+        return fingerprint
+
+    async def get_code_fingerprints(self, code_hashes: list[str]) -> list[dict[str, Any]]:
+        """Get global code fingerprints by normalized-code hash."""
+        if not code_hashes:
+            return []
+
+        unique_hashes = list(dict.fromkeys(code_hashes))
+        results = []
+        async with self._get_connection() as conn:
+            for start in range(0, len(unique_hashes), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = unique_hashes[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await conn.execute(f"""
+                    SELECT * FROM archon_code_fingerprints
+                    WHERE code_hash IN ({placeholders})
+                """, chunk)
+                rows = await cursor.fetchall()
+                results.extend(self._fingerprint_row_to_dict(row) for row in rows)
+        return results
+
+    async def find_code_fingerprints_by_band_keys(self, band_keys: list[str]) -> list[dict[str, Any]]:
+        """Get fingerprints sharing at least one LSH band key."""
+        if not band_keys:
+            return []
+
+        unique_keys = list(dict.fromkeys(band_keys))
+        candidate_hashes: set[str] = set()
+        results = []
+        async with self._get_connection() as conn:
+            for start in range(0, len(unique_keys), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = unique_keys[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await conn.execute(f"""
+                    SELECT DISTINCT code_hash FROM archon_code_fingerprint_bands
+                    WHERE band_key IN ({placeholders})
+                """, chunk)
+                candidate_hashes.update(row['code_hash'] for row in await cursor.fetchall())
+
+            hashes = list(candidate_hashes)
+            for start in range(0, len(hashes), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = hashes[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = await conn.execute(f"""
+                    SELECT code_hash, minhash, language, summary, example_name,
+                           llm_chat_model, hit_count
+                    FROM archon_code_fingerprints
+                    WHERE code_hash IN ({placeholders})
+                """, chunk)
+                results.extend(self._rows_to_list(await cursor.fetchall()))
+        return results
+
+    async def upsert_code_fingerprints(self, fingerprints: list[dict[str, Any]]) -> int:
+        """Insert or update code fingerprints and their LSH band keys."""
+        if not fingerprints:
+            return 0
+
+        now = datetime.now().isoformat()
+        async with self._get_connection() as conn:
+            for fingerprint in fingerprints:
+                embedding = fingerprint.get('embedding')
+                embedding_blob = array('f', embedding).tobytes() if embedding else None
+
+                await conn.execute("""
+                    INSERT INTO archon_code_fingerprints (
+                        code_hash, minhash, language, summary, example_name,
+                        llm_chat_model, embedding_model, embedding_dimension, embedding,
+                        hit_count, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)
+                    ON CONFLICT(code_hash) DO UPDATE SET
+                        summary = COALESCE(excluded.summary, summary),
+                        example_name = COALESCE(excluded.example_name, example_name),
+                        llm_chat_model = COALESCE(excluded.llm_chat_model, llm_chat_model),
+                        embedding_model = COALESCE(excluded.embedding_model, embedding_model),
+                        embedding_dimension = COALESCE(excluded.embedding_dimension, embedding_dimension),
+                        embedding = COALESCE(excluded.embedding, embedding),
+                        hit_count = hit_count + 1,
+                        updated_at = excluded.updated_at
+                """, (
+                    fingerprint['code_hash'],
+                    fingerprint['minhash'],
+                    fingerprint.get('language', ''),
+                    fingerprint.get('summary'),
+                    fingerprint.get('example_name'),
+                    fingerprint.get('llm_chat_model'),
+                    fingerprint.get('embedding_model'),
+                    fingerprint.get('embedding_dimension'),
+                    embedding_blob,
+                    now,
+                    now,
+                ))
+
+                band_keys = fingerprint.get('band_keys') or []
+                if band_keys:
+                    await conn.executemany("""
+                        INSERT OR IGNORE INTO archon_code_fingerprint_bands (band_key, code_hash)
+                        VALUES (?, ?)
+                    """, [(band_key, fingerprint['code_hash']) for band_key in band_keys])
+
+            await conn.commit()
+            return len(fingerprints)
+
     # ============================================
     # 5. Settings Operations (7 methods)
     # ============================================
@@ -770,8 +1250,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         async with self._get_connection() as conn:
             project_id = project_data.get('id', str(uuid4()))
             
-            # Prepare JSON fields
-            docs = json.dumps(project_data.get('docs', []))
+            # Prepare JSON fields (documents live in archon_project_documents)
+            docs = '[]'
             features = json.dumps(project_data.get('features', []))
             data = json.dumps(project_data.get('data', []))
             
@@ -793,8 +1273,11 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 datetime.now().isoformat(),
                 datetime.now().isoformat()
             ))
+            await self._replace_project_documents(conn, project_id, project_data.get('docs') or [])
+            await self._sync_project_search_index(conn, project_id)
             
             await conn.commit()
+            revision_counters.bump(PROJECTS)
             project_data['id'] = project_id
             return project_data
     
@@ -838,8 +1321,73 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                                 project[field] = []
                 results.append(project)
             
+            if include_content:
+                docs_by_project = await self._load_project_documents(conn)
+                for project in results:
+                    project['docs'] = docs_by_project.get(project['id'], [])
+            
             return results
     
+    async def search_projects(
+        self,
+        query: str | None = None,
+        limit: int | None = None,
+        cursor: tuple[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search projects by title/description, returning lightweight projections."""
+        conditions = []
+        params: list[Any] = []
+
+        match = self._project_match_expression(query)
+        if match:
+            conditions.append("id IN (SELECT project_id FROM archon_projects_fts WHERE archon_projects_fts MATCH ?)")
+            params.append(match)
+        if cursor:
+            conditions.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            params.extend([cursor[0], cursor[0], cursor[1]])
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        async with self._get_connection() as conn:
+            cursor_result = await conn.execute(f"""
+                SELECT id, title, description, github_repo, pinned, created_at, updated_at,
+                       (SELECT COUNT(*) FROM archon_project_documents d
+                        WHERE d.project_id = archon_projects.id) AS docs_count,
+                       CASE WHEN json_valid(features) THEN json_array_length(features) ELSE 0 END AS features_count,
+                       COALESCE(data, '') NOT IN ('', '[]', '{{}}', 'null') AS has_data
+                FROM archon_projects
+                {where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            """, [*params, -1 if limit is None else limit])
+            rows = await cursor_result.fetchall()
+
+        return [
+            {
+                **{key: row[key] for key in ('id', 'title', 'description', 'github_repo', 'created_at', 'updated_at')},
+                "pinned": bool(row['pinned']),
+                "stats": {
+                    "docs_count": row['docs_count'] or 0,
+                    "features_count": row['features_count'] or 0,
+                    "has_data": bool(row['has_data']),
+                },
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _project_match_expression(query: str | None) -> str | None:
+        """Build an FTS5 prefix-match expression from free text (every term must match)."""
+        terms = re.findall(r"\w+", query or "")
+        return " ".join(f'"{term}"*' for term in terms) or None
+
+    async def _sync_project_search_index(self, conn: aiosqlite.Connection, project_id: str) -> None:
+        """Refresh a project's full-text index row (call inside the writing transaction)."""
+        await conn.execute("DELETE FROM archon_projects_fts WHERE project_id = ?", (project_id,))
+        await conn.execute("""
+            INSERT INTO archon_projects_fts (project_id, title, description)
+            SELECT id, title, COALESCE(description, '') FROM archon_projects WHERE id = ?
+        """, (project_id,))
+
     async def get_project_by_id(self, project_id: str) -> dict[str, Any] | None:
         """Get a specific project by ID."""
         async with self._get_connection() as conn:
@@ -858,6 +1406,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                             project[field] = json.loads(project[field])
                         except:
                             project[field] = []
+                docs_by_project = await self._load_project_documents(conn, project_id)
+                project['docs'] = docs_by_project.get(project_id, [])
                 return project
             return None
     
@@ -873,7 +1423,10 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             params = []
             
             for field, value in update_data.items():
-                if field in ['docs', 'features', 'data']:
+                if field == 'docs':
+                    # Replacing the whole array rewrites the project's document rows
+                    await self._replace_project_documents(conn, project_id, value or [])
+                elif field in ['features', 'data']:
                     # JSON fields
                     update_fields.append(f"{field} = ?")
                     params.append(json.dumps(value))
@@ -893,7 +1446,17 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 """
                 
                 await conn.execute(query, params)
+                if 'title' in update_data or 'description' in update_data:
+                    await self._sync_project_search_index(conn, project_id)
+                await conn.commit()
+                revision_counters.bump(PROJECTS)
+            elif 'docs' in update_data:
+                await conn.execute(
+                    "UPDATE archon_projects SET updated_at = ? WHERE id = ?",
+                    (datetime.now().isoformat(), project_id),
+                )
                 await conn.commit()
+                revision_counters.bump(PROJECTS)
             
             # Return updated project
             return await self.get_project_by_id(project_id)
@@ -905,7 +1468,11 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 DELETE FROM archon_projects 
                 WHERE id = ?
             """, (project_id,))
+            await conn.execute("DELETE FROM archon_projects_fts WHERE project_id = ?", (project_id,))
             await conn.commit()
+            # Tasks are removed with the project (ON DELETE CASCADE)
+            revision_counters.bump(PROJECTS)
+            revision_counters.bump(TASKS, project_id)
             return cursor.rowcount > 0
     
     async def unpin_all_projects_except(self, project_id: str) -> int:
@@ -917,6 +1484,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 WHERE id != ? AND pinned = 1
             """, (datetime.now().isoformat(), project_id))
             await conn.commit()
+            revision_counters.bump(PROJECTS)
             return cursor.rowcount
     
     async def get_project_features(self, project_id: str) -> list[dict[str, Any]]:
@@ -935,6 +1503,237 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                     return []
             return []
     
+    # Project documents are rows in archon_project_documents. Content is stored
+    # as zlib-compressed JSON ('zlib'); rows migrated from the legacy docs array
+    # keep plain JSON ('json') until they are next written.
+    _DOCUMENT_FIELDS = ('id', 'document_type', 'title', 'status', 'version', 'tags', 'author', 'content')
+    _DOCUMENT_MANAGED_FIELDS = ('project_id', 'revision', 'content_size', 'created_at', 'updated_at')
+
+    @staticmethod
+    def _encode_document_content(content: Any) -> tuple[bytes, int]:
+        """Compress a document's JSON content, returning (blob, uncompressed size)."""
+        raw = json.dumps(content if content is not None else {}).encode('utf-8')
+        return zlib.compress(raw), len(raw)
+
+    def _document_row_to_dict(self, row: aiosqlite.Row, include_content: bool = True) -> dict[str, Any]:
+        """Convert a project document row back into the document dict shape."""
+        document = {}
+        try:
+            document.update(json.loads(row['metadata'] or '{}'))
+        except (TypeError, ValueError):
+            pass
+        document.update({
+            'id': row['id'],
+            'document_type': row['document_type'],
+            'title': row['title'],
+            'status': row['status'],
+            'version': row['version'],
+            'tags': json.loads(row['tags'] or '[]'),
+            'author': row['author'],
+            'revision': row['revision'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+        })
+        if document['author'] is None:
+            del document['author']
+        if include_content:
+            raw = row['content']
+            if raw is not None and row['content_encoding'] == 'zlib':
+                raw = zlib.decompress(raw)
+            document['content'] = json.loads(raw) if raw else {}
+        else:
+            document['content_size'] = row['content_size']
+        return document
+
+    def _document_params(self, document: dict[str, Any]) -> dict[str, Any]:
+        """Split a document dict into column values (content compressed, extra keys as metadata)."""
+        content, content_size = self._encode_document_content(document.get('content'))
+        metadata = {
+            key: value for key, value in document.items()
+            if key not in self._DOCUMENT_FIELDS and key not in self._DOCUMENT_MANAGED_FIELDS
+        }
+        return {
+            'id': document.get('id') or str(uuid4()),
+            'document_type': document.get('document_type'),
+            'title': document.get('title'),
+            'status': document.get('status', 'draft'),
+            'version': document.get('version', '1.0'),
+            'tags': json.dumps(document.get('tags') or []),
+            'author': document.get('author'),
+            'metadata': json.dumps(metadata),
+            'content': content,
+            'content_size': content_size,
+        }
+
+    async def _load_project_documents(
+        self, conn: aiosqlite.Connection, project_id: str | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Load full documents grouped by project (one project, or all of them)."""
+        query = "SELECT * FROM archon_project_documents"
+        params: list[Any] = []
+        if project_id is not None:
+            query += " WHERE project_id = ?"
+            params.append(project_id)
+        cursor = await conn.execute(query + " ORDER BY project_id, position", params)
+
+        docs_by_project: dict[str, list[dict[str, Any]]] = {}
+        for row in await cursor.fetchall():
+            docs_by_project.setdefault(row['project_id'], []).append(self._document_row_to_dict(row))
+        return docs_by_project
+
+    async def _replace_project_documents(
+        self, conn: aiosqlite.Connection, project_id: str, documents: list[dict[str, Any]]
+    ) -> None:
+        """Replace all of a project's documents (call inside the writing transaction)."""
+        cursor = await conn.execute(
+            "SELECT id, revision, created_at FROM archon_project_documents WHERE project_id = ?",
+            (project_id,),
+        )
+        existing = {row['id']: row for row in await cursor.fetchall()}
+        await conn.execute("DELETE FROM archon_project_documents WHERE project_id = ?", (project_id,))
+
+        now = datetime.now().isoformat()
+        rows = []
+        seen_ids = set()
+        for position, document in enumerate(documents):
+            params = self._document_params(document)
+            if params['id'] in seen_ids:
+                # Keep every document of an array that repeats an id
+                params['id'] = str(uuid4())
+            seen_ids.add(params['id'])
+            previous = existing.get(params['id'])
+            rows.append((
+                *params.values(),
+                project_id,
+                position,
+                previous['revision'] + 1 if previous else 1,
+                document.get('created_at') or (previous['created_at'] if previous else now),
+                document.get('updated_at') or now,
+            ))
+        await conn.executemany("""
+            INSERT INTO archon_project_documents (
+                id, document_type, title, status, version, tags, author, metadata,
+                content, content_size, project_id, position, revision, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+    async def list_project_documents(
+        self,
+        project_id: str,
+        include_content: bool = False
+    ) -> list[dict[str, Any]]:
+        """List a project's documents in order (content is only decompressed when requested)."""
+        if include_content:
+            async with self._get_connection() as conn:
+                docs_by_project = await self._load_project_documents(conn, project_id)
+            return docs_by_project.get(project_id, [])
+
+        async with self._get_connection() as conn:
+            cursor = await conn.execute("""
+                SELECT id, document_type, title, status, version, tags, author, metadata,
+                       content_size, revision, created_at, updated_at
+                FROM archon_project_documents
+                WHERE project_id = ?
+                ORDER BY position
+            """, (project_id,))
+            rows = await cursor.fetchall()
+        return [self._document_row_to_dict(row, include_content=False) for row in rows]
+
+    async def get_project_document(self, project_id: str, doc_id: str) -> dict[str, Any] | None:
+        """Get a single project document with its content."""
+        async with self._get_connection() as conn:
+            cursor = await conn.execute("""
+                SELECT * FROM archon_project_documents WHERE project_id = ? AND id = ?
+            """, (project_id, doc_id))
+            row = await cursor.fetchone()
+        return self._document_row_to_dict(row) if row else None
+
+    async def create_project_document(
+        self,
+        project_id: str,
+        document_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Append a document row to a project."""
+        params = self._document_params(document_data)
+        now = datetime.now().isoformat()
+        async with self._get_connection() as conn:
+            await conn.execute("""
+                INSERT INTO archon_project_documents (
+                    id, document_type, title, status, version, tags, author, metadata,
+                    content, content_size, project_id, position, revision, created_at, updated_at
+                ) VALUES (
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                    (SELECT COALESCE(MAX(position), -1) + 1 FROM archon_project_documents WHERE project_id = ?),
+                    1, ?, ?
+                )
+            """, (*params.values(), project_id, project_id, now, now))
+            await conn.execute(
+                "UPDATE archon_projects SET updated_at = ? WHERE id = ?", (now, project_id)
+            )
+            await conn.commit()
+        revision_counters.bump(PROJECTS)
+        return await self.get_project_document(project_id, params['id'])
+
+    async def update_project_document(
+        self,
+        project_id: str,
+        doc_id: str,
+        update_data: dict[str, Any],
+        expected_revision: int | None = None
+    ) -> dict[str, Any] | None:
+        """Update one document row, guarded by its revision when expected_revision is given."""
+        assignments = []
+        params: list[Any] = []
+        for field in ('document_type', 'title', 'status', 'version', 'author'):
+            if field in update_data:
+                assignments.append(f"{field} = ?")
+                params.append(update_data[field])
+        if 'tags' in update_data:
+            assignments.append("tags = ?")
+            params.append(json.dumps(update_data['tags'] or []))
+        if 'content' in update_data:
+            content, content_size = self._encode_document_content(update_data['content'])
+            assignments.append("content = ?, content_encoding = 'zlib', content_size = ?")
+            params.extend([content, content_size])
+
+        now = datetime.now().isoformat()
+        assignments.append("revision = revision + 1, updated_at = ?")
+        params.extend([now, project_id, doc_id])
+        condition = "project_id = ? AND id = ?"
+        if expected_revision is not None:
+            condition += " AND revision = ?"
+            params.append(expected_revision)
+
+        async with self._get_connection() as conn:
+            cursor = await conn.execute(
+                f"UPDATE archon_project_documents SET {', '.join(assignments)} WHERE {condition}", params
+            )
+            if cursor.rowcount == 0:
+                return None
+            await conn.execute(
+                "UPDATE archon_projects SET updated_at = ? WHERE id = ?", (now, project_id)
+            )
+            await conn.commit()
+        revision_counters.bump(PROJECTS)
+        return await self.get_project_document(project_id, doc_id)
+
+    async def delete_project_document(self, project_id: str, doc_id: str) -> bool:
+        """Delete one document row."""
+        async with self._get_connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM archon_project_documents WHERE project_id = ? AND id = ?",
+                (project_id, doc_id),
+            )
+            if cursor.rowcount == 0:
+                return False
+            await conn.execute(
+                "UPDATE archon_projects SET updated_at = ? WHERE id = ?",
+                (datetime.now().isoformat(), project_id),
+            )
+            await conn.commit()
+        revision_counters.bump(PROJECTS)
+        return True
+
     async def get_task_counts_by_project(self, project_id: str) -> dict[str, int]:
         """Get task counts grouped by status for a project."""
         async with self._get_connection() as conn:
@@ -1006,6 +1805,55 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             rows = await cursor.fetchall()
             return self._rows_to_list(rows)
     
+    async def make_room_for_task_order(self, project_id: str, status: str, task_order: int) -> int:
+        """Shift the consecutive run of tasks occupying task_order up by one (single UPDATE)."""
+        async with self._get_connection() as conn:
+            shifted = await self._shift_task_order_run(conn, project_id, status, task_order)
+            if shifted:
+                await conn.commit()
+                revision_counters.bump(TASKS, project_id)
+            return shifted
+    
+    async def _shift_task_order_run(self, conn, project_id: str, status: str, task_order: int) -> int:
+        """Shift the run of tasks starting at task_order up by one, without committing."""
+        cursor = await conn.execute("""
+            SELECT task_order FROM archon_tasks
+            WHERE project_id = ? AND status = ? AND archived = 0 AND task_order >= ?
+            ORDER BY task_order
+        """, (project_id, status, task_order))
+        run_end = task_order - 1
+        async for row in cursor:
+            if row['task_order'] > run_end + 1:
+                break
+            run_end = row['task_order']
+        await cursor.close()
+
+        if run_end < task_order:
+            return 0
+
+        cursor = await conn.execute("""
+            UPDATE archon_tasks SET task_order = task_order + 1, updated_at = ?
+            WHERE project_id = ? AND status = ? AND archived = 0
+              AND task_order BETWEEN ? AND ?
+        """, (datetime.now().isoformat(), project_id, status, task_order, run_end))
+        return cursor.rowcount
+    
+    async def rebalance_task_orders(self, project_id: str, status: str, gap: int) -> int:
+        """Respace a column's task orders to gap, 2 * gap, ... in one statement."""
+        async with self._get_connection() as conn:
+            cursor = await conn.execute("""
+                UPDATE archon_tasks SET task_order = ranked.position * ?
+                FROM (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY task_order, created_at, id) AS position
+                    FROM archon_tasks
+                    WHERE project_id = ? AND status = ? AND archived = 0
+                ) AS ranked
+                WHERE archon_tasks.id = ranked.id
+            """, (gap, project_id, status))
+            await conn.commit()
+            revision_counters.bump(TASKS, project_id)
+            return cursor.rowcount
+    
     async def get_sources_for_project(
         self,
         project_id: str,
@@ -1047,6 +1895,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             ))
             
             await conn.commit()
+            revision_counters.bump(PROJECTS)
             return {
                 'id': link_id,
                 'project_id': project_id,
@@ -1066,6 +1915,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 WHERE project_id = ? AND source_id = ?
             """, (project_id, source_id))
             await conn.commit()
+            revision_counters.bump(PROJECTS)
             return cursor.rowcount > 0
     
     async def list_project_sources(
@@ -1098,45 +1948,66 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     async def create_task(self, task_data: dict[str, Any]) -> dict[str, Any]:
         """Create a new task."""
         async with self._get_connection() as conn:
-            task_id = task_data.get('id', str(uuid4()))
-            
-            # Get next task_order if not provided
-            if 'task_order' not in task_data:
-                cursor = await conn.execute("""
-                    SELECT MAX(task_order) as max_order 
-                    FROM archon_tasks 
-                    WHERE project_id = ?
-                """, (task_data['project_id'],))
-                row = await cursor.fetchone()
-                task_order = (row['max_order'] or 0) + 1
-            else:
-                task_order = task_data['task_order']
-            
-            await conn.execute("""
-                INSERT INTO archon_tasks (
-                    id, project_id, title, description, status,
-                    assignee, task_order, priority, feature,
-                    archived, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task_id,
-                task_data['project_id'],
-                task_data['title'],
-                task_data.get('description'),
-                task_data.get('status', 'todo'),
-                task_data.get('assignee', 'User'),
-                task_order,
-                task_data.get('priority', 'medium'),
-                task_data.get('feature'),
-                False,
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
-            ))
-            
+            task = await self._insert_task(conn, task_data)
+            await conn.commit()
+            revision_counters.bump(TASKS, task_data['project_id'])
+            return task
+    
+    async def _insert_task(self, conn, task_data: dict[str, Any]) -> dict[str, Any]:
+        """Insert one task row without committing."""
+        task_id = task_data.get('id', str(uuid4()))
+        
+        # Get next task_order if not provided
+        if 'task_order' not in task_data:
+            cursor = await conn.execute("""
+                SELECT MAX(task_order) as max_order 
+                FROM archon_tasks 
+                WHERE project_id = ?
+            """, (task_data['project_id'],))
+            row = await cursor.fetchone()
+            task_order = (row['max_order'] or 0) + 1
+        else:
+            task_order = task_data['task_order']
+        
+        await conn.execute("""
+            INSERT INTO archon_tasks (
+                id, project_id, title, description, status,
+                assignee, task_order, priority, feature,
+                archived, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            task_id,
+            task_data['project_id'],
+            task_data['title'],
+            task_data.get('description'),
+            task_data.get('status', 'todo'),
+            task_data.get('assignee', 'User'),
+            task_order,
+            task_data.get('priority', 'medium'),
+            task_data.get('feature'),
+            False,
+            datetime.now().isoformat(),
+            datetime.now().isoformat()
+        ))
+        
+        task_data['id'] = task_id
+        task_data['task_order'] = task_order
+        return task_data
+    
+    async def create_tasks_batch(self, tasks_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several tasks on one connection with a single commit."""
+        async with self._get_connection() as conn:
+            created = []
+            for task_data in tasks_data:
+                task_order = task_data.get('task_order')
+                if task_order and task_order > 0:
+                    await self._shift_task_order_run(
+                        conn, task_data['project_id'], task_data.get('status', 'todo'), task_order
+                    )
+                created.append(await self._insert_task(conn, task_data))
             await conn.commit()
-            task_data['id'] = task_id
-            task_data['task_order'] = task_order
-            return task_data
+            revision_counters.bump(TASKS, *{t['project_id'] for t in created})
+            return created
     
     async def list_tasks(
         self,
@@ -1204,40 +2075,99 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     ) -> dict[str, Any] | None:
         """Update a task with specified fields."""
         async with self._get_connection() as conn:
-            # Build dynamic UPDATE query
-            update_fields = []
-            params = []
-            
-            for field, value in update_data.items():
-                if field not in ['id', 'created_at']:
-                    update_fields.append(f"{field} = ?")
-                    params.append(value)
-            
-            if update_fields:
-                update_fields.append("updated_at = ?")
-                params.append(datetime.now().isoformat())
-                params.append(task_id)
-                
-                query = f"""
-                    UPDATE archon_tasks 
-                    SET {', '.join(update_fields)}
-                    WHERE id = ?
-                """
-                
-                await conn.execute(query, params)
+            previous_project_id = await self._update_task_row(conn, task_id, update_data)
+            if previous_project_id is not None:
                 await conn.commit()
+                revision_counters.bump(TASKS, previous_project_id, update_data.get('project_id'))
             
             # Return updated task
             return await self.get_task_by_id(task_id)
     
+    async def _update_task_row(self, conn, task_id: str, update_data: dict[str, Any]) -> str | None:
+        """
+        Apply update_data to one task row without committing.
+
+        Returns the task's previous project_id (so a task moved between projects
+        invalidates both), or None if the task does not exist or nothing changed.
+        """
+        # Build dynamic UPDATE query
+        update_fields = []
+        params = []
+        
+        for field, value in update_data.items():
+            if field not in ['id', 'created_at']:
+                update_fields.append(f"{field} = ?")
+                params.append(value)
+        
+        if not update_fields:
+            return None
+        
+        cursor = await conn.execute(
+            "SELECT project_id FROM archon_tasks WHERE id = ?", (task_id,)
+        )
+        row = await cursor.fetchone()
+        if row is None:
+            return None
+        update_fields.append("updated_at = ?")
+        params.append(datetime.now().isoformat())
+        params.append(task_id)
+        
+        query = f"""
+            UPDATE archon_tasks 
+            SET {', '.join(update_fields)}
+            WHERE id = ?
+        """
+        
+        await conn.execute(query, params)
+        return row['project_id']
+    
+    async def _get_tasks_by_ids(self, conn, task_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch tasks by id in one query, keyed by id."""
+        task_ids = list(dict.fromkeys(task_ids))
+        tasks = {}
+        for start in range(0, len(task_ids), self._IN_CLAUSE_CHUNK_SIZE):
+            chunk = task_ids[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = await conn.execute(
+                f"SELECT * FROM archon_tasks WHERE id IN ({placeholders})", chunk
+            )
+            tasks.update((row['id'], dict(row)) for row in await cursor.fetchall())
+        return tasks
+    
+    async def update_tasks_batch(
+        self,
+        updates: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]] | None:
+        """Update several tasks on one connection; nothing is written if any task is missing."""
+        async with self._get_connection() as conn:
+            task_ids = [task_id for task_id, _ in updates]
+            existing = await self._get_tasks_by_ids(conn, task_ids)
+            if len(existing) < len(set(task_ids)):
+                return None
+            
+            touched_projects = {task['project_id'] for task in existing.values()}
+            for task_id, update_data in updates:
+                await self._update_task_row(conn, task_id, update_data)
+                touched_projects.add(update_data.get('project_id'))
+            await conn.commit()
+            revision_counters.bump(TASKS, *touched_projects)
+            
+            tasks = await self._get_tasks_by_ids(conn, task_ids)
+            return [tasks[task_id] for task_id in task_ids]
+    
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
         async with self._get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT project_id FROM archon_tasks WHERE id = ?", (task_id,)
+            )
+            row = await cursor.fetchone()
             cursor = await conn.execute("""
                 DELETE FROM archon_tasks 
                 WHERE id = ?
             """, (task_id,))
             await conn.commit()
+            revision_counters.bump(TASKS, row['project_id'] if row else None)
             return cursor.rowcount > 0
     
     async def archive_task(
@@ -1263,10 +2193,39 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             await conn.commit()
             
             # Return updated task
-            return await self.get_task_by_id(task_id)
+            task = await self.get_task_by_id(task_id)
+            revision_counters.bump(TASKS, task['project_id'] if task else None)
+            return task
+    
+    async def archive_tasks_batch(
+        self,
+        task_ids: list[str],
+        archived_by: str = 'system'
+    ) -> list[dict[str, Any]] | None:
+        """Archive several tasks in one transaction; nothing is written if any task is missing."""
+        async with self._get_connection() as conn:
+            existing = await self._get_tasks_by_ids(conn, task_ids)
+            if len(existing) < len(set(task_ids)):
+                return None
+            
+            now = datetime.now().isoformat()
+            existing_ids = list(existing)
+            for start in range(0, len(existing_ids), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = existing_ids[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                await conn.execute(f"""
+                    UPDATE archon_tasks 
+                    SET archived = 1, archived_by = ?, archived_at = ?, updated_at = ?
+                    WHERE id IN ({placeholders})
+                """, [archived_by, now, now, *chunk])
+            await conn.commit()
+            revision_counters.bump(TASKS, *{task['project_id'] for task in existing.values()})
+            
+            tasks = await self._get_tasks_by_ids(conn, task_ids)
+            return [tasks[task_id] for task_id in task_ids]
     
     # ============================================
-    # 8. Source Operations (13 methods)
+    # 8. Source Operations (14 methods)
     # ============================================
     
     async def list_sources(
@@ -1487,6 +2446,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 ))
 
             await conn.commit()
+            revision_counters.bump(SOURCES)
             source_data['source_id'] = source_id
             return source_data
     
@@ -1522,6 +2482,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 
                 await conn.execute(query, params)
                 await conn.commit()
+                revision_counters.bump(SOURCES)
             
             # Return updated source
             return await self.get_source_by_id(source_id)
@@ -1551,38 +2512,103 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             """, (source_id,))
             
             await conn.commit()
+            revision_counters.bump(SOURCES)
             return cursor.rowcount > 0
     
-    async def get_page_count_by_source(self, source_id: str) -> int:
-        """Get the count of pages for a source."""
+    async def get_source_stats_by_sources(self, source_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get archon_source_stats counts and the first page URL of many sources."""
+        if not source_ids:
+            return {}
+
+        unique_ids = list(dict.fromkeys(source_ids))
+        stats = {}
+        async with self._get_connection() as conn:
+            for start in range(0, len(unique_ids), self._IN_CLAUSE_CHUNK_SIZE):
+                chunk = unique_ids[start:start + self._IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                # MIN(url) is a single probe of idx_archon_page_metadata_source_url per source
+                cursor = await conn.execute(f"""
+                    SELECT s.source_id,
+                           COALESCE(st.page_count, 0) AS page_count,
+                           COALESCE(st.code_example_count, 0) AS code_example_count,
+                           (SELECT MIN(p.url) FROM archon_page_metadata p
+                            WHERE p.source_id = s.source_id) AS first_page_url
+                    FROM archon_sources s
+                    LEFT JOIN archon_source_stats st ON st.source_id = s.source_id
+                    WHERE s.source_id IN ({placeholders})
+                """, chunk)
+                for row in await cursor.fetchall():
+                    stats[row['source_id']] = {
+                        'page_count': row['page_count'],
+                        'code_example_count': row['code_example_count'],
+                        'first_page_url': row['first_page_url'],
+                    }
+        return stats
+
+    async def get_corpus_stats(self) -> dict[str, int]:
+        """Get totals across all sources from archon_source_stats."""
+        totals = ', '.join(f"COALESCE(SUM({field}), 0) AS {field}" for field in self._SOURCE_STATS_FIELDS)
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                SELECT COUNT(*) as count FROM archon_page_metadata 
-                WHERE source_id = ?
-            """, (source_id,))
+            cursor = await conn.execute(f"""
+                SELECT (SELECT COUNT(*) FROM archon_sources) AS sources_count, {totals}
+                FROM archon_source_stats
+            """)
+            return dict(await cursor.fetchone())
+
+    async def get_page_count_by_source(self, source_id: str, section_title: str | None = None) -> int:
+        """Get the count of pages for a source, optionally within one section."""
+        query = "SELECT COUNT(*) as count FROM archon_page_metadata WHERE source_id = ?"
+        params: list[Any] = [source_id]
+        if section_title:
+            query += " AND section_title = ?"
+            params.append(section_title)
+        async with self._get_connection() as conn:
+            cursor = await conn.execute(query, params)
             row = await cursor.fetchone()
             return row['count'] if row else 0
     
+    # Columns returned by metadata-only page listings (everything except full_content)
+    _PAGE_SUMMARY_COLUMNS = (
+        "id, source_id, url, section_title, section_order, word_count, char_count, "
+        "chunk_count, metadata, created_at, updated_at"
+    )
+
     async def list_pages_by_source(
         self,
         source_id: str,
         limit: int | None = None,
-        offset: int | None = None
+        offset: int | None = None,
+        after_url: str | None = None,
+        include_content: bool = True,
+        section_title: str | None = None
     ) -> list[dict[str, Any]]:
-        """List all pages for a source."""
+        """List pages for a source, ordered by URL, with keyset pagination."""
         async with self._get_connection() as conn:
-            query = """
-                SELECT * FROM archon_page_metadata 
+            columns = "*" if include_content else self._PAGE_SUMMARY_COLUMNS
+            query = f"""
+                SELECT {columns} FROM {self._PAGE_ROWS}
                 WHERE source_id = ?
-                ORDER BY url
             """
             params = [source_id]
+
+            if section_title:
+                query += " AND section_title = ?"
+                params.append(section_title)
+
+            # Seek past the cursor using idx_archon_page_metadata_source_url
+            if after_url is not None:
+                query += " AND url > ?"
+                params.append(after_url)
+
+            query += " ORDER BY url"
             
             if limit:
                 query += " LIMIT ?"
                 params.append(limit)
             
             if offset:
+                if not limit:
+                    query += " LIMIT -1"
                 query += " OFFSET ?"
                 params.append(offset)
             
@@ -1606,33 +2632,49 @@ class SQLiteDatabaseRepository(DatabaseRepository):
     async def delete_crawled_pages_by_source(self, source_id: str) -> int:
         """Delete all crawled pages for a source."""
         async with self._get_connection() as conn:
-            cursor = await conn.execute("""
-                DELETE FROM archon_crawled_pages 
-                WHERE source_id = ?
-            """, (source_id,))
+            deleted = await self._delete_with_source_stats(
+                conn, 'archon_crawled_pages', "source_id = ?", [source_id]
+            )
             await conn.commit()
-            return cursor.rowcount
+            return deleted
     
+    # Columns returned by metadata-only chunk listings (everything except content)
+    _CHUNK_SUMMARY_COLUMNS = (
+        "id, url, chunk_number, metadata, source_id, page_id, llm_chat_model, "
+        "embedding_model, embedding_dimension, created_at"
+    )
+
     async def list_crawled_pages_by_source(
         self,
         source_id: str,
         limit: int | None = None,
-        offset: int | None = None
+        offset: int | None = None,
+        after: tuple[str, int] | None = None,
+        include_content: bool = True
     ) -> list[dict[str, Any]]:
-        """List crawled pages for a source."""
+        """List crawled pages for a source, ordered by URL and chunk, with keyset pagination."""
         async with self._get_connection() as conn:
-            query = """
-                SELECT * FROM archon_crawled_pages 
+            columns = "*" if include_content else self._CHUNK_SUMMARY_COLUMNS
+            query = f"""
+                SELECT {columns} FROM {self._CHUNK_ROWS}
                 WHERE source_id = ?
-                ORDER BY url, chunk_number
             """
             params = [source_id]
+
+            # Seek past the cursor using idx_archon_crawled_pages_source_url_chunk
+            if after is not None:
+                query += " AND (url, chunk_number) > (?, ?)"
+                params.extend(after)
+
+            query += " ORDER BY url, chunk_number"
             
             if limit:
                 query += " LIMIT ?"
                 params.append(limit)
             
             if offset:
+                if not limit:
+                    query += " LIMIT -1"
                 query += " OFFSET ?"
                 params.append(offset)
             
@@ -1682,83 +2724,119 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """Create a new document version."""
         async with self._get_connection() as conn:
             version_id = version_data.get('id', str(uuid4()))
-            
-            # Prepare JSON content
+
+            # Prepare JSON content (a full snapshot or a JSON Patch delta)
             content = json.dumps(version_data.get('content', {}))
-            
+
             await conn.execute("""
                 INSERT INTO archon_document_versions (
-                    id, project_id, task_id, version_number,
-                    content, created_by, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    id, project_id, task_id, field_name, version_number,
+                    content, change_summary, change_type, document_id,
+                    storage_format, created_by, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 version_id,
                 version_data.get('project_id'),
                 version_data.get('task_id'),
+                version_data.get('field_name'),
                 version_data.get('version_number', 1),
                 content,
+                version_data.get('change_summary'),
+                version_data.get('change_type', 'update'),
+                version_data.get('document_id'),
+                version_data.get('storage_format', 'snapshot'),
                 version_data.get('created_by', 'system'),
-                datetime.now().isoformat()
+                version_data.get('created_at') or datetime.now().isoformat()
             ))
-            
+
             await conn.commit()
             version_data['id'] = version_id
             return version_data
-    
+
+    def _version_row_to_dict(self, row: aiosqlite.Row) -> dict[str, Any]:
+        """Convert a document version row, parsing its JSON content."""
+        version = dict(row)
+        if 'content' in version and version['content']:
+            try:
+                version['content'] = json.loads(version['content'])
+            except:
+                version['content'] = {}
+        return version
+
     async def list_document_versions(
         self,
         project_id: str,
-        limit: int | None = None
+        limit: int | None = None,
+        field_name: str | None = None
     ) -> list[dict[str, Any]]:
         """List document versions for a project."""
         async with self._get_connection() as conn:
             query = """
-                SELECT * FROM archon_document_versions 
+                SELECT * FROM archon_document_versions
                 WHERE project_id = ?
-                ORDER BY created_at DESC
             """
             params = [project_id]
-            
+
+            if field_name:
+                query += " AND field_name = ?"
+                params.append(field_name)
+
+            query += " ORDER BY created_at DESC"
+
             if limit:
                 query += " LIMIT ?"
                 params.append(limit)
-            
+
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
-            
-            results = []
-            for row in rows:
-                version = dict(row)
-                # Parse JSON content
-                if 'content' in version and version['content']:
-                    try:
-                        version['content'] = json.loads(version['content'])
-                    except:
-                        version['content'] = {}
-                results.append(version)
-            
-            return results
-    
+
+            return [self._version_row_to_dict(row) for row in rows]
+
+    async def get_latest_document_version_number(self, project_id: str, field_name: str) -> int:
+        """Get the highest version number of a project field (index-only lookup)."""
+        async with self._get_connection() as conn:
+            cursor = await conn.execute("""
+                SELECT MAX(version_number) FROM archon_document_versions
+                WHERE project_id = ? AND field_name = ?
+            """, (project_id, field_name))
+            row = await cursor.fetchone()
+            return row[0] or 0
+
+    async def get_document_version_chain(
+        self,
+        project_id: str,
+        field_name: str,
+        version_number: int
+    ) -> list[dict[str, Any]]:
+        """Get versions from the nearest snapshot up to version_number."""
+        async with self._get_connection() as conn:
+            cursor = await conn.execute("""
+                SELECT * FROM archon_document_versions
+                WHERE project_id = ? AND field_name = ?
+                  AND version_number <= ?
+                  AND version_number >= (
+                      SELECT MAX(version_number) FROM archon_document_versions
+                      WHERE project_id = ? AND field_name = ?
+                        AND version_number <= ? AND storage_format = 'snapshot'
+                  )
+                ORDER BY version_number
+            """, (project_id, field_name, version_number, project_id, field_name, version_number))
+            rows = await cursor.fetchall()
+            return [self._version_row_to_dict(row) for row in rows]
+
     async def get_document_version_by_id(self, version_id: str) -> dict[str, Any] | None:
         """Get a specific document version by ID."""
         async with self._get_connection() as conn:
             cursor = await conn.execute("""
-                SELECT * FROM archon_document_versions 
+                SELECT * FROM archon_document_versions
                 WHERE id = ?
             """, (version_id,))
             row = await cursor.fetchone()
-            
+
             if row:
-                version = dict(row)
-                # Parse JSON content
-                if 'content' in version and version['content']:
-                    try:
-                        version['content'] = json.loads(version['content'])
-                    except:
-                        version['content'] = {}
-                return version
+                return self._version_row_to_dict(row)
             return None
-    
+
     async def delete_document_version(self, version_id: str) -> bool:
         """Delete a document version."""
         async with self._get_connection() as conn:
@@ -1781,16 +2859,16 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """Get a crawled page by URL."""
         async with self._get_connection() as conn:
             if source_id:
-                query = """
-                    SELECT * FROM archon_crawled_pages 
+                query = f"""
+                    SELECT * FROM {self._CHUNK_ROWS}
                     WHERE url = ? AND source_id = ?
                     ORDER BY chunk_number
                     LIMIT 1
                 """
                 params = [url, source_id]
             else:
-                query = """
-                    SELECT * FROM archon_crawled_pages 
+                query = f"""
+                    SELECT * FROM {self._CHUNK_ROWS}
                     WHERE url = ?
                     ORDER BY chunk_number
                     LIMIT 1
@@ -1815,25 +2893,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """Insert a new crawled page."""
         async with self._get_connection() as conn:
             # Use auto-increment ID for SQLite
-            metadata = json.dumps(page_data.get('metadata', {}))
-
-            await conn.execute("""
-                INSERT INTO archon_crawled_pages (
-                    url, chunk_number, content, metadata, source_id, page_id,
-                    llm_chat_model, embedding_model, embedding_dimension, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                page_data.get('url'),
-                page_data.get('chunk_number', 0),
-                page_data.get('content'),
-                metadata,
-                page_data.get('source_id'),
-                page_data.get('page_id'),
-                page_data.get('llm_chat_model'),
-                page_data.get('embedding_model'),
-                page_data.get('embedding_dimension'),
-                datetime.now().isoformat()
-            ))
+            await self._insert_chunks(conn, [page_data])
 
             await conn.commit()
             # Note: Embeddings are not stored in SQLite (no vector support)
@@ -1844,25 +2904,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         """Insert or update a crawled page."""
         async with self._get_connection() as conn:
             # Use auto-increment ID for SQLite
-            metadata = json.dumps(page_data.get('metadata', {}))
-
-            await conn.execute("""
-                INSERT OR REPLACE INTO archon_crawled_pages (
-                    url, chunk_number, content, metadata, source_id, page_id,
-                    llm_chat_model, embedding_model, embedding_dimension, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                page_data.get('url'),
-                page_data.get('chunk_number', 0),
-                page_data.get('content'),
-                metadata,
-                page_data.get('source_id'),
-                page_data.get('page_id'),
-                page_data.get('llm_chat_model'),
-                page_data.get('embedding_model'),
-                page_data.get('embedding_dimension'),
-                page_data.get('created_at', datetime.now().isoformat())
-            ))
+            await self._insert_chunks(conn, [page_data], replace=True)
 
             await conn.commit()
             # Note: Embeddings are not stored in SQLite (no vector support)
@@ -1875,12 +2917,11 @@ class SQLiteDatabaseRepository(DatabaseRepository):
         
         async with self._get_connection() as conn:
             placeholders = ','.join('?' * len(urls))
-            cursor = await conn.execute(f"""
-                DELETE FROM archon_crawled_pages 
-                WHERE url IN ({placeholders})
-            """, urls)
+            deleted = await self._delete_with_source_stats(
+                conn, 'archon_crawled_pages', f"url IN ({placeholders})", urls
+            )
             await conn.commit()
-            return cursor.rowcount
+            return deleted
     
     async def insert_crawled_pages_batch(self, pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Insert multiple crawled pages in a batch."""
@@ -1888,27 +2929,8 @@ class SQLiteDatabaseRepository(DatabaseRepository):
             return []
 
         async with self._get_connection() as conn:
-            for page in pages:
-                # Use auto-increment ID for SQLite
-                metadata = json.dumps(page.get('metadata', {}))
-
-                await conn.execute("""
-                    INSERT INTO archon_crawled_pages (
-                        url, chunk_number, content, metadata, source_id, page_id,
-                        llm_chat_model, embedding_model, embedding_dimension, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    page.get('url'),
-                    page.get('chunk_number', 0),
-                    page.get('content'),
-                    metadata,
-                    page.get('source_id'),
-                    page.get('page_id'),
-                    page.get('llm_chat_model'),
-                    page.get('embedding_model'),
-                    page.get('embedding_dimension'),
-                    datetime.now().isoformat()
-                ))
+            # Use auto-increment ID for SQLite
+            await self._insert_chunks(conn, pages)
 
             await conn.commit()
             # Note: Embeddings (embedding_768, embedding_1024, etc.) are not stored in SQLite
@@ -2034,6 +3056,7 @@ class SQLiteDatabaseRepository(DatabaseRepository):
                 'archon_sources', 'archon_crawled_pages', 'archon_code_examples',
                 'archon_page_metadata', 'archon_projects', 'archon_tasks',
                 'archon_settings', 'archon_document_versions', 'archon_project_sources',
+                'archon_project_documents',
                 'archon_migrations'
             ]
             
@@ -40,6 +40,18 @@ async def apply_migration():
     # Apply migration
     try:
         async with aiosqlite.connect(db_path) as conn:
+            # Databases created by an older version of this migration still have
+            # the per-row aggregation triggers; upgrade them to tracker rollups
+            cursor = await conn.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name IN ('archon_mcp_usage_events', 'archon_mcp_usage_source_hourly')
+            """)
+            existing_tables = {row[0] for row in await cursor.fetchall()}
+            if existing_tables == {"archon_mcp_usage_events"}:
+                upgrade_file = migration_file.with_name("006_mcp_usage_rollups.sql")
+                logfire.info(f"Upgrading existing MCP usage tables: {upgrade_file}")
+                await conn.executescript(upgrade_file.read_text())
+
             # Execute migration statements
             statements = [s.strip() for s in migration_sql.split(';') if s.strip() and not s.strip().startswith('--')]
 
@@ -70,19 +82,6 @@ async def apply_migration():
             else:
                 logfire.warning("⚠ No MCP usage tables found after migration")
 
-            # Verify triggers were created
-            cursor = await conn.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='trigger' AND name LIKE 'trg_mcp_%'
-                ORDER BY name
-            """)
-            triggers = await cursor.fetchall()
-
-            if triggers:
-                logfire.info("✓ Created triggers:")
-                for trigger in triggers:
-                    logfire.info(f"  - {trigger[0]}")
-
     except Exception as e:
         logfire.error(f"Failed to apply migration: {e}", exc_info=True)
         sys.exit(1)
@@ -1,118 +1,298 @@
 """
 Crawler Manager Service
 
-Handles initialization and management of the Crawl4AI crawler instance.
+Handles initialization and management of the Crawl4AI crawler pool.
 This avoids circular imports by providing a service-level access to the crawler.
+
+Each crawl operation leases one browser from a small pool, so a heavy site only
+slows the crawls sharing its browser. Browsers are recycled after a number of
+pages or when their process tree grows past a memory limit.
 """
 
+import asyncio
 import os
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
-try:
-    from crawl4ai import AsyncWebCrawler, BrowserConfig
-except ImportError:
-    AsyncWebCrawler = None
-    BrowserConfig = None
+import psutil
 
 from ..config.logfire_config import get_logger, safe_logfire_error, safe_logfire_info
 
 logger = get_logger(__name__)
 
+# crawl4ai (and Playwright) are imported when the first browser launches
+AsyncWebCrawler = None
+BrowserConfig = None
+
+
+def _load_crawl4ai() -> None:
+    global AsyncWebCrawler, BrowserConfig
+    if AsyncWebCrawler is not None and BrowserConfig is not None:
+        return
+    try:
+        from crawl4ai import AsyncWebCrawler, BrowserConfig
+    except ImportError:
+        AsyncWebCrawler = None
+        BrowserConfig = None
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default))))
+    except ValueError:
+        logger.warning(f"Invalid {name}={os.getenv(name)!r}, using {default}")
+        return default
+
+
+def _create_browser_config():
+    """Browser settings shared by every pooled crawler."""
+    # Initialize browser config - same for Docker and local
+    # crawl4ai/Playwright will handle Docker-specific settings internally
+    return BrowserConfig(
+        headless=True,
+        verbose=False,
+        # Set viewport for proper rendering
+        viewport_width=1920,
+        viewport_height=1080,
+        # Add user agent to appear as a real browser
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        # Set browser type
+        browser_type="chromium",
+        # Extra args for Chromium - optimized for speed
+        extra_args=[
+            "--disable-blink-features=AutomationControlled",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+            "--disable-setuid-sandbox",
+            "--disable-web-security",
+            "--disable-features=IsolateOrigins,site-per-process",
+            # Performance optimizations
+            "--disable-images",  # Skip image loading for faster page loads
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-plugins",
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+            "--disable-features=TranslateUI",
+            "--disable-ipc-flooding-protection",
+            # Additional speed optimizations
+            "--aggressive-cache-discard",
+            "--disable-background-networking",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--metrics-recording-only",
+            "--no-first-run",
+            "--disable-popup-blocking",
+            "--disable-prompt-on-repost",
+            "--disable-domain-reliability",
+            "--disable-component-update",
+        ],
+    )
+
+
+def _child_pids() -> set[int]:
+    try:
+        return {child.pid for child in psutil.Process().children(recursive=True)}
+    except psutil.Error:
+        return set()
+
+
+@dataclass
+class _PoolSlot:
+    """One pooled browser and its usage counters."""
+
+    index: int
+    crawler: Any
+    pids: set[int] = field(default_factory=set)  # Browser/driver processes started for this slot
+    started_at: float = field(default_factory=time.monotonic)
+    pages: int = 0
+    active: int = 0  # Crawl operations currently holding a lease
+    restarts: int = 0
+    retiring: bool = False  # Due for recycling once its leases are released
+
+    def rss_bytes(self) -> int:
+        """Resident memory of the slot's browser process tree."""
+        processes: dict[int, psutil.Process] = {}
+        for pid in self.pids:
+            try:
+                root = psutil.Process(pid)
+                processes[pid] = root
+                for child in root.children(recursive=True):
+                    processes[child.pid] = child
+            except psutil.Error:
+                continue
+
+        total = 0
+        for process in processes.values():
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+
+
+class _CountingCrawler:
+    """Crawler proxy that counts the pages each pooled browser loads."""
+
+    def __init__(self, crawler: Any, slot: _PoolSlot):
+        self._crawler = crawler
+        self._slot = slot
+
+    async def arun(self, url: str, *args, **kwargs):
+        self._slot.pages += 1
+        return await self._crawler.arun(url, *args, **kwargs)
+
+    async def arun_many(self, urls: list[str], *args, **kwargs):
+        self._slot.pages += len(urls)
+        return await self._crawler.arun_many(urls, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._crawler, name)
+
+
+class CrawlerLease:
+    """A crawl operation's claim on one pooled browser. Call release() when the crawl ends."""
+
+    def __init__(self, manager: "CrawlerManager", slot: _PoolSlot):
+        self._manager = manager
+        self._slot = slot
+        self._released = False
+        self.crawler = _CountingCrawler(slot.crawler, slot)
+
+    @property
+    def index(self) -> int:
+        return self._slot.index
+
+    def release(self) -> None:
+        """Return the browser to the pool (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._manager._release(self._slot)
+
+
 class CrawlerManager:
-    """Manages the global crawler instance."""
+    """Manages the pool of crawler instances."""
 
     _instance: Optional["CrawlerManager"] = None
-    _crawler: AsyncWebCrawler | None = None
-    _initialized: bool = False
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._slots = []
+            cls._instance._lock = asyncio.Lock()
+            cls._instance._recycle_tasks = set()
+            cls._instance.pool_size = _env_int("CRAWLER_POOL_SIZE", 2, 1)
+            cls._instance.recycle_after_pages = _env_int("CRAWLER_RECYCLE_PAGES", 500, 1)
+            cls._instance.recycle_memory_mb = _env_int("CRAWLER_RECYCLE_MEMORY_MB", 1536, 0)
         return cls._instance
 
-    async def get_crawler(self) -> AsyncWebCrawler:
-        """Get or create the crawler instance."""
+    @property
+    def _initialized(self) -> bool:
+        return bool(self._slots)
+
+    async def get_crawler(self) -> Any:
+        """
+        Get a crawler without leasing it (least busy browser).
+
+        Crawl operations should use acquire() so the pool can balance and recycle browsers.
+        """
         if not self._initialized:
             await self.initialize()
-        return self._crawler
+        slot = min(self._slots, key=lambda s: (s.retiring, s.active, s.pages))
+        return slot.crawler
 
     async def initialize(self):
-        """Initialize the crawler if not already initialized."""
-        if self._initialized:
-            safe_logfire_info("Crawler already initialized, skipping")
+        """Start the first pooled browser if none is running; the rest start on demand."""
+        async with self._lock:
+            if self._initialized:
+                safe_logfire_info("Crawler already initialized, skipping")
+                return
+            await self._start_slot(0)
+
+    async def acquire(self) -> CrawlerLease:
+        """
+        Lease a browser for one crawl operation.
+
+        Idle browsers are preferred (least used first). When all are busy a new
+        one is started until the pool is full; after that the browser with the
+        fewest active crawls is shared.
+        """
+        async with self._lock:
+            slot = self._pick_slot()
+            if slot is None:
+                slot = await self._start_slot(len(self._slots))
+            elif slot.active == 0 and (slot.retiring or self._needs_recycle(slot)):
+                await self._restart_slot(slot)
+            slot.active += 1
+            return CrawlerLease(self, slot)
+
+    def _pick_slot(self) -> _PoolSlot | None:
+        candidates = [slot for slot in self._slots if not slot.retiring or slot.active == 0]
+        idle = [slot for slot in candidates if slot.active == 0]
+        if idle:
+            return min(idle, key=lambda s: s.pages)
+        if len(self._slots) < self.pool_size:
+            return None
+        return min(candidates or self._slots, key=lambda s: (s.active, s.pages))
+
+    def _needs_recycle(self, slot: _PoolSlot) -> bool:
+        if slot.pages >= self.recycle_after_pages:
+            return True
+        return bool(self.recycle_memory_mb) and slot.rss_bytes() >= self.recycle_memory_mb * 1024 * 1024
+
+    def _release(self, slot: _PoolSlot) -> None:
+        slot.active = max(0, slot.active - 1)
+        if slot not in self._slots:
             return
+        if slot.retiring or self._needs_recycle(slot):
+            slot.retiring = True
+            if slot.active == 0:
+                task = asyncio.get_running_loop().create_task(self._recycle_idle(slot))
+                self._recycle_tasks.add(task)
+                task.add_done_callback(self._recycle_tasks.discard)
+
+    async def _recycle_idle(self, slot: _PoolSlot) -> None:
+        async with self._lock:
+            if slot in self._slots and slot.retiring and slot.active == 0:
+                try:
+                    await self._restart_slot(slot)
+                except Exception as e:
+                    safe_logfire_error(f"Failed to recycle crawler {slot.index}: {e}")
+
+    async def _launch(self) -> tuple[Any, set[int]]:
+        _load_crawl4ai()
+        # Check if crawl4ai is available
+        if not AsyncWebCrawler or not BrowserConfig:
+            logger.error("ERROR: crawl4ai not available")
+            logger.error(f"AsyncWebCrawler: {AsyncWebCrawler}")
+            logger.error(f"BrowserConfig: {BrowserConfig}")
+            raise ImportError("crawl4ai is not installed or available")
 
+        # Browsers are launched one at a time (under the pool lock), so the new
+        # child processes belong to this crawler
+        before = _child_pids()
+        crawler = AsyncWebCrawler(config=_create_browser_config())
+        await crawler.__aenter__()
+        return crawler, _child_pids() - before
+
+    async def _start_slot(self, index: int) -> _PoolSlot:
         try:
-            safe_logfire_info("Initializing Crawl4AI crawler...")
+            safe_logfire_info(f"Initializing Crawl4AI crawler {index + 1}/{self.pool_size}...")
             logger.info("=== CRAWLER INITIALIZATION START ===")
 
-            # Check if crawl4ai is available
-            if not AsyncWebCrawler or not BrowserConfig:
-                logger.error("ERROR: crawl4ai not available")
-                logger.error(f"AsyncWebCrawler: {AsyncWebCrawler}")
-                logger.error(f"BrowserConfig: {BrowserConfig}")
-                raise ImportError("crawl4ai is not installed or available")
-
             # Check for Docker environment
             in_docker = os.path.exists("/.dockerenv") or os.getenv("DOCKER_CONTAINER", False)
-
-            # Initialize browser config - same for Docker and local
-            # crawl4ai/Playwright will handle Docker-specific settings internally
-            browser_config = BrowserConfig(
-                headless=True,
-                verbose=False,
-                # Set viewport for proper rendering
-                viewport_width=1920,
-                viewport_height=1080,
-                # Add user agent to appear as a real browser
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                # Set browser type
-                browser_type="chromium",
-                # Extra args for Chromium - optimized for speed
-                extra_args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-web-security",
-                    "--disable-features=IsolateOrigins,site-per-process",
-                    # Performance optimizations
-                    "--disable-images",  # Skip image loading for faster page loads
-                    "--disable-gpu",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-features=TranslateUI",
-                    "--disable-ipc-flooding-protection",
-                    # Additional speed optimizations
-                    "--aggressive-cache-discard",
-                    "--disable-background-networking",
-                    "--disable-default-apps",
-                    "--disable-sync",
-                    "--metrics-recording-only",
-                    "--no-first-run",
-                    "--disable-popup-blocking",
-                    "--disable-prompt-on-repost",
-                    "--disable-domain-reliability",
-                    "--disable-component-update",
-                ],
-            )
-
             safe_logfire_info(f"Creating AsyncWebCrawler with config | in_docker={in_docker}")
 
-            # Initialize crawler with the correct parameter name
-            self._crawler = AsyncWebCrawler(config=browser_config)
-            safe_logfire_info("AsyncWebCrawler instance created, entering context...")
-            await self._crawler.__aenter__()
-            self._initialized = True
-            safe_logfire_info(f"Crawler entered context successfully | crawler={self._crawler}")
+            crawler, pids = await self._launch()
+            slot = _PoolSlot(index=index, crawler=crawler, pids=pids)
+            self._slots.append(slot)
 
-            safe_logfire_info("✅ Crawler initialized successfully")
+            safe_logfire_info(f"✅ Crawler {index} initialized successfully | processes={len(pids)}")
             logger.info("=== CRAWLER INITIALIZATION SUCCESS ===")
-            logger.info(f"Crawler instance: {self._crawler}")
-            logger.info(f"Initialized: {self._initialized}")
+            return slot
 
         except Exception as e:
             safe_logfire_error(f"Failed to initialize crawler: {e}")
@@ -125,42 +305,85 @@ class CrawlerManager:
             logger.error(f"Error: {e}")
             logger.error(f"Traceback:\n{tb}")
             logger.error("=== END CRAWLER ERROR ===")
-            # Don't mark as initialized if the crawler is None
-            # This allows retries and proper error propagation
-            self._crawler = None
-            self._initialized = False
             raise Exception(f"Failed to initialize Crawl4AI crawler: {e}")
 
+    async def _restart_slot(self, slot: _PoolSlot) -> None:
+        rss_mb = slot.rss_bytes() / (1024 * 1024)
+        safe_logfire_info(
+            f"Recycling crawler {slot.index} | pages={slot.pages} | rss_mb={rss_mb:.0f}"
+        )
+        await self._close(slot)
+        try:
+            slot.crawler, slot.pids = await self._launch()
+        except Exception:
+            # Drop the slot; acquire() starts a replacement on demand
+            self._slots.remove(slot)
+            raise
+        slot.pages = 0
+        slot.restarts += 1
+        slot.retiring = False
+        slot.started_at = time.monotonic()
+
+    async def _close(self, slot: _PoolSlot) -> None:
+        try:
+            await slot.crawler.__aexit__(None, None, None)
+        except Exception as e:
+            safe_logfire_error(f"Error cleaning up crawler {slot.index}: {e}")
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Pool metrics for health checks (pages, RSS and restarts per browser)."""
+        now = time.monotonic()
+        return {
+            "size": self.pool_size,
+            "running": len(self._slots),
+            "active_crawls": sum(slot.active for slot in self._slots),
+            "recycle_after_pages": self.recycle_after_pages,
+            "recycle_memory_mb": self.recycle_memory_mb,
+            "contexts": [
+                {
+                    "index": slot.index,
+                    "active_crawls": slot.active,
+                    "pages": slot.pages,
+                    "rss_mb": round(slot.rss_bytes() / (1024 * 1024), 1),
+                    "restarts": slot.restarts,
+                    "retiring": slot.retiring,
+                    "uptime_seconds": round(now - slot.started_at),
+                }
+                for slot in self._slots
+            ],
+        }
+
     async def cleanup(self):
         """Clean up the crawler resources."""
-        if self._crawler and self._initialized:
-            try:
-                await self._crawler.__aexit__(None, None, None)
-                safe_logfire_info("Crawler cleaned up successfully")
-            except Exception as e:
-                safe_logfire_error(f"Error cleaning up crawler: {e}")
-            finally:
-                self._crawler = None
-                self._initialized = False
+        for task in list(self._recycle_tasks):
+            task.cancel()
+        async with self._lock:
+            for slot in self._slots:
+                await self._close(slot)
+            if self._slots:
+                safe_logfire_info("Crawler pool cleaned up successfully")
+            self._slots.clear()
 
 # Global instance
 _crawler_manager = CrawlerManager()
 
-async def get_crawler() -> AsyncWebCrawler | None:
-    """Get the global crawler instance."""
-    global _crawler_manager
+async def get_crawler() -> Any | None:
+    """Get a crawler from the global pool without leasing it."""
     crawler = await _crawler_manager.get_crawler()
     if crawler is None:
         logger.warning("get_crawler() returning None")
         logger.warning(f"_crawler_manager: {_crawler_manager}")
-        logger.warning(
-            f"_crawler_manager._crawler: {_crawler_manager._crawler if _crawler_manager else 'N/A'}"
-        )
-        logger.warning(
-            f"_crawler_manager._initialized: {_crawler_manager._initialized if _crawler_manager else 'N/A'}"
-        )
+        logger.warning(f"_crawler_manager pool: {_crawler_manager.get_pool_stats()}")
     return crawler
 
+async def acquire_crawler() -> CrawlerLease:
+    """Lease a pooled crawler for one crawl operation."""
+    return await _crawler_manager.acquire()
+
+def get_crawler_pool_stats() -> dict[str, Any]:
+    """Get the global crawler pool metrics."""
+    return _crawler_manager.get_pool_stats()
+
 async def initialize_crawler():
     """Initialize the global crawler."""
     await _crawler_manager.initialize()
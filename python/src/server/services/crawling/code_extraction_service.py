@@ -15,8 +15,10 @@ from ...repositories.repository_factory import get_repository
 from ...services.credential_service import credential_service
 from ..storage.code_storage_service import (
     add_code_examples_to_database,
+    find_known_code_summaries,
     generate_code_summaries_batch,
 )
+from .helpers.html_scanner import HtmlCodeBlock, HtmlPageScan, scan_html
 
 
 class CodeExtractionService:
@@ -297,6 +299,8 @@ class CodeExtractionService:
             try:
                 source_url = doc["url"]
                 html_content = doc.get("html", "")
+                # Pages crawled with CRAWL_STREAM_EXTRACTION carry the scan instead of raw HTML
+                html_scan: HtmlPageScan | None = doc.get("html_scan")
                 md = doc.get("markdown", "")
 
                 # Debug logging
@@ -370,11 +374,14 @@ class CodeExtractionService:
                         safe_logfire_info(f"⚠️ NO CONTENT for PDF file | url={source_url}")
 
                 # If not a text file or PDF, or no code blocks found, try HTML extraction as fallback
-                if len(code_blocks) == 0 and html_content and not is_text_file:
-                    safe_logfire_info(
-                        f"Trying HTML extraction first | url={source_url} | html_length={len(html_content)}"
-                    )
-                    html_code_blocks = await self._extract_html_code_blocks(html_content)
+                if len(code_blocks) == 0 and (html_content or html_scan) and not is_text_file:
+                    if html_scan is not None:
+                        html_code_blocks = await self._code_blocks_from_scan(html_scan)
+                    else:
+                        safe_logfire_info(
+                            f"Trying HTML extraction first | url={source_url} | html_length={len(html_content)}"
+                        )
+                        html_code_blocks = await self._extract_html_code_blocks(html_content)
                     if html_code_blocks:
                         code_blocks = html_code_blocks
                         safe_logfire_info(
@@ -427,337 +434,73 @@ class CodeExtractionService:
 
     async def _extract_html_code_blocks(self, content: str) -> list[dict[str, Any]]:
         """
-        Extract code blocks from HTML patterns in content.
+        Extract code blocks from HTML content.
         This is a fallback when markdown conversion didn't preserve code blocks.
 
+        The page is parsed once by scan_html, which finds <pre> blocks and code
+        editors (CodeMirror, Monaco) with their language hints and surrounding
+        text. Standalone <code> elements are only used when there are no blocks.
+
         Args:
-            content: The content to search for HTML code patterns
-            min_length: Minimum length for code blocks
+            content: The raw HTML of the page
 
         Returns:
             List of code blocks with metadata
         """
-        import re
-
-        # Add detailed logging
-        safe_logfire_info(f"Processing HTML of length {len(content)} for code extraction")
-
-        # Check if we have actual content
-        if len(content) < 1000:
-            safe_logfire_info(
-                f"Warning: HTML content seems too short, first 500 chars: {repr(content[:500])}"
-            )
-
-        # Look for specific indicators of code blocks
-        has_prism = "prism" in content.lower()
-        has_highlight = "highlight" in content.lower()
-        has_shiki = "shiki" in content.lower()
-        has_codemirror = "codemirror" in content.lower() or "cm-" in content
+        scan = await asyncio.to_thread(scan_html, content)
         safe_logfire_info(
-            f"Code library indicators | prism={has_prism} | highlight={has_highlight} | shiki={has_shiki} | codemirror={has_codemirror}"
+            f"Scanned HTML of length {len(content)} | code_blocks={len(scan.code_blocks)} | "
+            f"inline_code={len(scan.inline_code)}"
         )
+        return await self._code_blocks_from_scan(scan)
 
-        # Check for any pre tags with different attributes
-        pre_matches = re.findall(r"<pre[^>]*>", content[:5000], re.IGNORECASE)
-        if pre_matches:
-            safe_logfire_info(f"Found {len(pre_matches)} <pre> tags in first 5000 chars")
-            for i, pre_tag in enumerate(pre_matches[:3]):  # Show first 3
-                safe_logfire_info(f"Pre tag {i + 1}: {pre_tag}")
-
+    async def _code_blocks_from_scan(self, scan: HtmlPageScan) -> list[dict[str, Any]]:
+        """Filter and clean the code blocks found by scan_html."""
         code_blocks = []
-        extracted_positions = set()  # Track already extracted code block positions
 
-        # Comprehensive patterns for various code block formats
-        # Order matters - more specific patterns first
-        patterns = [
-            # GitHub/GitLab patterns
-            (
-                r'<div[^>]*class=["\'][^"\']*highlight[^"\']*["\'][^>]*>.*?<pre[^>]*class=["\'][^"\']*(?:language-)?(\w+)[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
-                "github-highlight",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*snippet-clipboard-content[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
-                "github-snippet",
-            ),
-            # Docusaurus patterns
-            (
-                r'<div[^>]*class=["\'][^"\']*codeBlockContainer[^"\']*["\'][^>]*>.*?<pre[^>]*class=["\'][^"\']*prism-code[^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</pre>',
-                "docusaurus",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>.*?<pre[^>]*class=["\'][^"\']*prism-code[^"\']*["\'][^>]*>(.*?)</pre>',
-                "docusaurus-alt",
-            ),
-            # Milkdown specific patterns - check their actual HTML structure
-            (
-                r'<pre[^>]*><code[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</code></pre>',
-                "milkdown-typed",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*code-wrapper[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
-                "milkdown-wrapper",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*code-block-wrapper[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
-                "milkdown-wrapper-code",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*milkdown-code-block[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
-                "milkdown-code-block",
-            ),
-            (
-                r'<pre[^>]*class=["\'][^"\']*code-block[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
-                "milkdown",
-            ),
-            (r"<div[^>]*data-code-block[^>]*>.*?<pre[^>]*>(.*?)</pre>", "milkdown-alt"),
-            (
-                r'<div[^>]*class=["\'][^"\']*milkdown[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
-                "milkdown-div",
-            ),
-            # Monaco Editor - capture all view-lines content
-            (
-                r'<div[^>]*class=["\'][^"\']*monaco-editor[^"\']*["\'][^>]*>.*?<div[^>]*class=["\'][^"\']*view-lines[^"\']*[^>]*>(.*?)</div>(?=.*?</div>.*?</div>)',
-                "monaco",
-            ),
-            # CodeMirror patterns
-            (
-                r'<div[^>]*class=["\'][^"\']*cm-content[^"\']*["\'][^>]*>((?:<div[^>]*class=["\'][^"\']*cm-line[^"\']*["\'][^>]*>.*?</div>\s*)+)</div>',
-                "codemirror",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*CodeMirror[^"\']*["\'][^>]*>.*?<div[^>]*class=["\'][^"\']*CodeMirror-code[^"\']*["\'][^>]*>(.*?)</div>',
-                "codemirror-legacy",
-            ),
-            # Prism.js with language - must be before generic pre
-            (
-                r'<pre[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>\s*<code[^>]*>(.*?)</code>\s*</pre>',
-                "prism",
-            ),
-            (
-                r'<pre[^>]*>\s*<code[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</code>\s*</pre>',
-                "prism-alt",
-            ),
-            # highlight.js - must be before generic pre/code
-            (
-                r'<pre[^>]*><code[^>]*class=["\'][^"\']*hljs(?:\s+language-(\w+))?[^"\']*["\'][^>]*>(.*?)</code></pre>',
-                "hljs",
-            ),
-            (
-                r'<pre[^>]*class=["\'][^"\']*hljs[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
-                "hljs-pre",
-            ),
-            # Shiki patterns (VitePress, Astro, etc.)
-            (
-                r'<pre[^>]*class=["\'][^"\']*shiki[^"\']*["\'][^>]*(?:.*?style=["\'][^"\']*background-color[^"\']*["\'])?[^>]*>\s*<code[^>]*>(.*?)</code>\s*</pre>',
-                "shiki",
-            ),
-            (r'<pre[^>]*class=["\'][^"\']*astro-code[^"\']*["\'][^>]*>(.*?)</pre>', "astro-shiki"),
-            (
-                r'<div[^>]*class=["\'][^"\']*astro-code[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
-                "astro-wrapper",
-            ),
-            # VitePress/Vue patterns
-            (
-                r'<div[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
-                "vitepress",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*vp-code[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
-                "vitepress-vp",
-            ),
-            # Nextra patterns
-            (r"<div[^>]*data-nextra-code[^>]*>.*?<pre[^>]*>(.*?)</pre>", "nextra"),
-            (
-                r'<pre[^>]*class=["\'][^"\']*nx-[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
-                "nextra-nx",
-            ),
-            # Standard pre/code patterns - should be near the end
-            (
-                r'<pre[^>]*><code[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</code></pre>',
-                "standard-lang",
-            ),
-            (r"<pre[^>]*>\s*<code[^>]*>(.*?)</code>\s*</pre>", "standard"),
-            # Generic patterns - should be last
-            (
-                r'<div[^>]*class=["\'][^"\']*code-block[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
-                "generic-div",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*codeblock[^"\']*["\'][^>]*>(.*?)</div>',
-                "generic-codeblock",
-            ),
-            (
-                r'<div[^>]*class=["\'][^"\']*highlight[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
-                "highlight",
-            ),
-        ]
-
-        for pattern_tuple in patterns:
-            pattern_str, source_type = pattern_tuple
-            matches = list(re.finditer(pattern_str, content, re.DOTALL | re.IGNORECASE))
-
-            # Log pattern matches for Milkdown patterns and CodeMirror
-            if matches and (
-                "milkdown" in source_type
-                or "codemirror" in source_type
-                or "milkdown" in content[:1000].lower()
-            ):
-                safe_logfire_info(f"Pattern {source_type} found {len(matches)} matches")
-
-            for match in matches:
-                # Extract code content based on pattern type
-                if source_type in ["standard-lang", "prism", "vitepress", "hljs", "milkdown-typed"]:
-                    # These patterns capture language in group 1, code in group 2
-                    if match.lastindex and match.lastindex >= 2:
-                        language = match.group(1)
-                        code_content = match.group(2).strip()
-                    else:
-                        code_content = match.group(1).strip()
-                        language = ""
-                else:
-                    # Most patterns have code in group 1
-                    code_content = match.group(1).strip()
-                    # Try to extract language from the full match
-                    full_match = match.group(0)
-                    lang_match = re.search(r'class=["\'].*?language-(\w+)', full_match)
-                    language = lang_match.group(1) if lang_match else ""
-
-                # Get the start position for complete block extraction
-                code_start_pos = match.start()
-
-                # For CodeMirror, extract text from cm-lines
-                if source_type == "codemirror":
-                    # Extract text from each cm-line div
-                    cm_lines = re.findall(
-                        r'<div[^>]*class=["\'][^"\']*cm-line[^"\']*["\'][^>]*>(.*?)</div>',
-                        code_content,
-                        re.DOTALL,
-                    )
-                    if cm_lines:
-                        # Clean each line and join
-                        cleaned_lines = []
-                        for line in cm_lines:
-                            # Remove span tags but keep content
-                            line = re.sub(r"<span[^>]*>", "", line)
-                            line = re.sub(r"</span>", "", line)
-                            # Remove other HTML tags
-                            line = re.sub(r"<[^>]+>", "", line)
-                            cleaned_lines.append(line)
-                        code_content = "\n".join(cleaned_lines)
-                    else:
-                        # Fallback: just clean HTML
-                        code_content = re.sub(r"<span[^>]*>", "", code_content)
-                        code_content = re.sub(r"</span>", "", code_content)
-                        code_content = re.sub(r"<[^>]+>", "\n", code_content)
-
-                # For Monaco, extract text from nested divs
-                if source_type == "monaco":
-                    # Extract actual code from Monaco's complex structure
-                    code_content = re.sub(r"<div[^>]*>", "\n", code_content)
-                    code_content = re.sub(r"</div>", "", code_content)
-                    code_content = re.sub(r"<span[^>]*>", "", code_content)
-                    code_content = re.sub(r"</span>", "", code_content)
-
-                # Calculate dynamic minimum length
-                context_for_length = content[max(0, code_start_pos - 500) : code_start_pos + 500]
-                min_length = await self._calculate_min_length(language, context_for_length)
-
-                # Skip if initial content is too short
-                if len(code_content) < min_length:
-                    # Try to find complete block if we have a language
-                    if language and code_start_pos > 0:
-                        # Look for complete code block
-                        complete_code, block_end_pos = await self._find_complete_code_block(
-                            content, code_start_pos, min_length, language
-                        )
-                        if len(complete_code) >= min_length:
-                            code_content = complete_code
-                            end_pos = block_end_pos
-                        else:
-                            continue
-                    else:
-                        continue
+        for found in scan.code_blocks:
+            language = found.language
+            context_for_length = f"{found.context_before[-500:]}\n{found.context_after[:500]}"
+            min_length = await self._calculate_min_length(language, context_for_length)
+            if len(found.code.strip()) < min_length:
+                continue
 
-                # Extract position info for deduplication
-                start_pos = match.start()
-                end_pos = (
-                    match.end()
-                    if len(code_content) <= len(match.group(0))
-                    else code_start_pos + len(code_content)
+            cleaned_code = self._clean_code_content(found.code, language, decode_html=False)
+            if await self._validate_code_quality(cleaned_code, language):
+                safe_logfire_info(
+                    f"Extracted code block | source_type={found.source_type} | language={language} | min_length={min_length} | original_length={len(found.code)} | cleaned_length={len(cleaned_code)}"
+                )
+                code_blocks.append(self._html_code_block(found, cleaned_code))
+            else:
+                safe_logfire_info(
+                    f"Code block failed validation | source_type={found.source_type} | language={language} | length={len(cleaned_code)}"
                 )
 
-                # Check if we've already extracted code from this position
-                position_key = (start_pos, end_pos)
-                overlapping = False
-                for existing_start, existing_end in extracted_positions:
-                    # Check if this match overlaps with an existing extraction
-                    if not (end_pos <= existing_start or start_pos >= existing_end):
-                        overlapping = True
-                        break
-
-                if not overlapping:
-                    extracted_positions.add(position_key)
-
-                    # Extract context
-                    context_before = content[max(0, start_pos - 1000) : start_pos].strip()
-                    context_after = content[end_pos : min(len(content), end_pos + 1000)].strip()
-
-                    # Clean the code content
-                    cleaned_code = self._clean_code_content(code_content, language)
-
-                    # Validate code quality
-                    if await self._validate_code_quality(cleaned_code, language):
-                        # Log successful extraction
-                        safe_logfire_info(
-                            f"Extracted code block | source_type={source_type} | language={language} | min_length={min_length} | original_length={len(code_content)} | cleaned_length={len(cleaned_code)}"
-                        )
-
-                        code_blocks.append({
-                            "code": cleaned_code,
-                            "language": language,
-                            "context_before": context_before,
-                            "context_after": context_after,
-                            "full_context": f"{context_before}\n\n{cleaned_code}\n\n{context_after}",
-                            "source_type": source_type,  # Track which pattern matched
-                        })
-                    else:
-                        safe_logfire_info(
-                            f"Code block failed validation | source_type={source_type} | language={language} | length={len(cleaned_code)}"
-                        )
-
-        # Pattern 2: <code>...</code> (standalone)
-        if not code_blocks:  # Only if we didn't find pre/code blocks
-            code_pattern = r"<code[^>]*>(.*?)</code>"
-            matches = re.finditer(code_pattern, content, re.DOTALL | re.IGNORECASE)
-
-            for match in matches:
-                code_content = match.group(1).strip()
-                # Clean the code content
-                cleaned_code = self._clean_code_content(code_content, "")
-
-                # Check if it's multiline or substantial enough and validate quality
-                # Use a minimal length for standalone code tags
-                if len(cleaned_code) >= 100 and ("\n" in cleaned_code or len(cleaned_code) > 100):
-                    if await self._validate_code_quality(cleaned_code, ""):
-                        start_pos = match.start()
-                        end_pos = match.end()
-                        context_before = content[max(0, start_pos - 1000) : start_pos].strip()
-                        context_after = content[end_pos : min(len(content), end_pos + 1000)].strip()
-
-                        code_blocks.append({
-                            "code": cleaned_code,
-                            "language": "",
-                            "context_before": context_before,
-                            "context_after": context_after,
-                            "full_context": f"{context_before}\n\n{cleaned_code}\n\n{context_after}",
-                        })
-                    else:
-                        safe_logfire_info(
-                            f"Standalone code block failed validation | length={len(cleaned_code)}"
-                        )
+        # Standalone <code> elements, only if there were no pre/editor blocks
+        if not code_blocks:
+            for found in scan.inline_code:
+                cleaned_code = self._clean_code_content(found.code, "", decode_html=False)
+                if len(cleaned_code) < 100:
+                    continue
+                if await self._validate_code_quality(cleaned_code, ""):
+                    code_blocks.append(self._html_code_block(found, cleaned_code))
+                else:
+                    safe_logfire_info(
+                        f"Standalone code block failed validation | length={len(cleaned_code)}"
+                    )
 
         return code_blocks
 
+    def _html_code_block(self, found: HtmlCodeBlock, cleaned_code: str) -> dict[str, Any]:
+        return {
+            "code": cleaned_code,
+            "language": found.language,
+            "context_before": found.context_before,
+            "context_after": found.context_after,
+            "full_context": f"{found.context_before}\n\n{cleaned_code}\n\n{found.context_after}",
+            "source_type": found.source_type,  # Track which highlighter rendered the block
+        }
+
     async def _extract_text_file_code_blocks(
         self, content: str, url: str, min_length: int | None = None
     ) -> list[dict[str, Any]]:
@@ -1329,13 +1072,14 @@ class CodeExtractionService:
 
         return text
 
-    def _clean_code_content(self, code: str, language: str = "") -> str:
+    def _clean_code_content(self, code: str, language: str = "", decode_html: bool = True) -> str:
         """
         Clean and fix common issues in extracted code content.
 
         Args:
             code: The code content to clean
             language: The detected language (optional)
+            decode_html: Whether the code still contains HTML tags and entities
 
         Returns:
             Cleaned code content
@@ -1343,7 +1087,8 @@ class CodeExtractionService:
         import re
 
         # First apply HTML entity decoding and tag cleaning
-        code = self._decode_html_entities(code)
+        if decode_html:
+            code = self._decode_html_entities(code)
 
         # Fix common concatenation issues from span removal
         # Common patterns where spaces are missing between keywords
@@ -1566,7 +1311,7 @@ class CodeExtractionService:
         progress_callback: Callable | None = None,
         cancellation_check: Callable[[], None] | None = None,
         provider: str | None = None,
-    ) -> list[dict[str, str]]:
+    ) -> list[dict[str, Any]]:
         """
         Generate summaries for all code blocks.
 
@@ -1584,6 +1329,7 @@ class CodeExtractionService:
                 default_summaries.append({
                     "example_name": f"Code Example{f' ({language})' if language else ''}",
                     "summary": "Code example for demonstration purposes.",
+                    "fallback": True,
                 })
 
             # Report progress for skipped summaries
@@ -1602,7 +1348,12 @@ class CodeExtractionService:
         max_workers = 3
 
         # Extract just the code blocks for batch processing
-        code_blocks_for_summaries = [item["block"] for item in all_code_blocks]
+        all_blocks = [item["block"] for item in all_code_blocks]
+
+        # Snippets already summarized for any source or earlier crawl skip the LLM entirely
+        known_summaries = await find_known_code_summaries(self.repository, all_blocks)
+        pending_indices = [i for i, known in enumerate(known_summaries) if known is None]
+        code_blocks_for_summaries = [all_blocks[i] for i in pending_indices]
 
         # Generate summaries with progress tracking
         summary_progress_callback = None
@@ -1630,19 +1381,27 @@ class CodeExtractionService:
 
         try:
             results = await generate_code_summaries_batch(
-                code_blocks_for_summaries, max_workers, progress_callback=summary_progress_callback, provider=provider
+                code_blocks_for_summaries,
+                max_workers,
+                progress_callback=summary_progress_callback,
+                provider=provider,
             )
 
+            # Merge generated summaries back between the reused ones
+            for i, result in zip(pending_indices, results, strict=False):
+                known_summaries[i] = result
+
             # Ensure all results are valid dicts
             validated_results = []
-            for result in results:
+            for result in known_summaries:
                 if isinstance(result, dict):
                     validated_results.append(result)
                 else:
                     # Handle non-dict results (CancelledError, etc.)
                     validated_results.append({
                         "example_name": "Code Example",
-                        "summary": "Code example for demonstration purposes."
+                        "summary": "Code example for demonstration purposes.",
+                        "fallback": True,
                     })
 
             return validated_results
@@ -1651,7 +1410,7 @@ class CodeExtractionService:
             raise
 
     def _prepare_code_examples_for_storage(
-        self, all_code_blocks: list[dict[str, Any]], summary_results: list[dict[str, str]]
+        self, all_code_blocks: list[dict[str, Any]], summary_results: list[dict[str, Any]]
     ) -> dict[str, list[Any]]:
         """
         Prepare code examples for storage by organizing data into arrays.
@@ -1663,6 +1422,7 @@ class CodeExtractionService:
         code_chunk_numbers = []
         code_examples = []
         code_summaries = []
+        code_fallback_summaries = []
         code_metadatas = []
 
         for code_item, summary_result in zip(all_code_blocks, summary_results, strict=False):
@@ -1674,15 +1434,18 @@ class CodeExtractionService:
             if isinstance(summary_result, dict):
                 summary = summary_result.get("summary", "Code example for demonstration purposes.")
                 example_name = summary_result.get("example_name", "Code Example")
+                is_fallback = bool(summary_result.get("fallback")) or "summary" not in summary_result
             else:
                 # Handle CancelledError or other non-dict results
                 summary = "Code example for demonstration purposes."
                 example_name = "Code Example"
+                is_fallback = True
 
             code_urls.append(source_url)
             code_chunk_numbers.append(len(code_examples))
             code_examples.append(block["code"])
             code_summaries.append(summary)
+            code_fallback_summaries.append(is_fallback)
 
             code_meta = {
                 "chunk_index": len(code_examples) - 1,
@@ -1702,6 +1465,7 @@ class CodeExtractionService:
             "chunk_numbers": code_chunk_numbers,
             "examples": code_examples,
             "summaries": code_summaries,
+            "fallback_summaries": code_fallback_summaries,
             "metadatas": code_metadatas,
         }
 
@@ -1763,6 +1527,7 @@ class CodeExtractionService:
                 progress_callback=storage_progress_callback,
                 provider=provider,
                 embedding_provider=embedding_provider,
+                fallback_summaries=storage_data.get("fallback_summaries"),
             )
 
             # Report completion of code extraction/storage phase
@@ -205,6 +205,10 @@ class CrawlingService:
         """Parse a sitemap and extract URLs."""
         return self.sitemap_strategy.parse_sitemap(sitemap_url, self._check_cancellation)
 
+    async def fetch_sitemap(self, sitemap_url: str) -> list[str]:
+        """Fetch and parse a sitemap without blocking the event loop."""
+        return await self.sitemap_strategy.fetch_sitemap(sitemap_url, self._check_cancellation)
+
     async def crawl_batch_with_progress(
         self,
         urls: list[str],
@@ -319,7 +323,7 @@ class CrawlingService:
                 self.doc_storage_ops, self.progress_mapper, self._check_cancellation
             ),
             url_type_handler=UrlTypeHandler(
-                self.url_handler, self.crawl_markdown_file, self.parse_sitemap,
+                self.url_handler, self.crawl_markdown_file, self.fetch_sitemap,
                 self.crawl_batch_with_progress, self.crawl_recursive_with_progress, self._is_self_link
             ),
             url_handler=self.url_handler,
@@ -0,0 +1,388 @@
+"""
+Single-pass HTML scanning for crawled pages.
+
+Collects the <title>, every code block (<pre>, CodeMirror and Monaco editors)
+with its language hint, highlighter and surrounding text, and standalone
+<code> elements in one traversal of the document. Parsing is event based:
+lxml's libxml2 HTML parser drives the scanner when installed (it ships with
+crawl4ai), the standard library's HTMLParser otherwise. Runtime is linear in
+the page size, unlike running a regex per highlighter over the raw HTML.
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any
+
+from ....config.logfire_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Characters of visible text kept before and after each code block
+CONTEXT_CHARS = 1000
+
+# Standalone <code> elements shorter than this are inline identifiers, not examples
+MIN_INLINE_CODE_CHARS = 100
+
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source",
+    "track", "wbr",
+})
+_HIDDEN_TAGS = frozenset({"script", "style", "noscript", "template", "button", "svg"})
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "figcaption", "figure",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p",
+    "pre", "section", "table", "td", "th", "tr", "ul",
+})
+# Line-number gutters rendered next to the code
+_GUTTER_CLASSES = re.compile(r"line-number|lineno|gutter|blob-num")
+# Code editors that render lines as <div>s instead of a <pre>
+_EDITOR_ROOTS = (
+    ("cm-content", "codemirror"),
+    ("CodeMirror-code", "codemirror-legacy"),
+    ("view-lines", "monaco"),
+)
+# Class fragments identifying the highlighter that rendered a block, most specific first
+_SOURCE_TYPES = (
+    ("prism-code", "docusaurus"),
+    ("astro-code", "astro-shiki"),
+    ("shiki", "shiki"),
+    ("vp-code", "vitepress"),
+    ("hljs", "hljs"),
+    ("milkdown", "milkdown"),
+    ("nx-", "nextra"),
+    ("highlight", "github-highlight"),
+    ("language-", "prism"),
+)
+_LANGUAGE_CLASS = re.compile(r"^(?:language|lang|highlight-source|highlight)-([\w+#.-]+)$")
+_IGNORED_LANGUAGES = frozenset({"default", "none", "nohighlight", "plain", "plaintext", "text"})
+_WHITESPACE = re.compile(r"\s+")
+_BLANK_LINES = re.compile(r" ?\n[ \n]*")
+
+
+@dataclass
+class HtmlCodeBlock:
+    """A code block found in a page, with the visible text around it."""
+
+    code: str
+    language: str = ""
+    source_type: str = "standard"
+    context_before: str = ""
+    context_after: str = ""
+
+
+@dataclass
+class HtmlPageScan:
+    """Everything extracted from one page in a single traversal."""
+
+    title: str | None = None
+    code_blocks: list[HtmlCodeBlock] = field(default_factory=list)
+    inline_code: list[HtmlCodeBlock] = field(default_factory=list)
+
+
+def _language_hint(attrs: dict[str, str | None]) -> str:
+    """Read a language from data-language/data-lang or a language-*/lang-*/highlight-* class."""
+    candidates = [attrs.get("data-language"), attrs.get("data-lang")]
+    classes = attrs.get("class") or ""
+    if "lang" in classes or "highlight" in classes:
+        for token in classes.split():
+            match = _LANGUAGE_CLASS.match(token)
+            if match:
+                candidates.append(match.group(1))
+    for candidate in candidates:
+        if candidate and candidate.lower() not in _IGNORED_LANGUAGES:
+            return candidate.lower()
+    return ""
+
+
+def _source_type(classes: str) -> str | None:
+    for fragment, source_type in _SOURCE_TYPES:
+        if fragment in classes:
+            return source_type
+    return None
+
+
+class _Capture:
+    """Text of a code block being collected."""
+
+    def __init__(self, depth: int, language: str, source_type: str | None, context_before: str, inline: bool):
+        self.depth = depth
+        self.language = language
+        self.source_type = source_type
+        self.context_before = context_before
+        self.inline = inline
+        self.parts: list[str] = []
+
+    def newline(self) -> None:
+        if self.parts and not self.parts[-1].endswith("\n"):
+            self.parts.append("\n")
+
+
+class _PageScanner:
+    """Scanner state, fed start/end/data events (lxml's parser target interface)."""
+
+    def __init__(self) -> None:
+        self.result = HtmlPageScan()
+        # Open elements as (tag, class attribute, language hint, hides text)
+        self._stack: list[tuple[str, str, str, bool]] = []
+        self._hidden = 0
+        self._title_parts: list[str] | None = None
+        self._capture: _Capture | None = None
+        self._recent = ""
+        # Blocks still collecting context_after, with the text gathered so far
+        self._awaiting_context: list[tuple[HtmlCodeBlock, list[str], int]] = []
+
+    # Visible text outside code blocks feeds the context window
+    def _add_text(self, text: str) -> None:
+        self._recent += text
+        if len(self._recent) > 2 * CONTEXT_CHARS:
+            self._recent = self._recent[-CONTEXT_CHARS:]
+        if self._awaiting_context:
+            still_awaiting = []
+            for block, parts, length in self._awaiting_context:
+                parts.append(text)
+                length += len(text)
+                if length < CONTEXT_CHARS:
+                    still_awaiting.append((block, parts, length))
+                else:
+                    block.context_after = _clean_context("".join(parts)[:CONTEXT_CHARS])
+            self._awaiting_context = still_awaiting
+
+    def start(self, tag: str, attributes: dict[str, str | None]) -> None:
+        classes = attributes.get("class") or ""
+        capture = self._capture
+
+        if tag == "br":
+            if capture is not None:
+                capture.parts.append("\n")
+            elif not self._hidden:
+                self._add_text("\n")
+            return
+
+        hides = tag in _HIDDEN_TAGS or bool(classes and _GUTTER_CLASSES.search(classes))
+        language = _language_hint(attributes)
+        if tag not in _VOID_TAGS:
+            self._stack.append((tag, classes, language, hides))
+            self._hidden += hides
+        if self._hidden:
+            return
+
+        if capture is not None:
+            if tag in _BLOCK_TAGS:
+                capture.newline()
+            if not capture.language:
+                capture.language = language
+            if capture.source_type is None:
+                capture.source_type = _source_type(classes)
+            if capture.inline and tag == "pre":
+                # A <pre> inside a standalone <code> makes it a real block
+                capture.inline = False
+            return
+
+        if tag in _BLOCK_TAGS and not self._recent.endswith("\n"):
+            self._add_text("\n")
+
+        if tag == "title" and self.result.title is None and self._title_parts is None:
+            self._title_parts = []
+        elif tag == "pre" or tag == "code":
+            self._start_capture(source_type=None, inline=tag == "code")
+        elif tag == "div":
+            for fragment, source_type in _EDITOR_ROOTS:
+                if fragment in classes:
+                    self._start_capture(source_type=source_type, inline=False)
+                    break
+
+    def _start_capture(self, source_type: str | None, inline: bool) -> None:
+        _, classes, language, _ = self._stack[-1]
+        self._capture = _Capture(
+            depth=len(self._stack),
+            language=language,
+            source_type=source_type or _source_type(classes),
+            # Cleaned only if the block is kept
+            context_before=self._recent[-CONTEXT_CHARS:],
+            inline=inline,
+        )
+
+    def end(self, tag: str) -> None:
+        # Tolerate unclosed children (<p>, <li>) by closing everything down to the match
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > position:
+            closed_tag, _, _, hides = self._stack.pop()
+            self._hidden -= hides
+            self._close(closed_tag)
+
+    def _close(self, tag: str) -> None:
+        capture = self._capture
+        if capture is not None:
+            if len(self._stack) < capture.depth:
+                self._finish_capture(capture)
+            elif tag in _BLOCK_TAGS and not self._hidden:
+                capture.newline()
+        elif tag == "title" and self._title_parts is not None:
+            title = " ".join("".join(self._title_parts).split())
+            self.result.title = title or None
+            self._title_parts = None
+        elif tag in _BLOCK_TAGS and not self._hidden and not self._recent.endswith("\n"):
+            self._add_text("\n")
+
+    def _finish_capture(self, capture: _Capture) -> None:
+        self._capture = None
+        code = "".join(capture.parts).strip("\n")
+        if not code.strip():
+            return
+        if capture.inline and len(code.strip()) < MIN_INLINE_CODE_CHARS:
+            # Short inline code reads as part of the surrounding prose
+            self._add_text(code)
+            return
+        language, source_type = capture.language, capture.source_type
+        # Fall back to hints on the wrappers around the block, nearest first
+        for _, classes, hint, _ in reversed(self._stack):
+            if language and source_type:
+                break
+            language = language or hint
+            source_type = source_type or _source_type(classes)
+        block = HtmlCodeBlock(
+            code=code,
+            language=language,
+            source_type="inline" if capture.inline else source_type or "standard",
+            context_before=_clean_context(capture.context_before),
+        )
+        (self.result.inline_code if capture.inline else self.result.code_blocks).append(block)
+        self._awaiting_context.append((block, [], 0))
+
+    def data(self, data: str) -> None:
+        if self._hidden:
+            return
+        if self._capture is not None:
+            self._capture.parts.append(data)
+        elif self._title_parts is not None:
+            self._title_parts.append(data)
+        elif data.isspace():
+            if not self._recent.endswith((" ", "\n")):
+                self._add_text(" ")
+        else:
+            self._add_text(_WHITESPACE.sub(" ", data))
+
+    def close(self) -> HtmlPageScan:
+        if self._capture is not None:
+            self._finish_capture(self._capture)
+        for block, parts, _ in self._awaiting_context:
+            block.context_after = _clean_context("".join(parts)[:CONTEXT_CHARS])
+        self._awaiting_context = []
+        return self.result
+
+
+class _StdlibDriver(HTMLParser):
+    """Feeds HTMLParser events to a _PageScanner when lxml is not installed."""
+
+    def __init__(self, scanner: _PageScanner):
+        super().__init__(convert_charrefs=True)
+        self.scanner = scanner
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.scanner.start(tag, dict(attrs))
+
+    def handle_endtag(self, tag: str) -> None:
+        self.scanner.end(tag)
+
+    def handle_data(self, data: str) -> None:
+        self.scanner.data(data)
+
+
+def _clean_context(text: str) -> str:
+    return _BLANK_LINES.sub("\n", text).strip()
+
+
+def scan_html(html: str) -> HtmlPageScan:
+    """
+    Extract the title, code blocks and standalone <code> elements of a page.
+
+    Code text is returned decoded (entities resolved, tags removed), with <br>
+    and line elements turned into newlines. Context is the visible text
+    around the block, not raw HTML.
+    """
+    scanner = _PageScanner()
+    if not html:
+        return scanner.close()
+    try:
+        if LXML_AVAILABLE:
+            parser = etree.HTMLParser(target=scanner, huge_tree=True)
+            parser.feed(html)
+            return parser.close()
+        driver = _StdlibDriver(scanner)
+        driver.feed(html)
+        driver.close()
+    except Exception as e:
+        logger.debug(f"HTML scan stopped early: {e}")
+    return scanner.close()
+
+
+class _StopScan(Exception):
+    pass
+
+
+class _TitleScanner(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] | None = None
+        self.title: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "title" and self.parts is None:
+            self.parts = []
+        elif tag == "body":
+            raise _StopScan
+
+    def handle_data(self, data: str) -> None:
+        if self.parts is not None:
+            self.parts.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self.parts is not None:
+            self.title = " ".join("".join(self.parts).split()) or None
+            raise _StopScan
+
+
+def extract_html_title(html: str) -> str | None:
+    """Get the <title> text of an HTML document, parsing no further than <body>."""
+    scanner = _TitleScanner()
+    try:
+        scanner.feed(html)
+        scanner.close()
+    except _StopScan:
+        pass
+    except Exception as e:
+        logger.debug(f"Title scan stopped early: {e}")
+    return scanner.title
+
+
+async def build_page_result(url: str, markdown: str, html: str | None, stream_extraction: bool) -> dict[str, Any]:
+    """
+    Build the crawl result for one page as it comes off the crawler.
+
+    With stream_extraction the page is scanned immediately and only the scan
+    (code blocks with their context) is kept under "html_scan", so raw HTML is
+    never held for the rest of the crawl. Otherwise the raw HTML is kept under
+    "html" for code extraction after the crawl.
+    """
+    if stream_extraction:
+        scan = await asyncio.to_thread(scan_html, html or "")
+        return {"url": url, "markdown": markdown, "title": scan.title or "Untitled", "html_scan": scan}
+    return {
+        "url": url,
+        "markdown": markdown,
+        "html": html,  # Raw HTML for code extraction
+        "title": extract_html_title(html or "") or "Untitled",
+    }
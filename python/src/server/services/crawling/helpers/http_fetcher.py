@@ -0,0 +1,405 @@
+"""
+HTTP Fetcher Helper
+
+Fast path for static content. Text and markdown files, sitemaps and
+server-rendered HTML are fetched over one pooled httpx client (keep-alive,
+gzip/brotli, HTTP/2 when h2 is installed, conditional GET) instead of a full
+headless Chromium page load. HTML that looks JavaScript-rendered is left to
+the browser, and the share of pages served by the fast path is tracked.
+"""
+
+import asyncio
+import dataclasses
+import importlib.util
+import os
+import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import httpx
+
+from ....config.logfire_config import get_logger
+
+logger = get_logger(__name__)
+
+# Converted markdown shorter than this means the static HTML had no real content
+MIN_STATIC_MARKDOWN_LENGTH = 200
+
+# Responses remembered for conditional GET (ETag / Last-Modified revalidation)
+MAX_VALIDATOR_ENTRIES = 256
+MAX_VALIDATOR_BODY_BYTES = 2 * 1024 * 1024
+
+TEXT_CONTENT_TYPES = ("text/plain", "text/markdown", "text/x-markdown")
+TEXT_FILE_EXTENSIONS = (".txt", ".md", ".markdown", ".mdx")
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Empty single-page-app mount points (React, Next.js, Vue, Nuxt, Svelte, Angular)
+_EMPTY_APP_ROOT = re.compile(
+    r'<(?:div|main)[^>]*\bid=["\'](?:root|app|__next|__nuxt|svelte)["\'][^>]*>\s*</(?:div|main)>'
+    r"|<app-root[^>]*>\s*</app-root>",
+    re.IGNORECASE,
+)
+_NOSCRIPT_JS_NOTICE = re.compile(
+    r"<noscript[^>]*>[^<]*(?:enable|requires?|need)\s+javascript", re.IGNORECASE
+)
+
+
+def http2_enabled() -> bool:
+    """
+    Whether the fetcher should offer HTTP/2 (CRAWL_HTTP2, default: true).
+
+    HTTP/2 needs the optional h2 package (httpx[http2]) and is negotiated via ALPN.
+    """
+    if os.getenv("CRAWL_HTTP2", "true").lower() not in ("true", "1", "yes"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def looks_js_rendered(html: str) -> bool:
+    """Check whether static HTML is an empty app shell that needs a browser to render."""
+    return bool(_EMPTY_APP_ROOT.search(html) or _NOSCRIPT_JS_NOTICE.search(html))
+
+
+def html_to_markdown(html: str, base_url: str, markdown_generator: Any, crawl_config: Any = None) -> str:
+    """
+    Convert HTML with a crawl4ai markdown generator (fit markdown when it has a content filter).
+
+    With the crawl's CrawlerRunConfig, the HTML is first cleaned by its scraping
+    strategy, as crawl4ai does after a browser load. Browser-only steps such as
+    remove_overlay_elements act on the rendered DOM and have no static equivalent.
+    """
+    if crawl_config is not None and getattr(markdown_generator, "content_source", "cleaned_html") == "cleaned_html":
+        params = {key: value for key, value in crawl_config.__dict__.items() if key != "url"}
+        html = crawl_config.scraping_strategy.scrap(base_url, html, **params).cleaned_html
+    generated = markdown_generator.generate_markdown(input_html=html, base_url=base_url, citations=False)
+    return generated.fit_markdown or generated.raw_markdown or ""
+
+
+class _LinkCollector(HTMLParser):
+    """Collects <a href> targets resolved against the page URL."""
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "base":
+            href = dict(attrs).get("href")
+            if href:
+                self.base_url = urljoin(self.base_url, href)
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith(("#", "javascript:", "mailto:", "tel:")):
+                self.hrefs.append(urldefrag(urljoin(self.base_url, href))[0])
+
+
+def extract_links(html: str, page_url: str) -> dict[str, list[dict[str, str]]]:
+    """
+    Extract links in the shape of crawl4ai's CrawlResult.links.
+
+    Links on the page's host (ignoring a leading "www.") are internal.
+    """
+    collector = _LinkCollector(page_url)
+    try:
+        collector.feed(html)
+        collector.close()
+    except Exception as e:
+        logger.debug(f"Link extraction stopped early for {page_url}: {e}")
+
+    page_host = urlparse(page_url).netloc.lower().removeprefix("www.")
+    links: dict[str, list[dict[str, str]]] = {"internal": [], "external": []}
+    for href in dict.fromkeys(collector.hrefs):
+        parsed = urlparse(href)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        kind = "internal" if parsed.netloc.lower().removeprefix("www.") == page_host else "external"
+        links[kind].append({"href": href})
+    return links
+
+
+@dataclass
+class FetchResult:
+    """A fetched response body."""
+
+    url: str  # Final URL after redirects
+    content_type: str
+    content: bytes
+    encoding: str = "utf-8"
+    not_modified: bool = False  # Served from the validator cache after a 304
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    @property
+    def is_html(self) -> bool:
+        return "html" in self.content_type
+
+    def is_text_file(self, requested_url: str) -> bool:
+        """Plain text/markdown, by content type or (for generic types) by file extension."""
+        if self.content_type in TEXT_CONTENT_TYPES:
+            return True
+        if self.is_html or self.content_type.startswith(("image/", "audio/", "video/")):
+            return False
+        path = urlparse(requested_url).path.lower()
+        return path.endswith(TEXT_FILE_EXTENSIONS)
+
+
+class StaticMarkdown(str):
+    """Markdown string exposing the raw_markdown/fit_markdown attributes of crawl4ai results."""
+
+    @property
+    def raw_markdown(self) -> str:
+        return str(self)
+
+    @property
+    def fit_markdown(self) -> str:
+        return str(self)
+
+
+@dataclass
+class StaticCrawlResult:
+    """A page served by the fast path, shaped like crawl4ai's CrawlResult."""
+
+    url: str
+    markdown: StaticMarkdown
+    html: str = ""
+    links: dict[str, list[dict[str, str]]] = field(default_factory=lambda: {"internal": [], "external": []})
+    success: bool = True
+    error_message: str = ""
+
+
+async def chain_results(
+    static_results: Iterable[StaticCrawlResult], browser_results: AsyncIterator[Any] | None
+) -> AsyncIterator[Any]:
+    """Yield fast-path results first, then stream the browser results (if any)."""
+    for result in static_results:
+        yield result
+    if browser_results is not None:
+        async for result in browser_results:
+            yield result
+
+
+class HttpFetcher:
+    """
+    Pooled HTTP client for the crawl fast path.
+
+    Counts every fast-path attempt as a hit (served without the browser) or a
+    fallback (left to Chromium); get_stats() reports the hit ratio.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._validators: OrderedDict[str, tuple[str | None, str | None, FetchResult]] = OrderedDict()
+        self._stats = {"attempts": 0, "hits": 0, "fallbacks": 0, "not_modified": 0, "errors": 0}
+        self.http2 = http2_enabled()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            # httpx advertises gzip/deflate (and br/zstd when brotli/zstandard are installed)
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                follow_redirects=True,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0),
+                headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,text/markdown,text/plain,application/xml;q=0.9,*/*;q=0.8",
+                },
+                transport=self._transport,
+            )
+        return self._client
+
+    async def fetch(self, url: str) -> FetchResult | None:
+        """
+        GET a URL, revalidating a remembered response with If-None-Match / If-Modified-Since.
+
+        Returns:
+            FetchResult for a 200 (or a 304 of a remembered response), None otherwise
+        """
+        headers = {}
+        remembered = self._validators.get(url)
+        if remembered:
+            etag, last_modified, _ = remembered
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = await self._get_client().get(url, headers=headers)
+        except httpx.HTTPError as e:
+            self._stats["errors"] += 1
+            logger.debug(f"Fast path fetch failed for {url}: {e}")
+            return None
+
+        if response.status_code == 304 and remembered:
+            self._stats["not_modified"] += 1
+            self._validators.move_to_end(url)
+            return dataclasses.replace(remembered[2], not_modified=True)
+
+        if response.status_code != 200:
+            logger.debug(f"Fast path fetch of {url} returned HTTP {response.status_code}")
+            return None
+
+        result = FetchResult(
+            url=str(response.url),
+            content_type=response.headers.get("content-type", "").split(";")[0].strip().lower(),
+            content=response.content,
+            encoding=response.encoding or "utf-8",
+        )
+        self._remember(url, response, result)
+        return result
+
+    def _remember(self, url: str, response: httpx.Response, result: FetchResult) -> None:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not (etag or last_modified) or len(result.content) > MAX_VALIDATOR_BODY_BYTES:
+            self._validators.pop(url, None)
+            return
+        self._validators[url] = (etag, last_modified, result)
+        self._validators.move_to_end(url)
+        while len(self._validators) > MAX_VALIDATOR_ENTRIES:
+            self._validators.popitem(last=False)
+
+    def _record(self, hit: bool) -> None:
+        self._stats["attempts"] += 1
+        self._stats["hits" if hit else "fallbacks"] += 1
+
+    async def fetch_text(self, url: str) -> str | None:
+        """
+        Fetch a text/markdown file directly.
+
+        Returns:
+            The file content, or None when the browser should handle the URL
+        """
+        result = await self.fetch(url)
+        text = result.text if result and result.is_text_file(url) else None
+        self._record(bool(text and text.strip()))
+        return text if text and text.strip() else None
+
+    async def fetch_page(
+        self, url: str, markdown_generator: Any, crawl_config: Any = None
+    ) -> StaticCrawlResult | None:
+        """
+        Fetch a page and convert it to markdown without a browser.
+
+        Text files are returned as-is. HTML is cleaned with the crawl config's
+        scraping strategy and converted with the crawl's markdown generator (in a
+        worker thread) unless it looks JavaScript-rendered or converts to almost
+        nothing.
+
+        Returns:
+            StaticCrawlResult, or None when the browser should handle the URL
+        """
+        result = await self.fetch(url)
+        page = None
+        if result is not None:
+            if result.is_text_file(url):
+                text = result.text
+                if text.strip():
+                    page = StaticCrawlResult(url=url, markdown=StaticMarkdown(text))
+            elif result.is_html:
+                page = await self._convert_html(url, result, markdown_generator, crawl_config)
+        self._record(page is not None)
+        return page
+
+    async def _convert_html(
+        self, url: str, result: FetchResult, markdown_generator: Any, crawl_config: Any = None
+    ) -> StaticCrawlResult | None:
+        html = result.text
+        if looks_js_rendered(html):
+            return None
+
+        try:
+            generated = await asyncio.to_thread(
+                html_to_markdown, html, result.url, markdown_generator, crawl_config
+            )
+        except Exception as e:
+            logger.debug(f"Fast path markdown conversion failed for {url}: {e}")
+            return None
+
+        if len(generated.strip()) < MIN_STATIC_MARKDOWN_LENGTH:
+            return None
+
+        return StaticCrawlResult(
+            url=url,
+            markdown=StaticMarkdown(generated),
+            html=html,
+            links=extract_links(html, result.url),
+        )
+
+    async def fetch_pages(
+        self,
+        urls: list[str],
+        markdown_generator: Any,
+        max_concurrent: int = 10,
+        crawl_config: Any = None,
+        cancellation_check: Callable[[], None] | None = None,
+    ) -> dict[str, StaticCrawlResult]:
+        """
+        Fetch several pages through the fast path concurrently.
+
+        Args:
+            urls: Page URLs
+            markdown_generator: The crawl's markdown generator
+            max_concurrent: Maximum concurrent fetches
+            crawl_config: The crawl's CrawlerRunConfig, whose scraping strategy cleans HTML
+            cancellation_check: Called before each URL is fetched; raises
+                asyncio.CancelledError to stop the remaining fetches
+
+        Returns:
+            Mapping of URL to result for the pages served without a browser
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def fetch_one(url: str) -> tuple[str, StaticCrawlResult | None]:
+            async with semaphore:
+                if cancellation_check:
+                    cancellation_check()
+                return url, await self.fetch_page(url, markdown_generator, crawl_config)
+
+        pages = await asyncio.gather(*(fetch_one(url) for url in urls))
+        return {url: page for url, page in pages if page is not None}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get fast-path counters (attempts, hits, fallbacks, not_modified, errors, hit_ratio, http2)."""
+        attempts = self._stats["attempts"]
+        return {
+            **self._stats,
+            "hit_ratio": round(self._stats["hits"] / attempts, 3) if attempts else 0.0,
+            "http2": self.http2,
+        }
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_http_fetcher: HttpFetcher | None = None
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """Get the process-wide fast-path fetcher."""
+    global _http_fetcher
+    if _http_fetcher is None:
+        _http_fetcher = HttpFetcher()
+    return _http_fetcher
+
+
+async def close_http_fetcher() -> None:
+    """Close the process-wide fetcher's connections."""
+    if _http_fetcher is not None:
+        await _http_fetcher.aclose()
@@ -31,7 +31,7 @@ class UrlTypeHandler:
         Args:
             url_handler: URL handler instance
             crawl_markdown_file: Function to crawl markdown files
-            parse_sitemap: Function to parse sitemaps
+            parse_sitemap: Async function to fetch and parse sitemaps
             crawl_batch_with_progress: Function for batch crawling
             crawl_recursive_with_progress: Function for recursive crawling
             is_self_link_checker: Function to check if link is self-referential
@@ -143,7 +143,7 @@ class UrlTypeHandler:
         self, url: str, progress_callback: Callable | None
     ) -> tuple[list[dict[str, Any]], str]:
         """Handle sitemap crawling."""
-        sitemap_urls = self.parse_sitemap(url)
+        sitemap_urls = await self.parse_sitemap(url)
 
         if not sitemap_urls:
             return [], "sitemap"
@@ -133,3 +133,20 @@ class ISitemapCrawlStrategy(Protocol):
             List of URLs from the sitemap
         """
         ...
+
+    async def fetch_sitemap(
+        self,
+        sitemap_url: str,
+        cancellation_check: Callable[[], None] | None = None,
+    ) -> list[str]:
+        """
+        Fetch and parse a sitemap without blocking the event loop.
+
+        Args:
+            sitemap_url: URL of the sitemap
+            cancellation_check: Optional function to check for cancellation
+
+        Returns:
+            List of URLs from the sitemap
+        """
+        ...
@@ -12,6 +12,8 @@ from crawl4ai import CacheMode, CrawlerRunConfig, MemoryAdaptiveDispatcher
 
 from ....config.logfire_config import get_logger
 from ...credential_service import credential_service
+from ..helpers.html_scanner import build_page_result
+from ..helpers.http_fetcher import chain_results, get_http_fetcher
 
 logger = get_logger(__name__)
 
@@ -93,6 +95,8 @@ class BatchCrawlStrategy:
             if memory_threshold != raw_memory_threshold:
                 logger.warning(f"Invalid MEMORY_THRESHOLD_PERCENT={raw_memory_threshold}, clamped to {memory_threshold}")
             check_interval = float(settings.get("DISPATCHER_CHECK_INTERVAL", "0.5"))
+            fast_path = str(settings.get("CRAWL_FAST_PATH", "true")).lower() == "true"
+            stream_extraction = str(settings.get("CRAWL_STREAM_EXTRACTION", "true")).lower() == "true"
         except (ValueError, KeyError, TypeError) as e:
             # Critical configuration errors should fail fast
             logger.error(f"Invalid crawl settings format: {e}", exc_info=True)
@@ -107,6 +111,8 @@ class BatchCrawlStrategy:
                 max_concurrent = 10  # Safe default to prevent memory issues
             memory_threshold = 80.0
             check_interval = 0.5
+            fast_path = True
+            stream_extraction = True
             settings = {}  # Empty dict for defaults
 
         # Check if any URLs are documentation sites
@@ -215,12 +221,39 @@ class BatchCrawlStrategy:
             logger.info(
                 f"Starting parallel crawl of batch {batch_start + 1}-{batch_end} ({len(batch_urls)} URLs)"
             )
-            batch_results = await self.crawler.arun_many(
-                urls=batch_urls, config=crawl_config, dispatcher=dispatcher
-            )
+            # Static pages come straight over HTTP; only the rest need a browser
+            static_pages = {}
+            if fast_path:
+                try:
+                    static_pages = await get_http_fetcher().fetch_pages(
+                        batch_urls, self.markdown_generator, max_concurrent, crawl_config, cancellation_check
+                    )
+                except asyncio.CancelledError:
+                    cancelled = True
+                    await report_progress(
+                        min(int((processed / max(total_urls, 1)) * 100), 99),
+                        "Crawl cancelled",
+                        status="cancelled",
+                        total_pages=total_urls,
+                        processed_pages=processed,
+                        successful_count=len(successful_results),
+                    )
+                    break
+            browser_urls = [url for url in batch_urls if url not in static_pages]
+            if static_pages:
+                logger.info(
+                    f"Fast path served {len(static_pages)}/{len(batch_urls)} URLs, "
+                    f"{len(browser_urls)} left for the browser"
+                )
+
+            batch_results = None
+            if browser_urls:
+                batch_results = await self.crawler.arun_many(
+                    urls=browser_urls, config=crawl_config, dispatcher=dispatcher
+                )
 
             # Handle streaming results
-            async for result in batch_results:
+            async for result in chain_results(static_pages.values(), batch_results):
                 # Check for cancellation during streaming
                 if cancellation_check:
                     try:
@@ -245,30 +278,18 @@ class BatchCrawlStrategy:
                     # Map back to original URL
                     original_url = url_mapping.get(result.url, result.url)
 
-                    # Extract title from HTML <title> tag
-                    title = "Untitled"
-                    if result.html:
-                        import re
-                        title_match = re.search(r'<title[^>]*>(.*?)</title>', result.html, re.IGNORECASE | re.DOTALL)
-                        if title_match:
-                            extracted_title = title_match.group(1).strip()
-                            # Clean up HTML entities
-                            extracted_title = extracted_title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
-                            if extracted_title:
-                                title = extracted_title
+                    # Title and code blocks come from the HTML as each page arrives
+                    page = await build_page_result(
+                        original_url, result.markdown.fit_markdown, result.html, stream_extraction
+                    )
 
                     # Fallback to link text if HTML title extraction failed
-                    if title == "Untitled" and link_text_fallbacks:
+                    if page["title"] == "Untitled" and link_text_fallbacks:
                         fallback_text = link_text_fallbacks.get(original_url, "")
                         if fallback_text:
-                            title = fallback_text
-
-                    successful_results.append({
-                        "url": original_url,
-                        "markdown": result.markdown.fit_markdown,
-                        "html": result.html,  # Use raw HTML
-                        "title": title,
-                    })
+                            page["title"] = fallback_text
+
+                    successful_results.append(page)
                 else:
                     logger.warning(
                         f"Failed to crawl {result.url}: {getattr(result, 'error_message', 'Unknown error')}"
@@ -13,6 +13,8 @@ from crawl4ai import CacheMode, CrawlerRunConfig, MemoryAdaptiveDispatcher
 
 from ....config.logfire_config import get_logger
 from ...credential_service import credential_service
+from ..helpers.html_scanner import build_page_result
+from ..helpers.http_fetcher import chain_results, get_http_fetcher
 from ..helpers.url_handler import URLHandler
 
 logger = get_logger(__name__)
@@ -96,6 +98,8 @@ class RecursiveCrawlStrategy:
             if memory_threshold != raw_memory_threshold:
                 logger.warning(f"Invalid MEMORY_THRESHOLD_PERCENT={raw_memory_threshold}, clamped to {memory_threshold}")
             check_interval = float(settings.get("DISPATCHER_CHECK_INTERVAL", "0.5"))
+            fast_path = str(settings.get("CRAWL_FAST_PATH", "true")).lower() == "true"
+            stream_extraction = str(settings.get("CRAWL_STREAM_EXTRACTION", "true")).lower() == "true"
         except (ValueError, KeyError, TypeError) as e:
             # Critical configuration errors should fail fast
             logger.error(f"Invalid crawl settings format: {e}", exc_info=True)
@@ -110,6 +114,8 @@ class RecursiveCrawlStrategy:
                 max_concurrent = 10  # Safe default to prevent memory issues
             memory_threshold = 80.0
             check_interval = 0.5
+            fast_path = True
+            stream_extraction = True
             settings = {}  # Empty dict for defaults
 
         # Check if start URLs include documentation sites
@@ -250,15 +256,43 @@ class RecursiveCrawlStrategy:
                     processed_pages=total_processed,
                 )
 
+                # Static pages come straight over HTTP; only the rest need a browser
+                static_pages = {}
+                if fast_path:
+                    try:
+                        static_pages = await get_http_fetcher().fetch_pages(
+                            transformed_batch_urls,
+                            self.markdown_generator,
+                            max_concurrent,
+                            run_config,
+                            cancellation_check,
+                        )
+                    except asyncio.CancelledError:
+                        cancelled = True
+                        await report_progress(
+                            min(int((total_processed / max(total_discovered, 1)) * 100), 99),
+                            "Crawl cancelled during batch processing",
+                            status="cancelled",
+                            total_pages=total_discovered,
+                            processed_pages=total_processed,
+                        )
+                        break
+                browser_urls = [url for url in transformed_batch_urls if url not in static_pages]
+
                 # Use arun_many for native parallel crawling with streaming
-                logger.info(f"Starting parallel crawl of {len(batch_urls)} URLs with arun_many")
-                batch_results = await self.crawler.arun_many(
-                    urls=transformed_batch_urls, config=run_config, dispatcher=dispatcher
+                logger.info(
+                    f"Starting parallel crawl of {len(batch_urls)} URLs "
+                    f"({len(static_pages)} via fast path, {len(browser_urls)} with arun_many)"
                 )
+                batch_results = None
+                if browser_urls:
+                    batch_results = await self.crawler.arun_many(
+                        urls=browser_urls, config=run_config, dispatcher=dispatcher
+                    )
 
-                # Handle streaming results from arun_many
+                # Handle streaming results from the fast path and arun_many
                 i = 0
-                async for result in batch_results:
+                async for result in chain_results(static_pages.values(), batch_results):
                     # Check for cancellation during streaming results
                     if cancellation_check:
                         try:
@@ -285,24 +319,10 @@ class RecursiveCrawlStrategy:
                     total_processed += 1
 
                     if result.success and result.markdown and result.markdown.fit_markdown:
-                        # Extract title from HTML <title> tag
-                        title = "Untitled"
-                        if result.html:
-                            import re
-                            title_match = re.search(r'<title[^>]*>(.*?)</title>', result.html, re.IGNORECASE | re.DOTALL)
-                            if title_match:
-                                extracted_title = title_match.group(1).strip()
-                                # Clean up HTML entities
-                                extracted_title = extracted_title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
-                                if extracted_title:
-                                    title = extracted_title
-
-                        results_all.append({
-                            "url": original_url,
-                            "markdown": result.markdown.fit_markdown,
-                            "html": result.html,  # Always use raw HTML for code extraction
-                            "title": title,
-                        })
+                        # Title and code blocks come from the HTML as each page arrives
+                        results_all.append(await build_page_result(
+                            original_url, result.markdown.fit_markdown, result.html, stream_extraction
+                        ))
                         depth_successful += 1
 
                         # Find internal links for next depth
@@ -11,6 +11,8 @@ from typing import Any
 from crawl4ai import CacheMode, CrawlerRunConfig
 
 from ....config.logfire_config import get_logger
+from ..helpers.html_scanner import extract_html_title
+from ..helpers.http_fetcher import get_http_fetcher
 
 logger = get_logger(__name__)
 
@@ -185,16 +187,7 @@ class SinglePageCrawlStrategy:
                     logger.info(f"Markdown sample for getting-started: {markdown_sample}")
 
                 # Extract title from HTML <title> tag
-                title = "Untitled"
-                if result.html:
-                    import re
-                    title_match = re.search(r'<title[^>]*>(.*?)</title>', result.html, re.IGNORECASE | re.DOTALL)
-                    if title_match:
-                        extracted_title = title_match.group(1).strip()
-                        # Clean up HTML entities
-                        extracted_title = extracted_title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
-                        if extracted_title:
-                            title = extracted_title
+                title = extract_html_title(result.html or "") or "Untitled"
 
                 return {
                     "success": True,
@@ -271,6 +264,18 @@ class SinglePageCrawlStrategy:
                 processed_pages=0
             )
 
+            # Text files need no rendering: fetch them directly, keeping the browser as fallback
+            text = await get_http_fetcher().fetch_text(url)
+            if text is not None:
+                logger.info(f"Fetched markdown file without browser: {url}")
+                await report_progress(
+                    end_progress,
+                    f"Text file crawled successfully: {original_url}",
+                    total_pages=1,
+                    processed_pages=1
+                )
+                return [{'url': original_url, 'markdown': text, 'html': ''}]
+
             # Use consistent configuration even for text files
             crawl_config = CrawlerRunConfig(
                 cache_mode=CacheMode.ENABLED,
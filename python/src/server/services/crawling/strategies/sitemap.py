@@ -10,6 +10,7 @@ from xml.etree import ElementTree
 import requests
 
 from ....config.logfire_config import get_logger
+from ..helpers.http_fetcher import get_http_fetcher
 
 logger = get_logger(__name__)
 
@@ -45,15 +46,7 @@ class SitemapCrawlStrategy:
                 logger.error(f"Failed to fetch sitemap: HTTP {resp.status_code}")
                 return urls
 
-            try:
-                tree = ElementTree.fromstring(resp.content)
-                urls = [loc.text for loc in tree.findall('.//{*}loc') if loc.text]
-                logger.info(f"Successfully extracted {len(urls)} URLs from sitemap")
-
-            except ElementTree.ParseError:
-                logger.exception(f"Error parsing sitemap XML from {sitemap_url}")
-            except Exception:
-                logger.exception(f"Unexpected error parsing sitemap from {sitemap_url}")
+            urls = self._extract_urls(resp.content, sitemap_url)
 
         except requests.exceptions.RequestException:
             logger.exception(f"Network error fetching sitemap from {sitemap_url}")
@@ -61,3 +54,44 @@ class SitemapCrawlStrategy:
             logger.exception(f"Unexpected error in sitemap parsing for {sitemap_url}")
 
         return urls
+
+    async def fetch_sitemap(
+        self, sitemap_url: str, cancellation_check: Callable[[], None] | None = None
+    ) -> list[str]:
+        """
+        Fetch and parse a sitemap over the pooled fast-path client without blocking the event loop.
+
+        Args:
+            sitemap_url: URL of the sitemap to parse
+            cancellation_check: Optional function to check for cancellation
+
+        Returns:
+            List of URLs extracted from the sitemap
+        """
+        if cancellation_check:
+            try:
+                cancellation_check()
+            except asyncio.CancelledError:
+                logger.info("Sitemap parsing cancelled by user")
+                raise
+
+        logger.info(f"Fetching sitemap: {sitemap_url}")
+        result = await get_http_fetcher().fetch(sitemap_url)
+        if result is None:
+            logger.error(f"Failed to fetch sitemap: {sitemap_url}")
+            return []
+
+        return self._extract_urls(result.content, sitemap_url)
+
+    def _extract_urls(self, content: bytes, sitemap_url: str) -> list[str]:
+        """Extract <loc> URLs from sitemap XML."""
+        try:
+            tree = ElementTree.fromstring(content)
+            urls = [loc.text for loc in tree.findall('.//{*}loc') if loc.text]
+            logger.info(f"Successfully extracted {len(urls)} URLs from sitemap")
+            return urls
+        except ElementTree.ParseError:
+            logger.exception(f"Error parsing sitemap XML from {sitemap_url}")
+        except Exception:
+            logger.exception(f"Unexpected error parsing sitemap from {sitemap_url}")
+        return []
@@ -5,9 +5,11 @@ Handles loading, storing, and accessing credentials with encryption for sensitiv
 Credentials include API keys, service credentials, and application configuration.
 """
 
+import asyncio
 import base64
 import os
 import re
+import threading
 import time
 from dataclasses import dataclass
 
@@ -24,6 +26,28 @@ from ..config.logfire_config import get_logger
 
 logger = get_logger(__name__)
 
+# PBKDF2 with 100k iterations costs tens of milliseconds, so the Fernet key is
+# derived once per process (per service key) and reused for every encrypt/decrypt.
+_derived_keys: dict[str, bytes] = {}
+_derived_keys_lock = threading.Lock()
+
+def _derive_encryption_key(service_key: str) -> bytes:
+    """Derive (once) the Fernet key for a service key."""
+    key = _derived_keys.get(service_key)
+    if key is None:
+        with _derived_keys_lock:
+            key = _derived_keys.get(service_key)
+            if key is None:
+                kdf = PBKDF2HMAC(
+                    algorithm=hashes.SHA256(),
+                    length=32,
+                    salt=b"static_salt_for_credentials",  # In production, consider using a configurable salt
+                    iterations=100000,
+                )
+                key = base64.urlsafe_b64encode(kdf.derive(service_key.encode()))
+                _derived_keys[service_key] = key
+    return key
+
 @dataclass
 class CredentialItem:
     """Represents a credential/setting item."""
@@ -58,21 +82,24 @@ class CredentialService:
         self._rag_settings_cache: dict[str, Any] | None = None
         self._rag_cache_timestamp: float | None = None
         self._rag_cache_ttl = 300  # 5 minutes TTL for RAG settings cache
+        # Decrypted secrets: key -> (encrypted_value, plaintext, expires_at)
+        self._decrypted_cache: dict[str, tuple[str, str, float]] = {}
+        self._decrypted_cache_ttl = 60  # Short TTL so plaintext secrets don't linger
 
-    def _get_encryption_key(self) -> bytes:
-        """Generate encryption key from environment variables."""
+    @staticmethod
+    def _get_service_key() -> str:
         # Use Supabase service key as the basis for encryption key
-        service_key = os.getenv("SUPABASE_SERVICE_KEY", "default-key-for-development")
-
-        # Generate a proper encryption key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"static_salt_for_credentials",  # In production, consider using a configurable salt
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(service_key.encode()))
-        return key
+        return os.getenv("SUPABASE_SERVICE_KEY", "default-key-for-development")
+
+    def _get_encryption_key(self) -> bytes:
+        """Get the encryption key derived from environment variables (derived once per process)."""
+        return _derive_encryption_key(self._get_service_key())
+
+    async def _ensure_encryption_key(self) -> None:
+        """Derive the encryption key in a worker thread so the event loop never runs PBKDF2."""
+        service_key = self._get_service_key()
+        if service_key not in _derived_keys:
+            await asyncio.to_thread(_derive_encryption_key, service_key)
 
     def _encrypt_value(self, value: str) -> str:
         """Encrypt a sensitive value using Fernet encryption."""
@@ -125,8 +152,13 @@ class CredentialService:
 
             self._cache = credentials
             self._cache_initialized = True
+            self._decrypted_cache.clear()
             logger.info(f"Loaded {len(credentials)} credentials from database")
 
+            if any(isinstance(value, dict) for value in credentials.values()):
+                # Warm the key off-loop before the first decrypt needs it
+                await self._ensure_encryption_key()
+
             return credentials
 
         except Exception as e:
@@ -144,12 +176,24 @@ class CredentialService:
         if isinstance(value, dict) and value.get("is_encrypted") and decrypt:
             encrypted_value = value.get("encrypted_value")
             if encrypted_value:
+                cached = self._decrypted_cache.get(key)
+                if cached and cached[0] == encrypted_value and cached[2] > time.monotonic():
+                    return cached[1]
+
                 try:
-                    return self._decrypt_value(encrypted_value)
+                    await self._ensure_encryption_key()
+                    decrypted = self._decrypt_value(encrypted_value)
                 except Exception as e:
                     logger.error(f"Failed to decrypt credential {key}: {e}")
                     return default
 
+                self._decrypted_cache[key] = (
+                    encrypted_value,
+                    decrypted,
+                    time.monotonic() + self._decrypted_cache_ttl,
+                )
+                return decrypted
+
         return value
 
     async def get_encrypted_credential_raw(self, key: str) -> str | None:
@@ -173,7 +217,9 @@ class CredentialService:
     ) -> bool:
         """Set a credential value."""
         try:
+            self._decrypted_cache.pop(key, None)
             if is_encrypted:
+                await self._ensure_encryption_key()
                 encrypted_value = self._encrypt_value(value)
                 data = {
                     "key": key,
@@ -251,6 +297,7 @@ class CredentialService:
             # Remove from cache
             if key in self._cache:
                 del self._cache[key]
+            self._decrypted_cache.pop(key, None)
 
             # Invalidate RAG settings cache if this was a rag_strategy setting
             # We check the cache to see if the deleted key was in rag_strategy category
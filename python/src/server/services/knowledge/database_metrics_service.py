@@ -41,33 +41,16 @@ class DatabaseMetricsService:
         try:
             safe_logfire_info("Getting database metrics")
 
-            metrics = {}
-
-            # Sources count - get all sources and count them
-            sources = await self.repository.list_sources()
-            metrics["sources_count"] = len(sources)
-
-            # Crawled pages count - sum up pages across all sources
-            pages_count = 0
-            for source in sources:
-                source_id = source.get("source_id")
-                if source_id:
-                    source_page_count = await self.repository.get_page_count_by_source(source_id)
-                    pages_count += source_page_count
-            metrics["pages_count"] = pages_count
-
-            # Code examples count - sum up code examples across all sources
-            code_examples_count = 0
-            try:
-                for source in sources:
-                    source_id = source.get("source_id")
-                    if source_id:
-                        source_code_count = await self.repository.get_code_example_count_by_source(source_id)
-                        code_examples_count += source_code_count
-            except Exception:
-                # If code examples table doesn't exist or errors, set to 0
-                code_examples_count = 0
-            metrics["code_examples_count"] = code_examples_count
+            # Totals are maintained by the repository on every write, so this is one read
+            stats = await self.repository.get_corpus_stats()
+            metrics = {
+                "sources_count": stats["sources_count"],
+                "pages_count": stats["page_count"],
+                "chunks_count": stats["chunk_count"],
+                "code_examples_count": stats["code_example_count"],
+                "words_count": stats["word_count"],
+                "content_bytes": stats["content_bytes"],
+            }
 
             # Add timestamp
             metrics["timestamp"] = datetime.now().isoformat()
@@ -10,6 +10,7 @@ from typing import Any
 from ...config.logfire_config import safe_logfire_error, safe_logfire_info
 from ...repositories.database_repository import DatabaseRepository
 from ...repositories.repository_factory import get_repository
+from ...utils.pagination_utils import decode_cursor, encode_cursor
 
 class KnowledgeItemService:
     """
@@ -80,21 +81,13 @@ class KnowledgeItemService:
             chunk_counts = {}
 
             if source_ids:
-                # Batch fetch first URLs using repository
-                for source_id in source_ids:
-                    pages = await self.repository.list_pages_by_source(source_id, limit=1)
-                    if pages:
-                        first_urls[source_id] = pages[0].get("url", f"source://{source_id}")
-
-                # Get code example counts per source
-                for source_id in source_ids:
-                    count = await self.repository.get_code_example_count_by_source(source_id)
-                    code_example_counts[source_id] = count
-
-                # Get page counts per source (chunks)
-                for source_id in source_ids:
-                    count = await self.repository.get_page_count_by_source(source_id)
-                    chunk_counts[source_id] = count
+                # Counts and first URLs for all sources on the page in one query
+                source_stats = await self.repository.get_source_stats_by_sources(source_ids)
+                for source_id, stats in source_stats.items():
+                    if stats.get("first_page_url"):
+                        first_urls[source_id] = stats["first_page_url"]
+                    code_example_counts[source_id] = stats.get("code_example_count", 0)
+                    chunk_counts[source_id] = stats.get("page_count", 0)
 
                 safe_logfire_info(f"Code example counts: {code_example_counts}")
 
@@ -470,7 +463,9 @@ class KnowledgeItemService:
         source_id: str,
         domain_filter: str | None = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: str | None = None,
+        include_content: bool = True
     ) -> dict[str, Any]:
         """
         Get paginated document chunks for a specific source.
@@ -479,12 +474,22 @@ class KnowledgeItemService:
             source_id: The source ID to get chunks for
             domain_filter: Optional domain filter for URLs (not yet implemented)
             limit: Maximum number of chunks to return
-            offset: Number of chunks to skip for pagination
+            offset: Number of chunks to skip for pagination (ignored when cursor is given)
+            cursor: Keyset cursor from a previous response's next_cursor
+            include_content: Whether to include chunk content (False returns metadata only)
 
         Returns:
-            Dict with chunks, total count, and pagination info
+            Dict with chunks, total count, pagination info and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         try:
+            after = None
+            if cursor:
+                url, chunk_number = decode_cursor(cursor, expected_length=2)
+                after = (url, chunk_number)
+
             # Get total count for this source
             total = await self.repository.get_page_count_by_source(source_id)
 
@@ -492,8 +497,24 @@ class KnowledgeItemService:
             # Note: list_crawled_pages_by_source returns archon_crawled_pages data
             chunks = await self.repository.list_crawled_pages_by_source(
                 source_id=source_id,
-                limit=limit,
-                offset=offset
+                limit=limit + 1 if after else limit,
+                offset=None if after else offset,
+                after=after,
+                include_content=include_content
+            )
+
+            if after:
+                # One extra row tells whether another page exists
+                has_more = len(chunks) > limit
+                chunks = chunks[:limit]
+            else:
+                has_more = offset + limit < total
+
+            # Cursor is taken before domain filtering so the next page continues after the raw rows
+            next_cursor = (
+                encode_cursor(chunks[-1].get("url", ""), chunks[-1].get("chunk_number", 0))
+                if chunks and has_more
+                else None
             )
 
             # Apply domain filtering if provided (manual filter since repository doesn't support it yet)
@@ -514,7 +535,8 @@ class KnowledgeItemService:
                 "total": total,
                 "limit": limit,
                 "offset": offset,
-                "has_more": offset + limit < total,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
             }
 
         except Exception as e:
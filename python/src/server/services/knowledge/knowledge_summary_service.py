@@ -75,11 +75,10 @@ class KnowledgeSummaryService:
             summaries = []
             
             if source_ids:
-                # Get document counts in a single query
-                doc_counts = await self._get_document_counts_batch(source_ids)
-                
-                # Get code example counts in a single query
-                code_counts = await self._get_code_example_counts_batch(source_ids)
+                # Get document and code example counts in a single read of the source stats
+                source_stats = await self._get_source_stats_batch(source_ids)
+                doc_counts = self._get_document_counts_batch(source_ids, source_stats)
+                code_counts = self._get_code_example_counts_batch(source_ids, source_stats)
                 
                 # Get first URLs in a single query
                 first_urls = await self._get_first_urls_batch(source_ids)
@@ -160,53 +159,52 @@ class KnowledgeSummaryService:
             safe_logfire_error(f"Failed to get knowledge summaries | error={str(e)}")
             raise
     
-    async def _get_document_counts_batch(self, source_ids: list[str]) -> dict[str, int]:
+    async def _get_source_stats_batch(self, source_ids: list[str]) -> dict[str, dict[str, Any]]:
         """
-        Get document counts for multiple sources in a single query.
+        Get the stored stats for multiple sources in a single query.
 
         Args:
             source_ids: List of source IDs
 
         Returns:
-            Dict mapping source_id to document count
+            Dict mapping source_id to its stats (empty if they cannot be read)
         """
         try:
-            counts = {}
+            return await self.repository.get_source_stats_by_sources(source_ids)
 
-            # Use repository method for each source
-            for source_id in source_ids:
-                count = await self.repository.get_page_count_by_source(source_id)
-                counts[source_id] = count
+        except Exception as e:
+            safe_logfire_error(f"Failed to get source stats | error={str(e)}")
+            return {}
 
-            return counts
+    def _get_document_counts_batch(
+        self, source_ids: list[str], source_stats: dict[str, dict[str, Any]]
+    ) -> dict[str, int]:
+        """
+        Get document counts for multiple sources from their stats.
 
-        except Exception as e:
-            safe_logfire_error(f"Failed to get document counts | error={str(e)}")
-            return {sid: 0 for sid in source_ids}
+        Args:
+            source_ids: List of source IDs
+            source_stats: Stats from _get_source_stats_batch
+
+        Returns:
+            Dict mapping source_id to document count
+        """
+        return {sid: source_stats.get(sid, {}).get("page_count", 0) for sid in source_ids}
     
-    async def _get_code_example_counts_batch(self, source_ids: list[str]) -> dict[str, int]:
+    def _get_code_example_counts_batch(
+        self, source_ids: list[str], source_stats: dict[str, dict[str, Any]]
+    ) -> dict[str, int]:
         """
-        Get code example counts for multiple sources efficiently.
+        Get code example counts for multiple sources from their stats.
 
         Args:
             source_ids: List of source IDs
+            source_stats: Stats from _get_source_stats_batch
 
         Returns:
             Dict mapping source_id to code example count
         """
-        try:
-            counts = {}
-
-            # Use repository method for each source
-            for source_id in source_ids:
-                count = await self.repository.get_code_example_count_by_source(source_id)
-                counts[source_id] = count
-
-            return counts
-
-        except Exception as e:
-            safe_logfire_error(f"Failed to get code example counts | error={str(e)}")
-            return {sid: 0 for sid in source_ids}
+        return {sid: source_stats.get(sid, {}).get("code_example_count", 0) for sid in source_ids}
     
     async def _get_first_urls_batch(self, source_ids: list[str]) -> dict[str, str]:
         """
@@ -0,0 +1,289 @@
+"""
+MCP Usage Rollups
+
+Streaming aggregation of MCP tool usage events into the hourly, daily and
+per-source rollup tables. The MCP usage tracker feeds every event into a
+UsageRollupAggregator and writes the accumulated deltas when it flushes, so
+the analytics endpoints read a few compact rows per bucket instead of scanning
+raw events.
+
+Latency is summarized in a fixed log-scale histogram (1ms .. 60s plus an
+overflow bucket). Histograms of the same layout merge by adding counts, which
+keeps rollups mergeable across flushes, hours and processes; percentiles are
+reported as the upper bound of the bucket they fall into.
+
+This module is shared by the MCP server (writer) and the API server (reader),
+so it must only depend on the standard library.
+"""
+
+import bisect
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+# Upper bounds (inclusive) of the latency buckets; one overflow bucket follows
+LATENCY_BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+HISTOGRAM_SIZE = len(LATENCY_BUCKET_BOUNDS_MS) + 1
+
+HOUR_BUCKET_FORMAT = "%Y-%m-%d %H:00:00"
+DAY_BUCKET_FORMAT = "%Y-%m-%d"
+RETENTION_DAYS = 180
+
+# Sessions/queries already counted per bucket are remembered this long
+_SEEN_RETENTION = timedelta(days=2)
+
+_UPSERT_HOURLY_SQL = """
+    INSERT INTO archon_mcp_usage_hourly (
+        hour_bucket, tool_name, tool_category, call_count, error_count,
+        avg_response_time_ms, total_response_time_ms, unique_sessions,
+        latency_histogram, last_updated
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(hour_bucket, tool_name) DO UPDATE SET
+        call_count = call_count + excluded.call_count,
+        error_count = error_count + excluded.error_count,
+        total_response_time_ms = total_response_time_ms + excluded.total_response_time_ms,
+        avg_response_time_ms = (total_response_time_ms + excluded.total_response_time_ms)
+            / (call_count + excluded.call_count),
+        unique_sessions = unique_sessions + excluded.unique_sessions,
+        latency_histogram = merge_latency_histograms(latency_histogram, excluded.latency_histogram),
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_DAILY_SQL = """
+    INSERT INTO archon_mcp_usage_daily (
+        date_bucket, tool_name, tool_category, call_count, error_count,
+        avg_response_time_ms, total_response_time_ms, unique_sessions,
+        latency_histogram, last_updated
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(date_bucket, tool_name) DO UPDATE SET
+        call_count = call_count + excluded.call_count,
+        error_count = error_count + excluded.error_count,
+        total_response_time_ms = total_response_time_ms + excluded.total_response_time_ms,
+        avg_response_time_ms = (total_response_time_ms + excluded.total_response_time_ms)
+            / (call_count + excluded.call_count),
+        unique_sessions = unique_sessions + excluded.unique_sessions,
+        latency_histogram = merge_latency_histograms(latency_histogram, excluded.latency_histogram),
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_SOURCE_HOURLY_SQL = """
+    INSERT INTO archon_mcp_usage_source_hourly (
+        hour_bucket, source_id, query_count, error_count,
+        total_response_time_ms, unique_queries, latency_histogram, last_updated
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(hour_bucket, source_id) DO UPDATE SET
+        query_count = query_count + excluded.query_count,
+        error_count = error_count + excluded.error_count,
+        total_response_time_ms = total_response_time_ms + excluded.total_response_time_ms,
+        unique_queries = unique_queries + excluded.unique_queries,
+        latency_histogram = merge_latency_histograms(latency_histogram, excluded.latency_histogram),
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+
+def latency_bucket_index(response_time_ms: int) -> int:
+    """Get the histogram bucket index for a response time."""
+    return bisect.bisect_left(LATENCY_BUCKET_BOUNDS_MS, max(response_time_ms, 0))
+
+
+def decode_histogram(value: str | None) -> list[int]:
+    """Decode a stored histogram, tolerating NULL and malformed values."""
+    if not value:
+        return [0] * HISTOGRAM_SIZE
+    try:
+        counts = [int(count) for count in json.loads(value)]
+    except (TypeError, ValueError):
+        return [0] * HISTOGRAM_SIZE
+    return (counts + [0] * HISTOGRAM_SIZE)[:HISTOGRAM_SIZE]
+
+
+def merge_histograms(*histograms: str | None) -> str:
+    """Merge stored histograms by adding their bucket counts."""
+    merged = [0] * HISTOGRAM_SIZE
+    for histogram in histograms:
+        for index, count in enumerate(decode_histogram(histogram)):
+            merged[index] += count
+    return json.dumps(merged)
+
+
+def histogram_percentile(histogram: list[int], percentile: float) -> int | None:
+    """
+    Estimate a latency percentile from histogram counts.
+
+    Args:
+        histogram: Bucket counts (see LATENCY_BUCKET_BOUNDS_MS)
+        percentile: Percentile between 0 and 100
+
+    Returns:
+        Upper bound in milliseconds of the bucket holding the percentile
+        (the last bound for the overflow bucket), or None for an empty histogram
+    """
+    total = sum(histogram)
+    if total == 0:
+        return None
+    rank = max(1, -(-total * percentile // 100))
+    running = 0
+    for index, count in enumerate(histogram):
+        running += count
+        if running >= rank:
+            return LATENCY_BUCKET_BOUNDS_MS[min(index, len(LATENCY_BUCKET_BOUNDS_MS) - 1)]
+    return LATENCY_BUCKET_BOUNDS_MS[-1]
+
+
+def _new_delta(**fields: Any) -> dict[str, Any]:
+    return {"calls": 0, "errors": 0, "total_ms": 0, "unique": 0, "histogram": [0] * HISTOGRAM_SIZE, **fields}
+
+
+def _add_to_delta(delta: dict[str, Any], response_time_ms: int, success: bool) -> None:
+    delta["calls"] += 1
+    delta["errors"] += 0 if success else 1
+    delta["total_ms"] += response_time_ms
+    delta["histogram"][latency_bucket_index(response_time_ms)] += 1
+
+
+def _merge_delta(target: dict[str, Any], delta: dict[str, Any]) -> None:
+    for field in ("calls", "errors", "total_ms", "unique"):
+        target[field] += delta[field]
+    target["histogram"] = [a + b for a, b in zip(target["histogram"], delta["histogram"], strict=True)]
+
+
+class UsageRollupAggregator:
+    """
+    Accumulates rollup deltas for usage events until they are written.
+
+    Keyed by (hour, tool), (day, tool) and (hour, source). Distinct sessions
+    and queries are tracked per bucket in memory, so unique_sessions and
+    unique_queries are exact within one process and approximate across
+    restarts (a session seen before a restart is counted again).
+    """
+
+    def __init__(self):
+        self._hourly: dict[tuple[str, str], dict[str, Any]] = {}
+        self._daily: dict[tuple[str, str], dict[str, Any]] = {}
+        self._sources: dict[tuple[str, str], dict[str, Any]] = {}
+        self._seen: dict[tuple[str, str, str], set[str]] = {}
+        self._seen_expiry: dict[tuple[str, str, str], datetime] = {}
+
+    @property
+    def pending(self) -> bool:
+        """Whether there are deltas that have not been written yet."""
+        return bool(self._hourly or self._daily or self._sources)
+
+    def add(
+        self,
+        tool_name: str,
+        tool_category: str,
+        session_id: str | None,
+        source_id: str | None,
+        query_text: str | None,
+        response_time_ms: int,
+        success: bool,
+        timestamp: datetime,
+    ) -> None:
+        """Fold one usage event into the pending deltas."""
+        hour = timestamp.strftime(HOUR_BUCKET_FORMAT)
+        day = timestamp.strftime(DAY_BUCKET_FORMAT)
+
+        hourly = self._hourly.setdefault((hour, tool_name), _new_delta(tool_category=tool_category))
+        _add_to_delta(hourly, response_time_ms, success)
+        daily = self._daily.setdefault((day, tool_name), _new_delta(tool_category=tool_category))
+        _add_to_delta(daily, response_time_ms, success)
+        if session_id:
+            hourly["unique"] += self._first_seen(("hour", hour, tool_name), session_id, timestamp)
+            daily["unique"] += self._first_seen(("day", day, tool_name), session_id, timestamp)
+
+        if source_id:
+            source = self._sources.setdefault((hour, source_id), _new_delta())
+            _add_to_delta(source, response_time_ms, success)
+            if query_text:
+                source["unique"] += self._first_seen(("source", hour, source_id), query_text, timestamp)
+
+    def _first_seen(self, key: tuple[str, str, str], value: str, timestamp: datetime) -> int:
+        """Return 1 the first time a value is seen in a bucket, else 0."""
+        seen = self._seen.get(key)
+        if seen is None:
+            self._prune_seen(timestamp)
+            seen = self._seen[key] = set()
+            self._seen_expiry[key] = timestamp + _SEEN_RETENTION
+        if value in seen:
+            return 0
+        seen.add(value)
+        return 1
+
+    def _prune_seen(self, now: datetime) -> None:
+        for key in [key for key, expiry in self._seen_expiry.items() if expiry < now]:
+            del self._seen[key]
+            del self._seen_expiry[key]
+
+    def drain(self) -> dict[str, dict]:
+        """Take all pending deltas, leaving the aggregator empty."""
+        deltas = {"hourly": self._hourly, "daily": self._daily, "sources": self._sources}
+        self._hourly, self._daily, self._sources = {}, {}, {}
+        return deltas
+
+    def restore(self, deltas: dict[str, dict]) -> None:
+        """Put back deltas whose write failed so the next flush retries them."""
+        for name, pending in (("hourly", self._hourly), ("daily", self._daily), ("sources", self._sources)):
+            for key, delta in deltas[name].items():
+                if key in pending:
+                    _merge_delta(pending[key], delta)
+                else:
+                    pending[key] = delta
+
+    @staticmethod
+    async def write(conn, deltas: dict[str, dict]) -> None:
+        """
+        Merge deltas into the rollup tables without committing.
+
+        Each delta is one atomic upsert, so concurrent writers never lose
+        counts; histograms are merged by the merge_latency_histograms SQL
+        function registered on the connection.
+
+        Args:
+            conn: aiosqlite connection
+            deltas: Result of drain()
+        """
+        await conn.create_function("merge_latency_histograms", 2, merge_histograms, deterministic=True)
+
+        rows = [
+            (bucket, tool, d["tool_category"], d["calls"], d["errors"], d["total_ms"] // d["calls"],
+             d["total_ms"], d["unique"], json.dumps(d["histogram"]))
+            for (bucket, tool), d in deltas["hourly"].items()
+        ]
+        if rows:
+            await conn.executemany(_UPSERT_HOURLY_SQL, rows)
+
+        rows = [
+            (bucket, tool, d["tool_category"], d["calls"], d["errors"], d["total_ms"] // d["calls"],
+             d["total_ms"], d["unique"], json.dumps(d["histogram"]))
+            for (bucket, tool), d in deltas["daily"].items()
+        ]
+        if rows:
+            await conn.executemany(_UPSERT_DAILY_SQL, rows)
+
+        rows = [
+            (bucket, source_id, d["calls"], d["errors"], d["total_ms"], d["unique"], json.dumps(d["histogram"]))
+            for (bucket, source_id), d in deltas["sources"].items()
+        ]
+        if rows:
+            await conn.executemany(_UPSERT_SOURCE_HOURLY_SQL, rows)
+
+
+async def apply_retention(conn, now: datetime | None = None) -> None:
+    """Delete raw events and rollups older than RETENTION_DAYS without committing."""
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=RETENTION_DAYS)
+    await conn.execute(
+        "DELETE FROM archon_mcp_usage_events WHERE timestamp < ?", (cutoff.strftime("%Y-%m-%d %H:%M:%S"),)
+    )
+    await conn.execute(
+        "DELETE FROM archon_mcp_usage_hourly WHERE hour_bucket < ?", (cutoff.strftime(HOUR_BUCKET_FORMAT),)
+    )
+    await conn.execute(
+        "DELETE FROM archon_mcp_usage_source_hourly WHERE hour_bucket < ?", (cutoff.strftime(HOUR_BUCKET_FORMAT),)
+    )
+    await conn.execute(
+        "DELETE FROM archon_mcp_usage_daily WHERE date_bucket < ?", (cutoff.strftime(DAY_BUCKET_FORMAT),)
+    )
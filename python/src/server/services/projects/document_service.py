@@ -6,9 +6,6 @@ that can be shared between MCP tools and FastAPI endpoints.
 """
 
 import uuid
-
-# Removed direct logging import - using unified config
-from datetime import datetime
 from typing import Any, Optional
 
 from src.server.utils import get_supabase_client
@@ -47,19 +44,19 @@ class DocumentService:
         author: str = None,
     ) -> tuple[bool, dict[str, Any]]:
         """
-        Add a new document to a project's docs JSONB field.
+        Add a new document to a project.
+
+        Documents are stored one row each, so adding one does not rewrite the
+        project's other documents.
 
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project
             project = await self.repository.get_project_by_id(project_id)
             if not project:
                 return False, {"error": f"Project with ID {project_id} not found"}
 
-            current_docs = project.get("docs", [])
-
             # Create new document entry
             new_doc = {
                 "id": str(uuid.uuid4()),
@@ -74,24 +71,18 @@ class DocumentService:
             if author:
                 new_doc["author"] = author
 
-            # Add to docs array
-            updated_docs = current_docs + [new_doc]
+            created_doc = await self.repository.create_project_document(project_id, new_doc)
 
-            # Update project
-            updated_project = await self.repository.update_project(
-                project_id=project_id,
-                update_data={"docs": updated_docs}
-            )
-
-            if updated_project:
+            if created_doc:
                 return True, {
                     "document": {
-                        "id": new_doc["id"],
+                        "id": created_doc["id"],
                         "project_id": project_id,
-                        "document_type": new_doc["document_type"],
-                        "title": new_doc["title"],
-                        "status": new_doc["status"],
-                        "version": new_doc["version"],
+                        "document_type": created_doc["document_type"],
+                        "title": created_doc["title"],
+                        "status": created_doc["status"],
+                        "version": created_doc["version"],
+                        "revision": created_doc.get("revision", 1),
                     }
                 }
             else:
@@ -103,7 +94,7 @@ class DocumentService:
 
     async def list_documents(self, project_id: str, include_content: bool = False) -> tuple[bool, dict[str, Any]]:
         """
-        List all documents in a project's docs JSONB field.
+        List all documents in a project.
 
         Args:
             project_id: The project ID
@@ -119,7 +110,7 @@ class DocumentService:
             if not project:
                 return False, {"error": f"Project with ID {project_id} not found"}
 
-            docs = project.get("docs", [])
+            docs = await self.repository.list_project_documents(project_id, include_content=include_content)
 
             # Format documents for response
             documents = []
@@ -135,12 +126,13 @@ class DocumentService:
                         "title": doc.get("title"),
                         "status": doc.get("status"),
                         "version": doc.get("version"),
+                        "revision": doc.get("revision"),
                         "tags": doc.get("tags", []),
                         "author": doc.get("author"),
                         "created_at": doc.get("created_at"),
                         "updated_at": doc.get("updated_at"),
                         "stats": {
-                            "content_size": len(str(doc.get("content", {})))
+                            "content_size": doc.get("content_size", 0)
                         }
                     })
 
@@ -156,32 +148,23 @@ class DocumentService:
 
     async def get_document(self, project_id: str, doc_id: str) -> tuple[bool, dict[str, Any]]:
         """
-        Get a specific document from a project's docs JSONB field.
+        Get a specific document from a project.
 
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            project = await self.repository.get_project_by_id(project_id)
-
-            if not project:
-                return False, {"error": f"Project with ID {project_id} not found"}
-
-            docs = project.get("docs", [])
-
-            # Find the specific document
-            document = None
-            for doc in docs:
-                if doc.get("id") == doc_id:
-                    document = doc
-                    break
+            document = await self.repository.get_project_document(project_id, doc_id)
 
             if document:
                 return True, {"document": document}
-            else:
-                return False, {
-                    "error": f"Document with ID {doc_id} not found in project {project_id}"
-                }
+
+            project = await self.repository.get_project_by_id(project_id)
+            if not project:
+                return False, {"error": f"Project with ID {project_id} not found"}
+            return False, {
+                "error": f"Document with ID {doc_id} not found in project {project_id}"
+            }
 
         except Exception as e:
             logger.error(f"Error getting document: {e}")
@@ -193,33 +176,44 @@ class DocumentService:
         doc_id: str,
         update_fields: dict[str, Any],
         create_version: bool = True,
+        expected_revision: int | None = None,
     ) -> tuple[bool, dict[str, Any]]:
         """
-        Update a document in a project's docs JSONB field.
+        Update a document in a project.
+
+        Only the document's own row is written, and the version snapshot (if
+        requested) holds only this document, under its "docs:<doc_id>" field.
+        With expected_revision, the
+        update is rejected with a revision conflict if the document changed
+        since that revision was read (optimistic concurrency).
 
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project docs
-            project = await self.repository.get_project_by_id(project_id)
-            if not project:
-                return False, {"error": f"Project with ID {project_id} not found"}
+            current_doc = await self.repository.get_project_document(project_id, doc_id)
+            if not current_doc:
+                project = await self.repository.get_project_by_id(project_id)
+                if not project:
+                    return False, {"error": f"Project with ID {project_id} not found"}
+                return False, {
+                    "error": f"Document with ID {doc_id} not found in project {project_id}"
+                }
 
-            current_docs = project.get("docs", [])
+            if expected_revision is not None and current_doc.get("revision") != expected_revision:
+                return False, self._revision_conflict(doc_id, expected_revision, current_doc)
 
-            # Create version snapshot if requested
-            if create_version and current_docs:
+            # Version only the edited document, from the row already read above
+            if create_version:
                 try:
-                    from .versioning_service import VersioningService
+                    from .versioning_service import VersioningService, document_field_name
 
                     versioning = VersioningService(repository=self.repository)
-
                     change_summary = self._build_change_summary(doc_id, update_fields)
                     await versioning.create_version(
                         project_id=project_id,
-                        field_name="docs",
-                        content=current_docs,
+                        field_name=document_field_name(doc_id),
+                        content=current_doc,
                         change_summary=change_summary,
                         change_type="update",
                         document_id=doc_id,
@@ -230,53 +224,21 @@ class DocumentService:
                         f"Version creation failed for document {doc_id}: {version_error}"
                     )
 
-            # Make a copy to modify
-            docs = current_docs.copy()
-
-            # Find and update the document
-            updated = False
-            for i, doc in enumerate(docs):
-                if doc.get("id") == doc_id:
-                    # Update allowed fields
-                    if "title" in update_fields:
-                        docs[i]["title"] = update_fields["title"]
-                    if "content" in update_fields:
-                        docs[i]["content"] = update_fields["content"]
-                    if "status" in update_fields:
-                        docs[i]["status"] = update_fields["status"]
-                    if "tags" in update_fields:
-                        docs[i]["tags"] = update_fields["tags"]
-                    if "author" in update_fields:
-                        docs[i]["author"] = update_fields["author"]
-                    if "version" in update_fields:
-                        docs[i]["version"] = update_fields["version"]
-
-                    docs[i]["updated_at"] = datetime.now().isoformat()
-                    updated = True
-                    break
-
-            if not updated:
-                return False, {
-                    "error": f"Document with ID {doc_id} not found in project {project_id}"
-                }
+            # Update allowed fields
+            allowed_fields = ("title", "content", "status", "tags", "author", "version")
+            update_data = {key: value for key, value in update_fields.items() if key in allowed_fields}
 
-            # Update the project
-            updated_project = await self.repository.update_project(
-                project_id=project_id,
-                update_data={"docs": docs, "updated_at": datetime.now().isoformat()}
+            updated_doc = await self.repository.update_project_document(
+                project_id, doc_id, update_data, expected_revision=expected_revision
             )
 
-            if updated_project:
-                # Find the updated document to return
-                updated_doc = None
-                for doc in docs:
-                    if doc.get("id") == doc_id:
-                        updated_doc = doc
-                        break
-
+            if updated_doc:
                 return True, {"document": updated_doc}
-            else:
-                return False, {"error": "Failed to update document"}
+
+            latest_doc = await self.repository.get_project_document(project_id, doc_id)
+            if latest_doc and expected_revision is not None:
+                return False, self._revision_conflict(doc_id, expected_revision, latest_doc)
+            return False, {"error": "Failed to update document"}
 
         except Exception as e:
             logger.error(f"Error updating document: {e}")
@@ -284,43 +246,40 @@ class DocumentService:
 
     async def delete_document(self, project_id: str, doc_id: str) -> tuple[bool, dict[str, Any]]:
         """
-        Delete a document from a project's docs JSONB field.
+        Delete a document from a project.
 
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current project docs
+            deleted = await self.repository.delete_project_document(project_id, doc_id)
+
+            if deleted:
+                return True, {"project_id": project_id, "doc_id": doc_id}
+
             project = await self.repository.get_project_by_id(project_id)
             if not project:
                 return False, {"error": f"Project with ID {project_id} not found"}
-
-            docs = project.get("docs", [])
-
-            # Remove the document
-            original_length = len(docs)
-            docs = [doc for doc in docs if doc.get("id") != doc_id]
-
-            if len(docs) == original_length:
-                return False, {
-                    "error": f"Document with ID {doc_id} not found in project {project_id}"
-                }
-
-            # Update the project
-            updated_project = await self.repository.update_project(
-                project_id=project_id,
-                update_data={"docs": docs, "updated_at": datetime.now().isoformat()}
-            )
-
-            if updated_project:
-                return True, {"project_id": project_id, "doc_id": doc_id}
-            else:
-                return False, {"error": "Failed to delete document"}
+            return False, {
+                "error": f"Document with ID {doc_id} not found in project {project_id}"
+            }
 
         except Exception as e:
             logger.error(f"Error deleting document: {e}")
             return False, {"error": f"Error deleting document: {str(e)}"}
 
+    def _revision_conflict(
+        self, doc_id: str, expected_revision: int, current_doc: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the error result for a stale expected_revision"""
+        return {
+            "error": (
+                f"Revision conflict: document {doc_id} is at revision {current_doc.get('revision')}, "
+                f"expected {expected_revision}"
+            ),
+            "current_revision": current_doc.get("revision"),
+        }
+
     def _build_change_summary(self, doc_id: str, update_fields: dict[str, Any]) -> str:
         """Build a human-readable change summary"""
         changes = []
@@ -15,6 +15,7 @@ from ...repositories.database_repository import DatabaseRepository
 from ...repositories.repository_factory import get_repository
 
 from ...config.logfire_config import get_logger
+from ...utils.pagination_utils import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
@@ -141,6 +142,38 @@ class ProjectService:
             logger.error(f"Error listing projects: {e}")
             return False, {"error": f"Error listing projects: {str(e)}"}
 
+    async def search_projects(
+        self, query: str | None = None, limit: int = 10, cursor: str | None = None
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Search projects with keyset pagination, returning lightweight projections.
+
+        Args:
+            query: Optional free-text search over title and description
+            limit: Page size
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            Tuple of (success, result_dict) with projects, next_cursor and has_more
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = tuple(decode_cursor(cursor, 2)) if cursor else None
+        try:
+            # Fetch one extra row to know whether another page exists
+            projects = await self.repository.search_projects(query=query, limit=limit + 1, cursor=after)
+        except Exception as e:
+            logger.error(f"Error searching projects: {e}")
+            return False, {"error": f"Error searching projects: {str(e)}"}
+
+        has_more = len(projects) > limit
+        projects = projects[:limit]
+        for project in projects:
+            project["description"] = project.get("description") or ""
+        next_cursor = encode_cursor(projects[-1]["created_at"], projects[-1]["id"]) if has_more else None
+        return True, {"projects": projects, "next_cursor": next_cursor, "has_more": has_more}
+
     async def get_project(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """
         Get a specific project by ID.
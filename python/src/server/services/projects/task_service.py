@@ -19,6 +19,16 @@ logger = get_logger(__name__)
 
 # Task updates are handled via polling - no broadcasting needed
 
+# Task orders are sparse integers: the UI spaces tasks TASK_ORDER_GAP apart and
+# drops a moved task between its neighbours, so inserts and moves write one row.
+# An insert only shifts tasks when its slot is taken, and a shift of at least
+# REBALANCE_RUN_LENGTH tasks means the column ran out of gaps and is respaced.
+TASK_ORDER_GAP = 1000
+REBALANCE_RUN_LENGTH = 16
+
+# Batch operations run in one repository transaction; this bounds its size.
+MAX_TASK_BATCH_SIZE = 200
+
 class TaskService:
     """Service class for task operations"""
 
@@ -77,53 +87,29 @@ class TaskService:
         code_examples: list[dict[str, Any]] = None,
     ) -> tuple[bool, dict[str, Any]]:
         """
-        Create a new task under a project with automatic reordering.
+        Create a new task under a project.
+
+        With task_order > 0 the task takes that slot; tasks are only shifted
+        when the slot is already taken (see make_room_for_task_order).
 
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Validate inputs
-            if not title or not isinstance(title, str) or len(title.strip()) == 0:
-                return False, {"error": "Task title is required and must be a non-empty string"}
-
-            if not project_id or not isinstance(project_id, str):
-                return False, {"error": "Project ID is required and must be a string"}
-
-            # Validate assignee
-            is_valid, error_msg = self.validate_assignee(assignee)
-            if not is_valid:
-                return False, {"error": error_msg}
-
-            # Validate priority
-            is_valid, error_msg = self.validate_priority(priority)
-            if not is_valid:
+            error_msg = self._validate_new_task(project_id, title, assignee, priority)
+            if error_msg:
                 return False, {"error": error_msg}
 
             task_status = "todo"
 
-            # REORDERING LOGIC: If inserting at a specific position, increment existing tasks
+            # Free the slot if another task holds it (usually a no-op with sparse orders)
+            shifted = 0
             if task_order > 0:
-                # Get all tasks in the same project and status with task_order >= new task's order
-                existing_tasks = await self.repository.get_tasks_by_project_and_status(
-                    project_id=project_id,
-                    status=task_status,
-                    task_order_gte=task_order
+                shifted = await self.repository.make_room_for_task_order(
+                    project_id=project_id, status=task_status, task_order=task_order
                 )
-
-                if existing_tasks:
-                    logger.info(f"Reordering {len(existing_tasks)} existing tasks")
-
-                    # Increment task_order for all affected tasks
-                    for existing_task in existing_tasks:
-                        new_order = existing_task["task_order"] + 1
-                        await self.repository.update_task(
-                            task_id=existing_task["id"],
-                            update_data={
-                                "task_order": new_order,
-                                "updated_at": datetime.now().isoformat(),
-                            }
-                        )
+                if shifted:
+                    logger.info(f"Shifted {shifted} tasks to make room at task_order={task_order}")
 
             task_data = {
                 "project_id": project_id,
@@ -144,21 +130,13 @@ class TaskService:
 
             task = await self.repository.create_task(task_data)
 
+            if task and shifted >= REBALANCE_RUN_LENGTH:
+                await self.repository.rebalance_task_orders(project_id, task_status, TASK_ORDER_GAP)
+                task = await self.repository.get_task_by_id(task["id"]) or task
+
             if task:
 
-                return True, {
-                    "task": {
-                        "id": task["id"],
-                        "project_id": task["project_id"],
-                        "title": task["title"],
-                        "description": task["description"],
-                        "status": task["status"],
-                        "assignee": task["assignee"],
-                        "task_order": task["task_order"],
-                        "priority": task["priority"],
-                        "created_at": task["created_at"],
-                    }
-                }
+                return True, {"task": self._created_task_summary(task)}
             else:
                 return False, {"error": "Failed to create task"}
 
@@ -166,6 +144,97 @@ class TaskService:
             logger.error(f"Error creating task: {e}")
             return False, {"error": f"Error creating task: {str(e)}"}
 
+    def _validate_new_task(
+        self, project_id: str, title: str, assignee: str, priority: str
+    ) -> str | None:
+        """Return the validation error for a task about to be created, if any."""
+        if not title or not isinstance(title, str) or len(title.strip()) == 0:
+            return "Task title is required and must be a non-empty string"
+
+        if not project_id or not isinstance(project_id, str):
+            return "Project ID is required and must be a string"
+
+        is_valid, error_msg = self.validate_assignee(assignee)
+        if not is_valid:
+            return error_msg
+
+        is_valid, error_msg = self.validate_priority(priority)
+        if not is_valid:
+            return error_msg
+
+        return None
+
+    @staticmethod
+    def _created_task_summary(task: dict[str, Any]) -> dict[str, Any]:
+        """Fields returned for a newly created task."""
+        return {
+            "id": task["id"],
+            "project_id": task["project_id"],
+            "title": task["title"],
+            "description": task["description"],
+            "status": task["status"],
+            "assignee": task["assignee"],
+            "task_order": task["task_order"],
+            "priority": task["priority"],
+            "created_at": task["created_at"],
+        }
+
+    async def create_tasks(self, tasks: list[dict[str, Any]]) -> tuple[bool, dict[str, Any]]:
+        """
+        Create several tasks in one repository transaction.
+
+        Each entry takes the create_task arguments (project_id, title,
+        description, assignee, task_order, priority, feature). Every entry is
+        validated first; one invalid entry rejects the whole batch.
+
+        Returns:
+            Tuple of (success, result_dict)
+        """
+        try:
+            if not tasks:
+                return False, {"error": "At least one task is required"}
+            if len(tasks) > MAX_TASK_BATCH_SIZE:
+                return False, {"error": f"Batch exceeds {MAX_TASK_BATCH_SIZE} tasks"}
+
+            now = datetime.now().isoformat()
+            tasks_data = []
+            for index, task in enumerate(tasks):
+                assignee = task.get("assignee") or "User"
+                priority = task.get("priority") or "medium"
+                error_msg = self._validate_new_task(
+                    task.get("project_id"), task.get("title"), assignee, priority
+                )
+                if error_msg:
+                    return False, {"error": f"Task {index}: {error_msg}", "index": index}
+
+                task_data = {
+                    "project_id": task["project_id"],
+                    "title": task["title"],
+                    "description": task.get("description") or "",
+                    "status": "todo",
+                    "assignee": assignee,
+                    "task_order": task.get("task_order") or 0,
+                    "priority": priority,
+                    "sources": task.get("sources") or [],
+                    "code_examples": task.get("code_examples") or [],
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                if task.get("feature"):
+                    task_data["feature"] = task["feature"]
+                tasks_data.append(task_data)
+
+            created = await self.repository.create_tasks_batch(tasks_data)
+
+            return True, {
+                "tasks": [self._created_task_summary(task) for task in created],
+                "count": len(created),
+            }
+
+        except Exception as e:
+            logger.error(f"Error creating tasks: {e}")
+            return False, {"error": f"Error creating tasks: {str(e)}"}
+
     async def list_tasks(
         self,
         project_id: str = None,
@@ -310,39 +379,9 @@ class TaskService:
             Tuple of (success, result_dict)
         """
         try:
-            # Build update data
-            update_data = {"updated_at": datetime.now().isoformat()}
-
-            # Validate and add fields
-            if "title" in update_fields:
-                update_data["title"] = update_fields["title"]
-
-            if "description" in update_fields:
-                update_data["description"] = update_fields["description"]
-
-            if "status" in update_fields:
-                is_valid, error_msg = self.validate_status(update_fields["status"])
-                if not is_valid:
-                    return False, {"error": error_msg}
-                update_data["status"] = update_fields["status"]
-
-            if "assignee" in update_fields:
-                is_valid, error_msg = self.validate_assignee(update_fields["assignee"])
-                if not is_valid:
-                    return False, {"error": error_msg}
-                update_data["assignee"] = update_fields["assignee"]
-
-            if "priority" in update_fields:
-                is_valid, error_msg = self.validate_priority(update_fields["priority"])
-                if not is_valid:
-                    return False, {"error": error_msg}
-                update_data["priority"] = update_fields["priority"]
-
-            if "task_order" in update_fields:
-                update_data["task_order"] = update_fields["task_order"]
-
-            if "feature" in update_fields:
-                update_data["feature"] = update_fields["feature"]
+            update_data, error_msg = self._build_update_data(update_fields)
+            if error_msg:
+                return False, {"error": error_msg}
 
             # Update task
             task = await self.repository.update_task(
@@ -359,6 +398,80 @@ class TaskService:
             logger.error(f"Error updating task: {e}")
             return False, {"error": f"Error updating task: {str(e)}"}
 
+    def _build_update_data(
+        self, update_fields: dict[str, Any]
+    ) -> tuple[dict[str, Any], str | None]:
+        """Validate update fields and build the repository update dict."""
+        update_data = {"updated_at": datetime.now().isoformat()}
+
+        # Validate and add fields
+        if "title" in update_fields:
+            update_data["title"] = update_fields["title"]
+
+        if "description" in update_fields:
+            update_data["description"] = update_fields["description"]
+
+        if "status" in update_fields:
+            is_valid, error_msg = self.validate_status(update_fields["status"])
+            if not is_valid:
+                return update_data, error_msg
+            update_data["status"] = update_fields["status"]
+
+        if "assignee" in update_fields:
+            is_valid, error_msg = self.validate_assignee(update_fields["assignee"])
+            if not is_valid:
+                return update_data, error_msg
+            update_data["assignee"] = update_fields["assignee"]
+
+        if "priority" in update_fields:
+            is_valid, error_msg = self.validate_priority(update_fields["priority"])
+            if not is_valid:
+                return update_data, error_msg
+            update_data["priority"] = update_fields["priority"]
+
+        if "task_order" in update_fields:
+            update_data["task_order"] = update_fields["task_order"]
+
+        if "feature" in update_fields:
+            update_data["feature"] = update_fields["feature"]
+
+        return update_data, None
+
+    async def update_tasks(
+        self, updates: list[tuple[str, dict[str, Any]]]
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Update several tasks in one repository transaction.
+
+        Args:
+            updates: List of (task_id, update_fields) pairs; fields as in update_task
+
+        Returns:
+            Tuple of (success, result_dict)
+        """
+        try:
+            if not updates:
+                return False, {"error": "At least one task update is required"}
+            if len(updates) > MAX_TASK_BATCH_SIZE:
+                return False, {"error": f"Batch exceeds {MAX_TASK_BATCH_SIZE} tasks"}
+
+            batch = []
+            for index, (task_id, update_fields) in enumerate(updates):
+                update_data, error_msg = self._build_update_data(update_fields)
+                if error_msg:
+                    return False, {"error": f"Task {task_id}: {error_msg}", "index": index}
+                batch.append((task_id, update_data))
+
+            tasks = await self.repository.update_tasks_batch(batch)
+
+            if tasks is None:
+                return False, {"error": "One or more tasks not found"}
+            return True, {"tasks": tasks, "count": len(tasks)}
+
+        except Exception as e:
+            logger.error(f"Error updating tasks: {e}")
+            return False, {"error": f"Error updating tasks: {str(e)}"}
+
     async def archive_task(
         self, task_id: str, archived_by: str = "mcp"
     ) -> tuple[bool, dict[str, Any]]:
@@ -393,6 +506,35 @@ class TaskService:
             logger.error(f"Error archiving task: {e}")
             return False, {"error": f"Error archiving task: {str(e)}"}
 
+    async def archive_tasks(
+        self, task_ids: list[str], archived_by: str = "mcp"
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Archive several tasks in one repository transaction.
+
+        Returns:
+            Tuple of (success, result_dict)
+        """
+        try:
+            if not task_ids:
+                return False, {"error": "At least one task ID is required"}
+            if len(task_ids) > MAX_TASK_BATCH_SIZE:
+                return False, {"error": f"Batch exceeds {MAX_TASK_BATCH_SIZE} tasks"}
+
+            tasks = await self.repository.archive_tasks_batch(task_ids, archived_by=archived_by)
+
+            if tasks is None:
+                return False, {"error": "One or more tasks not found"}
+            return True, {
+                "task_ids": [task["id"] for task in tasks],
+                "count": len(tasks),
+                "message": f"{len(tasks)} tasks archived successfully",
+            }
+
+        except Exception as e:
+            logger.error(f"Error archiving tasks: {e}")
+            return False, {"error": f"Error archiving tasks: {str(e)}"}
+
     async def get_all_project_task_counts(self) -> tuple[bool, dict[str, dict[str, int]]]:
         """
         Get task counts for all projects in a single optimized query.
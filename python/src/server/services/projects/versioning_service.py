@@ -5,6 +5,7 @@ This module provides core business logic for document versioning operations
 that can be shared between MCP tools and FastAPI endpoints.
 """
 
+import json
 from datetime import datetime
 from typing import Any, Optional
 
@@ -13,9 +14,26 @@ from ...repositories.database_repository import DatabaseRepository
 from ...repositories.repository_factory import get_repository
 
 from ...config.logfire_config import get_logger
+from ...utils.json_patch_utils import apply_json_patch, diff_json
 
 logger = get_logger(__name__)
 
+# Every Nth version of a field is a full snapshot (keyframe); the versions in
+# between store a JSON Patch against the previous version.
+KEYFRAME_INTERVAL = 10
+
+# Edits of a single project document are versioned under their own field,
+# "docs:<document id>", so they never snapshot the project's other documents.
+DOCUMENT_FIELD_PREFIX = "docs:"
+
+# Document fields written back when a document version is restored
+RESTORABLE_DOCUMENT_FIELDS = ("document_type", "title", "content", "status", "tags", "author", "version")
+
+
+def document_field_name(doc_id: str) -> str:
+    """Version field name for a single project document."""
+    return f"{DOCUMENT_FIELD_PREFIX}{doc_id}"
+
 class VersioningService:
     """Service class for document versioning operations"""
 
@@ -47,27 +65,38 @@ class VersioningService:
         """
         Create a version snapshot for a project JSONB field.
 
+        Every KEYFRAME_INTERVAL-th version is stored in full; the others store
+        a JSON Patch against the previous version, unless the patch would be
+        larger than the content itself.
+
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Get current highest version number for this project/field
-            # Note: Repository doesn't have a direct method for this, need to fetch and filter
-            all_versions = await self.repository.list_document_versions(project_id=project_id)
-
-            # Filter by field_name and get max version_number
-            field_versions = [v for v in all_versions if v.get("field_name") == field_name]
-            next_version = 1
-            if field_versions:
-                max_version = max(v.get("version_number", 0) for v in field_versions)
-                next_version = max_version + 1
+            latest_version = await self.repository.get_latest_document_version_number(
+                project_id, field_name
+            )
+            next_version = latest_version + 1
+
+            storage_format, stored_content = "snapshot", content
+            if latest_version and latest_version % KEYFRAME_INTERVAL:
+                try:
+                    _, previous_content = await self._reconstruct_version(
+                        project_id, field_name, latest_version
+                    )
+                    patch = diff_json(previous_content, content)
+                    if len(json.dumps(patch)) < len(json.dumps(content)):
+                        storage_format, stored_content = "delta", patch
+                except ValueError as e:
+                    logger.warning(f"Storing version {next_version} of {field_name} as a snapshot: {e}")
 
             # Create new version record
             version_data = {
                 "project_id": project_id,
                 "field_name": field_name,
                 "version_number": next_version,
-                "content": content,
+                "content": stored_content,
+                "storage_format": storage_format,
                 "change_summary": change_summary or f"{change_type.capitalize()} {field_name}",
                 "change_type": change_type,
                 "document_id": document_id,
@@ -79,7 +108,7 @@ class VersioningService:
 
             if version:
                 return True, {
-                    "version": version,
+                    "version": {**version, "content": content},
                     "project_id": project_id,
                     "field_name": field_name,
                     "version_number": next_version,
@@ -91,20 +120,55 @@ class VersioningService:
             logger.error(f"Error creating version: {e}")
             return False, {"error": f"Error creating version: {str(e)}"}
 
+    async def _reconstruct_version(
+        self, project_id: str, field_name: str, version_number: int
+    ) -> tuple[dict[str, Any] | None, Any]:
+        """
+        Rebuild a version's full content from its nearest keyframe.
+
+        Returns:
+            Tuple of (version record, content), or (None, None) if the version does not exist
+
+        Raises:
+            ValueError: If the delta chain is broken
+        """
+        chain = await self.repository.get_document_version_chain(project_id, field_name, version_number)
+        if not chain or chain[-1].get("version_number") != version_number:
+            return None, None
+
+        if chain[0].get("storage_format", "snapshot") != "snapshot":
+            raise ValueError(f"No keyframe found for version {version_number} of {field_name}")
+
+        content = chain[0]["content"]
+        expected_version = chain[0]["version_number"]
+        for version in chain[1:]:
+            expected_version += 1
+            if version.get("version_number") != expected_version:
+                raise ValueError(f"Version {expected_version} of {field_name} is missing")
+            if version.get("storage_format") == "delta":
+                content = apply_json_patch(content, version["content"])
+            else:
+                content = version["content"]
+
+        return chain[-1], content
+
     async def list_versions(self, project_id: str, field_name: str = None) -> tuple[bool, dict[str, Any]]:
         """
         Get version history for project JSONB fields.
 
+        Versions are returned without content (use get_version_content).
+
         Returns:
             Tuple of (success, result_dict)
         """
         try:
-            # Get all versions for the project
-            versions = await self.repository.list_document_versions(project_id=project_id)
-
-            # Filter by field_name if specified
-            if field_name:
-                versions = [v for v in versions if v.get("field_name") == field_name]
+            versions = await self.repository.list_document_versions(
+                project_id=project_id, field_name=field_name
+            )
+            versions = [
+                {key: value for key, value in version.items() if key != "content"}
+                for version in versions
+            ]
 
             # Sort by version_number descending (repository returns by created_at desc)
             versions.sort(key=lambda v: v.get("version_number", 0), reverse=True)
@@ -130,20 +194,12 @@ class VersioningService:
             Tuple of (success, result_dict)
         """
         try:
-            # Get all versions for the project and filter
-            all_versions = await self.repository.list_document_versions(project_id=project_id)
+            version, content = await self._reconstruct_version(project_id, field_name, version_number)
 
-            # Find the specific version by field_name and version_number
-            matching_versions = [
-                v for v in all_versions
-                if v.get("field_name") == field_name and v.get("version_number") == version_number
-            ]
-
-            if matching_versions:
-                version = matching_versions[0]
+            if version:
                 return True, {
-                    "version": version,
-                    "content": version["content"],
+                    "version": {**version, "content": content},
+                    "content": content,
                     "field_name": field_name,
                     "version_number": version_number,
                 }
@@ -165,19 +221,19 @@ class VersioningService:
         """
         try:
             # Get the version to restore
-            all_versions = await self.repository.list_document_versions(project_id=project_id)
-            matching_versions = [
-                v for v in all_versions
-                if v.get("field_name") == field_name and v.get("version_number") == version_number
-            ]
+            version_to_restore, content_to_restore = await self._reconstruct_version(
+                project_id, field_name, version_number
+            )
 
-            if not matching_versions:
+            if not version_to_restore:
                 return False, {
                     "error": f"Version {version_number} not found for {field_name} in project {project_id}"
                 }
 
-            version_to_restore = matching_versions[0]
-            content_to_restore = version_to_restore["content"]
+            if field_name.startswith(DOCUMENT_FIELD_PREFIX):
+                return await self._restore_document_version(
+                    project_id, field_name, version_number, content_to_restore, restored_by
+                )
 
             # Get current content to create backup
             current_project = await self.repository.get_project_by_id(project_id)
@@ -228,3 +284,56 @@ class VersioningService:
         except Exception as e:
             logger.error(f"Error restoring version: {e}")
             return False, {"error": f"Error restoring version: {str(e)}"}
+
+    async def _restore_document_version(
+        self,
+        project_id: str,
+        field_name: str,
+        version_number: int,
+        content_to_restore: dict[str, Any],
+        restored_by: str,
+    ) -> tuple[bool, dict[str, Any]]:
+        """Restore a single project document from one of its own versions."""
+        doc_id = field_name[len(DOCUMENT_FIELD_PREFIX):]
+        restored_fields = {
+            key: value for key, value in content_to_restore.items() if key in RESTORABLE_DOCUMENT_FIELDS
+        }
+
+        current_doc = await self.repository.get_project_document(project_id, doc_id)
+        if current_doc:
+            backup_result = await self.create_version(
+                project_id=project_id,
+                field_name=field_name,
+                content=current_doc,
+                change_summary=f"Backup before restoring to version {version_number}",
+                change_type="backup",
+                document_id=doc_id,
+                created_by=restored_by,
+            )
+            if not backup_result[0]:
+                logger.warning(f"Failed to create backup version: {backup_result[1]}")
+            restored_doc = await self.repository.update_project_document(project_id, doc_id, restored_fields)
+        else:
+            # The document was deleted since; bring it back under its original id
+            restored_doc = await self.repository.create_project_document(
+                project_id, {**restored_fields, "id": doc_id}
+            )
+
+        if not restored_doc:
+            return False, {"error": "Failed to restore version"}
+
+        await self.create_version(
+            project_id=project_id,
+            field_name=field_name,
+            content=restored_doc,
+            change_summary=f"Restored to version {version_number}",
+            change_type="restore",
+            document_id=doc_id,
+            created_by=restored_by,
+        )
+        return True, {
+            "project_id": project_id,
+            "field_name": field_name,
+            "restored_version": version_number,
+            "restored_by": restored_by,
+        }
@@ -218,6 +218,7 @@ class SQLiteMigrationService:
                     'archon_projects',
                     'archon_tasks',
                     'archon_project_sources',
+                    'archon_project_documents',
                     'archon_document_versions'
                 ]
                 
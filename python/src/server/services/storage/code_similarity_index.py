@@ -0,0 +1,204 @@
+"""
+Code Similarity Index
+
+MinHash/LSH near-duplicate index for code examples.
+
+Pairwise comparison of every code block is O(n²) in the number of blocks, which
+makes deduplication of large documentation sites very slow. This index hashes
+token shingles of the normalized code into MinHash signatures and buckets them
+with LSH banding, so only blocks that share at least one band become candidate
+pairs. Callers confirm candidates with the exact similarity ratio.
+
+Signatures are deterministic across processes (fixed seed, CRC32 shingle
+hashes), so they can also be persisted and compared later.
+"""
+
+import hashlib
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# 128 permutations split into 32 bands of 4 rows. Pairs with a Jaccard similarity
+# of 0.5 become candidates with ~87% probability, 0.6 with ~99%, which comfortably
+# covers the 0.85 SequenceMatcher threshold used for code deduplication.
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_SEED = 1
+
+
+def tokenize_code(normalized_code: str) -> list[str]:
+    """Split normalized code into identifier/number and punctuation tokens."""
+    return _TOKEN_PATTERN.findall(normalized_code)
+
+
+def shingle_hashes(normalized_code: str, shingle_size: int = DEFAULT_SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hash the token shingles of a normalized code string.
+
+    Args:
+        normalized_code: Code already passed through the comparison normalizer
+        shingle_size: Number of consecutive tokens per shingle
+
+    Returns:
+        Array of unique 32-bit shingle hashes (may be empty)
+    """
+    tokens = tokenize_code(normalized_code)
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+
+    if len(tokens) <= shingle_size:
+        shingles = {" ".join(tokens)}
+    else:
+        shingles = {" ".join(tokens[i : i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)}
+
+    return np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+class CodeSimilarityIndex:
+    """
+    In-memory LSH index over MinHash signatures of normalized code.
+
+    Usage:
+        index = CodeSimilarityIndex()
+        signature = index.signature(normalized_code)
+        candidates = index.query(signature)
+        index.add(block_id, signature)
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = DEFAULT_SEED,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            num_perm: Number of MinHash permutations (signature length)
+            bands: Number of LSH bands; must divide num_perm evenly
+            shingle_size: Number of consecutive tokens per shingle
+            seed: Seed for the permutation coefficients
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # RandomState keeps the coefficient stream stable across numpy releases,
+        # which matters for signatures that are persisted.
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+        self._buckets: list[dict[bytes, list[Hashable]]] = [defaultdict(list) for _ in range(bands)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def signature(self, normalized_code: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a normalized code string.
+
+        Args:
+            normalized_code: Code already passed through the comparison normalizer
+
+        Returns:
+            Array of num_perm 32-bit minimum hash values
+        """
+        hashes = shingle_hashes(normalized_code, self.shingle_size)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+
+        # (a * h + b) stays below 2**64 because h < 2**32 and a < 2**31
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[tuple[int, bytes]]:
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start : start + self.rows].tobytes()
+
+    def persistent_band_keys(self, signature: np.ndarray) -> list[str]:
+        """
+        Return compact, storable LSH band keys ("<band>:<digest>") for a signature.
+
+        Args:
+            signature: Signature produced by signature()
+
+        Returns:
+            One key per band; equal keys mean the band rows are identical
+        """
+        return [
+            f"{band}:{hashlib.blake2b(band_key, digest_size=8).hexdigest()}"
+            for band, band_key in self._band_keys(signature)
+        ]
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        """
+        Insert a signature under the given key.
+
+        Args:
+            key: Identifier returned by later queries (e.g. block index)
+            signature: Signature produced by signature()
+        """
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].append(key)
+        self._size += 1
+
+    def query(self, signature: np.ndarray) -> set[Hashable]:
+        """
+        Return the keys of all indexed signatures sharing at least one band.
+
+        Args:
+            signature: Signature produced by signature()
+
+        Returns:
+            Set of candidate keys (unconfirmed near-duplicates)
+        """
+        candidates: set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+
+def code_hash(normalized_code: str) -> str:
+    """Return the stable fingerprint hash of a normalized code string."""
+    return hashlib.sha256(normalized_code.encode("utf-8")).hexdigest()
+
+
+def signature_to_bytes(signature: np.ndarray) -> bytes:
+    """Serialize a signature for storage (values fit in 32 bits)."""
+    return signature.astype(np.uint32).tobytes()
+
+
+def signature_from_bytes(data: bytes) -> np.ndarray:
+    """Deserialize a signature produced by signature_to_bytes()."""
+    return np.frombuffer(data, dtype=np.uint32).astype(np.uint64)
+
+
+def estimate_jaccard(signature1: np.ndarray, signature2: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two shingle sets from their signatures."""
+    if signature1.size == 0 or signature1.size != signature2.size:
+        return 0.0
+    return float(np.count_nonzero(signature1 == signature2)) / signature1.size
@@ -28,6 +28,37 @@ from ..llm_provider_service import (
     prepare_chat_completion_params,
     synthesize_json_from_reasoning,
 )
+from ..threading_service import get_threading_service
+from .code_similarity_index import (
+    CodeSimilarityIndex,
+    code_hash,
+    estimate_jaccard,
+    signature_from_bytes,
+    signature_to_bytes,
+)
+
+# Minimum normalized similarity for two code blocks to be treated as variants
+CODE_SIMILARITY_THRESHOLD = 0.85
+
+# LSH candidates whose estimated shingle Jaccard falls below this are not confirmed
+# with the (expensive) character-level ratio; matches the LSH design point
+MIN_CANDIDATE_JACCARD = 0.5
+
+# Estimated Jaccard above which a stored summary is reused for a near-duplicate snippet
+NEAR_DUPLICATE_SUMMARY_JACCARD = 0.9
+
+# Placeholder summary used when generation is disabled or fails; never fingerprinted
+_FALLBACK_SUMMARY = "Code example for demonstration purposes."
+
+def _mark_fallback_json(payload: str) -> str:
+    """Flag a synthesized (non-LLM) summary JSON object as a fallback."""
+    try:
+        result = json.loads(payload)
+    except json.JSONDecodeError:
+        return payload
+    if not isinstance(result, dict):
+        return payload
+    return json.dumps({**result, "fallback": True})
 
 def _extract_json_payload(raw_response: str, context_code: str = "", language: str = "") -> str:
     """Return the best-effort JSON object from an LLM response."""
@@ -46,9 +77,9 @@ def _extract_json_payload(raw_response: str, context_code: str = "", language: s
         # extract_json_from_reasoning may return nothing; synthesize a fallback JSON if so\
         fallback_json = synthesize_json_from_reasoning("", context_code, language)
         if fallback_json:
-            return fallback_json
+            return _mark_fallback_json(fallback_json)
         # If all else fails, return a minimal valid JSON object to avoid downstream errors
-        return '{"example_name": "Code Example", "summary": "Code example extracted from context."}'
+        return '{"example_name": "Code Example", "summary": "Code example extracted from context.", "fallback": true}'
 
     if cleaned.startswith("```"):
         lines = cleaned.splitlines()
@@ -169,10 +200,91 @@ def _calculate_code_similarity(code1: str, code2: str) -> float:
     norm1 = _normalize_code_for_comparison(code1)
     norm2 = _normalize_code_for_comparison(code2)
 
-    # Use difflib's SequenceMatcher for similarity calculation
-    similarity = SequenceMatcher(None, norm1, norm2).ratio()
+    return _calculate_normalized_similarity(norm1, norm2)
+
+def _calculate_normalized_similarity(norm1: str, norm2: str, threshold: float = 0.0) -> float:
+    """
+    Calculate similarity between two already-normalized code strings.
+
+    When a threshold is given, the cheap upper bounds of SequenceMatcher are checked
+    first and returned as-is if they already fall below it, skipping the full ratio.
+
+    Args:
+        norm1: First normalized code string
+        norm2: Second normalized code string
+        threshold: Similarity the caller is interested in (0.0 = always compute exactly)
+
+    Returns:
+        Similarity ratio between 0.0 and 1.0 (an upper bound when below threshold)
+    """
+    matcher = SequenceMatcher(None, norm1, norm2)
+    if threshold > 0.0:
+        upper_bound = matcher.real_quick_ratio()
+        if upper_bound < threshold:
+            return upper_bound
+        upper_bound = matcher.quick_ratio()
+        if upper_bound < threshold:
+            return upper_bound
+
+    return matcher.ratio()
+
+def _group_similar_code_blocks(
+    code_blocks: list[dict[str, Any]], similarity_threshold: float = CODE_SIMILARITY_THRESHOLD
+) -> list[list[dict[str, Any]]]:
+    """
+    Group near-duplicate code blocks.
+
+    Each block is normalized once and indexed with MinHash/LSH; only candidate
+    pairs sharing an LSH band (and with a plausible estimated Jaccard) are
+    confirmed with the exact similarity ratio.
+    Groups are anchored on the first block in document order, matching the
+    previous pairwise pass.
+
+    Args:
+        code_blocks: Extracted code block dictionaries (must contain "code")
+        similarity_threshold: Minimum similarity ratio for blocks to be grouped
+
+    Returns:
+        List of groups, each a list of code blocks in document order
+    """
+    normalized = [_normalize_code_for_comparison(block["code"]) for block in code_blocks]
+
+    index = CodeSimilarityIndex()
+    signatures = [index.signature(norm) for norm in normalized]
+    for i, signature in enumerate(signatures):
+        index.add(i, signature)
+
+    groups = []
+    processed_indices = set()
+
+    for i, block in enumerate(code_blocks):
+        if i in processed_indices:
+            continue
+
+        similar_group = [block]
+        processed_indices.add(i)
+
+        candidates = sorted(j for j in index.query(signatures[i]) if j > i and j not in processed_indices)
 
-    return similarity
+        for j in candidates:
+            # Identical normalized code needs no ratio computation
+            if normalized[j] == normalized[i]:
+                similarity = 1.0
+            elif estimate_jaccard(signatures[i], signatures[j]) < MIN_CANDIDATE_JACCARD:
+                continue
+            else:
+                similarity = _calculate_normalized_similarity(
+                    normalized[i], normalized[j], similarity_threshold
+                )
+
+            if similarity >= similarity_threshold:
+                similar_group.append(code_blocks[j])
+                processed_indices.add(j)
+                search_logger.debug(f"Found similar code blocks with {similarity:.2f} similarity")
+
+        groups.append(similar_group)
+
+    return groups
 
 def _select_best_code_variant(similar_blocks: list[dict[str, Any]]) -> dict[str, Any]:
     """
@@ -526,34 +638,11 @@ def extract_code_blocks(markdown_content: str, min_length: int = None) -> list[d
 
     search_logger.debug(f"Starting deduplication process for {len(code_blocks)} code blocks")
 
-    # Group similar code blocks together
-    similarity_threshold = 0.85  # 85% similarity threshold
-    grouped_blocks = []
-    processed_indices = set()
-
-    for i, block1 in enumerate(code_blocks):
-        if i in processed_indices:
-            continue
-
-        # Start a new group with this block
-        similar_group = [block1]
-        processed_indices.add(i)
-
-        # Find all similar blocks
-        for j, block2 in enumerate(code_blocks):
-            if j <= i or j in processed_indices:
-                continue
-
-            similarity = _calculate_code_similarity(block1["code"], block2["code"])
-
-            if similarity >= similarity_threshold:
-                similar_group.append(block2)
-                processed_indices.add(j)
-                search_logger.debug(f"Found similar code blocks with {similarity:.2f} similarity")
-
-        # Select the best variant from the similar group
-        best_variant = _select_best_code_variant(similar_group)
-        grouped_blocks.append(best_variant)
+    # Group similar code blocks together and keep the best variant of each group
+    grouped_blocks = [
+        _select_best_code_variant(similar_group)
+        for similar_group in _group_similar_code_blocks(code_blocks, CODE_SIMILARITY_THRESHOLD)
+    ]
 
     deduplicated_count = len(code_blocks) - len(grouped_blocks)
     if deduplicated_count > 0:
@@ -565,7 +654,7 @@ def extract_code_blocks(markdown_content: str, min_length: int = None) -> list[d
 
 def generate_code_example_summary(
     code: str, context_before: str, context_after: str, language: str = "", provider: str = None
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """
     Generate a summary and name for a code example using its surrounding context.
 
@@ -591,7 +680,7 @@ async def _generate_code_example_summary_async(
     language: str = "",
     provider: str = None,
     client = None
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """
     Async version of generate_code_example_summary using unified LLM provider service.
 
@@ -672,7 +761,7 @@ async def _generate_summary_with_client(
     llm_client, code: str, context_before: str, context_after: str,
     language: str, provider: str, model_choice: str,
     guard_prompt: str, strict_prompt: str
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Helper function that generates summary using a provided client."""
     search_logger.info(
         f"Generating summary for {hash(code) & 0xffffff:06x} using model: {model_choice}"
@@ -786,6 +875,7 @@ async def _generate_summary_with_client(
                                     final_result = {
                                         "example_name": result.get("example_name", f"Code Example{f' ({language})' if language else ''}"),
                                         "summary": result.get("summary", "Code example for demonstration purposes."),
+                                        "fallback": True,
                                     }
                                     search_logger.info(f"Generated fallback summary from context - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}")
                                     return final_result
@@ -793,10 +883,9 @@ async def _generate_summary_with_client(
                                     pass  # Continue to normal error handling
                             else:
                                 # Even synthesis failed - provide hardcoded fallback for minimal responses
-                                final_result = {
-                                    "example_name": f"Code Example{f' ({language})' if language else ''}",
-                                    "summary": "Code example extracted from development context.",
-                                }
+                                final_result = _fallback_code_summary(
+                                    language, "Code example extracted from development context."
+                                )
                                 search_logger.info(f"Used hardcoded fallback for minimal response - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}")
                                 return final_result
 
@@ -818,6 +907,8 @@ async def _generate_summary_with_client(
                                 ),
                                 "summary": result.get("summary", "Code example for demonstration purposes."),
                             }
+                            if result.get("fallback") is True or not result.get("summary"):
+                                final_result["fallback"] = True
 
                             search_logger.info(
                                 f"Generated code example summary - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}"
@@ -953,6 +1044,8 @@ async def _generate_summary_with_client(
             ),
             "summary": result.get("summary", "Code example for demonstration purposes."),
         }
+        if result.get("fallback") is True or not result.get("summary"):
+            final_result["fallback"] = True
 
         search_logger.info(
             f"Generated code example summary - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}"
@@ -972,14 +1065,12 @@ async def _generate_summary_with_client(
                 return {
                     "example_name": fallback_result.get("example_name", f"Code Example{f' ({language})' if language else ''}"),
                     "summary": fallback_result.get("summary", "Code example for demonstration purposes."),
+                    "fallback": True,
                 }
         except Exception:
             pass  # Fall through to generic fallback
 
-        return {
-            "example_name": f"Code Example{f' ({language})' if language else ''}",
-            "summary": "Code example for demonstration purposes.",
-        }
+        return _fallback_code_summary(language)
     except Exception as e:
         search_logger.error(f"Error generating code summary using unified LLM provider: {e}")
         # Try to generate context-aware fallback
@@ -991,21 +1082,284 @@ async def _generate_summary_with_client(
                 return {
                     "example_name": fallback_result.get("example_name", f"Code Example{f' ({language})' if language else ''}"),
                     "summary": fallback_result.get("summary", "Code example for demonstration purposes."),
+                    "fallback": True,
                 }
         except Exception:
             pass  # Fall through to generic fallback
 
-        return {
-            "example_name": f"Code Example{f' ({language})' if language else ''}",
-            "summary": "Code example for demonstration purposes.",
+        return _fallback_code_summary(language)
+
+def _exact_code_key(code: str, language: str = "") -> str:
+    """
+    Identity hash of a code example: its exact (whitespace-trimmed) code and language.
+
+    The comparison normalization is lossy (it can drop whole import lines and
+    parameters), so it is only used to group near-duplicates within a batch and
+    never to decide that two snippets from different sources are the same.
+    """
+    return code_hash(f"{language or ''}\n{code.strip()}")
+
+def _fingerprint_code_examples(
+    code_examples: list[str], languages: list[str] | None = None
+) -> tuple[CodeSimilarityIndex, list[str], list[Any]]:
+    """Compute exact identity hashes and MinHash signatures of the trimmed code for code examples."""
+    index = CodeSimilarityIndex()
+    hashes = []
+    signatures = []
+    for code, language in zip(code_examples, languages or [""] * len(code_examples), strict=True):
+        hashes.append(_exact_code_key(code, language))
+        signatures.append(index.signature(code.strip()))
+    return index, hashes, signatures
+
+async def find_known_code_summaries(
+    repository: DatabaseRepository, code_blocks: list[dict[str, Any]]
+) -> list[dict[str, str] | None]:
+    """
+    Look up summaries of code blocks already seen in any source or earlier crawl.
+
+    Only summaries generated by the current summary model (MODEL_CHOICE) are
+    reused, so switching models re-summarizes snippets. Exact matches on the
+    code and language hash are reused directly. Remaining blocks are matched against
+    near-duplicates via the persisted LSH band keys, reusing the summary of the
+    closest fingerprint of the same language.
+
+    Args:
+        repository: Database repository holding the global fingerprint table
+        code_blocks: Code block dictionaries (must contain "code")
+
+    Returns:
+        List aligned with code_blocks: a summary dict for known snippets, None otherwise
+    """
+    if not code_blocks:
+        return []
+
+    known: list[dict[str, str] | None] = [None] * len(code_blocks)
+    try:
+        model_choice = await _get_model_choice()
+        index, hashes, signatures = _fingerprint_code_examples(
+            [block["code"] for block in code_blocks],
+            [block.get("language", "") or "" for block in code_blocks],
+        )
+
+        def is_reusable(fingerprint: dict[str, Any]) -> bool:
+            return bool(fingerprint.get("summary")) and fingerprint.get("llm_chat_model") == model_choice
+
+        exact = {
+            fingerprint["code_hash"]: fingerprint
+            for fingerprint in await repository.get_code_fingerprints(hashes)
+            if is_reusable(fingerprint)
         }
+        missing = []
+        for i, block_hash in enumerate(hashes):
+            fingerprint = exact.get(block_hash)
+            if fingerprint:
+                known[i] = {
+                    "example_name": fingerprint.get("example_name") or "Code Example",
+                    "summary": fingerprint["summary"],
+                }
+            else:
+                missing.append(i)
+
+        if missing:
+            band_keys_by_block = {i: index.persistent_band_keys(signatures[i]) for i in missing}
+            candidates = [
+                fingerprint
+                for fingerprint in await repository.find_code_fingerprints_by_band_keys(
+                    [key for keys in band_keys_by_block.values() for key in keys]
+                )
+                if is_reusable(fingerprint)
+            ]
+            candidate_signatures = [signature_from_bytes(fp["minhash"]) for fp in candidates]
+
+            for i in missing:
+                language = code_blocks[i].get("language", "") or ""
+                best_score, best = 0.0, None
+                for fingerprint, candidate_signature in zip(candidates, candidate_signatures, strict=True):
+                    if (fingerprint.get("language") or "") != language:
+                        continue
+                    score = estimate_jaccard(signatures[i], candidate_signature)
+                    if score > best_score:
+                        best_score, best = score, fingerprint
+                if best is not None and best_score >= NEAR_DUPLICATE_SUMMARY_JACCARD:
+                    known[i] = {
+                        "example_name": best.get("example_name") or "Code Example",
+                        "summary": best["summary"],
+                    }
+
+        reused = sum(1 for summary in known if summary is not None)
+        if reused:
+            search_logger.info(f"Reusing {reused}/{len(code_blocks)} code summaries from the fingerprint index")
+    except Exception as e:
+        # The fingerprint index is an optimization; never fail extraction because of it
+        search_logger.warning(f"Code fingerprint lookup failed, summarizing all blocks: {e}")
+        return [None] * len(code_blocks)
+
+    return known
+
+def _get_summary_batch_size() -> int:
+    """Get the number of code snippets summarized per LLM call (1 disables batching)."""
+    try:
+        if credential_service._cache_initialized and "CODE_SUMMARY_BATCH_SIZE" in credential_service._cache:
+            batch_size = int(credential_service._cache["CODE_SUMMARY_BATCH_SIZE"])
+        else:
+            batch_size = int(os.getenv("CODE_SUMMARY_BATCH_SIZE", "4"))
+    except (TypeError, ValueError):
+        batch_size = 4
+    return max(1, min(batch_size, 10))
+
+def _fallback_code_summary(language: str = "", summary: str = _FALLBACK_SUMMARY) -> dict[str, Any]:
+    """Placeholder summary used when generation fails; flagged so it is never fingerprinted."""
+    return {
+        "example_name": f"Code Example{f' ({language})' if language else ''}",
+        "summary": summary,
+        "fallback": True,
+    }
+
+def _estimate_summary_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough token estimate (prompt + completion budget) for the shared rate limiter."""
+    return len(prompt) // 4 + max_tokens
+
+def _single_summary_prompt_text(block: dict[str, Any]) -> str:
+    """Approximate the single-snippet prompt size without building the full prompt."""
+    return (
+        block.get("context_before", "")[-500:]
+        + block["code"][:1500]
+        + block.get("context_after", "")[:500]
+    )
+
+async def _generate_code_summaries_multi(
+    llm_client,
+    blocks: list[dict[str, Any]],
+    provider: str,
+    model_choice: str,
+) -> list[dict[str, str] | None]:
+    """
+    Summarize several code blocks with a single structured-output LLM call.
+
+    Args:
+        llm_client: Shared LLM client
+        blocks: Code block dictionaries (code, context_before, context_after, language)
+        provider: LLM provider name
+        model_choice: Chat model to use
+
+    Returns:
+        List aligned with blocks: a summary dict, or None where the response did
+        not contain a usable entry (callers fall back to single-snippet generation)
+    """
+    sections = []
+    for block_id, block in enumerate(blocks):
+        context_before = block.get("context_before", "")
+        context_after = block.get("context_after", "")
+        sections.append(
+            f"""<snippet id="{block_id}">
+<context_before>
+{context_before[-500:]}
+</context_before>
+
+<code_example language="{block.get("language", "")}">
+{block["code"][:1500]}
+</code_example>
+
+<context_after>
+{context_after[:500]}
+</context_after>
+</snippet>"""
+        )
+
+    prompt = (
+        "\n\n".join(sections)
+        + f"""
+
+For EACH of the {len(blocks)} snippets above, based on the code example and its surrounding context, provide:
+1. A concise, action-oriented name (1-4 words) that describes what this code DOES, not what it is. Focus on the action or purpose.
+   Good examples: "Parse JSON Response", "Validate Email Format", "Connect PostgreSQL", "Handle File Upload"
+   Bad examples: "Function Example", "Code Snippet", "JavaScript Code", "API Code"
+2. A summary (2-3 sentences) that describes what this code example demonstrates and its purpose
+
+Respond with a valid JSON object only, using the snippet ids, exactly in this format:
+{{
+  "summaries": [
+    {{"id": 0, "example_name": "Action-oriented name (1-4 words)", "summary": "2-3 sentence description"}}
+  ]
+}}
+Do not include commentary, markdown fences, or reasoning notes."""
+    )
+
+    provider_lower = provider.lower()
+    is_grok_model = (provider_lower == "grok") or ("grok" in model_choice.lower())
+    request_params = {
+        "model": model_choice,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a helpful assistant that analyzes code examples and provides JSON responses with example names and summaries.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": 500 * len(blocks) + 200,
+        "temperature": 0.3,
+    }
+    if provider_lower == "ollama":
+        request_params["format"] = "json"
+    elif not is_grok_model and (
+        provider_lower in {"openai", "google", "anthropic"}
+        or (provider_lower == "openrouter" and model_choice.startswith("openai/"))
+    ):
+        request_params["response_format"] = {"type": "json_object"}
+
+    results: list[dict[str, str] | None] = [None] * len(blocks)
+    async with get_threading_service().rate_limited_operation(
+        _estimate_summary_tokens(prompt, request_params["max_tokens"])
+    ):
+        response = await llm_client.chat.completions.create(
+            **prepare_chat_completion_params(model_choice, request_params)
+        )
+
+    choice = response.choices[0] if response.choices else None
+    content = extract_message_text(choice)[0] if choice else ""
+    if not content:
+        search_logger.warning(f"Empty batched summary response from {model_choice} for {len(blocks)} snippets")
+        return results
+
+    try:
+        payload = json.loads(_extract_json_payload(content.strip()))
+    except json.JSONDecodeError as e:
+        search_logger.warning(f"Failed to parse batched summary response: {e}. Response snippet: {repr(content[:200])}")
+        return results
+
+    entries = payload.get("summaries") if isinstance(payload, dict) else None
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            block_id = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        example_name = entry.get("example_name")
+        summary = entry.get("summary")
+        if (
+            0 <= block_id < len(blocks)
+            and isinstance(example_name, str) and example_name.strip()
+            and isinstance(summary, str) and summary.strip()
+        ):
+            results[block_id] = {"example_name": example_name.strip(), "summary": summary.strip()}
+
+    return results
 
 async def generate_code_summaries_batch(
-    code_blocks: list[dict[str, Any]], max_workers: int = None, progress_callback=None, provider: str = None
-) -> list[dict[str, str]]:
+    code_blocks: list[dict[str, Any]],
+    max_workers: int = None,
+    progress_callback=None,
+    provider: str = None,
+) -> list[dict[str, Any]]:
     """
     Generate summaries for multiple code blocks with rate limiting and proper worker management.
 
+    Identical snippets within the call are summarized once, and up to
+    CODE_SUMMARY_BATCH_SIZE snippets share a single structured-output LLM request.
+    Requests go through the shared threading-service rate limiter. Snippets seen in
+    earlier crawls are filtered out beforehand by find_known_code_summaries.
+
     Args:
         code_blocks: List of code block dictionaries
         max_workers: Maximum number of concurrent API requests
@@ -1013,7 +1367,8 @@ async def generate_code_summaries_batch(
         provider: LLM provider to use for generation (e.g., 'grok', 'openai', 'anthropic')
 
     Returns:
-        List of summary dictionaries
+        List of summary dictionaries; placeholders that did not come from the LLM
+        carry "fallback": True
     """
     if not code_blocks:
         return []
@@ -1031,88 +1386,105 @@ async def generate_code_summaries_batch(
         except:
             max_workers = 3  # Default fallback
 
+    batch_size = _get_summary_batch_size()
+    model_choice = await _get_model_choice()
+    if provider is None:
+        try:
+            provider_config = await credential_service.get_active_provider("llm")
+            provider = provider_config.get("provider", "openai")
+        except Exception as e:
+            search_logger.warning(f"Failed to get provider from credential service: {e}, defaulting to openai")
+            provider = "openai"
+
+    total = len(code_blocks)
+    summaries: list[dict[str, Any] | None] = [None] * total
+    keys = [_exact_code_key(block["code"], block.get("language", "")) for block in code_blocks]
+
+    # Coalesce identical snippets so each one is summarized once
+    pending: dict[str, list[int]] = defaultdict(list)
+    for i, key in enumerate(keys):
+        pending[key].append(i)
+
     search_logger.info(
-        f"Generating summaries for {len(code_blocks)} code blocks with max_workers={max_workers}"
+        f"Generating summaries for {total} code blocks with max_workers={max_workers}, "
+        f"batch_size={batch_size} ({len(pending)} unique)"
     )
 
+    completed_count = 0
+    lock = asyncio.Lock()
+
+    async def report_progress(newly_completed: int) -> None:
+        nonlocal completed_count
+        async with lock:
+            completed_count += newly_completed
+            if progress_callback:
+                # Simple progress based on summaries completed
+                try:
+                    await progress_callback({
+                        "status": "code_extraction",
+                        "percentage": int((completed_count / total) * 100),
+                        "log": f"Generated {completed_count}/{total} code summaries",
+                        "completed_summaries": completed_count,
+                        "total_summaries": total,
+                    })
+                except Exception as e:
+                    search_logger.warning(f"Code summary progress callback failed: {e}")
+
+    representatives = [indices[0] for indices in pending.values()]
+    batches = [representatives[i : i + batch_size] for i in range(0, len(representatives), batch_size)]
+    generated: dict[int, dict[str, Any]] = {}
+
     # Create a shared LLM client for all summaries (performance optimization)
     async with get_llm_client(provider=provider) as shared_client:
         search_logger.debug("Created shared LLM client for batch summary generation")
 
         # Semaphore to limit concurrent requests
         semaphore = asyncio.Semaphore(max_workers)
-        completed_count = 0
-        lock = asyncio.Lock()
 
-        async def generate_single_summary_with_limit(block: dict[str, Any]) -> dict[str, str]:
-            nonlocal completed_count
+        async def summarize_single(index: int) -> dict[str, Any]:
+            block = code_blocks[index]
+            try:
+                async with get_threading_service().rate_limited_operation(
+                    _estimate_summary_tokens(_single_summary_prompt_text(block), 2000)
+                ):
+                    return await _generate_code_example_summary_async(
+                        block["code"],
+                        block["context_before"],
+                        block["context_after"],
+                        block.get("language", ""),
+                        provider,
+                        shared_client  # Pass shared client for reuse
+                    )
+            except Exception as e:
+                search_logger.error(f"Error generating summary for code block {index}: {e}")
+                return _fallback_code_summary(block.get("language", ""))
+
+        async def summarize_batch(batch: list[int]) -> None:
             async with semaphore:
-                # Add delay between requests to avoid rate limiting
-                await asyncio.sleep(0.5)  # 500ms delay between requests
-
-                # Call async version directly with shared client (no event loop overhead)
-                result = await _generate_code_example_summary_async(
-                    block["code"],
-                    block["context_before"],
-                    block["context_after"],
-                    block.get("language", ""),
-                    provider,
-                    shared_client  # Pass shared client for reuse
-                )
+                results: list[dict[str, Any] | None] = [None] * len(batch)
+                if len(batch) > 1:
+                    try:
+                        results = await _generate_code_summaries_multi(
+                            shared_client, [code_blocks[i] for i in batch], provider, model_choice
+                        )
+                    except Exception as e:
+                        search_logger.warning(f"Batched summary request failed, summarizing individually: {e}")
 
-                # Update progress
-                async with lock:
-                    completed_count += 1
-                    if progress_callback:
-                        # Simple progress based on summaries completed
-                        progress_percentage = int((completed_count / len(code_blocks)) * 100)
-                        await progress_callback({
-                            "status": "code_extraction",
-                            "percentage": progress_percentage,
-                            "log": f"Generated {completed_count}/{len(code_blocks)} code summaries",
-                            "completed_summaries": completed_count,
-                            "total_summaries": len(code_blocks),
-                        })
-
-                return result
-
-        # Process all blocks concurrently but with rate limiting
-        try:
-            summaries = await asyncio.gather(
-                *[generate_single_summary_with_limit(block) for block in code_blocks],
-                return_exceptions=True,
-            )
+                for position, index in enumerate(batch):
+                    if results[position] is None:
+                        results[position] = await summarize_single(index)
+                    generated[index] = results[position]
 
-            # Handle any exceptions in the results
-            final_summaries = []
-            for i, summary in enumerate(summaries):
-                if isinstance(summary, Exception):
-                    search_logger.error(f"Error generating summary for code block {i}: {summary}")
-                    # Use fallback summary
-                    language = code_blocks[i].get("language", "")
-                    fallback = {
-                        "example_name": f"Code Example{f' ({language})' if language else ''}",
-                        "summary": "Code example for demonstration purposes.",
-                    }
-                    final_summaries.append(fallback)
-                else:
-                    final_summaries.append(summary)
+            await report_progress(sum(len(pending[keys[index]]) for index in batch))
 
-            search_logger.info(f"Successfully generated {len(final_summaries)} code summaries")
-            return final_summaries
+        await asyncio.gather(*[summarize_batch(batch) for batch in batches])
 
-        except Exception as e:
-            search_logger.error(f"Error in batch summary generation: {e}")
-            # Return fallback summaries for all blocks
-            fallback_summaries = []
-            for block in code_blocks:
-                language = block.get("language", "")
-                fallback = {
-                    "example_name": f"Code Example{f' ({language})' if language else ''}",
-                    "summary": "Code example for demonstration purposes.",
-                }
-                fallback_summaries.append(fallback)
-            return fallback_summaries
+    for index, summary in generated.items():
+        for duplicate in pending[keys[index]]:
+            summaries[duplicate] = summary
+
+    search_logger.info(f"Successfully generated {len(generated)} code summaries for {total} code blocks")
+    return summaries
 
 async def add_code_examples_to_database(
     repository: DatabaseRepository,
@@ -1126,6 +1498,7 @@ async def add_code_examples_to_database(
     progress_callback: Callable | None = None,
     provider: str | None = None,
     embedding_provider: str | None = None,
+    fallback_summaries: list[bool] | None = None,
 ):
     """
     Add code examples to the database code_examples table in batches.
@@ -1142,6 +1515,8 @@ async def add_code_examples_to_database(
         progress_callback: Optional async callback for progress updates
         provider: Optional LLM provider used for summary generation tracking
         embedding_provider: Optional embedding provider override for vector generation
+        fallback_summaries: Optional per-example flags marking placeholder summaries that
+            did not come from the LLM; these are not recorded for reuse
     """
     if not urls:
         return
@@ -1174,6 +1549,27 @@ async def add_code_examples_to_database(
         f"Using contextual embeddings for code examples: {use_contextual_embeddings}"
     )
 
+    # Get model information for tracking
+    from ..llm_provider_service import get_embedding_model
+
+    # Get embedding model name
+    embedding_model_name = await get_embedding_model(provider=embedding_provider)
+
+    # Consult the global fingerprint index so known snippets reuse their embeddings
+    code_texts = [code if isinstance(code, str) else str(code) for code in code_examples]
+    fingerprint_index, code_hashes, code_signatures = _fingerprint_code_examples(
+        code_texts, [(metadata or {}).get("language", "") or "" for metadata in metadatas]
+    )
+    try:
+        known_fingerprints = {
+            fingerprint["code_hash"]: fingerprint
+            for fingerprint in await repository.get_code_fingerprints(code_hashes)
+        }
+    except Exception as e:
+        search_logger.warning(f"Code fingerprint lookup failed, embedding all examples: {e}")
+        known_fingerprints = {}
+    reused_embedding_count = 0
+
     # Process in batches
     total_items = len(urls)
     for i in range(0, total_items, batch_size):
@@ -1197,6 +1593,30 @@ async def add_code_examples_to_database(
             combined_texts.append(combined_text)
             original_indices.append(j)
 
+        # Reuse stored embeddings of identical snippets embedded from the same text and model
+        # (contextual embeddings depend on the surrounding document, so they are never reused)
+        reused_embeddings: dict[int, list[float]] = {}
+        if not use_contextual_embeddings:
+            for j in original_indices:
+                fingerprint = known_fingerprints.get(code_hashes[j])
+                if (
+                    fingerprint
+                    and fingerprint.get("embedding")
+                    and fingerprint.get("embedding_model") == embedding_model_name
+                    and fingerprint.get("summary") == summaries[j]
+                ):
+                    reused_embeddings[j] = fingerprint["embedding"]
+
+            if reused_embeddings:
+                remaining = [
+                    (text, j)
+                    for text, j in zip(combined_texts, original_indices, strict=True)
+                    if j not in reused_embeddings
+                ]
+                combined_texts = [text for text, _ in remaining]
+                original_indices = [j for _, j in remaining]
+                reused_embedding_count += len(reused_embeddings)
+
         # Apply contextual embeddings if enabled
         if use_contextual_embeddings and url_to_full_document:
             # Get full documents for context
@@ -1221,28 +1641,28 @@ async def add_code_examples_to_database(
             batch_texts = combined_texts
 
         # Create embeddings for the batch (optionally overriding the embedding provider)
-        result = await create_embeddings_batch(batch_texts, provider=embedding_provider)
-
-        # Log any failures
-        if result.has_failures:
-            search_logger.error(
-                f"Failed to create {result.failure_count} code example embeddings. "
-                f"Successful: {result.success_count}"
-            )
-
-        # Use only successful embeddings
-        valid_embeddings = result.embeddings
-        successful_texts = result.texts_processed
+        valid_embeddings = []
+        successful_texts = []
+        if batch_texts:
+            result = await create_embeddings_batch(batch_texts, provider=embedding_provider)
 
-        # Get model information for tracking
-        from ..llm_provider_service import get_embedding_model
+            # Log any failures
+            if result.has_failures:
+                search_logger.error(
+                    f"Failed to create {result.failure_count} code example embeddings. "
+                    f"Successful: {result.success_count}"
+                )
 
-        # Get embedding model name
-        embedding_model_name = await get_embedding_model(provider=embedding_provider)
+            # Use only successful embeddings
+            valid_embeddings = result.embeddings
+            successful_texts = result.texts_processed
 
         # Get LLM chat model (used for code summaries and contextual embeddings if enabled)
         llm_chat_model = None
+        summary_model = None
         try:
+            # Summaries always come from MODEL_CHOICE; fingerprints record it for reuse
+            summary_model = await _get_model_choice()
             # First check if contextual embeddings were used
             if use_contextual_embeddings:
                 provider_config = await credential_service.get_active_provider("llm")
@@ -1252,17 +1672,19 @@ async def add_code_examples_to_database(
                     llm_chat_model = await credential_service.get_credential("MODEL_CHOICE", "gpt-4o-mini")
             else:
                 # For code summaries, we use MODEL_CHOICE
-                llm_chat_model = await _get_model_choice()
+                llm_chat_model = summary_model
         except Exception as e:
             search_logger.warning(f"Failed to get LLM chat model: {e}")
             llm_chat_model = "gpt-4o-mini"  # Default fallback
 
-        if not valid_embeddings:
+        if not valid_embeddings and not reused_embeddings:
             search_logger.warning("Skipping batch - no successful embeddings created")
             continue
 
         # Prepare batch data - only for successful embeddings
         batch_data = []
+        batch_fingerprints = []
+        embedded_items: list[tuple[int, Any]] = []
 
         # Build positions map to handle duplicate texts correctly
         # Each text maps to a queue of indices where it appears
@@ -1280,8 +1702,12 @@ async def add_code_examples_to_database(
                 search_logger.warning(f"Could not map embedding back to original code example (no remaining index for text: {text[:50]}...)")
                 continue
 
-            idx = orig_idx  # Global index into urls/chunk_numbers/etc.
+            embedded_items.append((orig_idx, embedding))
+
+        embedded_items.extend(reused_embeddings.items())
+        embedded_items.sort(key=lambda item: item[0])
 
+        for idx, embedding in embedded_items:  # idx: global index into urls/chunk_numbers/etc.
             # Use source_id from metadata if available, otherwise extract from URL
             if metadatas[idx] and "source_id" in metadatas[idx]:
                 source_id = metadatas[idx]["source_id"]
@@ -1321,6 +1747,23 @@ async def add_code_examples_to_database(
                 "embedding_dimension": embedding_dim,  # Add dimension tracking
             })
 
+            is_fallback_summary = bool(fallback_summaries and fallback_summaries[idx])
+            batch_fingerprints.append({
+                "code_hash": code_hashes[idx],
+                "minhash": signature_to_bytes(code_signatures[idx]),
+                "band_keys": fingerprint_index.persistent_band_keys(code_signatures[idx]),
+                "language": (metadatas[idx] or {}).get("language", ""),
+                "summary": None if is_fallback_summary else summaries[idx],
+                "example_name": None if is_fallback_summary else (metadatas[idx] or {}).get("example_name"),
+                "llm_chat_model": None if is_fallback_summary else summary_model,
+                "embedding_model": embedding_model_name,
+                "embedding_dimension": embedding_dim,
+                # Only plain (code + summary) embeddings are reusable across sources
+                "embedding": None
+                if use_contextual_embeddings or is_fallback_summary
+                else (embedding if isinstance(embedding, list) else embedding.tolist()),
+            })
+
         if not batch_data:
             search_logger.warning("No records to insert for this batch; skipping insert.")
             continue
@@ -1328,10 +1771,12 @@ async def add_code_examples_to_database(
         # Insert batch into database with retry logic
         max_retries = 3
         retry_delay = 1.0
+        stored_fingerprints: list[dict[str, Any]] = []
 
         for retry in range(max_retries):
             try:
                 await repository.insert_code_examples_batch(batch_data)
+                stored_fingerprints = batch_fingerprints
                 # Success - break out of retry loop
                 break
             except Exception as e:
@@ -1348,10 +1793,11 @@ async def add_code_examples_to_database(
                     # Optionally, try inserting records one by one as a last resort
                     search_logger.info("Attempting to insert records individually...")
                     successful_inserts = 0
-                    for record in batch_data:
+                    for record, fingerprint in zip(batch_data, batch_fingerprints, strict=True):
                         try:
                             await repository.insert_code_example(record)
                             successful_inserts += 1
+                            stored_fingerprints.append(fingerprint)
                         except Exception as individual_error:
                             search_logger.error(
                                 f"Failed to insert individual record for URL {record['url']}: {individual_error}"
@@ -1362,6 +1808,13 @@ async def add_code_examples_to_database(
                             f"Successfully inserted {successful_inserts}/{len(batch_data)} records individually"
                         )
 
+        # Record fingerprints of the stored rows so later sources and crawls can reuse this work
+        try:
+            if stored_fingerprints:
+                await repository.upsert_code_fingerprints(stored_fingerprints)
+        except Exception as e:
+            search_logger.warning(f"Failed to record code fingerprints: {e}")
+
         search_logger.info(
             f"Inserted batch {i // batch_size + 1} of {(total_items + batch_size - 1) // batch_size} code examples"
         )
@@ -1383,6 +1836,11 @@ async def add_code_examples_to_database(
                 "total_batches": total_batches,
             })
 
+    if reused_embedding_count:
+        search_logger.info(
+            f"Reused {reused_embedding_count}/{total_items} code example embeddings from the fingerprint index"
+        )
+
     # Report final completion at 100% after all batches are done
     if progress_callback and total_items > 0:
         await progress_callback({
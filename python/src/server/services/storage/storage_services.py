@@ -5,6 +5,7 @@ This module contains all storage service classes that handle document and data s
 These services extend the base storage functionality with specific implementations.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ...config.logfire_config import get_logger, safe_span
@@ -26,6 +27,7 @@ class DocumentStorageService(BaseStorageService):
         extract_code_examples: bool = True,
         progress_callback: Any | None = None,
         cancellation_check: Any | None = None,
+        chunks: list[str] | None = None,
     ) -> tuple[bool, dict[str, Any]]:
         """
         Upload and process a document file with progress reporting.
@@ -39,6 +41,7 @@ class DocumentStorageService(BaseStorageService):
             extract_code_examples: Whether to extract code examples from the document
             progress_callback: Optional callback for progress
             cancellation_check: Optional function to check for cancellation
+            chunks: Chunks already cut from file_content (see chunk_document_stream)
 
         Returns:
             Tuple of (success, result_dict)
@@ -60,13 +63,14 @@ class DocumentStorageService(BaseStorageService):
                 await report_progress("Starting document processing...", 10)
 
                 # Use base class chunking
-                chunks = await self.smart_chunk_text_async(
-                    file_content,
-                    chunk_size=5000,
-                    progress_callback=lambda msg, pct: report_progress(
-                        f"Chunking: {msg}", 10 + float(pct) * 0.2
-                    ),
-                )
+                if chunks is None:
+                    chunks = await self.smart_chunk_text_async(
+                        file_content,
+                        chunk_size=5000,
+                        progress_callback=lambda msg, pct: report_progress(
+                            f"Chunking: {msg}", 10 + float(pct) * 0.2
+                        ),
+                    )
 
                 if not chunks:
                     raise ValueError(f"No content could be extracted from {filename}. The file may be empty, corrupted, or in an unsupported format.")
@@ -231,6 +235,26 @@ class DocumentStorageService(BaseStorageService):
 
                 return False, {"error": f"Error uploading document: {str(e)}"}
 
+    async def chunk_document_stream(self, segments: AsyncIterator[str]) -> tuple[str, list[str]]:
+        """
+        Chunk document text segments as they are extracted.
+
+        Each segment is chunked while the next one is still being parsed, so
+        chunking overlaps extraction instead of waiting for the whole file.
+
+        Args:
+            segments: Text segments in document order (e.g. from stream_document_text)
+
+        Returns:
+            Tuple of (full_text, chunks)
+        """
+        texts: list[str] = []
+        chunks: list[str] = []
+        async for segment in segments:
+            texts.append(segment)
+            chunks.extend(await self.smart_chunk_text_async(segment, chunk_size=5000))
+        return "\n\n".join(texts), chunks
+
     async def store_documents(self, documents: list[dict[str, Any]], **kwargs) -> dict[str, Any]:
         """
         Store multiple documents. Implementation of abstract method.
@@ -5,25 +5,16 @@ This module provides utilities for extracting text from various document formats
 including PDF, Word documents, and plain text files.
 """
 
+import asyncio
 import io
+import multiprocessing
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
 
 # Removed direct logging import - using unified config
 
 # Import document processing libraries with availability checks
-try:
-    import PyPDF2
-
-    PYPDF2_AVAILABLE = True
-except ImportError:
-    PYPDF2_AVAILABLE = False
-
-try:
-    import pdfplumber
-
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-
 try:
     from docx import Document as DocxDocument
 
@@ -33,8 +24,25 @@ except ImportError:
 
 from ..config.logfire_config import get_logger, logfire
 
+# PDF parsing lives in workers.pdf_pages so process-pool workers can import it cheaply
+from ..workers.pdf_pages import (
+    PDFPLUMBER_AVAILABLE,
+    PYPDF2_AVAILABLE,
+    count_pdf_pages,
+    extract_pdf_page_range,
+    extract_pdf_pages,
+)
+
 logger = get_logger(__name__)
 
+# Pages handed to one process-pool task when parsing a PDF in parallel
+PDF_PAGES_PER_TASK = 8
+
+# Extracted text is chunked in segments of roughly this size while later pages are still parsing
+STREAM_SEGMENT_CHARS = 50_000
+
+_pdf_process_pool: ProcessPoolExecutor | None = None
+
 def _preserve_code_blocks_across_pages(text: str) -> str:
     """
     Fix code blocks that were split across PDF page boundaries.
@@ -219,7 +227,10 @@ def extract_text_from_document(file_content: bytes, filename: str, content_type:
 
 def extract_text_from_pdf(file_content: bytes) -> str:
     """
-    Extract text from PDF using both PyPDF2 and pdfplumber for best results.
+    Extract text from PDF using pdfplumber, falling back to PyPDF2 page by page.
+
+    Uploads are parsed in parallel by stream_document_text; this in-memory
+    variant parses the pages in the calling thread.
 
     Args:
         file_content: Raw PDF bytes
@@ -232,72 +243,23 @@ def extract_text_from_pdf(file_content: bytes) -> str:
             "No PDF processing libraries available. Please install pdfplumber and PyPDF2."
         )
 
-    text_content = []
+    total_pages = count_pdf_pages(io.BytesIO(file_content))
+    pages = extract_pdf_pages(io.BytesIO(file_content), 0, total_pages)
+
+    text_content = [f"--- Page {page_number} ---\n{text}" for page_number, text in pages if text.strip()]
+    if not text_content:
+        raise ValueError(
+            "No text extracted from PDF: file may be empty, images-only, "
+            "or scanned document without OCR"
+        )
+
+    processed_text = _preserve_code_blocks_across_pages("\n\n".join(text_content))
+    logger.debug(
+        f"PDF extracted: {len(text_content)}/{total_pages} pages, {len(processed_text)} chars, "
+        f"{processed_text.count('```') // 2} code blocks"
+    )
+    return processed_text
 
-    # First try with pdfplumber (better for complex layouts)
-    if PDFPLUMBER_AVAILABLE:
-        try:
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content.append(f"--- Page {page_num + 1} ---\n{page_text}")
-                    except Exception as e:
-                        logfire.warning(f"pdfplumber failed on page {page_num + 1}: {e}")
-                        continue
-
-            # If pdfplumber got good results, use them
-            if text_content and len("\n".join(text_content).strip()) > 100:
-                combined_text = "\n\n".join(text_content)
-                logger.info(f"🔍 PDF DEBUG: Extracted {len(text_content)} pages, total length: {len(combined_text)}")
-                logger.info(f"🔍 PDF DEBUG: First 500 chars: {repr(combined_text[:500])}")
-                
-                # Check for backticks before and after processing
-                backtick_count_before = combined_text.count("```")
-                logger.info(f"🔍 PDF DEBUG: Backticks found before processing: {backtick_count_before}")
-                
-                processed_text = _preserve_code_blocks_across_pages(combined_text)
-                backtick_count_after = processed_text.count("```")
-                logger.info(f"🔍 PDF DEBUG: Backticks found after processing: {backtick_count_after}")
-                
-                if backtick_count_after > 0:
-                    logger.info(f"🔍 PDF DEBUG: Sample after processing: {repr(processed_text[:1000])}")
-                
-                return processed_text
-
-        except Exception as e:
-            logfire.warning(f"pdfplumber extraction failed: {e}, trying PyPDF2")
-
-    # Fallback to PyPDF2
-    if PYPDF2_AVAILABLE:
-        try:
-            text_content = []
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(f"--- Page {page_num + 1} ---\n{page_text}")
-                except Exception as e:
-                    logfire.warning(f"PyPDF2 failed on page {page_num + 1}: {e}")
-                    continue
-
-            if text_content:
-                combined_text = "\n\n".join(text_content)
-                return _preserve_code_blocks_across_pages(combined_text)
-            else:
-                raise ValueError(
-                    "No text extracted from PDF: file may be empty, images-only, "
-                    "or scanned document without OCR"
-                )
-
-        except Exception as e:
-            raise Exception("PyPDF2 failed to extract text") from e
-
-    # If we get here, no libraries worked
-    raise Exception("Failed to extract text from PDF - no working PDF libraries available")
 
 def extract_text_from_docx(file_content: bytes) -> str:
     """
@@ -337,3 +299,127 @@ def extract_text_from_docx(file_content: bytes) -> str:
 
     except Exception as e:
         raise Exception("Failed to extract text from Word document") from e
+
+
+def get_pdf_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool used for PDF parsing (DOCUMENT_PARSE_WORKERS, default: up to 4).
+
+    Workers are spawned rather than forked so they don't inherit the server's
+    threads and event loop.
+    """
+    global _pdf_process_pool
+    if _pdf_process_pool is None:
+        default_workers = max(1, min(4, os.cpu_count() or 1))
+        try:
+            max_workers = max(1, int(os.getenv("DOCUMENT_PARSE_WORKERS", str(default_workers))))
+        except ValueError:
+            max_workers = default_workers
+        _pdf_process_pool = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_process_pool
+
+
+def shutdown_pdf_process_pool() -> None:
+    """Stop the PDF parsing workers."""
+    global _pdf_process_pool
+    if _pdf_process_pool is not None:
+        _pdf_process_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_process_pool = None
+
+
+def _reject_empty_file(path: str, filename: str) -> None:
+    """Raise ValueError for an empty file (it can't be memory-mapped or parsed)."""
+    if os.path.getsize(path) == 0:
+        raise ValueError(f"The file {filename} appears to be empty.")
+
+
+async def stream_pdf_pages(path: str) -> AsyncIterator[tuple[int, int, str]]:
+    """
+    Parse a PDF file in the process pool, yielding pages in order as they complete.
+
+    Yields:
+        (page_number, total_pages, text) for every page, including empty ones
+
+    Raises:
+        ValueError: If the file is empty
+    """
+    _reject_empty_file(path, os.path.basename(path))
+    total_pages = await asyncio.to_thread(count_pdf_pages, path)
+    loop = asyncio.get_running_loop()
+    pool = get_pdf_process_pool()
+    futures = [
+        loop.run_in_executor(pool, extract_pdf_page_range, path, start, min(start + PDF_PAGES_PER_TASK, total_pages))
+        for start in range(0, total_pages, PDF_PAGES_PER_TASK)
+    ]
+    try:
+        for future in futures:
+            for page_number, text in await future:
+                yield page_number, total_pages, text
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def stream_document_text(
+    path: str,
+    filename: str,
+    content_type: str,
+    page_callback: Callable[[int, int], Awaitable[None]] | None = None,
+) -> AsyncIterator[str]:
+    """
+    Extract text from a document on disk, yielding it in segments as pages are parsed.
+
+    PDF pages are parsed in the process pool and grouped into segments of about
+    STREAM_SEGMENT_CHARS; a segment never ends inside an open code block, so
+    code blocks split across pages are still rejoined. Other formats are
+    extracted in a worker thread and yielded as one segment.
+
+    Args:
+        path: Path of the spooled upload
+        filename: Name of the file
+        content_type: MIME type of the file
+        page_callback: Optional async callback(pages_done, total_pages)
+
+    Raises:
+        ValueError: If the file is empty, the format is unsupported or no text could be extracted
+    """
+    _reject_empty_file(path, filename)
+    if not (content_type == "application/pdf" or filename.lower().endswith(".pdf")):
+        def extract() -> str:
+            with open(path, "rb") as f:
+                return extract_text_from_document(f.read(), filename, content_type)
+
+        text = await asyncio.to_thread(extract)
+        if page_callback:
+            await page_callback(1, 1)
+        yield text
+        return
+
+    buffer: list[str] = []
+    buffered_chars = 0
+    code_fences = 0
+    extracted_any = False
+    async for page_number, total_pages, page_text in stream_pdf_pages(path):
+        if page_text.strip():
+            buffer.append(f"--- Page {page_number} ---\n{page_text}")
+            buffered_chars += len(buffer[-1])
+            code_fences += page_text.count("```")
+        if page_callback:
+            await page_callback(page_number, total_pages)
+
+        if buffered_chars >= STREAM_SEGMENT_CHARS and code_fences % 2 == 0:
+            extracted_any = True
+            yield _preserve_code_blocks_across_pages("\n\n".join(buffer))
+            buffer, buffered_chars, code_fences = [], 0, 0
+
+    if buffer:
+        extracted_any = True
+        yield _preserve_code_blocks_across_pages("\n\n".join(buffer))
+    if not extracted_any:
+        raise ValueError(
+            "No text extracted from PDF: file may be empty, images-only, "
+            "or scanned document without OCR"
+        )
+
@@ -0,0 +1,122 @@
+"""JSON Patch (RFC 6902) utilities for delta-encoded document versions.
+
+Only the add/remove/replace operations are produced and understood, which is
+all that is needed to turn one JSON value into another.
+"""
+
+import copy
+from typing import Any
+
+
+def _escape(token: str | int) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _diff(old: Any, new: Any, path: str, patch: list[dict[str, Any]]) -> None:
+    if type(old) is type(new) and isinstance(old, dict):
+        for key in old:
+            if key not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            if key not in old:
+                patch.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+            else:
+                _diff(old[key], value, f"{path}/{_escape(key)}", patch)
+        return
+
+    if type(old) is type(new) and isinstance(old, list):
+        # Skip the common prefix and suffix, then patch the differing middle
+        start = 0
+        while start < len(old) and start < len(new) and old[start] == new[start]:
+            start += 1
+        old_end, new_end = len(old), len(new)
+        while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        common = min(old_end, new_end) - start
+        for offset in range(common):
+            _diff(old[start + offset], new[start + offset], f"{path}/{start + offset}", patch)
+        # Remove from the back so earlier indexes stay valid
+        for index in range(old_end - 1, start + common - 1, -1):
+            patch.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(start + common, new_end):
+            patch.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        return
+
+    if old != new or type(old) is not type(new):
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def diff_json(old: Any, new: Any) -> list[dict[str, Any]]:
+    """Build a JSON Patch that turns old into new.
+
+    Args:
+        old: Source JSON value
+        new: Target JSON value
+
+    Returns:
+        List of add/remove/replace operations (empty if the values are equal)
+    """
+    patch: list[dict[str, Any]] = []
+    _diff(old, new, "", patch)
+    return patch
+
+
+def apply_json_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """Apply a JSON Patch produced by diff_json.
+
+    Args:
+        document: JSON value to patch (left unmodified)
+        patch: add/remove/replace operations
+
+    Returns:
+        The patched JSON value
+
+    Raises:
+        ValueError: If an operation is unsupported or its path does not exist
+    """
+    result = copy.deepcopy(document)
+    for operation in patch:
+        op, path = operation.get("op"), operation.get("path", "")
+        if op not in ("add", "remove", "replace"):
+            raise ValueError(f"Unsupported JSON Patch operation: {op}")
+
+        if path == "":
+            if op == "remove":
+                raise ValueError("Cannot remove the document root")
+            result = copy.deepcopy(operation["value"])
+            continue
+
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        try:
+            target = result
+            for token in parents:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+
+            value = copy.deepcopy(operation.get("value"))
+            if isinstance(target, list):
+                index = len(target) if last == "-" else int(last)
+                if op == "add":
+                    if index > len(target):
+                        raise IndexError(index)
+                    target.insert(index, value)
+                elif op == "remove":
+                    del target[index]
+                else:
+                    target[index] = value
+            else:
+                if op != "add" and last not in target:
+                    raise KeyError(last)
+                if op == "remove":
+                    del target[last]
+                else:
+                    target[last] = value
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid JSON Patch path: {path}") from e
+
+    return result
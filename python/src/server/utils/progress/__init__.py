@@ -3,6 +3,7 @@ Progress Tracking Utilities
 
 Provides utilities for tracking and broadcasting progress updates.
 """
+from .progress_broadcaster import ProgressBroadcaster, progress_broadcaster
 from .progress_tracker import ProgressTracker
 
-__all__ = ['ProgressTracker']
+__all__ = ['ProgressBroadcaster', 'ProgressTracker', 'progress_broadcaster']
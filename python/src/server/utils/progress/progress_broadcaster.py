@@ -0,0 +1,195 @@
+"""
+Progress Broadcaster
+
+Pushes ProgressTracker updates to streaming subscribers (Server-Sent Events).
+
+Each operation gets a channel once somebody subscribes to it. Every update becomes
+an event with a per-operation, monotonically increasing id that carries the
+current state (without the log list) and only the log entries added since the
+previous event. Subscribers read from small bounded queues; when a slow
+subscriber's queue is full, the newest update is merged into the last queued
+event instead of growing the queue. A short event history lets reconnecting
+clients resume from their Last-Event-ID with a single coalesced delta.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any
+
+# Log entries kept per (coalesced) event; matches ProgressTracker's log retention
+MAX_EVENT_LOGS = 200
+
+
+def merge_progress_events(older: dict[str, Any], newer: dict[str, Any]) -> dict[str, Any]:
+    """Coalesce two consecutive events: newest state, concatenated log deltas."""
+    return {
+        "id": newer["id"],
+        "state": newer["state"],
+        "logs": (older["logs"] + newer["logs"])[-MAX_EVENT_LOGS:],
+        "snapshot": older["snapshot"] or newer["snapshot"],
+    }
+
+
+class ProgressSubscription:
+    """Bounded, coalescing event queue for one streaming client."""
+
+    def __init__(self, progress_id: str, max_queue_size: int):
+        self.progress_id = progress_id
+        self.max_queue_size = max(1, max_queue_size)
+        self.coalesced_count = 0
+        self.closed = False
+        self._events: deque[dict[str, Any]] = deque()
+        self._ready = asyncio.Event()
+
+    def push(self, event: dict[str, Any]) -> None:
+        """Queue an event, merging it into the last queued one if the queue is full."""
+        if self.closed:
+            return
+        if len(self._events) >= self.max_queue_size:
+            self._events.append(merge_progress_events(self._events.pop(), event))
+            self.coalesced_count += 1
+        else:
+            self._events.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop the subscription; pending events can still be drained."""
+        self.closed = True
+        self._ready.set()
+
+    async def get(self, timeout: float) -> dict[str, Any] | None:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait before returning None (used for keep-alives)
+
+        Returns:
+            The next event, or None on timeout or when closed with nothing pending
+        """
+        if not self._events and not self.closed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return None
+        if self._events:
+            return self._events.popleft()
+        return None
+
+
+class _ProgressChannel:
+    """Per-operation event sequence, history and subscribers."""
+
+    def __init__(self, history_size: int):
+        self.last_event_id = 0
+        self.history: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self.subscribers: set[ProgressSubscription] = set()
+
+
+class ProgressBroadcaster:
+    """Fan-out of progress updates to streaming subscribers."""
+
+    def __init__(self, max_queue_size: int = 16, history_size: int = 64):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            max_queue_size: Pending events per subscriber before coalescing kicks in
+            history_size: Events kept per operation for Last-Event-ID resumption
+        """
+        self.max_queue_size = max_queue_size
+        self.history_size = history_size
+        self._channels: dict[str, _ProgressChannel] = {}
+
+    def publish(self, progress_id: str, state: dict[str, Any], new_logs: list[dict[str, Any]] | None = None) -> None:
+        """
+        Publish a progress update. No-op for operations nobody has subscribed to.
+
+        Args:
+            progress_id: Operation identifier
+            state: Current progress state (the "logs" list is not copied)
+            new_logs: Log entries added by this update
+        """
+        channel = self._channels.get(progress_id)
+        if channel is None:
+            return
+
+        channel.last_event_id += 1
+        event = {
+            "id": channel.last_event_id,
+            "state": {key: value for key, value in state.items() if key != "logs"},
+            "logs": list(new_logs or []),
+            "snapshot": False,
+        }
+        channel.history.append(event)
+        for subscription in channel.subscribers:
+            subscription.push(event)
+
+    def subscribe(
+        self, progress_id: str, state: dict[str, Any], last_event_id: int | None = None
+    ) -> ProgressSubscription:
+        """
+        Subscribe to an operation's updates.
+
+        The first queued event brings the client up to date: a coalesced delta of
+        the events after last_event_id when they are still in the history,
+        otherwise a full snapshot of the current state including its logs.
+
+        Args:
+            progress_id: Operation identifier
+            state: Current progress state, used for the initial snapshot
+            last_event_id: Last event id the client received (reconnects)
+
+        Returns:
+            Subscription to read events from; call unsubscribe() when done
+        """
+        channel = self._channels.get(progress_id)
+        if channel is None:
+            channel = self._channels[progress_id] = _ProgressChannel(self.history_size)
+
+        subscription = ProgressSubscription(progress_id, self.max_queue_size)
+
+        oldest_id = channel.history[0]["id"] if channel.history else channel.last_event_id + 1
+        if last_event_id is not None and last_event_id >= oldest_id - 1 and last_event_id <= channel.last_event_id:
+            missed = [event for event in channel.history if event["id"] > last_event_id]
+            if missed:
+                catch_up = missed[0]
+                for event in missed[1:]:
+                    catch_up = merge_progress_events(catch_up, event)
+                subscription.push(catch_up)
+        else:
+            subscription.push({
+                "id": channel.last_event_id,
+                "state": {key: value for key, value in state.items() if key != "logs"},
+                "logs": list(state.get("logs", []))[-MAX_EVENT_LOGS:],
+                "snapshot": True,
+            })
+
+        channel.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        """Detach a subscription. The channel history is kept for reconnects."""
+        subscription.close()
+        channel = self._channels.get(subscription.progress_id)
+        if channel is not None:
+            channel.subscribers.discard(subscription)
+
+    def close_channel(self, progress_id: str) -> None:
+        """Drop an operation's channel and close its subscribers (after cleanup)."""
+        channel = self._channels.pop(progress_id, None)
+        if channel is not None:
+            for subscription in channel.subscribers:
+                subscription.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get channel/subscriber counts for monitoring."""
+        return {
+            "channels": len(self._channels),
+            "subscribers": sum(len(channel.subscribers) for channel in self._channels.values()),
+        }
+
+
+# Global broadcaster instance fed by ProgressTracker
+progress_broadcaster = ProgressBroadcaster()
@@ -1,7 +1,8 @@
 """
 Progress Tracker Utility
 
-Tracks operation progress in memory for HTTP polling access.
+Tracks operation progress in memory for HTTP polling access and pushes each
+update to streaming subscribers through the progress broadcaster.
 """
 
 import asyncio
@@ -9,6 +10,7 @@ from datetime import datetime
 from typing import Any
 
 from ...config.logfire_config import safe_logfire_error, safe_logfire_info
+from .progress_broadcaster import progress_broadcaster
 
 class ProgressTracker:
     """
@@ -50,6 +52,7 @@ class ProgressTracker:
         """Remove progress state from memory."""
         if progress_id in cls._progress_states:
             del cls._progress_states[progress_id]
+        progress_broadcaster.close_channel(progress_id)
 
     @classmethod
     def list_active(cls) -> dict[str, dict[str, Any]]:
@@ -69,6 +72,7 @@ class ProgressTracker:
             # Only clean up if still in terminal state (prevent cleanup of reused IDs)
             if status in ["completed", "failed", "error", "cancelled"]:
                 del cls._progress_states[progress_id]
+                progress_broadcaster.close_channel(progress_id)
                 safe_logfire_info(f"Progress state cleaned up after delay | progress_id={progress_id} | status={status}")
 
     async def start(self, initial_data: dict[str, Any] | None = None):
@@ -139,12 +143,13 @@ class ProgressTracker:
         # Add log entry
         if "logs" not in self.state:
             self.state["logs"] = []
-        self.state["logs"].append({
+        log_entry = {
             "timestamp": datetime.now().isoformat(),
             "message": log,
             "status": status,
             "progress": actual_progress,  # Use the actual progress after "never go backwards" check
-        })
+        }
+        self.state["logs"].append(log_entry)
         # Keep only the last 200 log entries
         if len(self.state["logs"]) > 200:
             self.state["logs"] = self.state["logs"][-200:]
@@ -156,7 +161,7 @@ class ProgressTracker:
                 self.state[key] = value
         
 
-        self._update_state()
+        self._update_state(new_logs=[log_entry])
         
         # Schedule cleanup for terminal states
         if status in ["cancelled", "failed"]:
@@ -341,10 +346,16 @@ class ProgressTracker:
             current_file=current_file
         )
 
-    def _update_state(self):
-        """Update progress state in memory storage."""
+    def _update_state(self, new_logs: list[dict[str, Any]] | None = None):
+        """
+        Update progress state in memory storage and notify stream subscribers.
+
+        Args:
+            new_logs: Log entries added by this update (sent as the event's log delta)
+        """
         # Update the class-level dictionary
         ProgressTracker._progress_states[self.progress_id] = self.state
+        progress_broadcaster.publish(self.progress_id, self.state, new_logs)
 
         safe_logfire_info(
             f"📊 [PROGRESS] Updated {self.operation_type} | ID: {self.progress_id} | "
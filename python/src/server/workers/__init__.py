@@ -0,0 +1,6 @@
+"""
+Process-pool worker functions.
+
+Modules in this package are imported by spawned worker processes, so they
+must stay cheap to import: no service, repository or logfire imports.
+"""
@@ -0,0 +1,113 @@
+"""
+PDF page extraction run in the document parsing process pool.
+
+Spawned workers import this module to unpickle extract_pdf_page_range, so it
+depends only on the PDF libraries and the standard library.
+"""
+
+import logging
+import mmap
+from typing import BinaryIO
+
+try:
+    import PyPDF2
+
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    PYPDF2_AVAILABLE = False
+
+try:
+    import pdfplumber
+
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def count_pdf_pages(source: str | BinaryIO) -> int:
+    """
+    Count the pages of a PDF (path or binary stream) without extracting any text.
+
+    PyPDF2 is tried first (cheaper); pdfplumber is used if it is missing or
+    can't read the document.
+    """
+    if not PDFPLUMBER_AVAILABLE and not PYPDF2_AVAILABLE:
+        raise Exception("No PDF processing libraries available. Please install pdfplumber and PyPDF2.")
+
+    if PYPDF2_AVAILABLE:
+        try:
+            return len(PyPDF2.PdfReader(source).pages)
+        except Exception as e:
+            if not PDFPLUMBER_AVAILABLE:
+                raise Exception("PyPDF2 failed to read PDF") from e
+            logger.warning(f"PyPDF2 could not read PDF: {e}, trying pdfplumber")
+            if not isinstance(source, str):
+                source.seek(0)
+
+    try:
+        with pdfplumber.open(source) as pdf:
+            return len(pdf.pages)
+    except Exception as e:
+        raise Exception("Failed to read PDF with pdfplumber or PyPDF2") from e
+
+
+def extract_pdf_pages(stream: BinaryIO, start: int, end: int) -> list[tuple[int, str]]:
+    """
+    Extract text from pages [start, end) of a PDF stream.
+
+    The fallback is chosen per page: pdfplumber (better for complex layouts)
+    first, PyPDF2 only for pages pdfplumber can't read, so no page is parsed
+    twice unnecessarily. If pdfplumber can't open the document at all, every
+    page goes to PyPDF2.
+
+    Returns:
+        (page_number, text) pairs, 1-based, in page order
+    """
+    pages: list[tuple[int, str]] = []
+    plumber_pdf = None
+    if PDFPLUMBER_AVAILABLE:
+        try:
+            plumber_pdf = pdfplumber.open(stream)
+        except Exception as e:
+            if not PYPDF2_AVAILABLE:
+                raise Exception("pdfplumber failed to open PDF") from e
+            logger.warning(f"pdfplumber could not open PDF: {e}, trying PyPDF2")
+
+    pypdf_reader = None
+    if plumber_pdf is None:
+        try:
+            pypdf_reader = PyPDF2.PdfReader(stream)
+        except Exception as e:
+            raise Exception("Failed to open PDF with pdfplumber or PyPDF2") from e
+    try:
+        for index in range(start, end):
+            text = ""
+            if plumber_pdf is not None:
+                try:
+                    page = plumber_pdf.pages[index]
+                    text = page.extract_text() or ""
+                    page.close()
+                except Exception as e:
+                    logger.warning(f"pdfplumber failed on page {index + 1}: {e}")
+
+            if not text.strip() and PYPDF2_AVAILABLE:
+                try:
+                    if pypdf_reader is None:
+                        pypdf_reader = PyPDF2.PdfReader(stream)
+                    text = pypdf_reader.pages[index].extract_text() or ""
+                except Exception as e:
+                    logger.warning(f"PyPDF2 failed on page {index + 1}: {e}")
+
+            pages.append((index + 1, text))
+    finally:
+        if plumber_pdf is not None:
+            plumber_pdf.close()
+    return pages
+
+
+def extract_pdf_page_range(path: str, start: int, end: int) -> list[tuple[int, str]]:
+    """Process-pool task: extract pages [start, end) from a memory-mapped PDF file."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return extract_pdf_pages(mapped, start, end)
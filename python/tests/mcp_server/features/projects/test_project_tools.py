@@ -141,12 +141,14 @@ async def test_find_projects_success(mock_mcp, mock_context):
         mock_async_client.get.return_value = mock_response
         mock_client.return_value.__aenter__.return_value = mock_async_client
 
-        result = await find_projects(mock_context)
+        result = await find_projects(mock_context, query="auth", cursor="abc")
 
         result_data = json.loads(result)
         assert result_data["success"] is True
         assert len(result_data["projects"]) == 2
         assert result_data["count"] == 2
+        # Search and pagination happen in the API
+        assert mock_async_client.get.call_args.kwargs["params"] == {"limit": 10, "query": "auth", "cursor": "abc"}
 
 
 @pytest.mark.asyncio
@@ -233,3 +233,56 @@ async def test_delete_task_already_archived(mock_mcp, mock_context):
         )
         assert result_data["error"]["type"] == "http_error"
         assert "http 400" in result_data["error"]["message"].lower()
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_batch_single_request(mock_mcp, mock_context):
+    """Test a batch create sends the whole plan in one POST."""
+    register_task_tools(mock_mcp)
+    manage_task = mock_mcp._tools.get("manage_task")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "tasks": [{"id": f"task-{i}", "title": f"Step {i}"} for i in range(50)],
+        "count": 50,
+        "message": "50 tasks created successfully",
+    }
+
+    with patch("src.mcp_server.features.tasks.task_tools.httpx.AsyncClient") as mock_client:
+        mock_async_client = AsyncMock()
+        mock_async_client.post.return_value = mock_response
+        mock_client.return_value.__aenter__.return_value = mock_async_client
+
+        result = await manage_task(
+            mock_context,
+            action="create",
+            project_id="project-123",
+            tasks=[{"title": f"Step {i}", "feature": "plan"} for i in range(50)],
+        )
+
+        result_data = json.loads(result)
+        assert result_data["success"] is True
+        assert result_data["count"] == 50
+
+        assert mock_async_client.post.call_count == 1
+        call_args = mock_async_client.post.call_args
+        assert call_args[0][0].endswith("/api/tasks/batch")
+        sent_tasks = call_args[1]["json"]["tasks"]
+        assert len(sent_tasks) == 50
+        assert {task["project_id"] for task in sent_tasks} == {"project-123"}
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_batch_requires_task_ids(mock_mcp, mock_context):
+    """Test a batch update rejects entries without task_id before any request."""
+    register_task_tools(mock_mcp)
+    manage_task = mock_mcp._tools.get("manage_task")
+
+    result = await manage_task(
+        mock_context, action="update", tasks=[{"task_id": "t-1", "status": "done"}, {"status": "doing"}]
+    )
+
+    result_data = json.loads(result)
+    assert result_data["success"] is False
+    assert result_data["error"]["type"] == "validation_error"
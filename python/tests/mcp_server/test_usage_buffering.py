@@ -0,0 +1,166 @@
+"""
+Tests for buffered, batched MCP usage event writes.
+
+Validates that tool calls only append to the in-memory buffer and that the
+background flusher, size trigger, drop counter and shutdown flush behave.
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+
+from src.mcp_server.middleware.usage_tracker import MCPUsageTracker
+
+MIGRATION = Path(__file__).resolve().parents[3] / "migration" / "sqlite" / "002_mcp_usage_tracking.sql"
+
+
+@pytest.fixture
+async def tracker():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "archon.db")
+        async with aiosqlite.connect(db_path) as conn:
+            await conn.executescript(MIGRATION.read_text())
+            await conn.commit()
+
+        tracker = MCPUsageTracker()
+        tracker.db_path = db_path
+        tracker.flush_interval_ms = 60_000
+        yield tracker
+        await tracker.shutdown()
+
+
+async def count_events(db_path: str) -> int:
+    async with aiosqlite.connect(db_path) as conn:
+        cursor = await conn.execute("SELECT COUNT(*) FROM archon_mcp_usage_events")
+        return (await cursor.fetchone())[0]
+
+
+async def test_events_are_buffered_until_flush(tracker):
+    await tracker.track_tool_usage("find_projects", "project", {"query": "x"}, response_time_ms=12)
+
+    assert await count_events(tracker.db_path) == 0
+    assert await tracker.flush() == 1
+    assert await count_events(tracker.db_path) == 1
+
+    async with aiosqlite.connect(tracker.db_path) as conn:
+        cursor = await conn.execute("SELECT call_count FROM archon_mcp_usage_hourly")
+        assert (await cursor.fetchone())[0] == 1
+
+
+async def test_full_batch_wakes_flusher(tracker):
+    tracker.flush_batch_size = 3
+
+    for _ in range(3):
+        await tracker.track_tool_usage("find_tasks", "task", {})
+    for _ in range(50):
+        if tracker.get_stats()["written"] == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    stats = tracker.get_stats()
+    assert stats["written"] == 3
+    assert stats["flushes"] == 1
+    assert stats["pending"] == 0
+
+
+async def test_full_buffer_drops_oldest(tracker):
+    tracker.buffer_size = 2
+    tracker.flush_batch_size = 100
+
+    for name in ("first", "second", "third"):
+        await tracker.track_tool_usage(name, "test", {})
+    await tracker.flush()
+
+    async with aiosqlite.connect(tracker.db_path) as conn:
+        cursor = await conn.execute("SELECT tool_name FROM archon_mcp_usage_events ORDER BY tool_name")
+        assert [row[0] for row in await cursor.fetchall()] == ["second", "third"]
+    assert tracker.get_stats()["dropped"] == 1
+
+
+async def test_failed_flush_requeues_batch(tracker):
+    db_path = tracker.db_path
+    tracker.buffer_size = 3
+    for name in ("first", "second"):
+        await tracker.track_tool_usage(name, "test", {})
+
+    tracker.db_path = os.path.join(db_path, "missing", "archon.db")
+    assert await tracker.flush() == 0
+    assert tracker.get_stats()["pending"] == 2
+
+    # Requeued events go back in front; overflow drops the oldest
+    await tracker.track_tool_usage("third", "test", {})
+    await tracker.track_tool_usage("fourth", "test", {})
+    tracker.db_path = db_path
+    assert await tracker.flush() == 3
+
+    async with aiosqlite.connect(db_path) as conn:
+        cursor = await conn.execute("SELECT tool_name FROM archon_mcp_usage_events ORDER BY tool_name")
+        assert [row[0] for row in await cursor.fetchall()] == ["fourth", "second", "third"]
+    assert tracker.get_stats()["dropped"] == 1
+
+
+async def test_shutdown_flushes_pending_events(tracker):
+    await tracker.track_tool_usage("manage_task", "task", {})
+
+    await tracker.shutdown()
+
+    assert await count_events(tracker.db_path) == 1
+    assert tracker.get_stats()["pending"] == 0
+
+
+def slow_rollup_write(tracker, started: asyncio.Event):
+    """Make the flush transaction block briefly after it has started."""
+    write = tracker._rollups.write
+
+    async def slow_write(conn, deltas):
+        started.set()
+        await asyncio.sleep(0.05)
+        await write(conn, deltas)
+
+    tracker._rollups.write = slow_write
+
+
+async def test_shutdown_waits_for_in_flight_flush(tracker):
+    started = asyncio.Event()
+    slow_rollup_write(tracker, started)
+    tracker.flush_batch_size = 1
+
+    await tracker.track_tool_usage("find_tasks", "task", {})
+    await started.wait()
+    await tracker.shutdown()
+
+    assert await count_events(tracker.db_path) == 1
+    assert tracker.get_stats()["pending"] == 0
+
+
+async def test_cancelled_flush_requeues_batch(tracker):
+    started = asyncio.Event()
+    slow_rollup_write(tracker, started)
+    await tracker.track_tool_usage("find_tasks", "task", {})
+
+    flush = asyncio.create_task(tracker.flush())
+    await started.wait()
+    flush.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flush
+
+    assert tracker.get_stats()["pending"] == 1
+    assert tracker._rollups.pending
+    assert await tracker.flush() == 1
+
+
+async def test_tool_call_does_not_open_connection(tracker):
+    @tracker.track_tool("health_check", "health")
+    async def health_check():
+        return "ok"
+
+    with patch("src.mcp_server.middleware.usage_tracker.aiosqlite.connect") as mock_connect:
+        assert await health_check() == "ok"
+
+    mock_connect.assert_not_called()
+    assert tracker.get_stats()["pending"] == 1
@@ -0,0 +1,192 @@
+"""
+Tests for the MCP usage rollup aggregator.
+
+Validates that the tracker's flush merges hourly, daily and per-source
+rollups with latency histograms, and that the analytics endpoints read them.
+"""
+
+import json
+import os
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.mcp_server.middleware.usage_tracker import MCPUsageTracker
+from src.server.api_routes.mcp_analytics_api import router
+from src.server.services.mcp_usage_rollups import (
+    HISTOGRAM_SIZE,
+    LATENCY_BUCKET_BOUNDS_MS,
+    histogram_percentile,
+    latency_bucket_index,
+    merge_histograms,
+)
+
+MIGRATIONS = Path(__file__).resolve().parents[3] / "migration" / "sqlite"
+
+
+@pytest.fixture
+async def tracker():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "archon.db")
+        async with aiosqlite.connect(db_path) as conn:
+            await conn.executescript((MIGRATIONS / "002_mcp_usage_tracking.sql").read_text())
+            await conn.execute(
+                "CREATE TABLE archon_sources (source_id TEXT PRIMARY KEY, source_display_name TEXT, "
+                "title TEXT, source_url TEXT)"
+            )
+            await conn.execute("INSERT INTO archon_sources (source_id, title) VALUES ('src-1', 'Docs')")
+            await conn.commit()
+
+        tracker = MCPUsageTracker()
+        tracker.db_path = db_path
+        tracker.flush_interval_ms = 60_000
+        tracker.set_session_context("session-1")
+        yield tracker
+        await tracker.shutdown()
+
+
+async def fetch_all(db_path: str, sql: str) -> list[dict]:
+    async with aiosqlite.connect(db_path) as conn:
+        conn.row_factory = aiosqlite.Row
+        cursor = await conn.execute(sql)
+        return [dict(row) for row in await cursor.fetchall()]
+
+
+def test_histogram_helpers():
+    assert latency_bucket_index(0) == 0
+    assert latency_bucket_index(5) == 2
+    assert latency_bucket_index(6) == 3
+    assert latency_bucket_index(10**6) == HISTOGRAM_SIZE - 1
+
+    histogram = json.loads(merge_histograms(json.dumps([1] + [0] * 15), None, "not json"))
+    histogram[latency_bucket_index(300)] += 98
+    histogram[latency_bucket_index(10**6)] += 1
+
+    assert histogram_percentile(histogram, 50) == 500
+    assert histogram_percentile(histogram, 100) == LATENCY_BUCKET_BOUNDS_MS[-1]
+    assert histogram_percentile([0] * HISTOGRAM_SIZE, 50) is None
+
+
+async def test_flush_merges_rollups_across_flushes(tracker):
+    await tracker.track_tool_usage("rag_search", "rag", {"source_id": "src-1", "query": "a"}, response_time_ms=40)
+    await tracker.flush()
+    await tracker.track_tool_usage("rag_search", "rag", {"source_id": "src-1", "query": "a"}, response_time_ms=400)
+    await tracker.track_tool_usage(
+        "rag_search", "rag", {"source_id": "src-1", "query": "b"}, response_time_ms=3, success=False
+    )
+    await tracker.flush()
+
+    hourly = await fetch_all(tracker.db_path, "SELECT * FROM archon_mcp_usage_hourly")
+    daily = await fetch_all(tracker.db_path, "SELECT * FROM archon_mcp_usage_daily")
+    sources = await fetch_all(tracker.db_path, "SELECT * FROM archon_mcp_usage_source_hourly")
+
+    assert len(hourly) == 1
+    assert hourly[0]["hour_bucket"] == datetime.now(UTC).strftime("%Y-%m-%d %H:00:00")
+    assert (hourly[0]["call_count"], hourly[0]["error_count"], hourly[0]["unique_sessions"]) == (3, 1, 1)
+    assert (hourly[0]["total_response_time_ms"], hourly[0]["avg_response_time_ms"]) == (443, 147)
+    assert sum(json.loads(hourly[0]["latency_histogram"])) == 3
+    assert daily[0]["call_count"] == 3
+    assert (sources[0]["source_id"], sources[0]["query_count"], sources[0]["unique_queries"]) == ("src-1", 3, 2)
+
+
+async def test_failed_flush_retries_rollups(tracker):
+    db_path = tracker.db_path
+    tracker.db_path = os.path.join(db_path, "missing", "archon.db")
+    await tracker.track_tool_usage("find_tasks", "task", {}, response_time_ms=10)
+
+    assert await tracker.flush() == 0
+    tracker.db_path = db_path
+    await tracker.track_tool_usage("find_tasks", "task", {}, response_time_ms=10)
+    await tracker.flush()
+
+    hourly = await fetch_all(db_path, "SELECT call_count FROM archon_mcp_usage_hourly")
+    events = await fetch_all(db_path, "SELECT id FROM archon_mcp_usage_events")
+    # The failed batch was retried together with its rollup delta
+    assert hourly[0]["call_count"] == 2
+    assert len(events) == 2
+    assert tracker.get_stats()["failed"] == 1
+
+
+async def test_full_buffer_still_counts_dropped_events_in_rollups(tracker):
+    tracker.buffer_size = 1
+    for _ in range(3):
+        await tracker.track_tool_usage("find_tasks", "task", {})
+    await tracker.flush()
+
+    hourly = await fetch_all(tracker.db_path, "SELECT call_count FROM archon_mcp_usage_hourly")
+    assert hourly[0]["call_count"] == 3
+
+
+async def test_analytics_endpoints_read_rollups(tracker):
+    await tracker.track_tool_usage("rag_search", "rag", {"source_id": "src-1", "query": "a"}, response_time_ms=80)
+    await tracker.track_tool_usage("find_tasks", "task", {}, response_time_ms=15, success=False)
+    await tracker.flush()
+
+    app = FastAPI()
+    app.include_router(router)
+    with patch("src.server.api_routes.mcp_analytics_api.get_db_path", return_value=tracker.db_path):
+        client = TestClient(app)
+        summary = client.get("/api/mcp/analytics/summary").json()["summary"]
+        knowledge_bases = client.get("/api/mcp/analytics/knowledge-bases").json()
+
+    assert knowledge_bases["unique_queries_scope"] == "per_hour"
+    assert (summary["total_events"], summary["success_count"], summary["error_count"]) == (2, 1, 1)
+    assert summary["unique_tools"] == 2
+    assert summary["p50_response_time_ms"] == 20
+    assert summary["p95_response_time_ms"] == 100
+    assert knowledge_bases["data"] == [
+        {
+            "source_id": "src-1",
+            "source_name": "Docs",
+            "query_count": 1,
+            "unique_queries": 1,
+            "avg_response_time_ms": 80,
+            "success_rate": 100.0,
+            "percentage_of_total": 100.0,
+        }
+    ]
+
+
+async def test_upgrade_migration_replaces_triggers():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "archon.db")
+        async with aiosqlite.connect(db_path) as conn:
+            # Minimal pre-rollup schema with one of the old per-row triggers
+            await conn.executescript(
+                """
+                CREATE TABLE archon_mcp_usage_events (
+                    id TEXT PRIMARY KEY, tool_name TEXT, source_id TEXT, query_text TEXT,
+                    response_time_ms INTEGER, success INTEGER, timestamp DATETIME
+                );
+                CREATE TABLE archon_mcp_usage_hourly (
+                    hour_bucket DATETIME, tool_name TEXT, call_count INTEGER, avg_response_time_ms INTEGER
+                );
+                CREATE TABLE archon_mcp_usage_daily (
+                    date_bucket DATE, tool_name TEXT, call_count INTEGER, avg_response_time_ms INTEGER
+                );
+                INSERT INTO archon_mcp_usage_hourly VALUES ('2025-01-01 10:00:00', 'rag_search', 2, 30);
+                INSERT INTO archon_mcp_usage_events VALUES ('e1', 'rag_search', 'src-1', 'q', 20, 1, '2025-01-01 10:05:00');
+                INSERT INTO archon_mcp_usage_events VALUES ('e2', 'rag_search', 'src-1', 'q', 40, 0, '2025-01-01 10:45:00');
+                CREATE TRIGGER trg_mcp_events_cleanup AFTER INSERT ON archon_mcp_usage_events
+                BEGIN
+                    DELETE FROM archon_mcp_usage_events WHERE timestamp < datetime('now', '-180 days');
+                END;
+                """
+            )
+            await conn.executescript((MIGRATIONS / "006_mcp_usage_rollups.sql").read_text())
+
+            cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            assert await cursor.fetchall() == []
+            cursor = await conn.execute("SELECT total_response_time_ms FROM archon_mcp_usage_hourly")
+            assert (await cursor.fetchone())[0] == 60
+            cursor = await conn.execute(
+                "SELECT hour_bucket, query_count, error_count, total_response_time_ms, unique_queries "
+                "FROM archon_mcp_usage_source_hourly"
+            )
+            assert await cursor.fetchall() == [("2025-01-01 10:00:00", 2, 1, 60, 1)]
@@ -7,6 +7,7 @@ Validates that MCP tool usage is properly tracked and stored in the database.
 import os
 import tempfile
 from datetime import datetime
+from pathlib import Path
 
 import aiosqlite
 import pytest
@@ -22,19 +23,10 @@ async def temp_db():
 
     # Initialize database with MCP usage tracking tables
     async with aiosqlite.connect(db_path) as conn:
-        # Read and apply the MCP usage tracking migration
-        migration_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "migration/sqlite/002_mcp_usage_tracking.sql"
-        )
-
-        with open(migration_path, 'r') as f:
-            migration_sql = f.read()
-
-        statements = [s.strip() for s in migration_sql.split(';') if s.strip() and not s.strip().startswith('--')]
-        for statement in statements:
-            await conn.execute(statement)
-            await conn.commit()
+        # Read and apply the MCP usage tracking migration (migrations live at the repo root)
+        migration_path = Path(__file__).resolve().parents[3] / "migration" / "sqlite" / "002_mcp_usage_tracking.sql"
+        await conn.executescript(migration_path.read_text())
+        await conn.commit()
 
     yield db_path
 
@@ -73,6 +65,7 @@ async def test_track_tool_usage_inserts_event(temp_db):
     )
 
     # Verify the event was inserted
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -106,6 +99,7 @@ async def test_track_tool_usage_with_error(temp_db):
     )
 
     # Verify error was recorded
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -120,8 +114,8 @@ async def test_track_tool_usage_with_error(temp_db):
 
 
 @pytest.mark.asyncio
-async def test_hourly_aggregation_trigger(temp_db):
-    """Test that inserting events triggers hourly aggregation."""
+async def test_flush_writes_hourly_rollup(temp_db):
+    """Test that flushing tracked events merges them into the hourly rollup."""
     tracker = MCPUsageTracker()
     tracker.db_path = temp_db
 
@@ -135,7 +129,8 @@ async def test_hourly_aggregation_trigger(temp_db):
             success=True
         )
 
-    # Verify hourly aggregation was created
+    # Verify the hourly rollup was written
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -151,8 +146,8 @@ async def test_hourly_aggregation_trigger(temp_db):
 
 
 @pytest.mark.asyncio
-async def test_daily_aggregation_trigger(temp_db):
-    """Test that inserting events triggers daily aggregation."""
+async def test_flush_writes_daily_rollup(temp_db):
+    """Test that flushing tracked events merges them into the daily rollup."""
     tracker = MCPUsageTracker()
     tracker.db_path = temp_db
 
@@ -165,7 +160,8 @@ async def test_daily_aggregation_trigger(temp_db):
         success=True
     )
 
-    # Verify daily aggregation was created
+    # Verify the daily rollup was written
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -196,6 +192,7 @@ async def test_tracker_can_be_disabled(temp_db):
     )
 
     # Verify no event was inserted
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         cursor = await conn.execute("SELECT COUNT(*) as count FROM archon_mcp_usage_events")
         row = await cursor.fetchone()
@@ -219,6 +216,7 @@ async def test_query_truncation(temp_db):
     )
 
     # Verify query was truncated
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -250,6 +248,7 @@ async def test_metadata_extraction(temp_db):
     )
 
     # Verify metadata was extracted
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -275,6 +274,7 @@ async def test_response_time_calculation(temp_db):
     await tracker.track_tool_usage("test_tool", "test", {}, response_time_ms=300, success=True)
 
     # Verify average was calculated
+    await tracker.flush()
     async with aiosqlite.connect(temp_db) as conn:
         conn.row_factory = aiosqlite.Row
         cursor = await conn.execute("""
@@ -0,0 +1,95 @@
+"""Unit tests for the shared MCP HTTP client."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.mcp_server.utils.http_client import (
+    SharedHTTPClient,
+    get_connection_limits,
+    get_http_client,
+    set_shared_http_client,
+)
+
+
+@pytest.fixture
+async def keepalive_server():
+    """Minimal HTTP/1.1 server that keeps connections open and counts them."""
+    connections = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connections.append(writer)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: application/json\r\n\r\n{}")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", connections
+    server.close()
+
+
+@pytest.fixture
+def shared_client():
+    def register(client: SharedHTTPClient) -> SharedHTTPClient:
+        set_shared_http_client(client)
+        return client
+
+    yield register
+    set_shared_http_client(None)
+
+
+async def test_tool_calls_reuse_one_connection(keepalive_server, shared_client):
+    url, connections = keepalive_server
+    client = shared_client(SharedHTTPClient())
+
+    for _ in range(5):
+        async with get_http_client() as http:
+            response = await http.get(f"{url}/api/projects")
+            assert response.status_code == 200
+
+    stats = client.get_stats()
+    await client.aclose()
+    assert len(connections) == 1
+    assert (stats["requests"], stats["connections_opened"], stats["reused"]) == (5, 1, 4)
+    assert stats["reuse_ratio"] == 0.8
+
+
+async def test_per_call_timeout_override(shared_client):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    client = shared_client(SharedHTTPClient(transport=httpx.MockTransport(handler)))
+    async with get_http_client(httpx.Timeout(3.0)) as http:
+        await http.post("http://api/api/tasks", json={})
+    async with get_http_client() as http:
+        await http.get("http://api/api/tasks", timeout=httpx.Timeout(7.0))
+
+    await client.aclose()
+    assert [timeout["read"] for timeout in seen] == [3.0, 7.0]
+
+
+async def test_falls_back_to_short_lived_client_without_lifespan():
+    with patch("src.mcp_server.utils.http_client.httpx.AsyncClient") as mock_client:
+        async with get_http_client(httpx.Timeout(2.0)):
+            pass
+
+    mock_client.assert_called_once_with(timeout=httpx.Timeout(2.0))
+
+
+def test_connection_limits_from_env():
+    with patch.dict(os.environ, {"MCP_HTTP_MAX_CONNECTIONS": "8", "MCP_HTTP_MAX_KEEPALIVE": "4"}):
+        limits = get_connection_limits()
+
+    assert (limits.max_connections, limits.max_keepalive_connections) == (8, 4)
@@ -0,0 +1,140 @@
+"""Tests for server-push progress streaming (broadcaster and SSE endpoint)."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.server.api_routes.progress_api import router
+from src.server.utils.progress import ProgressBroadcaster, ProgressTracker, progress_broadcaster
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the progress API."""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clean_progress():
+    yield
+    for progress_id in list(ProgressTracker.list_active()):
+        ProgressTracker.clear_progress(progress_id)
+
+
+def parse_sse(body: str) -> list[dict]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append({"id": int(fields["id"]), "event": fields["event"], "data": json.loads(fields["data"])})
+    return events
+
+
+def log_entry(message: str) -> dict:
+    return {"timestamp": "2024-01-01T00:00:00", "message": message, "status": "crawling", "progress": 0}
+
+
+class TestProgressBroadcaster:
+    """Test event ids, coalescing and Last-Event-ID replay."""
+
+    async def test_publish_without_subscribers_is_noop(self):
+        broadcaster = ProgressBroadcaster()
+
+        broadcaster.publish("op", {"status": "crawling", "logs": []}, [log_entry("a")])
+
+        assert broadcaster.get_stats() == {"channels": 0, "subscribers": 0}
+
+    async def test_full_queue_coalesces_into_last_event(self):
+        broadcaster = ProgressBroadcaster(max_queue_size=2)
+        subscription = broadcaster.subscribe("op", {"status": "starting", "progress": 0, "logs": []})
+
+        for i in range(1, 5):
+            broadcaster.publish("op", {"status": "crawling", "progress": i * 10}, [log_entry(f"step {i}")])
+
+        snapshot = await subscription.get(timeout=0)
+        merged = await subscription.get(timeout=0)
+
+        assert snapshot["snapshot"] is True
+        assert merged["id"] == 4
+        assert merged["state"]["progress"] == 40
+        assert [log["message"] for log in merged["logs"]] == ["step 1", "step 2", "step 3", "step 4"]
+        assert subscription.coalesced_count == 3
+        assert await subscription.get(timeout=0) is None
+
+    async def test_reconnect_receives_only_missed_deltas(self):
+        broadcaster = ProgressBroadcaster(history_size=3)
+        first = broadcaster.subscribe("op", {"status": "starting", "logs": []})
+        for i in range(1, 5):
+            broadcaster.publish("op", {"status": "crawling", "progress": i}, [log_entry(f"step {i}")])
+        broadcaster.unsubscribe(first)
+
+        resumed = broadcaster.subscribe("op", {"status": "crawling", "logs": []}, last_event_id=2)
+        delta = await resumed.get(timeout=0)
+        assert delta["snapshot"] is False
+        assert delta["id"] == 4
+        assert [log["message"] for log in delta["logs"]] == ["step 3", "step 4"]
+
+        # Event 1 has fallen out of the history, so the client gets a snapshot
+        state = {"status": "crawling", "progress": 4, "logs": [log_entry("full")]}
+        stale = broadcaster.subscribe("op", state, last_event_id=0)
+        snapshot = await stale.get(timeout=0)
+        assert snapshot["snapshot"] is True
+        assert snapshot["logs"] == [log_entry("full")]
+
+    async def test_close_channel_closes_subscribers(self):
+        broadcaster = ProgressBroadcaster()
+        subscription = broadcaster.subscribe("op", {"status": "starting", "logs": []})
+        await subscription.get(timeout=0)
+
+        broadcaster.close_channel("op")
+
+        assert subscription.closed is True
+        assert await subscription.get(timeout=1) is None
+
+
+class TestProgressStreamEndpoint:
+    """Test GET /api/progress/{operation_id}/stream."""
+
+    def test_unknown_operation_returns_404(self, client):
+        assert client.get("/api/progress/missing/stream").status_code == 404
+
+    def test_finished_operation_streams_single_snapshot(self, client):
+        async def run_operation():
+            tracker = ProgressTracker("stream-done", operation_type="crawl")
+            await tracker.update("crawling", 50, "Halfway")
+            await tracker.update("completed", 100, "Done")
+
+        asyncio.run(run_operation())
+
+        response = client.get("/api/progress/stream-done/stream")
+        events = parse_sse(response.text)
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [event["event"] for event in events] == ["snapshot"]
+        assert events[0]["data"]["status"] == "completed"
+        assert events[0]["data"]["logs"] == ["Halfway", "Done"]
+
+    def test_reconnect_with_last_event_id_gets_delta(self, client):
+        async def run_operation():
+            tracker = ProgressTracker("stream-resume", operation_type="crawl")
+            listener = progress_broadcaster.subscribe("stream-resume", tracker.state)
+            await tracker.update("crawling", 20, "Page 1")
+            await tracker.update("crawling", 40, "Page 2")
+            await tracker.update("completed", 100, "Done")
+            progress_broadcaster.unsubscribe(listener)
+
+        asyncio.run(run_operation())
+
+        response = client.get("/api/progress/stream-resume/stream", headers={"Last-Event-ID": "1"})
+        events = parse_sse(response.text)
+
+        assert len(events) == 1
+        assert events[0]["id"] == 3
+        assert events[0]["event"] == "progress"
+        assert events[0]["data"]["progress"] == 100
+        assert events[0]["data"]["logs"] == ["Page 2", "Done"]
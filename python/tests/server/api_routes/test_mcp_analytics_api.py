@@ -110,6 +110,19 @@ def mock_raw_events_data():
     ]
 
 
+def to_hourly_rollups(events):
+    """Convert mock raw events into hourly rollup rows (one call per row)."""
+    return [
+        {
+            "tool_name": event["tool_name"],
+            "call_count": 1,
+            "error_count": 0 if event["status"] == "success" else 1,
+            "latency_histogram": None,
+        }
+        for event in events
+    ]
+
+
 # ============================================================================
 # GET /api/mcp/analytics/hourly
 # ============================================================================
@@ -473,22 +486,14 @@ def test_get_daily_analytics_database_error(client, mock_supabase):
 
 def test_get_24h_summary_calculation(client, mock_supabase, mock_raw_events_data):
     """Test 24h summary with proper calculation of statistics."""
-    # Convert mock data to SQLite format (success=1/0 instead of status="success"/"error")
-    sqlite_events = [
-        {
-            "id": event["id"],
-            "tool_name": event["tool_name"],
-            "success": 1 if event["status"] == "success" else 0,
-            "timestamp": event["created_at"],
-        }
-        for event in mock_raw_events_data
-    ]
+    # Each event lands in its own hourly rollup row
+    sqlite_events = to_hourly_rollups(mock_raw_events_data)
 
     with patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect:
         mock_conn = AsyncMock()
         mock_cursor = AsyncMock()
 
-        # Mock cursor.fetchall() to return SQLite-formatted events
+        # Mock cursor.fetchall() to return hourly rollup rows
         mock_cursor.fetchall = AsyncMock(return_value=sqlite_events)
 
         # Mock conn.execute() to return cursor
@@ -516,22 +521,14 @@ def test_get_24h_summary_calculation(client, mock_supabase, mock_raw_events_data
 
 def test_get_24h_summary_tool_usage_sorting(client, mock_supabase, mock_raw_events_data):
     """Test that tool usage is sorted by count descending."""
-    # Convert mock data to SQLite format (success=1/0 instead of status="success"/"error")
-    sqlite_events = [
-        {
-            "id": event["id"],
-            "tool_name": event["tool_name"],
-            "success": 1 if event["status"] == "success" else 0,
-            "timestamp": event["created_at"],
-        }
-        for event in mock_raw_events_data
-    ]
+    # Each event lands in its own hourly rollup row
+    sqlite_events = to_hourly_rollups(mock_raw_events_data)
 
     with patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect:
         mock_conn = AsyncMock()
         mock_cursor = AsyncMock()
 
-        # Mock cursor.fetchall() to return SQLite-formatted events
+        # Mock cursor.fetchall() to return hourly rollup rows
         mock_cursor.fetchall = AsyncMock(return_value=sqlite_events)
 
         # Mock conn.execute() to return cursor
@@ -565,17 +562,16 @@ def test_get_24h_summary_tool_usage_sorting(client, mock_supabase, mock_raw_even
 
 def test_get_24h_summary_success_rate_calculation(client, mock_supabase):
     """Test success rate calculation with various scenarios."""
-    # All success - Convert to SQLite format (success=1 instead of status="success")
+    # All success - two calls in one hourly rollup row
     all_success_data = [
-        {"id": "e1", "tool_name": "test_tool", "success": 1, "timestamp": datetime.now(UTC).isoformat()},
-        {"id": "e2", "tool_name": "test_tool", "success": 1, "timestamp": datetime.now(UTC).isoformat()},
+        {"tool_name": "test_tool", "call_count": 2, "error_count": 0, "latency_histogram": None},
     ]
 
     with patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect:
         mock_conn = AsyncMock()
         mock_cursor = AsyncMock()
 
-        # Mock cursor.fetchall() to return SQLite-formatted events
+        # Mock cursor.fetchall() to return hourly rollup rows
         mock_cursor.fetchall = AsyncMock(return_value=all_success_data)
 
         # Mock conn.execute() to return cursor
@@ -622,22 +618,14 @@ def test_get_24h_summary_empty_events(client, mock_supabase):
 
 def test_get_24h_summary_etag_generation(client, mock_supabase, mock_raw_events_data):
     """Test that ETag header is generated for summary."""
-    # Convert mock data to SQLite format (success=1/0 instead of status="success"/"error")
-    sqlite_events = [
-        {
-            "id": event["id"],
-            "tool_name": event["tool_name"],
-            "success": 1 if event["status"] == "success" else 0,
-            "timestamp": event["created_at"],
-        }
-        for event in mock_raw_events_data
-    ]
+    # Each event lands in its own hourly rollup row
+    sqlite_events = to_hourly_rollups(mock_raw_events_data)
 
     with patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect:
         mock_conn = AsyncMock()
         mock_cursor = AsyncMock()
 
-        # Mock cursor.fetchall() to return SQLite-formatted events
+        # Mock cursor.fetchall() to return hourly rollup rows
         mock_cursor.fetchall = AsyncMock(return_value=sqlite_events)
 
         # Mock conn.execute() to return cursor
@@ -656,16 +644,8 @@ def test_get_24h_summary_etag_generation(client, mock_supabase, mock_raw_events_
 
 def test_get_24h_summary_304_not_modified(client, mock_supabase, mock_raw_events_data):
     """Test 304 Not Modified response when ETag matches."""
-    # Convert mock data to SQLite format (success=1/0 instead of status="success"/"error")
-    sqlite_events = [
-        {
-            "id": event["id"],
-            "tool_name": event["tool_name"],
-            "success": 1 if event["status"] == "success" else 0,
-            "timestamp": event["created_at"],
-        }
-        for event in mock_raw_events_data
-    ]
+    # Each event lands in its own hourly rollup row
+    sqlite_events = to_hourly_rollups(mock_raw_events_data)
 
     # Mock datetime to ensure consistent start_time calculation
     fixed_time = datetime.now(UTC)
@@ -679,7 +659,7 @@ def test_get_24h_summary_304_not_modified(client, mock_supabase, mock_raw_events
             mock_conn = AsyncMock()
             mock_cursor = AsyncMock()
 
-            # Mock cursor.fetchall() to return SQLite-formatted events
+            # Mock cursor.fetchall() to return hourly rollup rows
             mock_cursor.fetchall = AsyncMock(return_value=sqlite_events)
 
             # Mock conn.execute() to return cursor
@@ -721,7 +701,7 @@ def test_get_24h_summary_database_error(client, mock_supabase):
 
 def test_refresh_materialized_views_success(client, mock_supabase):
     """Test successful refresh of materialized views (SQLite no-op)."""
-    # SQLite version doesn't need manual refresh, uses automatic triggers
+    # SQLite version doesn't need manual refresh, rollups are updated by the MCP usage tracker
     response = client.post("/api/mcp/analytics/refresh-views")
 
     assert response.status_code == 200
@@ -729,13 +709,13 @@ def test_refresh_materialized_views_success(client, mock_supabase):
 
     assert data["success"] is True
     assert "refreshed_at" in data
-    # Message should indicate automatic updates via triggers
+    # Message should indicate automatic updates
     assert "trigger" in data["message"].lower() or "automatic" in data["message"].lower()
 
 
 def test_refresh_materialized_views_no_data_returned(client):
-    """Test SQLite refresh endpoint always succeeds (automatic triggers)."""
-    # SQLite version uses automatic triggers, so this endpoint always succeeds
+    """Test SQLite refresh endpoint always succeeds (automatic rollups)."""
+    # SQLite version rollups are updated automatically, so this endpoint always succeeds
     response = client.post("/api/mcp/analytics/refresh-views")
 
     assert response.status_code == 200
@@ -822,8 +802,8 @@ def test_daily_analytics_table_name(client, mock_daily_analytics_data):
         assert "archon_mcp_usage_daily" in sql_query
 
 
-def test_summary_events_table_name(client, mock_raw_events_data):
-    """Test that summary queries correct SQLite events table."""
+def test_summary_rollup_table_name(client, mock_raw_events_data):
+    """Test that summary reads the hourly rollup table instead of raw events."""
     # SQLite version uses direct SQL queries, not Supabase table access
     with patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect:
         mock_conn = AsyncMock()
@@ -839,16 +819,16 @@ def test_summary_events_table_name(client, mock_raw_events_data):
         # Verify the SQL query includes the correct table name
         call_args = mock_conn.execute.call_args
         sql_query = call_args[0][0] if call_args else ""
-        assert "archon_mcp_usage_events" in sql_query
+        assert "archon_mcp_usage_hourly" in sql_query
+        assert "archon_mcp_usage_events" not in sql_query
 
 
 def test_summary_handles_missing_tool_names(client):
-    """Test that summary handles events with missing tool names."""
-    # Convert to SQLite format (success=1/0 instead of status="success"/"error")
+    """Test that summary handles rollup rows with missing tool names."""
     events_with_missing = [
-        {"id": "e1", "tool_name": "valid_tool", "success": 1, "timestamp": datetime.now(UTC).isoformat()},
-        {"id": "e2", "tool_name": None, "success": 1, "timestamp": datetime.now(UTC).isoformat()},
-        {"id": "e3", "success": 1, "timestamp": datetime.now(UTC).isoformat()},  # No tool_name key
+        {"tool_name": "valid_tool", "call_count": 1, "error_count": 0},
+        {"tool_name": None, "call_count": 1, "error_count": 0},
+        {"call_count": 1, "error_count": 0},  # No tool_name key
     ]
 
     with patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect:
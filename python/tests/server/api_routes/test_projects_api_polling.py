@@ -94,8 +94,9 @@ class TestProjectsListPolling:
 
     @pytest.mark.asyncio
     async def test_list_projects_etag_changes_with_data(self):
-        """Test that ETag changes when project data changes."""
+        """Test that ETag changes when a repository write bumps the projects revision."""
         from src.server.api_routes.projects_api import list_projects
+        from src.server.repositories.revision_counters import PROJECTS, revision_counters
 
         with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
              patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
@@ -114,7 +115,8 @@ class TestProjectsListPolling:
             await list_projects(response=response1, if_none_match=None)
             etag1 = response1.headers["ETag"]
 
-            # Modified data
+            # Modified data (repository writes bump the revision)
+            revision_counters.bump(PROJECTS)
             projects2 = [{"id": "proj-1", "name": "Project 1 Updated"}]
             mock_proj_service.list_projects.return_value = (True, {"projects": projects2})
             mock_source_service.format_projects_with_sources.return_value = projects2
@@ -0,0 +1,180 @@
+"""
+Unit tests for per-row project documents in document_service.py
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import aiosqlite
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.server.api_routes.projects_api import router as projects_router
+from src.server.repositories.fake_repository import FakeDatabaseRepository
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.projects.document_service import DocumentService
+from src.server.services.projects.versioning_service import VersioningService, document_field_name
+
+MIGRATIONS = Path(__file__).resolve().parents[5] / "migration" / "sqlite"
+
+
+@pytest.fixture
+async def sqlite_repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        await repository.create_project({"id": "proj-1", "title": "Project"})
+        yield repository
+
+
+@pytest.fixture(params=["sqlite", "fake"])
+async def repository(request, sqlite_repository):
+    if request.param == "sqlite":
+        return sqlite_repository
+    repository = FakeDatabaseRepository()
+    await repository.create_project({"id": "proj-1", "title": "Project", "docs": []})
+    return repository
+
+
+async def test_document_lifecycle(repository):
+    service = DocumentService(repository=repository)
+
+    _, first = await service.add_document("proj-1", "spec", "API Spec", content={"body": "x" * 1000})
+    _, second = await service.add_document("proj-1", "note", "Notes", tags=["a"], author="Agent")
+    doc_id = first["document"]["id"]
+
+    success, listed = await service.list_documents("proj-1")
+    assert success and [d["title"] for d in listed["documents"]] == ["API Spec", "Notes"]
+    assert "content" not in listed["documents"][0]
+    assert listed["documents"][0]["stats"]["content_size"] > 1000
+
+    success, result = await service.update_document("proj-1", doc_id, {"title": "API v2"})
+    assert success and result["document"]["revision"] == 2
+    assert result["document"]["content"] == {"body": "x" * 1000}
+
+    project = await repository.get_project_by_id("proj-1")
+    assert [d["title"] for d in project["docs"]] == ["API v2", "Notes"]
+
+    success, _ = await service.delete_document("proj-1", second["document"]["id"])
+    assert success
+    success, result = await service.get_document("proj-1", second["document"]["id"])
+    assert not success and "not found" in result["error"]
+    success, result = await service.get_document("missing", doc_id)
+    assert not success and "Project with ID missing not found" in result["error"]
+
+
+async def test_stale_revision_is_rejected(repository):
+    service = DocumentService(repository=repository)
+    _, created = await service.add_document("proj-1", "spec", "Spec")
+    doc_id = created["document"]["id"]
+
+    success, _ = await service.update_document("proj-1", doc_id, {"content": {"v": 1}}, expected_revision=1)
+    assert success
+    success, result = await service.update_document("proj-1", doc_id, {"content": {"v": 2}}, expected_revision=1)
+
+    assert not success
+    assert "revision conflict" in result["error"].lower() and result["current_revision"] == 2
+    assert (await repository.get_project_document("proj-1", doc_id))["content"] == {"v": 1}
+
+
+async def test_edit_versions_only_the_edited_document(repository):
+    service = DocumentService(repository=repository)
+    _, created = await service.add_document("proj-1", "spec", "Spec", content={"body": "v1"})
+    await service.add_document("proj-1", "note", "Other", content={"body": "x" * 1000})
+    doc_id = created["document"]["id"]
+    repository.list_project_documents = AsyncMock(side_effect=AssertionError("loaded all documents"))
+
+    await service.update_document("proj-1", doc_id, {"title": "Spec v2", "content": {"body": "v2"}})
+
+    field_name = document_field_name(doc_id)
+    success, result = await VersioningService(repository=repository).get_version_content("proj-1", field_name, 1)
+    assert success
+    assert result["content"]["title"] == "Spec" and result["content"]["content"] == {"body": "v1"}
+    assert result["version"]["document_id"] == doc_id
+
+    success, _ = await VersioningService(repository=repository).restore_version("proj-1", field_name, 1)
+    assert success
+    restored = await repository.get_project_document("proj-1", doc_id)
+    assert (restored["title"], restored["content"]) == ("Spec", {"body": "v1"})
+
+
+async def test_documents_are_compressed_rows(sqlite_repository):
+    service = DocumentService(repository=sqlite_repository)
+    _, created = await service.add_document("proj-1", "spec", "Spec", content={"body": "word " * 2000})
+
+    async with aiosqlite.connect(sqlite_repository.db_path) as conn:
+        cursor = await conn.execute(
+            "SELECT content_encoding, length(content), content_size FROM archon_project_documents WHERE id = ?",
+            (created["document"]["id"],),
+        )
+        encoding, stored_size, content_size = await cursor.fetchone()
+        cursor = await conn.execute("SELECT docs FROM archon_projects WHERE id = 'proj-1'")
+        (legacy_docs,) = await cursor.fetchone()
+
+    assert encoding == "zlib" and stored_size < content_size / 10
+    assert legacy_docs == "[]"
+    assert (await sqlite_repository.search_projects())[0]["stats"]["docs_count"] == 1
+
+
+async def test_replacing_docs_array_keeps_revisions(sqlite_repository):
+    service = DocumentService(repository=sqlite_repository)
+    _, created = await service.add_document("proj-1", "spec", "Spec")
+    doc = await sqlite_repository.get_project_document("proj-1", created["document"]["id"])
+
+    await sqlite_repository.update_project("proj-1", {"docs": [{"id": "new", "title": "New"}, doc]})
+
+    docs = (await sqlite_repository.get_project_by_id("proj-1"))["docs"]
+    assert [(d["id"], d["revision"]) for d in docs] == [("new", 1), (doc["id"], 2)]
+
+
+async def test_migration_moves_docs_array_into_rows():
+    async with aiosqlite.connect(":memory:") as conn:
+        await conn.executescript(
+            """
+            CREATE TABLE archon_projects (
+                id TEXT PRIMARY KEY, title TEXT, docs TEXT DEFAULT '[]', created_at TEXT, updated_at TEXT
+            );
+            INSERT INTO archon_projects VALUES (
+                'proj-1', 'P',
+                '[{"id": "d1", "title": "Spec", "content": {"a": 1}, "tags": ["x"], "custom": 5},
+                  {"id": "d2", "title": "Text", "content": "plain"}]',
+                '2025-01-01', '2025-01-02'
+            );
+            """
+        )
+        await conn.executescript((MIGRATIONS / "009_project_documents.sql").read_text())
+
+        cursor = await conn.execute(
+            "SELECT id, position, tags, metadata, content, content_encoding FROM archon_project_documents ORDER BY position"
+        )
+        rows = await cursor.fetchall()
+        cursor = await conn.execute("SELECT docs FROM archon_projects")
+        (docs,) = await cursor.fetchone()
+
+    assert rows == [
+        ("d1", 0, '["x"]', '{"custom":5}', '{"a":1}', "json"),
+        ("d2", 1, "[]", "{}", '"plain"', "json"),
+    ]
+    assert docs == "[]"
+
+
+def test_update_endpoint_returns_409_on_conflict():
+    app = FastAPI()
+    app.include_router(projects_router)
+    test_client = TestClient(app)
+    repository = FakeDatabaseRepository()
+
+    with patch("src.server.api_routes.projects_api.get_repository", return_value=repository):
+        repository.projects["proj-1"] = {"id": "proj-1", "title": "P", "docs": []}
+        doc_id = test_client.post(
+            "/api/projects/proj-1/docs", json={"document_type": "spec", "title": "Spec"}
+        ).json()["document"]["id"]
+
+        ok = test_client.put(f"/api/projects/proj-1/docs/{doc_id}", json={"title": "A", "revision": 1})
+        stale = test_client.put(f"/api/projects/proj-1/docs/{doc_id}", json={"title": "B", "revision": 1})
+
+    assert ok.status_code == 200 and ok.json()["document"]["revision"] == 2
+    assert stale.status_code == 409
@@ -0,0 +1,120 @@
+"""
+Unit tests for batch task create/update/archive in task_service.py
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.server.api_routes.projects_api import router as projects_router
+from src.server.repositories.fake_repository import FakeDatabaseRepository
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.projects.task_service import MAX_TASK_BATCH_SIZE, TaskService
+
+
+@pytest.fixture
+async def sqlite_repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        await repository.create_project({"id": "proj-1", "title": "Project"})
+        yield repository
+
+
+@pytest.fixture(params=["sqlite", "fake"])
+async def repository(request, sqlite_repository):
+    if request.param == "sqlite":
+        return sqlite_repository
+    repository = FakeDatabaseRepository()
+    await repository.create_project({"id": "proj-1", "title": "Project"})
+    return repository
+
+
+def plan(count: int) -> list[dict]:
+    return [
+        {"project_id": "proj-1", "title": f"Step {i}", "task_order": (i + 1) * 10, "feature": "plan"}
+        for i in range(count)
+    ]
+
+
+async def test_batch_lifecycle(repository):
+    service = TaskService(repository=repository)
+
+    success, result = await service.create_tasks(plan(50))
+    assert success and result["count"] == 50
+    ids = [task["id"] for task in result["tasks"]]
+
+    success, result = await service.update_tasks(
+        [(ids[0], {"status": "doing"}), (ids[1], {"status": "done", "assignee": "Agent"})]
+    )
+    assert success and [t["status"] for t in result["tasks"]] == ["doing", "done"]
+
+    success, result = await service.archive_tasks(ids[:10], archived_by="api")
+    assert success and result["task_ids"] == ids[:10]
+
+    remaining = await repository.list_tasks(project_id="proj-1")
+    assert [t["title"] for t in remaining] == [f"Step {i}" for i in range(10, 50)]
+
+
+async def test_batch_create_shifts_taken_slots(repository):
+    service = TaskService(repository=repository)
+    await service.create_task(project_id="proj-1", title="Existing", task_order=1)
+
+    success, _ = await service.create_tasks([
+        {"project_id": "proj-1", "title": "First", "task_order": 1},
+        {"project_id": "proj-1", "title": "Second", "task_order": 1},
+    ])
+
+    assert success
+    tasks = await repository.list_tasks(project_id="proj-1")
+    assert [(t["title"], t["task_order"]) for t in tasks] == [("Second", 1), ("First", 2), ("Existing", 3)]
+
+
+async def test_batch_is_all_or_nothing(repository):
+    service = TaskService(repository=repository)
+    _, created = await service.create_tasks(plan(2))
+    task_id = created["tasks"][0]["id"]
+
+    success, result = await service.create_tasks(plan(2) + [{"project_id": "proj-1", "title": ""}])
+    assert not success and result["index"] == 2
+
+    success, result = await service.update_tasks([(task_id, {"title": "Changed"}), ("missing", {"title": "X"})])
+    assert not success and "not found" in result["error"]
+
+    success, _ = await service.archive_tasks([task_id, "missing"])
+    assert not success
+
+    success, _ = await service.create_tasks(plan(MAX_TASK_BATCH_SIZE + 1))
+    assert not success
+
+    task = await repository.get_task_by_id(task_id)
+    assert task["title"] == "Step 0" and not task["archived"]
+    assert len(await repository.list_tasks(project_id="proj-1")) == 2
+
+
+def test_batch_endpoints():
+    app = FastAPI()
+    app.include_router(projects_router)
+    test_client = TestClient(app)
+    repository = FakeDatabaseRepository()
+    repository.projects["proj-1"] = {"id": "proj-1", "title": "P"}
+
+    with patch("src.server.api_routes.projects_api.get_repository", return_value=repository):
+        created = test_client.post("/api/tasks/batch", json={"tasks": plan(3)})
+        ids = [task["id"] for task in created.json()["tasks"]]
+
+        updated = test_client.put(
+            "/api/tasks/batch", json={"tasks": [{"id": task_id, "status": "review"} for task_id in ids]}
+        )
+        missing = test_client.put("/api/tasks/batch", json={"tasks": [{"id": "missing", "title": "X"}]})
+        archived = test_client.post("/api/tasks/batch/archive", json={"task_ids": ids[:2]})
+
+    assert created.status_code == 200 and created.json()["count"] == 3
+    assert updated.status_code == 200 and {t["status"] for t in updated.json()["tasks"]} == {"review"}
+    assert missing.status_code == 404
+    assert archived.status_code == 200 and archived.json()["count"] == 2
+    assert [t["archived"] for t in (repository.tasks[i] for i in ids)] == [True, True, False]
@@ -0,0 +1,131 @@
+"""
+Unit tests for delta-encoded document versions in versioning_service.py
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.server.repositories.fake_repository import FakeDatabaseRepository
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.projects.versioning_service import KEYFRAME_INTERVAL, VersioningService
+from src.server.utils.json_patch_utils import apply_json_patch, diff_json
+
+MIGRATIONS = Path(__file__).resolve().parents[5] / "migration" / "sqlite"
+
+
+def make_docs(revision: int) -> list[dict]:
+    """Project docs where each revision edits, adds or removes one document."""
+    docs = [
+        {"id": f"doc-{i}", "title": f"Doc {i}", "content": {"body": "text " * 200, "rev": 0}}
+        for i in range(5 + revision // 3)
+    ]
+    docs[revision % len(docs)]["content"]["rev"] = revision
+    if revision % 4 == 3:
+        docs.pop(0)
+    return docs
+
+
+@pytest.fixture
+async def sqlite_repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        await repository.create_project({"id": "proj-1", "title": "Project", "docs": make_docs(0)})
+        yield repository
+
+
+@pytest.fixture(params=["sqlite", "fake"])
+async def repository(request, sqlite_repository):
+    if request.param == "sqlite":
+        return sqlite_repository
+    repository = FakeDatabaseRepository()
+    await repository.create_project({"id": "proj-1", "title": "Project", "docs": make_docs(0)})
+    return repository
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 3], "c/d": {"~": None}}),
+        ([{"id": 1}, {"id": 2}, {"id": 3}], [{"id": 1}, {"id": 4}, {"id": 2, "x": True}, {"id": 3}]),
+        ([1, 2, 3, 4], []),
+        ({"a": 1}, [1]),
+        ({"flag": True}, {"flag": 1}),
+    ],
+)
+def test_json_patch_round_trip(old, new):
+    patch = diff_json(old, new)
+
+    assert apply_json_patch(old, patch) == new
+    assert diff_json(new, new) == []
+
+
+async def test_versions_store_keyframes_and_deltas(repository):
+    service = VersioningService(repository=repository)
+    revisions = 2 * KEYFRAME_INTERVAL + 3
+
+    for revision in range(revisions):
+        success, result = await service.create_version("proj-1", "docs", make_docs(revision))
+        assert success and result["version_number"] == revision + 1
+
+    versions = await repository.list_document_versions("proj-1", field_name="docs")
+    formats = {v["version_number"]: v["storage_format"] for v in versions}
+    assert [n for n, f in sorted(formats.items()) if f == "snapshot"] == [1, KEYFRAME_INTERVAL + 1, 2 * KEYFRAME_INTERVAL + 1]
+    assert await repository.get_latest_document_version_number("proj-1", "docs") == revisions
+    assert await repository.get_latest_document_version_number("proj-1", "features") == 0
+
+    for revision in range(revisions):
+        success, result = await service.get_version_content("proj-1", "docs", revision + 1)
+        assert success and result["content"] == make_docs(revision)
+
+    success, result = await service.list_versions("proj-1", "docs")
+    assert result["total_count"] == revisions
+    assert "content" not in result["versions"][0]
+
+
+async def test_restore_reconstructs_from_nearest_keyframe(sqlite_repository):
+    service = VersioningService(repository=sqlite_repository)
+    for revision in range(KEYFRAME_INTERVAL + 4):
+        await service.create_version("proj-1", "docs", make_docs(revision))
+
+    chain = await sqlite_repository.get_document_version_chain("proj-1", "docs", KEYFRAME_INTERVAL + 3)
+    assert [v["version_number"] for v in chain] == list(range(KEYFRAME_INTERVAL + 1, KEYFRAME_INTERVAL + 4))
+
+    success, result = await service.restore_version("proj-1", "docs", KEYFRAME_INTERVAL + 3)
+    assert success and result["restored_version"] == KEYFRAME_INTERVAL + 3
+
+    project = await sqlite_repository.get_project_by_id("proj-1")
+    restored = make_docs(KEYFRAME_INTERVAL + 2)
+    assert [(d["id"], d["content"]) for d in project["docs"]] == [(d["id"], d["content"]) for d in restored]
+    success, _ = await service.get_version_content("proj-1", "docs", 99)
+    assert not success
+
+
+async def test_large_rewrites_fall_back_to_snapshots(sqlite_repository):
+    service = VersioningService(repository=sqlite_repository)
+    await service.create_version("proj-1", "data", {"a": 1})
+    await service.create_version("proj-1", "data", ["completely", "different"])
+
+    versions = await sqlite_repository.list_document_versions("proj-1", field_name="data")
+    assert {v["storage_format"] for v in versions} == {"snapshot"}
+
+
+async def test_upgrade_migration_keeps_existing_versions_as_snapshots():
+    async with aiosqlite.connect(":memory:") as conn:
+        await conn.executescript(
+            """
+            CREATE TABLE archon_document_versions (
+                id TEXT PRIMARY KEY, project_id TEXT, task_id TEXT, field_name TEXT NOT NULL,
+                version_number INTEGER NOT NULL, content TEXT NOT NULL
+            );
+            INSERT INTO archon_document_versions VALUES ('v1', 'proj-1', NULL, 'docs', 1, '[]');
+            """
+        )
+        await conn.executescript((MIGRATIONS / "008_document_version_deltas.sql").read_text())
+
+        cursor = await conn.execute("SELECT storage_format FROM archon_document_versions")
+        assert await cursor.fetchall() == [("snapshot",)]
@@ -0,0 +1,98 @@
+"""
+Unit tests for the crawler pool in crawler_manager.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.server.services import crawler_manager
+from src.server.services.crawler_manager import CrawlerManager
+
+
+class FakeCrawler:
+    instances: list["FakeCrawler"] = []
+
+    def __init__(self, config=None):
+        self.closed = False
+        FakeCrawler.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def arun(self, url, config=None):
+        return url
+
+    async def arun_many(self, urls, config=None, dispatcher=None):
+        return list(urls)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    FakeCrawler.instances = []
+    monkeypatch.setattr(crawler_manager, "AsyncWebCrawler", FakeCrawler)
+    monkeypatch.setattr(crawler_manager, "BrowserConfig", lambda **kwargs: kwargs)
+    monkeypatch.setattr(CrawlerManager, "_instance", None)
+    monkeypatch.setenv("CRAWLER_POOL_SIZE", "2")
+    monkeypatch.setenv("CRAWLER_RECYCLE_PAGES", "3")
+    monkeypatch.setenv("CRAWLER_RECYCLE_MEMORY_MB", "0")
+    return CrawlerManager()
+
+
+async def test_leases_spread_across_pool_then_share_least_busy(manager):
+    first = await manager.acquire()
+    second = await manager.acquire()
+    third = await manager.acquire()
+
+    assert [first.index, second.index] == [0, 1]
+    assert len(FakeCrawler.instances) == 2  # Pool is full, third crawl shares a browser
+    third.release()
+    first.release()
+
+    # An idle browser is preferred over a busy one
+    assert (await manager.acquire()).index == 0
+    stats = manager.get_pool_stats()
+    assert stats["running"] == 2 and stats["active_crawls"] == 2
+
+
+async def test_browser_is_recycled_after_page_limit(manager):
+    lease = await manager.acquire()
+    await lease.crawler.arun("https://example.com/a")
+    await lease.crawler.arun_many(urls=["https://example.com/b", "https://example.com/c"])
+    assert manager.get_pool_stats()["contexts"][0]["pages"] == 3
+
+    lease.release()
+    lease.release()  # Releasing twice is harmless
+    await asyncio.sleep(0)
+    await asyncio.gather(*manager._recycle_tasks)
+
+    context = manager.get_pool_stats()["contexts"][0]
+    assert FakeCrawler.instances[0].closed
+    assert (context["pages"], context["restarts"], context["active_crawls"]) == (0, 1, 0)
+
+
+async def test_busy_browser_due_for_recycling_gets_no_new_crawls(manager):
+    busy = await manager.acquire()
+    other = await manager.acquire()
+    other.release()
+    await busy.crawler.arun_many(urls=["u1", "u2", "u3"])
+    manager._slots[0].retiring = True
+
+    assert (await manager.acquire()).index == 1
+
+    busy.release()
+    await asyncio.gather(*manager._recycle_tasks)
+    assert manager._slots[0].restarts == 1
+
+
+async def test_cleanup_closes_every_browser(manager):
+    await manager.acquire()
+    await manager.acquire()
+
+    await manager.cleanup()
+
+    assert all(crawler.closed for crawler in FakeCrawler.instances)
+    assert manager.get_pool_stats()["running"] == 0
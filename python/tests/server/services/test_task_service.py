@@ -13,7 +13,8 @@ import pytest
 from datetime import datetime
 
 from src.server.repositories import FakeDatabaseRepository
-from src.server.services.projects.task_service import TaskService
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.projects.task_service import REBALANCE_RUN_LENGTH, TASK_ORDER_GAP, TaskService
 
 
 @pytest.fixture
@@ -160,6 +161,54 @@ async def test_create_task_with_ordering(task_service, repository, test_project)
     assert tasks_sorted[3]["task_order"] == 3
 
 
+@pytest.mark.asyncio
+async def test_create_task_in_gap_writes_single_row(task_service, repository, test_project):
+    """Inserting between sparse orders does not touch the other tasks."""
+    for order in (1000, 2000, 3000):
+        await task_service.create_task(project_id=test_project["id"], title=f"Task {order}", task_order=order)
+    before = {t["id"]: t.get("updated_at") for t in repository.tasks.values()}
+
+    success, result = await task_service.create_task(
+        project_id=test_project["id"], title="Between", task_order=1500
+    )
+
+    assert success and result["task"]["task_order"] == 1500
+    assert all(repository.tasks[task_id].get("updated_at") == updated for task_id, updated in before.items())
+    assert sorted(t["task_order"] for t in repository.tasks.values()) == [1000, 1500, 2000, 3000]
+
+
+@pytest.mark.asyncio
+async def test_create_task_rebalances_dense_column(task_service, repository, test_project):
+    """A long run of consecutive orders is respaced by TASK_ORDER_GAP."""
+    for order in range(1, REBALANCE_RUN_LENGTH + 1):
+        await task_service.create_task(project_id=test_project["id"], title=f"Task {order}", task_order=order)
+
+    success, result = await task_service.create_task(project_id=test_project["id"], title="First", task_order=1)
+
+    assert success and result["task"]["task_order"] == TASK_ORDER_GAP
+    tasks = sorted(repository.tasks.values(), key=lambda t: t["task_order"])
+    assert [t["title"] for t in tasks[:2]] == ["First", "Task 1"]
+    assert [t["task_order"] for t in tasks] == [TASK_ORDER_GAP * i for i in range(1, len(tasks) + 1)]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_make_room_shifts_only_consecutive_run(tmp_path):
+    """The SQLite repository shifts just the occupied run in one UPDATE."""
+    repository = SQLiteDatabaseRepository(db_path=str(tmp_path / "archon.db"))
+    await repository.create_project({"id": "p", "title": "P"})
+    for order in (5, 6, 7, 9, 20):
+        await repository.create_task({"project_id": "p", "title": f"T{order}", "status": "todo", "task_order": order})
+
+    assert await repository.make_room_for_task_order("p", "todo", 8) == 0
+    assert await repository.make_room_for_task_order("p", "todo", 6) == 2
+    assert await repository.rebalance_task_orders("p", "todo", 100) == 5
+
+    tasks = await repository.get_tasks_by_project_and_status("p", "todo")
+    assert [(t["title"], t["task_order"]) for t in tasks] == [
+        ("T5", 100), ("T6", 200), ("T7", 300), ("T9", 400), ("T20", 500)
+    ]
+
+
 # ========================================================================
 # LIST TASKS TESTS
 # ========================================================================
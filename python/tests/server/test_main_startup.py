@@ -0,0 +1,56 @@
+"""
+Unit tests for lazy router loading and concurrent startup in main.py
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+import src.server.main as server_main
+from src.server.main import app, lifespan
+from src.server.services.prompt_service import prompt_service
+
+
+def test_routers_are_registered_on_first_request():
+    client = TestClient(app)
+
+    response = client.get("/api/version/current")
+    profile = client.get("/api/startup-profile").json()
+
+    assert response.status_code == 200
+    assert profile["routers_loaded"] is True
+    assert set(profile["router_imports"]) == set(server_main.API_ROUTER_MODULES)
+
+
+async def test_lifespan_is_ready_before_crawler_warmup_finishes(monkeypatch):
+    monkeypatch.setenv("ARCHON_DB_BACKEND", "sqlite")
+    monkeypatch.setenv("ARCHON_SKIP_DB_INIT", "true")
+    crawler_started = asyncio.Event()
+    release_crawler = asyncio.Event()
+
+    async def slow_crawler():
+        crawler_started.set()
+        await release_crawler.wait()
+
+    with (
+        patch("src.server.config.config.get_config"),
+        patch("src.server.services.credential_service.initialize_credentials", new=AsyncMock()) as credentials,
+        patch.object(prompt_service, "load_prompts", new=AsyncMock()) as prompts,
+        patch("src.server.main.setup_logfire"),
+        patch("src.server.services.crawler_manager.initialize_crawler", new=slow_crawler),
+        patch("src.server.services.crawler_manager.cleanup_crawler", new=AsyncMock()),
+    ):
+        async with lifespan(app):
+            await crawler_started.wait()
+            assert server_main._initialization_complete
+            assert credentials.await_count == 1 and prompts.await_count == 1
+
+            profile = server_main._startup_profile
+            assert {"credentials", "prompts", "router_import"} <= set(profile["phases"])
+            assert "crawler_warmup" not in profile["phases"]
+            release_crawler.set()
+            await server_main._crawler_warmup_task
+
+        assert "crawler_warmup" in server_main._startup_profile["phases"]
+        assert not server_main._initialization_complete
@@ -0,0 +1,206 @@
+"""Unit tests for streaming document extraction from spooled uploads."""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi import UploadFile
+
+from src.server.api_routes.knowledge_api import _spool_upload
+from src.server.services.storage import DocumentStorageService
+from src.server.utils import document_processing
+from src.server.utils.document_processing import shutdown_pdf_process_pool, stream_document_text
+from src.server.workers import pdf_pages
+
+
+def make_pdf(pages: list[list[str]]) -> bytes:
+    """Build a minimal PDF with one line of Courier text per entry."""
+    objects: list[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>")
+    pages_id = len(objects) + 1 + 2 * len(pages)
+    kids = []
+    for lines in pages:
+        ops = [b"BT /F1 11 Tf 14 TL 72 720 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*".encode())
+        ops.append(b"ET")
+        stream = b"\n".join(ops)
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content, font)
+        ))
+    add(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids)))
+    catalog = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref)
+    return bytes(out)
+
+
+@pytest.fixture(scope="module")
+def worker_processes():
+    # Spawning workers is slow, so the pool is shared by the tests in this module
+    yield
+    shutdown_pdf_process_pool()
+
+
+@pytest.fixture
+def process_pool(worker_processes, monkeypatch):
+    monkeypatch.setenv("DOCUMENT_PARSE_WORKERS", "2")
+    monkeypatch.setattr(document_processing, "PDF_PAGES_PER_TASK", 2)
+
+
+async def collect(path, filename, content_type):
+    progress = []
+
+    async def on_page(done, total):
+        progress.append((done, total))
+
+    segments = [s async for s in stream_document_text(str(path), filename, content_type, on_page)]
+    return segments, progress
+
+
+async def test_pdf_pages_stream_in_order_with_per_page_progress(tmp_path, process_pool):
+    pdf = tmp_path / "manual.pdf"
+    pdf.write_bytes(make_pdf([
+        ["Introduction"],
+        ["```python", "def hello():"],
+        ["    return 1", "```"],
+        [],
+        ["Appendix"],
+    ]))
+
+    segments, progress = await collect(pdf, "manual.pdf", "application/pdf")
+
+    assert progress == [(page, 5) for page in range(1, 6)]
+    text = "\n\n".join(segments)
+    assert text.index("--- Page 1 ---") < text.index("Appendix")
+    assert "--- Page 4 ---" not in text  # Empty pages are skipped
+    # The code block split across pages 2 and 3 is rejoined
+    assert "def hello():\n\nreturn 1\n```" in text
+
+
+async def test_segments_do_not_end_inside_code_blocks(tmp_path, process_pool, monkeypatch):
+    monkeypatch.setattr(document_processing, "STREAM_SEGMENT_CHARS", 10)
+    pdf = tmp_path / "code.pdf"
+    pdf.write_bytes(make_pdf([["```", "first = 1"], ["second = 2", "```"], ["Tail text"]]))
+
+    segments, _ = await collect(pdf, "code.pdf", "application/pdf")
+
+    assert len(segments) == 2
+    assert "--- Page 2 ---" not in segments[0] and "second = 2" in segments[0]
+    assert "Tail text" in segments[1]
+
+
+async def test_text_files_are_one_segment_and_empty_pdfs_fail(tmp_path, process_pool):
+    notes = tmp_path / "notes.md"
+    notes.write_text("# Notes\n\nBody")
+    segments, progress = await collect(notes, "notes.md", "text/markdown")
+    assert segments == ["# Notes\n\nBody"] and progress == [(1, 1)]
+
+    blank = tmp_path / "blank.pdf"
+    blank.write_bytes(make_pdf([[], []]))
+    with pytest.raises(ValueError):
+        await collect(blank, "blank.pdf", "application/pdf")
+
+
+async def test_spooled_upload_is_chunked_from_stream(request):
+    upload = UploadFile(io.BytesIO(b"word " * 3000), filename="big.txt")
+    path, size = await _spool_upload(upload)
+    request.addfinalizer(lambda: os.unlink(path))
+
+    service = DocumentStorageService(repository=None)
+    text, chunks = await service.chunk_document_stream(stream_document_text(path, "big.txt", "text/plain"))
+
+    assert size == 15000
+    assert path.endswith(".txt")
+    assert text == ("word " * 3000).strip()
+    assert len(chunks) > 1
+
+
+async def test_streamed_pdf_extraction_matches_in_memory_extraction(tmp_path, process_pool):
+    pdf = make_pdf([[f"Section {n}"] for n in range(1, 6)] + [[], ["```js", "let x = 1;"], ["x += 1;", "```"]])
+    path = tmp_path / "sections.pdf"
+    path.write_bytes(pdf)
+
+    serial = document_processing.extract_text_from_pdf(pdf)
+    segments, _ = await collect(path, "sections.pdf", "application/pdf")
+
+    assert segments == [serial]
+    assert [line for line in serial.splitlines() if line.startswith("--- Page")] == [
+        f"--- Page {n} ---" for n in (1, 2, 3, 4, 5, 7)
+    ]
+    assert "let x = 1;\n\nx += 1;\n```" in serial
+
+
+def test_pypdf2_fallback_is_chosen_per_page(monkeypatch):
+    pdf = make_pdf([["Readable"], ["Only PyPDF2"]])
+    real_open = pdf_pages.pdfplumber.open
+
+    def flaky_open(stream):
+        document = real_open(stream)
+        document.pages[1].extract_text = lambda: ""
+        return document
+
+    monkeypatch.setattr(pdf_pages.pdfplumber, "open", flaky_open)
+
+    pages = pdf_pages.extract_pdf_pages(io.BytesIO(pdf), 0, 2)
+
+    assert [number for number, _ in pages] == [1, 2]
+    assert "Readable" in pages[0][1] and "Only PyPDF2" in pages[1][1]
+
+
+def test_pdfs_pdfplumber_cannot_open_fall_back_to_pypdf2(monkeypatch):
+    pdf = make_pdf([["First page"], ["Second page"]])
+
+    def broken_open(stream):
+        raise ValueError("unreadable")
+
+    monkeypatch.setattr(pdf_pages.pdfplumber, "open", broken_open)
+
+    pages = pdf_pages.extract_pdf_pages(io.BytesIO(pdf), 0, 2)
+
+    assert "First page" in pages[0][1] and "Second page" in pages[1][1]
+
+
+def test_page_count_falls_back_to_pdfplumber(monkeypatch):
+    pdf = make_pdf([["One"], ["Two"], ["Three"]])
+
+    def broken_reader(stream):
+        raise ValueError("unreadable")
+
+    monkeypatch.setattr(pdf_pages.PyPDF2, "PdfReader", broken_reader)
+
+    assert pdf_pages.count_pdf_pages(io.BytesIO(pdf)) == 3
+
+
+async def test_empty_uploads_are_rejected(tmp_path):
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="empty.pdf appears to be empty"):
+        await collect(empty, "empty.pdf", "application/pdf")
+
+
+def test_pdf_worker_module_imports_without_server_services():
+    # Spawned pool workers import it to unpickle their task
+    code = "import sys, src.server.workers.pdf_pages; print(sorted(m for m in sys.modules if m.startswith(('src.server.', 'logfire'))))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "['src.server.workers', 'src.server.workers.pdf_pages']"
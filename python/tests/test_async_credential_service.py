@@ -7,10 +7,12 @@ Covers credential storage, retrieval, encryption/decryption, and caching.
 
 import asyncio
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.server.services import credential_service as credential_module
 from src.server.services.credential_service import (
     credential_service,
     get_credential,
@@ -27,10 +29,12 @@ class TestAsyncCredentialService:
         """Setup clean credential service for each test"""
         # Clear cache and reset state
         credential_service._cache.clear()
+        credential_service._decrypted_cache.clear()
         credential_service._cache_initialized = False
         yield
         # Cleanup after test
         credential_service._cache.clear()
+        credential_service._decrypted_cache.clear()
         credential_service._cache_initialized = False
 
     @pytest.fixture
@@ -310,3 +314,61 @@ class TestAsyncCredentialService:
         result2 = await get_credential("PERSISTENT_KEY", "default")
         assert result2 == "persistent_value"
         assert result1 == result2
+
+    @pytest.mark.asyncio
+    async def test_encryption_key_derived_once_off_loop(self):
+        """Test the PBKDF2 key is derived once per process, in a worker thread"""
+        derive_threads = []
+        real_kdf = credential_module.PBKDF2HMAC
+
+        def recording_kdf(*args, **kwargs):
+            derive_threads.append(threading.current_thread())
+            return real_kdf(*args, **kwargs)
+
+        with patch.dict(os.environ, {"SUPABASE_SERVICE_KEY": "derive-once-test-key"}), patch.object(
+            credential_module, "PBKDF2HMAC", side_effect=recording_kdf
+        ), patch.object(credential_service.repository, "upsert_setting_record", return_value=None):
+            await set_credential("SECRET_A", "value-a", is_encrypted=True)
+            await set_credential("SECRET_B", "value-b", is_encrypted=True)
+            credential_service._cache_initialized = True
+
+            assert await get_credential("SECRET_A") == "value-a"
+            assert await get_credential("SECRET_B") == "value-b"
+
+        assert len(derive_threads) == 1
+        assert derive_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_decrypted_values_cached_until_set_or_delete(self):
+        """Test decrypted secrets are cached and invalidated by set/delete"""
+        with patch.object(credential_service.repository, "upsert_setting_record", return_value=None), patch.object(
+            credential_service.repository, "delete_setting", return_value=True
+        ):
+            await set_credential("CACHED_SECRET", "first", is_encrypted=True)
+            credential_service._cache_initialized = True
+
+            with patch.object(
+                credential_service, "_decrypt_value", wraps=credential_service._decrypt_value
+            ) as decrypt:
+                assert await get_credential("CACHED_SECRET") == "first"
+                assert await get_credential("CACHED_SECRET") == "first"
+                assert decrypt.call_count == 1
+
+                await set_credential("CACHED_SECRET", "second", is_encrypted=True)
+                assert await get_credential("CACHED_SECRET") == "second"
+                assert decrypt.call_count == 2
+
+                await credential_service.delete_credential("CACHED_SECRET")
+                assert await get_credential("CACHED_SECRET", "gone") == "gone"
+
+            credential_service._decrypted_cache_ttl = 0
+            try:
+                await set_credential("CACHED_SECRET", "third", is_encrypted=True)
+                with patch.object(
+                    credential_service, "_decrypt_value", wraps=credential_service._decrypt_value
+                ) as decrypt:
+                    await get_credential("CACHED_SECRET")
+                    await get_credential("CACHED_SECRET")
+                    assert decrypt.call_count == 2
+            finally:
+                credential_service._decrypted_cache_ttl = 60
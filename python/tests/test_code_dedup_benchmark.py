@@ -0,0 +1,79 @@
+"""
+Benchmark for code example deduplication.
+
+Measures `_group_similar_code_blocks` on synthetic corpora with a realistic
+share of exact and near-duplicate variants. Up to BASELINE_MAX_BLOCKS blocks the
+original O(n²) pairwise grouping is timed too and must produce identical groups;
+larger corpora only report the LSH timing, since the baseline takes too long.
+
+Skipped by default. Run with:
+    ARCHON_RUN_BENCHMARKS=1 uv run pytest tests/test_code_dedup_benchmark.py -s
+"""
+
+import os
+import random
+import time
+
+import pytest
+
+from src.server.services.storage.code_storage_service import (
+    _group_similar_code_blocks,
+    _normalize_code_for_comparison,
+)
+from tests.test_code_similarity_index import brute_force_groups, make_code_block, mutate_code
+
+BASELINE_MAX_BLOCKS = 200
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not os.getenv("ARCHON_RUN_BENCHMARKS"), reason="Set ARCHON_RUN_BENCHMARKS=1 to run benchmarks"
+    ),
+]
+
+
+def build_corpus(block_count: int) -> list[dict]:
+    """Build a corpus where ~20% of blocks are exact or near-duplicate variants."""
+    rng = random.Random(block_count)
+    unique_count = int(block_count * 0.8)
+    originals = [make_code_block(seed, length=rng.randint(10, 40)) for seed in range(unique_count)]
+
+    blocks = [{"code": code, "language": "python"} for code in originals]
+    while len(blocks) < block_count:
+        source = rng.choice(originals)
+        code = source if rng.random() < 0.5 else mutate_code(source, len(blocks))
+        blocks.append({"code": code, "language": rng.choice(["python", ""])})
+
+    rng.shuffle(blocks)
+    return blocks
+
+
+@pytest.mark.parametrize("block_count", [200, 1_000, 5_000, 20_000])
+def test_dedup_benchmark(block_count):
+    blocks = build_corpus(block_count)
+
+    started = time.perf_counter()
+    groups = _group_similar_code_blocks(blocks)
+    lsh_elapsed = time.perf_counter() - started
+
+    if block_count <= BASELINE_MAX_BLOCKS:
+        started = time.perf_counter()
+        expected = brute_force_groups(blocks)
+        baseline_elapsed = time.perf_counter() - started
+        baseline = f"baseline {baseline_elapsed:.2f}s ({baseline_elapsed / lsh_elapsed:.1f}x)"
+    else:
+        expected = None
+        baseline = "baseline skipped"
+
+    print(
+        f"\n{block_count} blocks: LSH {lsh_elapsed:.2f}s ({block_count / lsh_elapsed:.0f} blocks/s), "
+        f"{baseline}, {len(groups)} groups"
+    )
+    if expected is not None:
+        assert [[id(block) for block in group] for group in groups] == [
+            [id(block) for block in group] for group in expected
+        ]
+    else:
+        # Exact duplicates always collapse into one group
+        distinct_codes = {_normalize_code_for_comparison(block["code"]) for block in blocks}
+        assert len(groups) <= len(distinct_codes)
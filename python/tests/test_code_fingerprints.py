@@ -0,0 +1,289 @@
+"""
+Tests for the global code-example fingerprint index.
+
+Covers the SQLite fingerprint table, summary reuse for exact and near-duplicate
+snippets, and embedding reuse in add_code_examples_to_database.
+"""
+
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.server.repositories.fake_repository import FakeDatabaseRepository
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.storage.code_similarity_index import signature_to_bytes
+from src.server.services.storage.code_storage_service import (
+    _fingerprint_code_examples,
+    add_code_examples_to_database,
+    find_known_code_summaries,
+)
+from tests.test_code_similarity_index import make_code_block, mutate_code
+
+
+def make_fingerprint(
+    code: str, summary: str, language: str = "python", embedding=None, model: str = "gpt-4o-mini"
+) -> dict:
+    index, hashes, signatures = _fingerprint_code_examples([code], [language])
+    return {
+        "code_hash": hashes[0],
+        "minhash": signature_to_bytes(signatures[0]),
+        "band_keys": index.persistent_band_keys(signatures[0]),
+        "language": language,
+        "summary": summary,
+        "example_name": "Example",
+        "llm_chat_model": model,
+        "embedding_model": "text-embedding-3-small",
+        "embedding_dimension": len(embedding) if embedding else None,
+        "embedding": embedding,
+    }
+
+
+@pytest.fixture
+async def sqlite_repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        yield repository
+
+
+class TestSQLiteFingerprints:
+    """Test fingerprint persistence in SQLite."""
+
+    async def test_upsert_and_get_roundtrip(self, sqlite_repository):
+        code = make_code_block(1)
+        await sqlite_repository.upsert_code_fingerprints([make_fingerprint(code, "Does things", embedding=[0.5] * 1536)])
+
+        fingerprints = await sqlite_repository.get_code_fingerprints([make_fingerprint(code, "")["code_hash"]])
+
+        assert len(fingerprints) == 1
+        assert fingerprints[0]["summary"] == "Does things"
+        assert fingerprints[0]["embedding"] == [0.5] * 1536
+        assert fingerprints[0]["hit_count"] == 0
+
+    async def test_upsert_existing_increments_hits_and_keeps_values(self, sqlite_repository):
+        code = make_code_block(2)
+        await sqlite_repository.upsert_code_fingerprints([make_fingerprint(code, "Original", embedding=[1.0] * 4)])
+
+        update = make_fingerprint(code, None)
+        await sqlite_repository.upsert_code_fingerprints([update])
+
+        fingerprint = (await sqlite_repository.get_code_fingerprints([update["code_hash"]]))[0]
+        assert fingerprint["summary"] == "Original"
+        assert fingerprint["embedding"] == [1.0] * 4
+        assert fingerprint["hit_count"] == 1
+
+    async def test_find_by_band_keys(self, sqlite_repository):
+        original = make_code_block(3)
+        await sqlite_repository.upsert_code_fingerprints([make_fingerprint(original, "Original")])
+
+        variant = make_fingerprint(mutate_code(original, 3), "")
+        candidates = await sqlite_repository.find_code_fingerprints_by_band_keys(variant["band_keys"])
+
+        assert [candidate["summary"] for candidate in candidates] == ["Original"]
+
+
+class TestFindKnownCodeSummaries:
+    """Test summary reuse across sources."""
+
+    @pytest.fixture(autouse=True)
+    def model_choice(self):
+        with patch(
+            "src.server.services.storage.code_storage_service._get_model_choice",
+            AsyncMock(return_value="gpt-4o-mini"),
+        ):
+            yield
+
+    async def test_exact_and_near_duplicates_are_reused(self):
+        repository = FakeDatabaseRepository()
+        original = make_code_block(4)
+        await repository.upsert_code_fingerprints([make_fingerprint(original, "Known summary")])
+
+        blocks = [
+            {"code": original, "language": "python"},
+            {"code": mutate_code(original, 4, edits=1), "language": "python"},
+            {"code": make_code_block(5), "language": "python"},
+        ]
+        known = await find_known_code_summaries(repository, blocks)
+
+        assert known[0]["summary"] == "Known summary"
+        assert known[1]["summary"] == "Known summary"
+        assert known[2] is None
+
+    async def test_language_mismatch_is_not_reused_for_near_duplicates(self):
+        repository = FakeDatabaseRepository()
+        original = make_code_block(6)
+        await repository.upsert_code_fingerprints([make_fingerprint(original, "Known", language="javascript")])
+
+        known = await find_known_code_summaries(
+            repository, [{"code": mutate_code(original, 6, edits=1), "language": "python"}]
+        )
+
+        assert known == [None]
+
+    async def test_exact_match_requires_same_language(self):
+        repository = FakeDatabaseRepository()
+        original = make_code_block(10)
+        await repository.upsert_code_fingerprints([make_fingerprint(original, "Known", language="javascript")])
+
+        known = await find_known_code_summaries(repository, [{"code": original, "language": "python"}])
+
+        assert known == [None]
+
+    async def test_snippets_equal_only_after_normalization_are_not_reused(self):
+        repository = FakeDatabaseRepository()
+        known_code = "from typing import Annotated\ndef create_user(name, age):\n    return User(name, age)"
+        other_code = "from typing import Annotated\nasync def delete_account(token, age):\n    return User(name, age)"
+        await repository.upsert_code_fingerprints([make_fingerprint(known_code, "Creates a user")])
+
+        known = await find_known_code_summaries(repository, [{"code": other_code, "language": "python"}])
+
+        assert known == [None]
+
+    async def test_summaries_from_other_models_are_not_reused(self):
+        repository = FakeDatabaseRepository()
+        original = make_code_block(9)
+        await repository.upsert_code_fingerprints([make_fingerprint(original, "Old model", model="gpt-3.5-turbo")])
+
+        known = await find_known_code_summaries(
+            repository,
+            [
+                {"code": original, "language": "python"},
+                {"code": mutate_code(original, 9, edits=1), "language": "python"},
+            ],
+        )
+
+        assert known == [None, None]
+
+    async def test_lookup_errors_fall_back_to_generation(self):
+        repository = FakeDatabaseRepository()
+        repository.get_code_fingerprints = AsyncMock(side_effect=RuntimeError("no table"))
+
+        known = await find_known_code_summaries(repository, [{"code": make_code_block(7)}])
+
+        assert known == [None]
+
+
+class TestEmbeddingReuse:
+    """Test that known snippets skip the embedding provider."""
+
+    async def test_known_snippet_skips_embedding_call(self):
+        repository = FakeDatabaseRepository()
+        code = make_code_block(8)
+        await repository.upsert_code_fingerprints([make_fingerprint(code, "Known", embedding=[0.1] * 1536)])
+
+        embeddings_batch = AsyncMock()
+        with (
+            patch(
+                "src.server.services.storage.code_storage_service.credential_service.get_credential",
+                AsyncMock(return_value="false"),
+            ),
+            patch(
+                "src.server.services.llm_provider_service.get_embedding_model",
+                AsyncMock(return_value="text-embedding-3-small"),
+            ),
+            patch(
+                "src.server.services.storage.code_storage_service._get_model_choice",
+                AsyncMock(return_value="gpt-4o-mini"),
+            ),
+            patch("src.server.services.storage.code_storage_service.create_embeddings_batch", embeddings_batch),
+        ):
+            await add_code_examples_to_database(
+                repository=repository,
+                urls=["https://example.com/docs"],
+                chunk_numbers=[0],
+                code_examples=[code],
+                summaries=["Known"],
+                metadatas=[{"source_id": "src-1", "language": "python", "example_name": "Example"}],
+            )
+
+        embeddings_batch.assert_not_called()
+        stored = list(repository.code_examples.values())
+        assert len(stored) == 1
+        assert stored[0]["embedding_1536"] == [0.1] * 1536
+
+    async def test_fingerprints_recorded_only_for_stored_rows(self):
+        repository = FakeDatabaseRepository()
+        stored_code = make_code_block(11)
+        failed_code = make_code_block(12)
+        await repository.upsert_code_fingerprints(
+            [
+                make_fingerprint(stored_code, "Stored", embedding=[0.1] * 1536),
+                make_fingerprint(failed_code, "Failed", embedding=[0.2] * 1536),
+            ]
+        )
+
+        async def insert_code_example(record):
+            if record["content"] == failed_code:
+                raise RuntimeError("disk full")
+
+        repository.insert_code_examples_batch = AsyncMock(side_effect=RuntimeError("disk full"))
+        repository.insert_code_example = insert_code_example
+        with (
+            patch(
+                "src.server.services.storage.code_storage_service.credential_service.get_credential",
+                AsyncMock(return_value="false"),
+            ),
+            patch(
+                "src.server.services.llm_provider_service.get_embedding_model",
+                AsyncMock(return_value="text-embedding-3-small"),
+            ),
+            patch(
+                "src.server.services.storage.code_storage_service._get_model_choice",
+                AsyncMock(return_value="gpt-4o-mini"),
+            ),
+            patch("src.server.services.storage.code_storage_service.asyncio.sleep", AsyncMock()),
+        ):
+            await add_code_examples_to_database(
+                repository=repository,
+                urls=["https://example.com/docs"] * 2,
+                chunk_numbers=[0, 1],
+                code_examples=[stored_code, failed_code],
+                summaries=["Stored", "Failed"],
+                metadatas=[{"source_id": "src-1", "language": "python", "example_name": "Example"}] * 2,
+            )
+
+        hits = {fingerprint["summary"]: fingerprint["hit_count"] for fingerprint in repository.code_fingerprints.values()}
+        assert hits == {"Stored": 1, "Failed": 0}
+
+    async def test_fallback_summaries_are_not_recorded(self):
+        repository = FakeDatabaseRepository()
+        code = make_code_block(13)
+
+        def embed(texts, provider=None):
+            return SimpleNamespace(embeddings=[[0.3] * 1536] * len(texts), texts_processed=list(texts), has_failures=False)
+
+        with (
+            patch(
+                "src.server.services.storage.code_storage_service.credential_service.get_credential",
+                AsyncMock(return_value="false"),
+            ),
+            patch(
+                "src.server.services.llm_provider_service.get_embedding_model",
+                AsyncMock(return_value="text-embedding-3-small"),
+            ),
+            patch(
+                "src.server.services.storage.code_storage_service._get_model_choice",
+                AsyncMock(return_value="gpt-4o-mini"),
+            ),
+            patch(
+                "src.server.services.storage.code_storage_service.create_embeddings_batch",
+                AsyncMock(side_effect=embed),
+            ),
+        ):
+            await add_code_examples_to_database(
+                repository=repository,
+                urls=["https://example.com/docs"],
+                chunk_numbers=[0],
+                code_examples=[code],
+                summaries=["Code example for demonstration purposes."],
+                metadatas=[{"source_id": "src-1", "language": "python", "example_name": "Code Example"}],
+                fallback_summaries=[True],
+            )
+
+        assert len(repository.code_examples) == 1
+        fingerprint = next(iter(repository.code_fingerprints.values()))
+        assert fingerprint["summary"] is None
+        assert fingerprint["llm_chat_model"] is None
@@ -0,0 +1,128 @@
+"""
+Tests for MinHash/LSH code deduplication.
+
+Verifies the similarity index and that LSH-based grouping in the code storage
+service produces the same groups as the exhaustive pairwise comparison.
+"""
+
+import random
+
+from src.server.services.storage.code_similarity_index import (
+    CodeSimilarityIndex,
+    estimate_jaccard,
+    shingle_hashes,
+)
+from src.server.services.storage.code_storage_service import (
+    CODE_SIMILARITY_THRESHOLD,
+    _calculate_code_similarity,
+    _group_similar_code_blocks,
+    _normalize_code_for_comparison,
+)
+
+
+def make_code_block(seed: int, length: int = 40) -> str:
+    """Generate a deterministic, realistic-looking Python snippet."""
+    rng = random.Random(seed)
+    names = ["client", "session", "router", "item", "user", "config", "result", "payload", "token"]
+    lines = [f"def handler_{seed}(request):"]
+    for i in range(length):
+        target = rng.choice(names)
+        source = rng.choice(names)
+        lines.append(f"    {target}_{i} = {source}.get('{rng.choice(names)}', {rng.randint(0, 999)})")
+    lines.append(f"    return {rng.choice(names)}_0")
+    return "\n".join(lines)
+
+
+def mutate_code(code: str, seed: int, edits: int = 2) -> str:
+    """Apply a few small line edits to simulate a code variant."""
+    rng = random.Random(seed)
+    lines = code.split("\n")
+    for _ in range(edits):
+        index = rng.randrange(1, len(lines))
+        lines[index] = lines[index].replace("get", "pop", 1)
+    return "\n".join(lines)
+
+
+def brute_force_groups(blocks):
+    """Reference implementation: the original O(n²) pairwise grouping."""
+    groups = []
+    processed = set()
+    for i, block1 in enumerate(blocks):
+        if i in processed:
+            continue
+        group = [block1]
+        processed.add(i)
+        for j, block2 in enumerate(blocks):
+            if j <= i or j in processed:
+                continue
+            if _calculate_code_similarity(block1["code"], block2["code"]) >= CODE_SIMILARITY_THRESHOLD:
+                group.append(block2)
+                processed.add(j)
+        groups.append(group)
+    return groups
+
+
+class TestCodeSimilarityIndex:
+    """Test the MinHash/LSH index itself."""
+
+    def test_signatures_are_deterministic(self):
+        code = _normalize_code_for_comparison(make_code_block(1))
+        assert (CodeSimilarityIndex().signature(code) == CodeSimilarityIndex().signature(code)).all()
+
+    def test_identical_code_is_candidate(self):
+        index = CodeSimilarityIndex()
+        code = _normalize_code_for_comparison(make_code_block(2))
+        index.add("a", index.signature(code))
+        assert index.query(index.signature(code)) == {"a"}
+
+    def test_near_duplicate_is_candidate_and_unrelated_is_not(self):
+        index = CodeSimilarityIndex()
+        original = make_code_block(3)
+        index.add("original", index.signature(_normalize_code_for_comparison(original)))
+
+        variant = index.signature(_normalize_code_for_comparison(mutate_code(original, 3)))
+        unrelated = index.signature(_normalize_code_for_comparison(make_code_block(99)))
+
+        assert "original" in index.query(variant)
+        assert "original" not in index.query(unrelated)
+
+    def test_estimate_jaccard(self):
+        index = CodeSimilarityIndex()
+        code = _normalize_code_for_comparison(make_code_block(4))
+        assert estimate_jaccard(index.signature(code), index.signature(code)) == 1.0
+
+    def test_empty_code(self):
+        index = CodeSimilarityIndex()
+        assert shingle_hashes("").size == 0
+        assert len(index.signature("")) == index.num_perm
+
+    def test_bands_must_divide_permutations(self):
+        try:
+            CodeSimilarityIndex(num_perm=100, bands=32)
+        except ValueError:
+            return
+        raise AssertionError("Expected ValueError for indivisible band configuration")
+
+
+class TestGroupSimilarCodeBlocks:
+    """Test LSH grouping against the pairwise reference."""
+
+    def test_matches_pairwise_grouping(self):
+        blocks = []
+        for seed in range(40):
+            code = make_code_block(seed)
+            blocks.append({"code": code, "language": "python"})
+            if seed % 3 == 0:
+                blocks.append({"code": mutate_code(code, seed), "language": "python"})
+            if seed % 5 == 0:
+                blocks.append({"code": code, "language": ""})
+        random.Random(7).shuffle(blocks)
+
+        expected = [[id(block) for block in group] for group in brute_force_groups(blocks)]
+        actual = [[id(block) for block in group] for group in _group_similar_code_blocks(blocks)]
+
+        assert actual == expected
+
+    def test_unique_blocks_stay_separate(self):
+        blocks = [{"code": make_code_block(seed)} for seed in range(10)]
+        assert len(_group_similar_code_blocks(blocks)) == 10
@@ -0,0 +1,92 @@
+"""
+Tests for multi-snippet code summary batching.
+
+Covers coalescing of identical snippets and the per-snippet fallback when a
+batched response is incomplete.
+"""
+
+import json
+import os
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.server.services.storage.code_storage_service import generate_code_summaries_batch
+from tests.test_code_similarity_index import make_code_block
+
+MODULE = "src.server.services.storage.code_storage_service"
+
+
+def make_block(seed: int, language: str = "python") -> dict:
+    return {"code": make_code_block(seed), "language": language, "context_before": "", "context_after": ""}
+
+
+def make_response(payload: dict) -> SimpleNamespace:
+    message = SimpleNamespace(content=json.dumps(payload), role="assistant")
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def batched_payload(request_params: dict, skip_ids: tuple[int, ...] = ()) -> dict:
+    prompt = request_params["messages"][1]["content"]
+    count = prompt.count("<snippet id=")
+    return {
+        "summaries": [
+            {"id": i, "example_name": f"Batched {i}", "summary": f"Summary {i}."}
+            for i in range(count)
+            if i not in skip_ids
+        ]
+    }
+
+
+@pytest.fixture
+def llm_client():
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(side_effect=lambda **params: make_response(batched_payload(params)))
+
+    @asynccontextmanager
+    async def fake_get_llm_client(provider=None):
+        yield client
+
+    with (
+        patch(f"{MODULE}.get_llm_client", fake_get_llm_client),
+        patch(f"{MODULE}._get_model_choice", AsyncMock(return_value="gpt-4o-mini")),
+        patch.dict(os.environ, {"CODE_SUMMARY_BATCH_SIZE": "4"}),
+    ):
+        yield client
+
+
+class TestGenerateCodeSummariesBatch:
+    """Test batching and coalescing in generate_code_summaries_batch."""
+
+    async def test_snippets_share_one_request_and_duplicates_are_coalesced(self, llm_client):
+        blocks = [make_block(1), make_block(2), make_block(1), make_block(3)]
+
+        summaries = await generate_code_summaries_batch(blocks, provider="openai")
+
+        assert llm_client.chat.completions.create.await_count == 1
+        params = llm_client.chat.completions.create.await_args.kwargs
+        assert params["response_format"] == {"type": "json_object"}
+        assert params["messages"][1]["content"].count("<snippet id=") == 3
+        assert summaries[0] == summaries[2]
+        assert [s["example_name"] for s in summaries] == ["Batched 0", "Batched 1", "Batched 0", "Batched 2"]
+
+    async def test_missing_batch_entries_fall_back_to_single_requests(self, llm_client):
+        single = {"example_name": "Single", "summary": "Single summary."}
+        llm_client.chat.completions.create.side_effect = lambda **params: make_response(
+            batched_payload(params, skip_ids=(1,)) if "<snippet id=" in params["messages"][1]["content"] else single
+        )
+
+        summaries = await generate_code_summaries_batch([make_block(7), make_block(8)], provider="openai")
+
+        assert llm_client.chat.completions.create.await_count == 2
+        assert summaries[0]["example_name"] == "Batched 0"
+        assert summaries[1] == single
+
+    async def test_failed_generation_is_flagged_as_fallback(self, llm_client):
+        llm_client.chat.completions.create.side_effect = RuntimeError("provider down")
+
+        summaries = await generate_code_summaries_batch([make_block(9), make_block(10)], provider="openai")
+
+        assert [s.get("fallback") for s in summaries] == [True, True]
@@ -0,0 +1,211 @@
+"""
+Benchmark for single-pass HTML code extraction.
+
+Builds documentation pages in the markup of common generators (Docusaurus,
+VitePress, Sphinx, MkDocs Material, CodeMirror playgrounds) with the navigation,
+prose and inline scripts of real docs sites, then compares scan_html against
+the per-highlighter regex scan it replaced (LEGACY_PATTERNS, run the way
+CodeExtractionService used to run them, plus the <title> and standalone
+<code> searches).
+
+Skipped by default. Run with:
+    ARCHON_RUN_BENCHMARKS=1 uv run pytest tests/test_html_scanner_benchmark.py -s
+"""
+
+import os
+import re
+import time
+
+import pytest
+
+from src.server.services.crawling.helpers.html_scanner import scan_html
+from tests.unit.services.crawling.test_html_scanner import DOCS_PAGES
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not os.getenv("ARCHON_RUN_BENCHMARKS"), reason="Set ARCHON_RUN_BENCHMARKS=1 to run benchmarks"
+    ),
+]
+
+PROSE = (
+    "<p>The client keeps connections open between requests, so reuse a single instance "
+    'across your application. See <a href="/docs/reference/client">the reference</a> for '
+    "every option and <code>timeout</code> for tuning slow endpoints.</p>"
+)
+
+LEGACY_PATTERNS = [
+    # GitHub/GitLab patterns
+    (
+        r'<div[^>]*class=["\'][^"\']*highlight[^"\']*["\'][^>]*>.*?<pre[^>]*class=["\'][^"\']*(?:language-)?(\w+)[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
+        "github-highlight",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*snippet-clipboard-content[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
+        "github-snippet",
+    ),
+    # Docusaurus patterns
+    (
+        r'<div[^>]*class=["\'][^"\']*codeBlockContainer[^"\']*["\'][^>]*>.*?<pre[^>]*class=["\'][^"\']*prism-code[^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</pre>',
+        "docusaurus",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>.*?<pre[^>]*class=["\'][^"\']*prism-code[^"\']*["\'][^>]*>(.*?)</pre>',
+        "docusaurus-alt",
+    ),
+    # Milkdown specific patterns - check their actual HTML structure
+    (
+        r'<pre[^>]*><code[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</code></pre>',
+        "milkdown-typed",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*code-wrapper[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
+        "milkdown-wrapper",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*code-block-wrapper[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
+        "milkdown-wrapper-code",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*milkdown-code-block[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
+        "milkdown-code-block",
+    ),
+    (
+        r'<pre[^>]*class=["\'][^"\']*code-block[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
+        "milkdown",
+    ),
+    (r"<div[^>]*data-code-block[^>]*>.*?<pre[^>]*>(.*?)</pre>", "milkdown-alt"),
+    (
+        r'<div[^>]*class=["\'][^"\']*milkdown[^"\']*["\'][^>]*>.*?<pre[^>]*><code[^>]*>(.*?)</code></pre>',
+        "milkdown-div",
+    ),
+    # Monaco Editor - capture all view-lines content
+    (
+        r'<div[^>]*class=["\'][^"\']*monaco-editor[^"\']*["\'][^>]*>.*?<div[^>]*class=["\'][^"\']*view-lines[^"\']*[^>]*>(.*?)</div>(?=.*?</div>.*?</div>)',
+        "monaco",
+    ),
+    # CodeMirror patterns
+    (
+        r'<div[^>]*class=["\'][^"\']*cm-content[^"\']*["\'][^>]*>((?:<div[^>]*class=["\'][^"\']*cm-line[^"\']*["\'][^>]*>.*?</div>\s*)+)</div>',
+        "codemirror",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*CodeMirror[^"\']*["\'][^>]*>.*?<div[^>]*class=["\'][^"\']*CodeMirror-code[^"\']*["\'][^>]*>(.*?)</div>',
+        "codemirror-legacy",
+    ),
+    # Prism.js with language - must be before generic pre
+    (
+        r'<pre[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>\s*<code[^>]*>(.*?)</code>\s*</pre>',
+        "prism",
+    ),
+    (
+        r'<pre[^>]*>\s*<code[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</code>\s*</pre>',
+        "prism-alt",
+    ),
+    # highlight.js - must be before generic pre/code
+    (
+        r'<pre[^>]*><code[^>]*class=["\'][^"\']*hljs(?:\s+language-(\w+))?[^"\']*["\'][^>]*>(.*?)</code></pre>',
+        "hljs",
+    ),
+    (
+        r'<pre[^>]*class=["\'][^"\']*hljs[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
+        "hljs-pre",
+    ),
+    # Shiki patterns (VitePress, Astro, etc.)
+    (
+        r'<pre[^>]*class=["\'][^"\']*shiki[^"\']*["\'][^>]*(?:.*?style=["\'][^"\']*background-color[^"\']*["\'])?[^>]*>\s*<code[^>]*>(.*?)</code>\s*</pre>',
+        "shiki",
+    ),
+    (r'<pre[^>]*class=["\'][^"\']*astro-code[^"\']*["\'][^>]*>(.*?)</pre>', "astro-shiki"),
+    (
+        r'<div[^>]*class=["\'][^"\']*astro-code[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
+        "astro-wrapper",
+    ),
+    # VitePress/Vue patterns
+    (
+        r'<div[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
+        "vitepress",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*vp-code[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
+        "vitepress-vp",
+    ),
+    # Nextra patterns
+    (r"<div[^>]*data-nextra-code[^>]*>.*?<pre[^>]*>(.*?)</pre>", "nextra"),
+    (
+        r'<pre[^>]*class=["\'][^"\']*nx-[^"\']*["\'][^>]*><code[^>]*>(.*?)</code></pre>',
+        "nextra-nx",
+    ),
+    # Standard pre/code patterns - should be near the end
+    (
+        r'<pre[^>]*><code[^>]*class=["\'][^"\']*language-(\w+)[^"\']*["\'][^>]*>(.*?)</code></pre>',
+        "standard-lang",
+    ),
+    (r"<pre[^>]*>\s*<code[^>]*>(.*?)</code>\s*</pre>", "standard"),
+    # Generic patterns - should be last
+    (
+        r'<div[^>]*class=["\'][^"\']*code-block[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
+        "generic-div",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*codeblock[^"\']*["\'][^>]*>(.*?)</div>',
+        "generic-codeblock",
+    ),
+    (
+        r'<div[^>]*class=["\'][^"\']*highlight[^"\']*["\'][^>]*>.*?<pre[^>]*>(.*?)</pre>',
+        "highlight",
+    ),
+]
+
+
+def legacy_regex_scan(html: str) -> int:
+    """Run every pattern over the page like the regex extractor did; returns the match count."""
+    matches = 0
+    for pattern, _ in LEGACY_PATTERNS:
+        matches += sum(1 for _ in re.finditer(pattern, html, re.DOTALL | re.IGNORECASE))
+    re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
+    matches += sum(1 for _ in re.finditer(r"<code[^>]*>(.*?)</code>", html, re.DOTALL | re.IGNORECASE))
+    return matches
+
+
+def build_page(sections: int) -> str:
+    """A docs page with a sidebar, `sections` sections of prose and code, and a script bundle."""
+    frameworks = sorted(DOCS_PAGES)
+    sidebar = "".join(
+        f'<li class="menu__list-item"><a class="menu__link" href="/docs/page-{n}">Page {n}</a></li>'
+        for n in range(200)
+    )
+    body = "".join(
+        f'<h2 id="section-{n}">Section {n}</h2>{PROSE * 3}{DOCS_PAGES[frameworks[n % len(frameworks)]]}{PROSE}'
+        for n in range(sections)
+    )
+    script = "<script>" + "window.__state.push({id:1,html:'<div class=\\'x\\'></div>'});" * 200 + "</script>"
+    return (
+        "<!DOCTYPE html><html><head><title>Client guide | Docs</title></head><body>"
+        f'<nav class="navbar"><div class="menu"><ul>{sidebar}</ul></div></nav>'
+        f'<main><article><div class="markdown">{body}</div></article></main>{script}</body></html>'
+    )
+
+
+@pytest.mark.parametrize("sections", [5, 40, 160, 640])
+def test_html_scan_benchmark(sections):
+    pages = [build_page(sections) for _ in range(3)]
+    size_mb = sum(len(page) for page in pages) / 1_000_000
+
+    started = time.perf_counter()
+    scans = [scan_html(page) for page in pages]
+    scan_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for page in pages:
+        legacy_regex_scan(page)
+    legacy_elapsed = time.perf_counter() - started
+
+    print(
+        f"\n{sections} sections ({size_mb / len(pages) * 1000:.0f} KB/page): "
+        f"scan_html {size_mb / scan_elapsed:.1f} MB/s, regex {size_mb / legacy_elapsed:.1f} MB/s "
+        f"({legacy_elapsed / scan_elapsed:.1f}x)"
+    )
+    for scan in scans:
+        assert scan.title == "Client guide | Docs"
+        assert len(scan.code_blocks) == sections
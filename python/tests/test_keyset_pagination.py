@@ -0,0 +1,145 @@
+"""
+Tests for keyset pagination and projections in page/chunk listings.
+
+Covers the SQLite repository cursors, metadata-only projections, the chunk
+service cursor round trip and the /api/pages cursor mode.
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.knowledge.knowledge_item_service import KnowledgeItemService
+from src.server.utils.pagination_utils import decode_cursor, encode_cursor
+
+SOURCE_ID = "src-keyset"
+
+
+@pytest.fixture
+async def repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        await repository.upsert_source({"source_id": SOURCE_ID, "title": "Keyset", "summary": ""})
+        await repository.upsert_page_metadata_batch([
+            {"source_id": SOURCE_ID, "url": f"https://docs.dev/page-{i:02d}", "full_content": f"Body {i}"}
+            for i in range(7)
+        ])
+        await repository.insert_crawled_pages_batch([
+            {
+                "source_id": SOURCE_ID,
+                "url": f"https://docs.dev/page-{i:02d}",
+                "chunk_number": chunk,
+                "content": f"Chunk {i}.{chunk}",
+                "metadata": {},
+            }
+            for i in range(3)
+            for chunk in range(3)
+        ])
+        yield repository
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor("https://docs.dev/a?b=c&d=é", 3)
+
+    assert decode_cursor(cursor, expected_length=2) == ["https://docs.dev/a?b=c&d=é", 3]
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, expected_length=1)
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!", expected_length=1)
+
+
+class TestRepositoryKeyset:
+    """Test keyset pagination in the SQLite repository."""
+
+    async def test_pages_walk_all_rows_without_content(self, repository):
+        urls = []
+        after_url = None
+        while True:
+            batch = await repository.list_pages_by_source(
+                SOURCE_ID, limit=3, after_url=after_url, include_content=False
+            )
+            if not batch:
+                break
+            assert all("full_content" not in page for page in batch)
+            urls.extend(page["url"] for page in batch)
+            after_url = batch[-1]["url"]
+
+        assert urls == [f"https://docs.dev/page-{i:02d}" for i in range(7)]
+
+    async def test_chunks_seek_on_url_and_chunk_number(self, repository):
+        chunks = await repository.list_crawled_pages_by_source(
+            SOURCE_ID, limit=4, after=("https://docs.dev/page-00", 1), include_content=False
+        )
+
+        assert [(c["url"][-7:], c["chunk_number"]) for c in chunks] == [
+            ("page-00", 2), ("page-01", 0), ("page-01", 1), ("page-01", 2)
+        ]
+        assert all("content" not in chunk for chunk in chunks)
+
+    async def test_offset_without_limit(self, repository):
+        chunks = await repository.list_crawled_pages_by_source(SOURCE_ID, offset=7)
+
+        assert len(chunks) == 2
+
+
+class TestChunkServiceCursor:
+    """Test cursor pagination through KnowledgeItemService.get_chunks_for_source."""
+
+    async def test_cursor_pages_cover_all_chunks(self, repository):
+        service = KnowledgeItemService(repository=repository)
+
+        first = await service.get_chunks_for_source(SOURCE_ID, limit=5)
+        second = await service.get_chunks_for_source(SOURCE_ID, limit=5, cursor=first["next_cursor"])
+
+        contents = [chunk["content"] for chunk in first["chunks"] + second["chunks"]]
+        assert len(contents) == 9
+        assert len(set(contents)) == 9
+        assert second["has_more"] is False
+        assert second["next_cursor"] is None
+
+
+class TestPagesApiCursor:
+    """Test cursor mode of GET /api/pages."""
+
+    def test_list_pages_with_limit_returns_next_cursor(self, client, repository):
+        with patch("src.server.api_routes.pages_api.get_repository", return_value=repository):
+            first = client.get("/api/pages", params={"source_id": SOURCE_ID, "limit": 4}).json()
+            second = client.get(
+                "/api/pages", params={"source_id": SOURCE_ID, "limit": 4, "cursor": first["next_cursor"]}
+            ).json()
+            invalid = client.get("/api/pages", params={"source_id": SOURCE_ID, "cursor": "???"})
+
+        assert first["total"] == 7
+        assert [page["url"][-7:] for page in first["pages"]] == ["page-00", "page-01", "page-02", "page-03"]
+        assert [page["url"][-7:] for page in second["pages"]] == ["page-04", "page-05", "page-06"]
+        assert second["next_cursor"] is None
+        assert invalid.status_code == 400
+
+    def test_section_total_uses_count_query(self, client, repository):
+        async def fail(*args, **kwargs):
+            raise AssertionError("loaded every page in the section")
+
+        with (
+            patch("src.server.api_routes.pages_api.get_repository", return_value=repository),
+            patch.object(repository, "list_page_metadata_by_source", fail),
+        ):
+            response = client.get("/api/pages", params={"source_id": SOURCE_ID, "section": "Missing", "limit": 2})
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+    def test_invalid_page_row_is_server_error(self, client, repository):
+        async def broken_rows(*args, **kwargs):
+            return [{"id": "p1", "url": None}]
+
+        with (
+            patch("src.server.api_routes.pages_api.get_repository", return_value=repository),
+            patch.object(repository, "list_pages_by_source", broken_rows),
+        ):
+            response = client.get("/api/pages", params={"source_id": SOURCE_ID, "limit": 2})
+
+        assert response.status_code == 500
@@ -370,8 +370,13 @@ class TestKnowledgeAPIIntegration:
         
         mock_supabase_client.from_.return_value = mock_from
         
-        # Test chunks endpoint error handling
-        response = client.get("/api/knowledge-items/test-source/chunks?limit=10")
+        # The endpoint reads through the repository, so fail there as well
+        with patch(
+            "src.server.services.knowledge.knowledge_item_service.KnowledgeItemService.get_chunks_for_source",
+            side_effect=Exception("Database connection error"),
+        ):
+            # Test chunks endpoint error handling
+            response = client.get("/api/knowledge-items/test-source/chunks?limit=10")
         
         assert response.status_code == 500
         data = response.json()
@@ -0,0 +1,164 @@
+"""
+Tests for compressed page bodies and chunk references in the SQLite repository.
+
+Page bodies are stored zlib-compressed (with a per-source preset dictionary once
+enough pages are known) and chunks can be stored as ranges of their page body;
+both must stay invisible to callers.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from src.server.repositories.sqlite_repository import (
+    PAGE_DICTIONARY_MIN_PAGES,
+    SQLiteDatabaseRepository,
+    train_page_dictionary,
+)
+
+NAV = "\n".join(f"- [Guide section {n}](https://docs.example.com/guide/{n})" for n in range(40))
+FOOTER = "Copyright 2026 Example Inc. All rights reserved. Edit this page on GitHub."
+
+
+def make_page(source_id: str, n: int) -> dict:
+    body = "\n\n".join(
+        f"## Topic {n}.{part}\n\nThe request handler {n} validates input part {part} before storing it."
+        for part in range(5)
+    )
+    return {
+        "source_id": source_id,
+        "url": f"https://docs.example.com/{source_id}/page-{n}",
+        "full_content": f"{NAV}\n\n# Page {n}\n\n{body}\n\n{FOOTER}",
+    }
+
+
+def make_chunks(page: dict, page_id: str) -> list[dict]:
+    parts = page["full_content"].split("\n\n## ")
+    chunks = [parts[0]] + [f"## {part}" for part in parts[1:]]
+    # A contextualized chunk does not appear verbatim in the page body
+    chunks[1] = "Context: guide page\n---\n" + chunks[1]
+    return [
+        {
+            "url": page["url"],
+            "chunk_number": number,
+            "content": content,
+            "metadata": {"chunk_size": len(content)},
+            "source_id": page["source_id"],
+            "page_id": page_id,
+        }
+        for number, content in enumerate(chunks)
+    ]
+
+
+@pytest.fixture
+async def make_repository(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        async def make(chunk_refs: bool = False) -> SQLiteDatabaseRepository:
+            monkeypatch.setenv("ARCHON_SQLITE_CHUNK_REFS", "true" if chunk_refs else "false")
+            repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+            await repository.initialize()
+            await repository.upsert_source({"source_id": "docs", "title": "Docs", "summary": ""})
+            return repository
+
+        yield make
+
+
+async def stored_pages(repository) -> list[dict]:
+    async with repository._get_connection() as conn:
+        cursor = await conn.execute("""
+            SELECT url, full_content, content_encoding, dictionary_id FROM archon_page_metadata ORDER BY url
+        """)
+        return [dict(row) for row in await cursor.fetchall()]
+
+
+def test_dictionary_prefers_shared_lines():
+    pages = [make_page("docs", n)["full_content"] for n in range(3)]
+
+    dictionary = train_page_dictionary(pages)
+
+    assert FOOTER.encode() in dictionary
+    assert b"# Page 1" not in dictionary
+    assert train_page_dictionary(["only one page"]) is None
+
+
+async def test_page_bodies_round_trip_compressed(make_repository):
+    repository = await make_repository()
+    pages = [make_page("docs", n) for n in range(PAGE_DICTIONARY_MIN_PAGES)]
+
+    saved = await repository.upsert_page_metadata_batch(pages)
+
+    rows = await stored_pages(repository)
+    assert {row["content_encoding"] for row in rows} == {"zlib-dict"}
+    assert len({row["dictionary_id"] for row in rows}) == 1
+    assert all(len(row["full_content"]) < len(pages[0]["full_content"]) / 3 for row in rows)
+
+    page = await repository.get_full_page_metadata_by_id(saved[0]["id"])
+    assert page["full_content"] == pages[0]["full_content"]
+    assert page["char_count"] == len(pages[0]["full_content"])
+    assert "content_encoding" not in page
+    by_url = await repository.get_page_metadata_by_url(pages[3]["url"])
+    assert by_url["full_content"] == pages[3]["full_content"]
+    listed = await repository.list_pages_by_source("docs", include_content=True)
+    assert [p["full_content"] for p in listed] == [p["full_content"] for p in sorted(pages, key=lambda p: p["url"])]
+
+
+async def test_small_batches_compress_without_dictionary(make_repository, monkeypatch):
+    repository = await make_repository()
+    await repository.upsert_page_metadata_batch([make_page("docs", 0)])
+
+    monkeypatch.setenv("ARCHON_SQLITE_COMPRESS_PAGES", "false")
+    plain = SQLiteDatabaseRepository(db_path=repository.db_path)
+    await plain.upsert_page_metadata_batch([make_page("docs", 1)])
+
+    rows = await stored_pages(repository)
+    assert [(row["content_encoding"], row["dictionary_id"]) for row in rows] == [("zlib", None), ("text", None)]
+    for n in range(2):
+        page = await plain.get_page_metadata_by_url(make_page("docs", n)["url"])
+        assert page["full_content"] == make_page("docs", n)["full_content"]
+
+
+async def test_chunk_references_resolve_on_read(make_repository):
+    repository = await make_repository(chunk_refs=True)
+    page = make_page("docs", 0)
+    page_id = (await repository.upsert_page_metadata_batch([page]))[0]["id"]
+    chunks = make_chunks(page, page_id)
+
+    await repository.insert_crawled_pages_batch(chunks)
+
+    async with repository._get_connection() as conn:
+        cursor = await conn.execute("""
+            SELECT content_encoding FROM archon_crawled_pages ORDER BY chunk_number
+        """)
+        encodings = [row["content_encoding"] for row in await cursor.fetchall()]
+    assert encodings == ["ref", "text", "ref", "ref", "ref", "ref"]
+
+    documents = await repository.get_documents_by_source("docs")
+    assert [doc["content"] for doc in documents] == [chunk["content"] for chunk in chunks]
+    listed = await repository.list_crawled_pages_by_source("docs", include_content=True)
+    assert [doc["content"] for doc in listed] == [chunk["content"] for chunk in chunks]
+    assert "content" not in (await repository.list_crawled_pages_by_source("docs", include_content=False))[0]
+    first = await repository.get_crawled_page_by_url(page["url"], "docs")
+    assert first["content"] == chunks[0]["content"]
+    hits = await repository.search_documents_hybrid("request handler 0 validates input part 3", [], 5)
+    assert [hit["chunk_number"] for hit in hits] == [4]
+
+
+async def test_replacing_a_page_keeps_referencing_chunks(make_repository):
+    repository = await make_repository(chunk_refs=True)
+    page = make_page("docs", 0)
+    page_id = (await repository.upsert_page_metadata_batch([page]))[0]["id"]
+    chunks = make_chunks(page, page_id)
+    await repository.insert_crawled_pages_batch(chunks)
+
+    await repository.upsert_page_metadata_batch([{**page, "full_content": "Rewritten page"}])
+
+    documents = await repository.get_documents_by_source("docs")
+    assert [doc["content"] for doc in documents] == [chunk["content"] for chunk in chunks]
+    # The inlined chunk text is counted in the source stats
+    async with repository._get_connection() as conn:
+        chunk_bytes = await repository._measure_source_stats(conn, "archon_crawled_pages", "1 = 1", [])
+        page_bytes = await repository._measure_source_stats(conn, "archon_page_metadata", "1 = 1", [])
+    stats = await repository.get_corpus_stats()
+    assert chunk_bytes["docs"][4] == sum(len(chunk["content"].encode()) for chunk in chunks)
+    assert stats["content_bytes"] == chunk_bytes["docs"][4] + page_bytes["docs"][4]
@@ -0,0 +1,120 @@
+"""
+Tests for server-side project search and pagination.
+
+Covers the SQLite full-text index maintenance, cursor pagination with
+lightweight projections, and the /api/projects search mode.
+"""
+
+import asyncio
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.server.api_routes.projects_api import router as projects_router
+from src.server.repositories.fake_repository import FakeDatabaseRepository
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+
+
+async def seed_projects(repository) -> list[str]:
+    ids = []
+    for i, (title, description) in enumerate([
+        ("Auth service", "OAuth login flows"),
+        ("Billing", "Invoices and authorization holds"),
+        ("Docs site", "Static documentation"),
+        ("Search", "Full-text search for the docs site"),
+        ("Café app", "Mobile ordering"),
+    ]):
+        project = await repository.create_project({
+            "id": f"proj-{i}",
+            "title": title,
+            "description": description,
+            "docs": [{"id": "d"}] * i,
+            "features": [],
+            "data": {"k": "v"} if i % 2 else [],
+        })
+        ids.append(project["id"])
+    return ids
+
+
+@pytest.fixture
+async def repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        yield repository
+
+
+class TestSQLiteProjectSearch:
+    """Test the project search index and cursors in SQLite."""
+
+    async def test_prefix_search_over_title_and_description(self, repository):
+        await seed_projects(repository)
+
+        results = await repository.search_projects(query="auth")
+        assert sorted(project["title"] for project in results) == ["Auth service", "Billing"]
+        assert await repository.search_projects(query="docs site") != []
+        assert [p["title"] for p in await repository.search_projects(query="cafe")] == ["Café app"]
+        assert await repository.search_projects(query='"; DROP TABLE') == []
+
+    async def test_projection_has_stats_and_no_content(self, repository):
+        await seed_projects(repository)
+
+        project = (await repository.search_projects(query="billing"))[0]
+
+        assert not {"docs", "features", "data"} & project.keys()
+        assert project["stats"] == {"docs_count": 1, "features_count": 0, "has_data": True}
+
+    async def test_cursor_walks_all_projects_newest_first(self, repository):
+        ids = await seed_projects(repository)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await repository.search_projects(limit=2, cursor=cursor)
+            if not page:
+                break
+            seen.extend(project["id"] for project in page)
+            cursor = (page[-1]["created_at"], page[-1]["id"])
+
+        everything = await repository.search_projects()
+        assert seen == [project["id"] for project in everything]
+        assert sorted(seen) == sorted(ids)
+
+    async def test_index_follows_updates_and_deletes(self, repository):
+        await seed_projects(repository)
+
+        await repository.update_project("proj-2", {"title": "Developer portal"})
+        await repository.delete_project("proj-0")
+
+        assert [p["id"] for p in await repository.search_projects(query="portal")] == ["proj-2"]
+        # The description is still indexed after a title-only update
+        assert [p["id"] for p in await repository.search_projects(query="documentation")] == ["proj-2"]
+        assert [p["id"] for p in await repository.search_projects(query="oauth")] == []
+
+
+class TestProjectSearchAPI:
+    """Test the /api/projects search mode."""
+
+    def test_paginated_search(self):
+        app = FastAPI()
+        app.include_router(projects_router)
+        test_client = TestClient(app)
+        repository = FakeDatabaseRepository()
+        asyncio.run(seed_projects(repository))
+
+        with patch("src.server.api_routes.projects_api.get_repository", return_value=repository):
+            first = test_client.get("/api/projects", params={"query": "docs", "limit": 1}).json()
+            second = test_client.get(
+                "/api/projects", params={"query": "docs", "limit": 1, "cursor": first["next_cursor"]}
+            ).json()
+            invalid = test_client.get("/api/projects", params={"cursor": "not a cursor!"})
+
+        assert first["has_more"] is True
+        assert second["has_more"] is False and second["next_cursor"] is None
+        assert {first["projects"][0]["title"], second["projects"][0]["title"]} == {"Docs site", "Search"}
+        assert "docs" not in first["projects"][0]
+        assert invalid.status_code == 400
@@ -0,0 +1,143 @@
+"""
+Tests for revision-counter ETags.
+
+Verifies that repository writes bump the per-collection revisions and that the
+polling endpoints answer unchanged requests with 304 before querying.
+"""
+
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.server.api_routes.mcp_analytics_api import get_db_revision
+from src.server.api_routes.mcp_analytics_api import router as analytics_router
+from src.server.api_routes.projects_api import router as projects_router
+from src.server.repositories.fake_repository import FakeDatabaseRepository
+from src.server.repositories.revision_counters import PROJECTS, TASKS, RevisionCounters, revision_counters
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+
+
+@pytest.fixture
+def test_client():
+    app = FastAPI()
+    app.include_router(projects_router)
+    app.include_router(analytics_router)
+    return TestClient(app)
+
+
+def test_bump_updates_collection_and_keys():
+    counters = RevisionCounters()
+
+    counters.bump(TASKS, "p1", "p2")
+    counters.bump(TASKS, "p1")
+
+    assert counters.get(TASKS) == 2
+    assert counters.get(TASKS, "p1") == 2
+    assert counters.get(TASKS, "p2") == 1
+    assert counters.get(TASKS, "p3") == 0
+    assert counters.version((TASKS, "p2")) != RevisionCounters().version((TASKS, "p2"))
+
+
+async def test_sqlite_task_move_bumps_both_projects():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        for project_id in ("rev-p1", "rev-p2"):
+            await repository.create_project({"id": project_id, "title": project_id})
+        task = await repository.create_task({"project_id": "rev-p1", "title": "Move me"})
+
+        before = (revision_counters.get(TASKS, "rev-p1"), revision_counters.get(TASKS, "rev-p2"))
+        await repository.update_task(task["id"], {"project_id": "rev-p2"})
+        after_move = (revision_counters.get(TASKS, "rev-p1"), revision_counters.get(TASKS, "rev-p2"))
+        await repository.delete_task(task["id"])
+
+        assert after_move == (before[0] + 1, before[1] + 1)
+        assert revision_counters.get(TASKS, "rev-p2") == after_move[1] + 1
+        assert revision_counters.get(TASKS, "rev-p1") == after_move[0]
+
+
+class TestProjectTasksShortCircuit:
+    """Test that unchanged task polls skip the query."""
+
+    def test_unchanged_poll_skips_query_until_write(self, test_client):
+        repository = FakeDatabaseRepository()
+
+        with patch("src.server.api_routes.projects_api.get_repository", return_value=repository):
+            first = test_client.get("/api/projects/rev-tasks/tasks")
+            etag = first.headers["ETag"]
+
+            with patch.object(repository, "list_tasks", AsyncMock(side_effect=AssertionError("queried"))):
+                unchanged = test_client.get("/api/projects/rev-tasks/tasks", headers={"If-None-Match": etag})
+
+            # Writes to another project's tasks leave this project's ETag valid
+            revision_counters.bump(TASKS, "rev-other")
+            other_project_write = test_client.get("/api/projects/rev-tasks/tasks", headers={"If-None-Match": etag})
+
+            asyncio.run(repository.create_task({"project_id": "rev-tasks", "title": "New", "status": "todo"}))
+            changed = test_client.get("/api/projects/rev-tasks/tasks", headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert other_project_write.status_code == 304
+        assert changed.status_code == 200
+        assert [task["title"] for task in changed.json()] == ["New"]
+
+    def test_projects_etag_depends_on_include_content(self, test_client):
+        repository = FakeDatabaseRepository()
+
+        with patch("src.server.api_routes.projects_api.get_repository", return_value=repository):
+            full = test_client.get("/api/projects")
+            light = test_client.get(
+                "/api/projects", params={"include_content": False}, headers={"If-None-Match": full.headers["ETag"]}
+            )
+            revision_counters.bump(PROJECTS)
+            after_write = test_client.get("/api/projects", headers={"If-None-Match": full.headers["ETag"]})
+
+        assert light.status_code == 200
+        assert after_write.status_code == 200
+
+
+class TestHourlyAnalyticsShortCircuit:
+    """Test the database-file revision used by the hourly analytics ETag."""
+
+    def test_db_revision_changes_on_write(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "archon.db")
+            assert get_db_revision(db_path) is None
+
+            with open(db_path, "wb") as f:
+                f.write(b"a")
+            first = get_db_revision(db_path)
+            with open(db_path, "ab") as f:
+                f.write(b"b")
+
+            assert get_db_revision(db_path) != first
+
+    def test_unchanged_poll_skips_query(self, test_client):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "archon.db")
+            with open(db_path, "wb") as f:
+                f.write(b"stub")
+
+            with (
+                patch("src.server.api_routes.mcp_analytics_api.get_db_path", return_value=db_path),
+                patch("src.server.api_routes.mcp_analytics_api.aiosqlite.connect") as mock_connect,
+            ):
+                mock_cursor = AsyncMock()
+                mock_cursor.fetchall = AsyncMock(return_value=[])
+                mock_conn = AsyncMock()
+                mock_conn.execute = AsyncMock(return_value=mock_cursor)
+                mock_connect.return_value.__aenter__.return_value = mock_conn
+
+                first = test_client.get("/api/mcp/analytics/hourly")
+                second = test_client.get(
+                    "/api/mcp/analytics/hourly", headers={"If-None-Match": first.headers["ETag"]}
+                )
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert mock_connect.call_count == 1
@@ -0,0 +1,179 @@
+"""
+Tests for denormalized source counters and batched knowledge item listing.
+
+Verifies that SQLite keeps the archon_source_stats rows in sync with repository
+writes, that per-source stats and corpus totals agree, and that list_items and
+the database metrics no longer issue per-source queries.
+"""
+
+import os
+import sqlite3
+import tempfile
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.server.repositories.sqlite_repository import SQLiteDatabaseRepository
+from src.server.services.knowledge.database_metrics_service import DatabaseMetricsService
+from src.server.services.knowledge.knowledge_item_service import KnowledgeItemService
+
+
+def make_page(source_id: str, url: str) -> dict:
+    return {"source_id": source_id, "url": url, "full_content": f"Content of {url}"}
+
+
+def make_code_example(source_id: str, url: str) -> dict:
+    return {"source_id": source_id, "url": url, "chunk_number": 0, "content": "print('hi')", "summary": "Prints"}
+
+
+def make_chunk(source_id: str, url: str, chunk_number: int, content: str = "Chunk text") -> dict:
+    return {"source_id": source_id, "url": url, "chunk_number": chunk_number, "content": content}
+
+
+async def recount(repository) -> dict[str, int]:
+    """Corpus totals counted from the tables themselves."""
+    totals = [0] * len(repository._SOURCE_STATS_FIELDS)
+    async with repository._get_connection() as conn:
+        for table in repository._SOURCE_STATS_MEASURES:
+            measured = await repository._measure_source_stats(conn, table, "1 = 1", [])
+            for values in measured.values():
+                totals = [total + value for total, value in zip(totals, values, strict=True)]
+    return dict(zip(repository._SOURCE_STATS_FIELDS, totals, strict=True))
+
+
+@pytest.fixture
+async def repository():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        repository = SQLiteDatabaseRepository(db_path=os.path.join(tmp_dir, "archon.db"))
+        await repository.initialize()
+        for source_id in ("src-a", "src-b"):
+            await repository.upsert_source({"source_id": source_id, "title": source_id, "summary": ""})
+        yield repository
+
+
+class TestSourceCounters:
+    """Test counter maintenance in the SQLite repository."""
+
+    async def test_page_and_code_example_writes_update_counters(self, repository):
+        await repository.upsert_page_metadata_batch([
+            make_page("src-a", "https://a.dev/b"),
+            make_page("src-a", "https://a.dev/a"),
+        ])
+        await repository.insert_code_examples_batch([
+            make_code_example("src-a", "https://a.dev/a"),
+            make_code_example("src-a", "https://a.dev/b"),
+        ])
+        await repository.insert_code_example(make_code_example("src-b", "https://b.dev/a"))
+
+        stats = await repository.get_source_stats_by_sources(["src-a", "src-b", "missing"])
+
+        assert stats["src-a"] == {"page_count": 2, "code_example_count": 2, "first_page_url": "https://a.dev/a"}
+        assert stats["src-b"] == {"page_count": 0, "code_example_count": 1, "first_page_url": None}
+        assert "missing" not in stats
+
+    async def test_deletes_and_page_moves_update_counters(self, repository):
+        await repository.upsert_page_metadata_batch([make_page("src-a", "https://shared.dev/page")])
+        await repository.insert_code_examples_batch([
+            make_code_example("src-a", "https://shared.dev/page"),
+            make_code_example("src-a", "https://shared.dev/other"),
+        ])
+
+        # Re-upserting the same URL under another source replaces the row
+        await repository.upsert_page_metadata_batch([make_page("src-b", "https://shared.dev/page")])
+        await repository.delete_code_examples_by_url("https://shared.dev/page")
+
+        stats = await repository.get_source_stats_by_sources(["src-a", "src-b"])
+        assert stats["src-a"]["page_count"] == 0
+        assert stats["src-a"]["first_page_url"] is None
+        assert stats["src-a"]["code_example_count"] == 1
+        assert stats["src-b"]["page_count"] == 1
+
+        await repository.delete_code_examples_by_source("src-a")
+        stats = await repository.get_source_stats_by_sources(["src-a"])
+        assert stats["src-a"]["code_example_count"] == 0
+
+
+class TestSourceStats:
+    """Test the archon_source_stats totals maintained on the write path."""
+
+    async def test_stats_follow_inserts_replacements_and_deletes(self, repository):
+        await repository.upsert_page_metadata_batch([
+            make_page("src-a", "https://a.dev/a"),
+            make_page("src-a", "https://a.dev/b"),
+        ])
+        await repository.insert_crawled_pages_batch([
+            make_chunk("src-a", "https://a.dev/a", n, "Chunk text é") for n in range(3)
+        ])
+        await repository.insert_document(make_chunk("src-b", "https://b.dev/a", 0))
+        await repository.upsert_crawled_page(make_chunk("src-a", "https://a.dev/a", 0, "A much longer replacement"))
+        await repository.insert_code_examples_batch([make_code_example("src-a", "https://a.dev/a")])
+        await repository.insert_code_example(make_code_example("src-b", "https://b.dev/a"))
+        # Moves the page to src-b and replaces its body
+        await repository.upsert_page_metadata_batch([
+            {"source_id": "src-b", "url": "https://a.dev/b", "full_content": "Moved page with more words"},
+        ])
+
+        stats = await repository.get_corpus_stats()
+        assert stats == {"sources_count": 2, **await recount(repository)}
+        assert (stats["page_count"], stats["chunk_count"], stats["code_example_count"]) == (2, 4, 2)
+        assert stats["word_count"] == 3 + 5
+
+        await repository.delete_crawled_pages_by_urls(["https://a.dev/a"])
+        await repository.delete_code_examples_by_url("https://a.dev/a")
+        await repository.delete_documents_by_source("src-b")
+        assert await repository.get_corpus_stats() == {"sources_count": 2, **await recount(repository)}
+        per_source = await repository.get_source_stats_by_sources(["src-a", "src-b"])
+        assert sum(stats["page_count"] for stats in per_source.values()) == 2
+        assert sum(stats["code_example_count"] for stats in per_source.values()) == 1
+
+        await repository.delete_source("src-b")
+        stats = await repository.get_corpus_stats()
+        assert stats == {"sources_count": 1, **await recount(repository)}
+        assert stats["page_count"] == 1
+
+    async def test_failed_batch_leaves_stats_unchanged(self, repository):
+        await repository.insert_crawled_pages_batch([make_chunk("src-a", "https://a.dev/a", 0)])
+        before = await repository.get_corpus_stats()
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await repository.insert_crawled_pages_batch([
+                make_chunk("src-a", "https://a.dev/b", 0),
+                make_chunk("src-a", "https://a.dev/a", 0),  # violates UNIQUE(url, chunk_number)
+            ])
+
+        assert await repository.get_corpus_stats() == before
+
+    async def test_metrics_read_corpus_stats(self, repository):
+        await repository.upsert_page_metadata_batch([make_page("src-a", "https://a.dev/a")])
+        await repository.insert_code_example(make_code_example("src-a", "https://a.dev/a"))
+        repository.list_sources = AsyncMock(side_effect=AssertionError("listed sources"))
+        repository.get_page_count_by_source = AsyncMock(side_effect=AssertionError("per-source query"))
+        repository.get_code_example_count_by_source = AsyncMock(side_effect=AssertionError("per-source query"))
+
+        metrics = await DatabaseMetricsService(repository=repository).get_metrics()
+
+        assert metrics["sources_count"] == 2
+        assert metrics["pages_count"] == 1
+        assert metrics["code_examples_count"] == 1
+        assert metrics["words_count"] == 3
+        assert metrics["average_pages_per_source"] == 0.5
+
+
+class TestListItemsBatching:
+    """Test that list_items reads counts with a single batch query."""
+
+    async def test_list_items_uses_batch_stats(self, repository):
+        await repository.upsert_page_metadata_batch([make_page("src-a", "https://a.dev/a")])
+        await repository.insert_code_example(make_code_example("src-a", "https://a.dev/a"))
+
+        repository.get_page_count_by_source = AsyncMock(side_effect=AssertionError("per-source query"))
+        repository.get_code_example_count_by_source = AsyncMock(side_effect=AssertionError("per-source query"))
+        repository.list_pages_by_source = AsyncMock(side_effect=AssertionError("per-source query"))
+
+        result = await KnowledgeItemService(repository=repository).list_items()
+
+        items = {item["source_id"]: item for item in result["items"]}
+        assert items["src-a"]["document_count"] == 1
+        assert items["src-a"]["code_examples_count"] == 1
+        assert items["src-a"]["url"] == "https://a.dev/a"
+        assert items["src-b"]["document_count"] == 0
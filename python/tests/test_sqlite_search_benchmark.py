@@ -0,0 +1,61 @@
+"""
+Benchmark for chunk search in the SQLite repository.
+
+Times `search_documents_hybrid` (a LIKE scan over every chunk's content) and
+`search_documents_vector` over a synthetic corpus, with chunks stored as text
+and as references into their page bodies.
+
+Skipped by default. Run with:
+    ARCHON_RUN_BENCHMARKS=1 uv run pytest tests/test_sqlite_search_benchmark.py -s
+"""
+
+import os
+import time
+
+import pytest
+
+from tests import test_page_compression_sqlite as page_compression
+from tests.test_page_compression_sqlite import make_chunks, make_page
+
+# Same temporary-database repository fixture as the page compression tests
+make_repository = page_compression.make_repository
+
+QUERIES = ["validates input part 3", "request handler 42", "no such phrase anywhere"]
+ROUNDS = 5
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not os.getenv("ARCHON_RUN_BENCHMARKS"), reason="Set ARCHON_RUN_BENCHMARKS=1 to run benchmarks"
+    ),
+]
+
+
+@pytest.mark.parametrize("chunk_refs", [False, True])
+@pytest.mark.parametrize("page_count", [500, 2_000, 5_000])
+async def test_search_benchmark(make_repository, chunk_refs, page_count):
+    repository = await make_repository(chunk_refs=chunk_refs)
+    pages = [make_page("docs", n) for n in range(page_count)]
+    saved = await repository.upsert_page_metadata_batch(pages)
+    page_ids = {page["url"]: page["id"] for page in saved}
+    chunks = [chunk for page in pages for chunk in make_chunks(page, page_ids[page["url"]])]
+    await repository.insert_crawled_pages_batch(chunks)
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for query in QUERIES:
+            await repository.search_documents_hybrid(query, [], 5)
+    hybrid_elapsed = (time.perf_counter() - started) / (ROUNDS * len(QUERIES))
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        hits = await repository.search_documents_vector([], 50, {"chunk_size": 0})
+    vector_elapsed = (time.perf_counter() - started) / ROUNDS
+
+    print(
+        f"\n{len(chunks)} chunks (refs {'on' if chunk_refs else 'off'}): "
+        f"hybrid {hybrid_elapsed * 1000:.1f} ms/query, filtered vector {vector_elapsed * 1000:.1f} ms/query"
+    )
+    assert hits == []
+    hits = await repository.search_documents_hybrid("request handler 7 validates input part 3", [], 5)
+    assert [(hit["url"], hit["chunk_number"]) for hit in hits] == [(pages[7]["url"], 4)]
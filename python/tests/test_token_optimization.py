@@ -236,6 +236,17 @@ class TestDocumentServiceOptimization:
                 "author": "Test Author"
             }]
         })
+        # Documents are rows; without content the repository reports content_size instead
+        mock_repository.list_project_documents = AsyncMock(return_value=[{
+            "id": "doc-1",
+            "title": "Test Doc",
+            "content_size": len(str({"huge": "content" * 1000})),
+            "document_type": "spec",
+            "status": "draft",
+            "version": "1.0",
+            "tags": ["test"],
+            "author": "Test Author"
+        }])
 
         service = DocumentService(repository=mock_repository)
         success, result = await service.list_documents("project-1")  # Default include_content=False
@@ -264,6 +275,12 @@ class TestDocumentServiceOptimization:
                 "document_type": "spec"
             }]
         })
+        mock_repository.list_project_documents = AsyncMock(return_value=[{
+            "id": "doc-1",
+            "title": "Test Doc",
+            "content": {"huge": "content"},
+            "document_type": "spec"
+        }])
 
         service = DocumentService(repository=mock_repository)
         success, result = await service.list_documents("project-1", include_content=True)
@@ -183,6 +183,14 @@ class FakeSitemapCrawlStrategy:
 
         return self._urls
 
+    async def fetch_sitemap(
+        self,
+        sitemap_url: str,
+        cancellation_check: Callable[[], None] | None = None,
+    ) -> list[str]:
+        """Fetch sitemap."""
+        return self.parse_sitemap(sitemap_url, cancellation_check)
+
     def reset_tracking(self):
         """Reset call tracking."""
         self.parse_sitemap_calls = []
@@ -0,0 +1,162 @@
+"""
+Unit tests for single-pass HTML scanning (helpers/html_scanner.py) and the
+HTML code extraction built on it.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.crawling.code_extraction_service import CodeExtractionService
+from src.server.services.crawling.helpers import html_scanner
+from src.server.services.crawling.helpers.html_scanner import build_page_result, extract_html_title, scan_html
+
+PYTHON_SNIPPET = """import asyncio
+
+async def fetch_all(client, urls):
+    results = []
+    for url in urls:
+        response = await client.get(url)
+        results.append(response.json())
+    return results
+"""
+
+# Code block markup as rendered by common documentation generators
+DOCS_PAGES = {
+    "docusaurus": (
+        '<div class="language-python codeBlockContainer_Ckt0 theme-code-block">'
+        '<div class="codeBlockContent_biex"><pre tabindex="0" class="prism-code language-python codeBlock_bY9V">'
+        '<code class="codeBlockLines_e6Vv">'
+        + "".join(
+            f'<span class="token-line"><span class="token plain">{line}</span><br></span>'
+            for line in PYTHON_SNIPPET.splitlines()
+        )
+        + '</code></pre><div class="buttonGroup__atx"><button type="button" title="Copy">Copy</button></div>'
+        "</div></div>"
+    ),
+    "vitepress": (
+        '<div class="language-python vp-adaptive-theme"><button title="Copy Code" class="copy"></button>'
+        '<span class="lang">python</span><pre class="shiki shiki-themes github-light github-dark vp-code">'
+        "<code>"
+        + "\n".join(f'<span class="line"><span>{line}</span></span>' for line in PYTHON_SNIPPET.splitlines())
+        + "</code></pre></div>"
+    ),
+    "sphinx": (
+        '<div class="highlight-python notranslate"><div class="highlight"><pre><span></span>'
+        + PYTHON_SNIPPET.replace("import", '<span class="kn">import</span>')
+        + "</pre></div></div>"
+    ),
+    "mkdocs": (
+        '<div class="language-python highlight"><table class="highlighttable"><tr>'
+        '<td class="linenos"><div class="linenodiv"><pre>1\n2\n3\n4\n5\n6\n7\n8</pre></div></td>'
+        '<td class="code"><div><pre><span></span><code>'
+        + PYTHON_SNIPPET
+        + "</code></pre></div></td></tr></table></div>"
+    ),
+    "codemirror": (
+        '<div class="cm-editor"><div class="cm-scroller"><div class="cm-gutters">'
+        '<div class="cm-gutterElement">1</div></div>'
+        '<div class="cm-content" data-language="python">'
+        + "".join(f'<div class="cm-line">{line or "<br>"}</div>' for line in PYTHON_SNIPPET.splitlines())
+        + "</div></div></div>"
+    ),
+}
+
+
+def docs_page(framework: str, title: str = "Fetching &amp; Caching | Docs") -> str:
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title>"
+        '<script>window.__DATA__ = "<pre>not code</pre>";</script><style>pre { margin: 0 }</style></head>'
+        '<body><nav><a href="/docs">Docs</a></nav><main><h1>Fetching many pages</h1>'
+        "<p>This example shows how to fetch several URLs with a shared client.</p>"
+        f"{DOCS_PAGES[framework]}"
+        "<p>Each response is decoded as JSON before it is returned.</p></main></body></html>"
+    )
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def parser(request, monkeypatch):
+    if request.param == "html.parser":
+        monkeypatch.setattr(html_scanner, "LXML_AVAILABLE", False)
+    elif not html_scanner.LXML_AVAILABLE:
+        pytest.skip("lxml is not installed")
+
+
+@pytest.mark.parametrize("framework", sorted(DOCS_PAGES))
+def test_scan_finds_code_with_language_and_context(framework, parser):
+    scan = scan_html(docs_page(framework))
+
+    assert scan.title == "Fetching & Caching | Docs"
+    assert len(scan.code_blocks) == 1
+    block = scan.code_blocks[0]
+    assert block.code.strip() == PYTHON_SNIPPET.strip()
+    assert block.language == "python"
+    assert "fetch several URLs with a shared client." in block.context_before
+    assert block.context_after.startswith("Each response is decoded as JSON")
+    assert "not code" not in block.context_before
+
+
+def test_scan_identifies_highlighters_and_decodes_entities(parser):
+    scan = scan_html(
+        DOCS_PAGES["docusaurus"]
+        + DOCS_PAGES["codemirror"]
+        + '<pre><code class="hljs language-TS">if (a &lt; b &amp;&amp; c) {}</code></pre>'
+    )
+
+    assert [block.source_type for block in scan.code_blocks] == ["docusaurus", "codemirror", "hljs"]
+    assert scan.code_blocks[2].code == "if (a < b && c) {}"
+    assert scan.code_blocks[2].language == "ts"
+
+
+def test_short_inline_code_stays_in_context(parser):
+    long_inline = "x = compute(" + ", ".join(f"arg{n}" for n in range(30)) + ")"
+    scan = scan_html(f"<p>Call <code>run()</code> first.</p><p><code>{long_inline}</code></p>")
+
+    assert scan.code_blocks == []
+    assert [block.code for block in scan.inline_code] == [long_inline]
+    assert scan.inline_code[0].context_before == "Call run() first."
+
+
+def test_unclosed_markup_does_not_swallow_later_blocks(parser):
+    scan = scan_html("<div><p>Intro<li>item<pre>first()</pre></div><pre>second()</pre><p>Tail")
+
+    assert [block.code for block in scan.code_blocks] == ["first()", "second()"]
+    assert scan.code_blocks[1].context_after == "Tail"
+
+
+def test_extract_title_stops_at_body():
+    assert extract_html_title("<head><title>\n  API  Reference </title></head>") == "API Reference"
+    assert extract_html_title("<body><svg><title>Icon</title></svg></body>") is None
+    assert extract_html_title("") is None
+
+
+async def test_extract_html_code_blocks_uses_scan():
+    service = CodeExtractionService(repository=MagicMock())
+    service._settings_cache = {"ENABLE_CONTEXTUAL_LENGTH": False, "MIN_CODE_BLOCK_LENGTH": 100}
+
+    blocks = await service._extract_html_code_blocks(docs_page("vitepress"))
+
+    assert len(blocks) == 1
+    assert blocks[0]["language"] == "python"
+    assert blocks[0]["source_type"] == "shiki"
+    assert "async def fetch_all(client, urls):" in blocks[0]["code"]
+    assert blocks[0]["context_after"].startswith("Each response")
+
+
+async def test_stream_extraction_keeps_scan_instead_of_html():
+    html = docs_page("docusaurus")
+
+    streamed = await build_page_result("https://docs.example.com/fetch", "# Fetching", html, stream_extraction=True)
+    buffered = await build_page_result("https://docs.example.com/fetch", "# Fetching", html, stream_extraction=False)
+
+    assert "html" not in streamed
+    assert streamed["title"] == buffered["title"] == "Fetching & Caching | Docs"
+    assert buffered["html"] == html
+
+    service = CodeExtractionService(repository=MagicMock())
+    service._settings_cache = {"ENABLE_CONTEXTUAL_LENGTH": False, "MIN_CODE_BLOCK_LENGTH": 100}
+    from_scan = await service._extract_code_blocks_from_documents([streamed], "source-1")
+    from_html = await service._extract_code_blocks_from_documents([buffered], "source-1")
+
+    assert len(from_scan) == 1
+    assert from_scan == from_html
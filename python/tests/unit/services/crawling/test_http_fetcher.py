@@ -0,0 +1,177 @@
+"""
+Unit tests for the static-content fast path (helpers/http_fetcher.py).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from crawl4ai import CrawlerRunConfig, DefaultMarkdownGenerator
+
+from src.server.services.crawling.helpers.http_fetcher import (
+    HttpFetcher,
+    StaticCrawlResult,
+    StaticMarkdown,
+    chain_results,
+    extract_links,
+    looks_js_rendered,
+)
+from src.server.services.crawling.strategies.sitemap import SitemapCrawlStrategy
+
+ARTICLE = (
+    "<html><head><title>Guide &amp; Reference</title></head><body><main>"
+    "<h1>Installing</h1>"
+    + "<p>Run the installer and follow the prompts to configure the service for your team.</p>" * 5
+    + '<a href="/docs/next">Next</a> <a href="https://other.example.org/x">Other</a>'
+    "</main></body></html>"
+)
+SPA_SHELL = '<html><head><title>App</title></head><body><div id="root"></div><script src="/app.js"></script></body></html>'
+SITEMAP = (
+    '<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    "<url><loc>https://example.com/a</loc></url><url><loc>https://example.com/b</loc></url></urlset>"
+)
+
+
+def make_fetcher(handler) -> HttpFetcher:
+    return HttpFetcher(transport=httpx.MockTransport(handler))
+
+
+def site(request: httpx.Request) -> httpx.Response:
+    routes = {
+        "/llms.txt": ("text/plain", "# Project\n\nDocs index"),
+        "/guide": ("text/html; charset=utf-8", ARTICLE),
+        "/app": ("text/html", SPA_SHELL),
+        "/sitemap.xml": ("application/xml", SITEMAP),
+    }
+    if request.url.path not in routes:
+        return httpx.Response(404)
+    content_type, body = routes[request.url.path]
+    return httpx.Response(200, headers={"content-type": content_type}, text=body)
+
+
+async def test_fetch_page_serves_text_and_static_html_but_not_app_shells():
+    fetcher = make_fetcher(site)
+    generator = DefaultMarkdownGenerator()
+
+    pages = await fetcher.fetch_pages(
+        ["https://example.com/llms.txt", "https://example.com/guide", "https://example.com/app",
+         "https://example.com/missing"],
+        generator,
+    )
+
+    assert set(pages) == {"https://example.com/llms.txt", "https://example.com/guide"}
+    assert pages["https://example.com/llms.txt"].markdown.fit_markdown == "# Project\n\nDocs index"
+    guide = pages["https://example.com/guide"]
+    assert "Installing" in guide.markdown.fit_markdown
+    assert guide.links["internal"] == [{"href": "https://example.com/docs/next"}]
+    assert guide.links["external"] == [{"href": "https://other.example.org/x"}]
+
+    stats = fetcher.get_stats()
+    assert (stats["attempts"], stats["hits"], stats["fallbacks"]) == (4, 2, 2)
+    assert stats["hit_ratio"] == 0.5
+    await fetcher.aclose()
+
+
+async def test_fetch_pages_cleans_html_with_the_crawl_config():
+    nav_page = ARTICLE.replace("<main>", "<nav>Site navigation menu</nav><main>")
+    fetcher = make_fetcher(lambda request: httpx.Response(200, headers={"content-type": "text/html"}, text=nav_page))
+    generator = DefaultMarkdownGenerator()
+
+    raw = await fetcher.fetch_pages(["https://example.com/guide"], generator)
+    cleaned = await fetcher.fetch_pages(
+        ["https://example.com/guide"], generator, crawl_config=CrawlerRunConfig(excluded_tags=["nav"])
+    )
+
+    assert "Site navigation menu" in raw["https://example.com/guide"].markdown.fit_markdown
+    markdown = cleaned["https://example.com/guide"].markdown.fit_markdown
+    assert "Site navigation menu" not in markdown
+    assert "Installing" in markdown
+
+
+async def test_fetch_pages_checks_cancellation_per_url():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, headers={"content-type": "text/plain"}, text="# Notes")
+
+    def cancellation_check():
+        if requested:
+            raise asyncio.CancelledError()
+
+    fetcher = make_fetcher(handler)
+
+    with pytest.raises(asyncio.CancelledError):
+        await fetcher.fetch_pages(
+            [f"https://example.com/{n}.txt" for n in range(5)],
+            DefaultMarkdownGenerator(),
+            max_concurrent=1,
+            cancellation_check=cancellation_check,
+        )
+
+    assert requested == ["https://example.com/0.txt"]
+
+
+async def test_conditional_get_reuses_remembered_body():
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"content-type": "text/markdown", "etag": '"v1"'}, text="# Notes")
+
+    fetcher = make_fetcher(handler)
+
+    assert await fetcher.fetch_text("https://example.com/notes.md") == "# Notes"
+    assert await fetcher.fetch_text("https://example.com/notes.md") == "# Notes"
+    assert seen_headers == [None, '"v1"']
+    assert fetcher.get_stats()["not_modified"] == 1
+
+
+async def test_fetch_text_rejects_html_served_for_text_urls():
+    fetcher = make_fetcher(lambda request: httpx.Response(200, headers={"content-type": "text/html"}, text=ARTICLE))
+
+    assert await fetcher.fetch_text("https://example.com/llms.txt") is None
+    assert fetcher.get_stats()["fallbacks"] == 1
+
+
+async def test_sitemap_fetch_uses_fast_path(monkeypatch):
+    fetcher = make_fetcher(site)
+    monkeypatch.setattr("src.server.services.crawling.strategies.sitemap.get_http_fetcher", lambda: fetcher)
+
+    urls = await SitemapCrawlStrategy().fetch_sitemap("https://example.com/sitemap.xml")
+
+    assert urls == ["https://example.com/a", "https://example.com/b"]
+
+
+async def test_chain_results_yields_static_then_browser_results():
+    async def browser():
+        yield "browser-page"
+
+    static = [StaticCrawlResult(url="https://example.com/a", markdown=StaticMarkdown("a"))]
+
+    assert [r async for r in chain_results(static, browser())] == [static[0], "browser-page"]
+    assert [r async for r in chain_results(static, None)] == static
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        (SPA_SHELL, True),
+        ('<div id="__next">  </div>', True),
+        ("<noscript>You need to enable JavaScript to run this app.</noscript>", True),
+        (ARTICLE, False),
+    ],
+)
+def test_looks_js_rendered(html, expected):
+    assert looks_js_rendered(html) is expected
+
+
+def test_extract_links_resolves_base_and_skips_fragments():
+    html = '<base href="https://www.example.com/docs/"><a href="page#x">P</a><a href="#top">T</a><a href="mailto:a@b">M</a>'
+
+    assert extract_links(html, "https://example.com/") == {
+        "internal": [{"href": "https://www.example.com/docs/page"}],
+        "external": [],
+    }